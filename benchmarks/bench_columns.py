@@ -0,0 +1,100 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the time taken and memory used to turn a carpark availability \
+    response into sanitised dicts, or into columns of NumPy arrays.
+
+The response is already decoded, so only the conversion is measured. Memory \
+    is what the result holds on to, as measured with ``tracemalloc``.
+
+Run with ``python -m benchmarks.bench_columns``. Requires ``numpy``.
+"""
+
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable
+
+from datagovsg import Housing
+from datagovsg.housing.columns import carpark_availability_columns
+from datagovsg.housing.types import CarparkAvailabilityItemDict
+from datagovsg.sanitiser import clear_sanitise_cache
+
+CARPARKS = 2000
+LOT_TYPES = ('C', 'Y', 'H')
+REPEATS = 10
+
+def carpark_availability_items() -> list[dict]:
+    """Build the items of a carpark availability response."""
+    return [
+        {
+            'timestamp': '2026-01-12T00:15:36+08:00',
+            'carpark_data': [
+                {
+                    'carpark_info': [
+                        {
+                            'total_lots': str(100 + n % 400),
+                            'lot_type': lot_type,
+                            'lots_available': str(n % 100),
+                        } for lot_type in LOT_TYPES[:1 + n % len(LOT_TYPES)]
+                    ],
+                    'carpark_number': f'C{n}',
+                    'update_datetime': f'2026-01-12T00:{n % 15:02d}:30',
+                } for n in range(CARPARKS)
+            ],
+        },
+    ]
+
+def measure(
+    convert: Callable[[Any], Any],
+    items: list[dict],
+) -> tuple[float, int]:
+    """Convert the items, and measure the best time taken and the memory \
+        held by the result."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        clear_sanitise_cache()
+        begin = perf_counter()
+        _ = convert(items)
+        best = min(best, perf_counter() - begin)
+
+    clear_sanitise_cache()
+    start()
+    result = convert(items)
+    size, _ = get_traced_memory()
+    stop()
+    del result
+    return best, size
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    client = Housing(cache_backend='memory', validation_level='off')
+    items = carpark_availability_items()
+    rows = len(carpark_availability_columns(items)['lot_type'])
+    converters = {
+        'dicts': lambda items: client.sanitise_data_with_schema(
+            items,
+            schema=list[CarparkAvailabilityItemDict],
+        ),
+        'columns': carpark_availability_columns,
+    }
+
+    print(f'{CARPARKS} carparks, {rows} rows')
+    for name, convert in converters.items():
+        seconds, size = measure(convert, items)
+        print(
+            f'{name:>8}: {seconds * 1000:6.1f} ms  {size / 1024:8.1f} KiB',
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how ``fetch_many()`` scales with its number of workers.
+
+The calls go to a local stub server that waits before responding, to stand \
+    in for network latency.
+
+Run with ``python -m benchmarks.bench_fetch_many``.
+"""
+
+from time import perf_counter
+
+from datagovsg import Environment
+from datagovsg.ratelimit import set_rate_limit
+
+from tests.mocks.api_response_environment import APIResponseAirTemperature
+
+from .stub_server import stub_server
+
+CALLS = 32
+LATENCY = 0.05
+WORKER_COUNTS = (1, 2, 4, 8, 16)
+
+def route(path: str, query: dict[str, list[str]]) -> tuple[int, dict]:
+    """Respond to every request with the air temperature mock response."""
+    return 200, APIResponseAirTemperature.json()
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    # Measure the workers, not the rate limit of the stub server's host.
+    set_rate_limit(None)
+
+    client = Environment(
+        cache_backend='memory',
+        pool_maxsize=max(WORKER_COUNTS),
+    )
+
+    with stub_server(route, delay=LATENCY) as base_url:
+        calls = [
+            (
+                'send_request',
+                {'url': f'{base_url}/air-temperature', 'params': {'n': n}},
+            ) for n in range(CALLS)
+        ]
+
+        print(f'{CALLS} calls, {LATENCY * 1000:.0f} ms latency per call')
+
+        serial_seconds = 0.0
+        for max_workers in WORKER_COUNTS:
+            start = perf_counter()
+            results = client.fetch_many(calls, max_workers=max_workers)
+            seconds = perf_counter() - start
+            assert all(isinstance(result, dict) for result in results)
+
+            if max_workers == 1:
+                serial_seconds = seconds
+            print(
+                f'{max_workers:2d} workers: {seconds * 1000:7.1f} ms ' \
+                    f'({serial_seconds / seconds:.1f}x)',
+            )
+
+if __name__ == '__main__':
+    main()
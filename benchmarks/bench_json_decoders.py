@@ -0,0 +1,83 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure ``send_request()`` of a large taxi availability response with each \
+    JSON decoder, and without decoding.
+
+The response comes from a local stub server, without latency and without \
+    the cache backend, so that decoding is most of the time taken.
+
+Run with ``python -m benchmarks.bench_json_decoders``.
+"""
+
+from json import dumps
+from time import perf_counter
+
+from datagovsg import Transport
+from datagovsg.constants import JSON_DECODERS
+from datagovsg.ratelimit import set_rate_limit
+
+from tests.mocks.api_response_transport import APIResponseTaxiAvailability
+
+from .stub_server import stub_server
+
+CALLS = 50
+TAXIS = 5000
+
+def taxi_availability() -> bytes:
+    """Build the body of a taxi availability response with many taxis."""
+    response = APIResponseTaxiAvailability.json()
+    feature = response['features'][0]
+    feature['geometry']['coordinates'] = [
+        [103.6 + n / 10000, 1.3 + n / 100000] for n in range(TAXIS)
+    ]
+    feature['properties']['taxi_count'] = TAXIS
+    return dumps(response).encode()
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    set_rate_limit(None)
+
+    body = taxi_availability()
+
+    def route(path: str, query: dict[str, list[str]]) -> tuple[int, bytes]:
+        """Respond with the taxi availability response."""
+        return 200, body
+
+    with stub_server(route) as base_url:
+        url = f'{base_url}/taxi-availability'
+        print(f'{CALLS} calls, {len(body) / 1024:.0f} KiB per response')
+
+        runs = [(decoder, False) for decoder in JSON_DECODERS]
+        runs.append((JSON_DECODERS[0], True))
+        for json_decoder, raw in runs:
+            try:
+                client = Transport(
+                    cache_backend='memory',
+                    json_decoder=json_decoder,
+                )
+            except ImportError:
+                print(f'{json_decoder:>8}: not installed')
+                continue
+
+            start = perf_counter()
+            for _ in range(CALLS):
+                _ = client.send_request(url, sanitise=False, raw=raw)
+            seconds = perf_counter() - start
+
+            label = 'raw' if raw else json_decoder
+            print(f'{label:>8}: {seconds / CALLS * 1000:7.2f} ms per call')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the time to read one field of a carpark availability response, \
+    when it is sanitised eagerly or lazily.
+
+The response is already decoded, so only sanitising is measured. The eager \
+    times grow with the number of carparks, and the lazy times should not.
+
+Run with ``python -m benchmarks.bench_lazy``.
+"""
+
+from time import perf_counter
+from typing import Any, Callable
+
+from datagovsg import Housing
+from datagovsg.housing.constants import (
+    CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+)
+from datagovsg.housing.types import CarparkAvailabilityItemDict
+
+from tests.mocks.api_response_housing import APIResponseCarparkAvailability
+
+CARPARK_COUNTS = (100, 1000, 10000)
+REPEATS = 20
+
+def carpark_availability_items(carpark_count: int) -> list[dict]:
+    """Build the items of a carpark availability response."""
+    items = APIResponseCarparkAvailability.json()['items']
+    carpark = items[0]['carpark_data'][0]
+    items[0]['carpark_data'] = [
+        carpark | {'carpark_number': f'C{n}'} for n in range(carpark_count)
+    ]
+    return items
+
+def time_first_field(
+    sanitise: Callable[[Any], Any],
+    items: list[dict],
+) -> float:
+    """Sanitise the items and read the last carpark's update time, and \
+        measure the best time taken."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = perf_counter()
+        _ = sanitise(items)[0]['carpark_data'][-1]['update_datetime']
+        best = min(best, perf_counter() - start)
+    return best
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    client = Housing(cache_backend='memory', validation_level='off')
+    sanitisers = {
+        'eager': lambda items: client.sanitise_data(
+            items,
+            ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        ),
+        'schema': lambda items: client.sanitise_data_with_schema(
+            items,
+            schema=list[CarparkAvailabilityItemDict],
+        ),
+        'lazy': lambda items: client.sanitise_data_lazily(
+            items,
+            ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        ),
+    }
+
+    print(f'{"carparks":>8}' + ''.join(f'  {name:>10}' for name in sanitisers))
+
+    for carpark_count in CARPARK_COUNTS:
+        items = carpark_availability_items(carpark_count)
+        line = f'{carpark_count:8d}'
+        for sanitise in sanitisers.values():
+            line += f'  {time_first_field(sanitise, items) * 1e6:7.1f} us'
+        print(line)
+
+if __name__ == '__main__':
+    main()
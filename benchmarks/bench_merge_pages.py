@@ -0,0 +1,112 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how merging pages of environment data scales with the number of \
+    pages, compared with comparing every station with every other station.
+
+Each synthetic page has the same stations as the previous page, plus a few \
+    new stations, as a long ``date=`` query over a changing network of \
+    stations would.
+
+Run with ``python -m benchmarks.bench_merge_pages``.
+"""
+
+from copy import deepcopy
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable
+
+from datagovsg.environment.pagination import MetadataIndex, merge_page
+
+PAGE_COUNTS = (25, 50, 100)
+STATIONS = 200
+NEW_STATIONS_PER_PAGE = 5
+READINGS_PER_PAGE = 10
+
+def station(n: int) -> dict:
+    """Build a synthetic station."""
+    return {
+        'id': f'S{n:04d}',
+        'deviceId': f'S{n:04d}',
+        'name': f'Station {n}',
+        'location': {'latitude': 1.3, 'longitude': 103.8},
+    }
+
+def pages_of_data(page_count: int) -> list[dict]:
+    """Build the data of synthetic pages of air temperature readings."""
+    return [
+        {
+            'stations': [
+                station(n) for n in range(
+                    STATIONS + NEW_STATIONS_PER_PAGE * page,
+                )
+            ],
+            'readings': [
+                {'timestamp': f'{page}-{n}', 'data': []}
+                for n in range(READINGS_PER_PAGE)
+            ],
+        } for page in range(page_count)
+    ]
+
+def merge_page_by_scan(data: Any, page_data: Any) -> None:
+    """Merge a page by comparing every station with the collected stations."""
+    data['readings'].extend(page_data['readings'])
+    for data_centre in page_data['stations']:
+        if data_centre not in data['stations']:
+            data['stations'].append(data_centre)
+
+def time_merge(
+    pages: list[dict],
+    merge: Callable[[Any, Any], None],
+) -> tuple[float, Any]:
+    """Merge pages, and measure the time taken."""
+    pages = deepcopy(pages)
+    start = perf_counter()
+    data = pages[0]
+    for page_data in pages[1:]:
+        merge(data, page_data)
+    return perf_counter() - start, data
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print(
+        f'{STATIONS} stations, {NEW_STATIONS_PER_PAGE} new stations per page',
+    )
+    print(
+        f'{"pages":>5}  {"stations":>8}  {"scan":>10}  {"indexed":>10}  ' \
+            f'{"per station":>11}',
+    )
+
+    for page_count in PAGE_COUNTS:
+        pages = pages_of_data(page_count)
+        scan_seconds, scan_data = time_merge(pages, merge_page_by_scan)
+
+        index: MetadataIndex = {}
+        indexed_seconds, indexed_data = time_merge(
+            pages,
+            partial(merge_page, index=index),
+        )
+        assert indexed_data == scan_data
+
+        # Linear scaling means a constant time per station merged.
+        station_count = sum(len(page['stations']) for page in pages[1:])
+        print(
+            f'{page_count:5d}  {station_count:8d}  ' \
+                f'{scan_seconds * 1000:7.1f} ms  ' \
+                f'{indexed_seconds * 1000:7.1f} ms  ' \
+                f'{indexed_seconds / station_count * 1e6:8.2f} us',
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure how much time the Environment client's ``pipeline`` mode saves \
+    on a long, multi-page ``rainfall(date=...)`` query.
+
+The pages come from a local stub server that waits before responding, to \
+    stand in for network latency.
+
+Run with ``python -m benchmarks.bench_pipeline``.
+"""
+
+from datetime import date, datetime, timedelta
+from json import dumps
+from time import perf_counter
+
+from datagovsg import Environment
+from datagovsg.environment.endpoints import ENDPOINTS
+from datagovsg.ratelimit import set_rate_limit
+
+from .stub_server import stub_server
+
+PAGES = 20
+READINGS_PER_PAGE = 300
+STATIONS = 60
+LATENCY = 0.02
+QUERY_DATE = date(2026, 1, 12)
+
+def rainfall_page(page: int) -> dict:
+    """Build the JSON value of a synthetic page of rainfall readings."""
+    start = datetime(2026, 1, 12) + timedelta(
+        minutes=5 * READINGS_PER_PAGE * page,
+    )
+    station_ids = [f'S{n:03d}' for n in range(STATIONS)]
+    data = {
+        'stations': [
+            {
+                'id': station_id,
+                'deviceId': station_id,
+                'name': f'Station {station_id}',
+                'location': {'latitude': 1.3, 'longitude': 103.8},
+            } for station_id in station_ids
+        ],
+        'readings': [
+            {
+                'timestamp': (start + timedelta(minutes=5 * n)).strftime(
+                    '%Y-%m-%dT%H:%M:%S+08:00',
+                ),
+                'data': [
+                    {'stationId': station_id, 'value': 0.2}
+                    for station_id in station_ids
+                ],
+            } for n in range(READINGS_PER_PAGE)
+        ],
+        'readingType': 'TB1 Rainfall 5 Minute Total F',
+        'readingUnit': 'mm',
+    }
+    if page + 1 < PAGES:
+        data['paginationToken'] = str(page + 1)
+    return {'code': 0, 'data': data, 'errorMsg': ''}
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    # Measure the pipeline, not the rate limit of the stub server's host.
+    set_rate_limit(None)
+
+    # Encode the pages once, so that the stub server in this process does not
+    # compete with the client for the CPU.
+    pages = [dumps(rainfall_page(page)).encode() for page in range(PAGES)]
+
+    def route(path: str, query: dict[str, list[str]]) -> tuple[int, bytes]:
+        """Respond with the page of the request's pagination token."""
+        return 200, pages[int(query.get('paginationToken', ['0'])[0])]
+
+    with stub_server(route, delay=LATENCY) as base_url:
+        ENDPOINTS['rainfall']['url'] = f'{base_url}/rainfall'
+
+        print(
+            f'{PAGES} pages of {READINGS_PER_PAGE} readings from {STATIONS} ' \
+                f'stations, {LATENCY * 1000:.0f} ms latency per page',
+        )
+
+        # Warm up the connection and the compiled sanitisers.
+        _ = Environment(cache_backend='memory').rainfall(date=QUERY_DATE)
+
+        results = {}
+        for pipeline in (False, True):
+            client = Environment(
+                cache_backend='memory',
+                share_session=False,
+                pipeline=pipeline,
+            )
+            start = perf_counter()
+            results[pipeline] = client.rainfall(date=QUERY_DATE)
+            seconds = perf_counter() - start
+
+            label = 'pipeline' if pipeline else 'no pipeline'
+            print(f'{label:>11}: {seconds * 1000:7.1f} ms')
+            if pipeline:
+                stats = client.pipeline_stats()
+                print(
+                    f'{"":>11}  {stats["hidden_seconds"] * 1000:7.1f} ms ' \
+                        f'hidden of {stats["fetch_seconds"] * 1000:.1f} ms ' \
+                        f'fetching {stats["pages_prefetched"]} prefetched ' \
+                        'pages',
+                )
+
+        assert results[False] == results[True]
+
+if __name__ == '__main__':
+    main()
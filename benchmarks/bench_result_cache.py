@@ -0,0 +1,80 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure repeated ``carpark_availability()`` calls within its cache \
+    duration, with and without a ``ResultCache``.
+
+The first call goes to a local stub server. Every other call is a hit in the \
+    SQLite cache backend, or in the result cache.
+
+Run with ``python -m benchmarks.bench_result_cache``.
+"""
+
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from requests_cache import SQLiteCache
+
+from datagovsg import Housing
+from datagovsg.housing import endpoints as housing_endpoints
+from datagovsg.ratelimit import set_rate_limit
+from datagovsg.resultcache import ResultCache
+
+from tests.mocks.api_response_housing import APIResponseCarparkAvailability
+
+from .stub_server import stub_server
+
+CALLS = 500
+CARPARKS = 2000
+
+def route(path: str, query: dict[str, list[str]]) -> tuple[int, dict]:
+    """Respond with carpark availability of many carparks."""
+    response = APIResponseCarparkAvailability.json()
+    item = response['items'][0]
+    carpark = item['carpark_data'][0]
+    item['carpark_data'] = [
+        carpark | {'carpark_number': f'C{n}'} for n in range(CARPARKS)
+    ]
+    return 200, response
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    set_rate_limit(None)
+
+    with stub_server(route) as base_url, TemporaryDirectory() as directory:
+        housing_endpoints.CARPARK_AVAILABILITY_API_ENDPOINT = \
+            f'{base_url}/carpark-availability'
+
+        print(f'{CALLS} calls, {CARPARKS} carparks per response')
+
+        for result_cache in (None, ResultCache()):
+            client = Housing(
+                cache_backend=SQLiteCache(f'{directory}/{id(result_cache)}'),
+                result_cache=result_cache,
+            )
+            _ = client.carpark_availability()
+
+            start = perf_counter()
+            for _ in range(CALLS):
+                _ = client.carpark_availability()
+            seconds = perf_counter() - start
+
+            label = 'no result cache' if result_cache is None \
+                else 'result cache'
+            print(
+                f'{label:>15}: {seconds / CALLS * 1e6:9.1f} us per call',
+            )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure sanitising a carpark availability response with and without the \
+    memos of converted strings.
+
+Like the real response, the synthetic carparks repeat a few update times and \
+    small lot counts.
+
+Run with ``python -m benchmarks.bench_sanitise_cache``.
+"""
+
+from time import perf_counter
+from typing import Any, Callable
+
+from datagovsg import Housing
+from datagovsg.constants import SANITISE_CACHE_MAX_ENTRIES
+from datagovsg.housing.constants import (
+    CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+)
+from datagovsg.housing.types import CarparkAvailabilityItemDict
+from datagovsg.sanitiser import (
+    clear_sanitise_cache,
+    sanitise_cache_stats,
+    set_sanitise_cache_size,
+)
+
+CARPARKS = 2000
+REPEATS = 10
+
+def carpark_availability_items() -> list[dict]:
+    """Build the items of a carpark availability response."""
+    return [
+        {
+            'timestamp': '2026-01-12T00:15:36+08:00',
+            'carpark_data': [
+                {
+                    'carpark_info': [
+                        {
+                            'total_lots': str(100 + n % 400),
+                            'lot_type': 'C',
+                            'lots_available': str(n % 100),
+                        },
+                    ],
+                    'carpark_number': f'C{n}',
+                    'update_datetime': f'2026-01-12T00:{n % 15:02d}:30',
+                } for n in range(CARPARKS)
+            ],
+        },
+    ]
+
+def time_sanitise(sanitise: Callable[[Any], Any], items: list[dict]) -> float:
+    """Sanitise the items, and measure the best time taken."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        clear_sanitise_cache()
+        start = perf_counter()
+        _ = sanitise(items)
+        best = min(best, perf_counter() - start)
+    return best
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    client = Housing(cache_backend='memory', validation_level='off')
+    items = carpark_availability_items()
+    sanitisers = {
+        'sanitise_data': lambda items: client.sanitise_data(
+            items,
+            ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        ),
+        'schema': lambda items: client.sanitise_data_with_schema(
+            items,
+            schema=list[CarparkAvailabilityItemDict],
+        ),
+    }
+
+    print(f'{CARPARKS} carparks, memos emptied before every run')
+    print(f'{"":>13}  {"no memo":>10}  {"memo":>10}  {"hit rate":>8}')
+
+    for name, sanitise in sanitisers.items():
+        set_sanitise_cache_size(0)
+        no_memo_seconds = time_sanitise(sanitise, items)
+
+        set_sanitise_cache_size(SANITISE_CACHE_MAX_ENTRIES)
+        memo_seconds = time_sanitise(sanitise, items)
+        stats = sanitise_cache_stats()
+        hit_rate = stats['hits'] / (stats['hits'] + stats['misses'])
+
+        print(
+            f'{name:>13}  {no_memo_seconds * 1000:7.1f} ms  ' \
+                f'{memo_seconds * 1000:7.1f} ms  {hit_rate:8.1%}',
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure sanitising a carpark availability response by walking it with a \
+    stack and a trie of ``ignore_keys``, compared with recursing and building \
+    the key path of every value.
+
+Both convert strings with the same memo, so only the walk is compared.
+
+Run with ``python -m benchmarks.bench_sanitise_tree``.
+"""
+
+from time import perf_counter
+from typing import Any, Callable
+
+from datagovsg.housing.constants import (
+    CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+)
+from datagovsg.sanitiser import sanitise_string, sanitise_tree
+
+CARPARK_COUNTS = (1000, 10000)
+REPEATS = 10
+
+def carpark_availability_items(carpark_count: int) -> list[dict]:
+    """Build the items of a carpark availability response."""
+    return [
+        {
+            'timestamp': '2026-01-12T00:15:36+08:00',
+            'carpark_data': [
+                {
+                    'carpark_info': [
+                        {
+                            'total_lots': str(100 + n % 400),
+                            'lot_type': 'C',
+                            'lots_available': str(n % 100),
+                        },
+                    ],
+                    'carpark_number': f'C{n}',
+                    'update_datetime': f'2026-01-12T00:{n % 15:02d}:30',
+                } for n in range(carpark_count)
+            ],
+        },
+    ]
+
+def sanitise_by_key_path(
+    value: Any,
+    ignore_keys: list[str],
+    key_path: str='',
+) -> Any:
+    """Sanitise a value by recursing and building every key path."""
+    if isinstance(value, list):
+        return [
+            sanitise_by_key_path(v, ignore_keys, f'{key_path}[]')
+            for v in value
+        ]
+    if isinstance(value, dict):
+        sanitised_dict = {}
+        for k, v in value.items():
+            current_key_path = '.'.join([key_path, k]) if key_path else k
+            if current_key_path in ignore_keys:
+                sanitised_dict[k] = v
+            else:
+                sanitised_dict[k] = sanitise_by_key_path(
+                    v,
+                    ignore_keys,
+                    current_key_path,
+                )
+        return sanitised_dict
+    if isinstance(value, str):
+        return sanitise_string(value)
+    return value
+
+def time_sanitise(
+    sanitise: Callable[[Any, list[str]], Any],
+    items: list[dict],
+) -> float:
+    """Sanitise the items, and measure the best time taken."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = perf_counter()
+        _ = sanitise(items, CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS)
+        best = min(best, perf_counter() - start)
+    return best
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print(f'{"carparks":>8}  {"recursive":>10}  {"iterative":>10}')
+
+    for carpark_count in CARPARK_COUNTS:
+        items = carpark_availability_items(carpark_count)
+        assert sanitise_tree(
+            items,
+            CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        ) == sanitise_by_key_path(
+            items,
+            CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        )
+
+        recursive_seconds = time_sanitise(sanitise_by_key_path, items)
+        iterative_seconds = time_sanitise(sanitise_tree, items)
+        print(
+            f'{carpark_count:8d}  {recursive_seconds * 1000:7.1f} ms  ' \
+                f'{iterative_seconds * 1000:7.1f} ms',
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the time taken and memory used to turn the body of a taxi \
+    availability response into sanitised dicts with lists of coordinates, \
+    or with a NumPy array of coordinates.
+
+Both start from the body's bytes, so decoding the JSON is measured too. \
+    Memory is the peak while converting, and what the result holds on to, \
+    as measured with ``tracemalloc``.
+
+Run with ``python -m benchmarks.bench_taxi_array``. Requires ``numpy``.
+"""
+
+from json import dumps
+from random import Random
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable
+
+from datagovsg import Transport
+from datagovsg.sanitiser import clear_sanitise_cache
+from datagovsg.transport.coordinates import taxi_availability_array
+from datagovsg.transport.types import (
+    TaxiAvailabilityArrayDict,
+    TaxiAvailabilityDict,
+)
+
+TAXIS = 5000
+REPEATS = 10
+
+def taxi_availability_content() -> bytes:
+    """Build the body of a taxi availability response."""
+    random = Random(0)
+    return dumps({
+        'type': 'FeatureCollection',
+        'crs': {
+            'type': 'link',
+            'properties': {
+                'href': 'http://spatialreference.org/ref/epsg/4326/ogcwkt/',
+                'type': 'ogcwkt',
+            },
+        },
+        'features': [
+            {
+                'type': 'Feature',
+                'geometry': {
+                    'type': 'MultiPoint',
+                    'coordinates': [
+                        [
+                            round(random.uniform(103.6, 104.0), 5),
+                            round(random.uniform(1.25, 1.45), 5),
+                        ] for _ in range(TAXIS)
+                    ],
+                },
+                'properties': {
+                    'timestamp': '2026-01-12T00:14:56+08:00',
+                    'taxi_count': TAXIS,
+                    'api_info': {'status': 'healthy'},
+                },
+            },
+        ],
+    }).encode()
+
+def measure(
+    convert: Callable[[bytes], Any],
+    content: bytes,
+) -> tuple[float, int, int]:
+    """Convert the body, and measure the best time taken, the peak memory \
+        and the memory held by the result."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        clear_sanitise_cache()
+        begin = perf_counter()
+        _ = convert(content)
+        best = min(best, perf_counter() - begin)
+
+    clear_sanitise_cache()
+    start()
+    result = convert(content)
+    size, peak = get_traced_memory()
+    stop()
+    del result
+    return best, peak, size
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    client = Transport(cache_backend='memory', validation_level='off')
+    content = taxi_availability_content()
+    converters = {
+        'lists': lambda content: client.sanitise_data_with_schema(
+            client.decode_json(content),
+            schema=TaxiAvailabilityDict,
+        ),
+        'array': lambda content: client.sanitise_data_with_schema(
+            taxi_availability_array(content, client.decode_json),
+            schema=TaxiAvailabilityArrayDict,
+        ),
+    }
+
+    print(f'{TAXIS} taxis, {len(content) / 1024:.1f} KiB of JSON')
+    for name, convert in converters.items():
+        seconds, peak, size = measure(convert, content)
+        print(
+            f'{name:>6}: {seconds * 1000:6.2f} ms  '
+            f'peak {peak / 1024:8.1f} KiB  held {size / 1024:8.1f} KiB',
+        )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the time taken to query a ``TaxiGrid`` as the fleet grows, \
+    against going through every taxi.
+
+Taxis are spread at random across Singapore. Each query is around a \
+    random point, with a radius of 500 m, a box of about 1 km by 1 km, or \
+    the 5 nearest taxis. The time to rebuild the grid is measured too.
+
+The time taken to go through every taxi grows with the fleet, while the \
+    time taken by the grid only grows with the number of taxis in the cells \
+    on the edge of a query, and with the number of taxis that are returned.
+
+Run with ``python -m benchmarks.bench_taxi_grid``.
+"""
+
+from math import cos, radians
+from random import Random
+from time import perf_counter
+from typing import Callable
+
+from datagovsg.constants import EARTH_RADIUS_M, SINGAPORE_LATITUDE
+from datagovsg.transport.spatial import TaxiGrid
+
+FLEET_SIZES = (1000, 5000, 20000, 100000)
+QUERIES = 500
+RADIUS_M = 500.0
+
+def taxi_availability(taxis: int, random: Random) -> dict:
+    """Build a taxi availability with taxis at random positions."""
+    return {
+        'features': [
+            {
+                'geometry': {
+                    'coordinates': [
+                        [random.uniform(103.6, 104.0), random.uniform(1.25, 1.45)]
+                        for _ in range(taxis)
+                    ],
+                },
+            },
+        ],
+    }
+
+def scan_count_within(
+    positions: list[list[float]],
+) -> Callable[[float, float, float], int]:
+    """Count the taxis within a radius by going through every taxi."""
+    y_scale = radians(EARTH_RADIUS_M)
+    x_scale = y_scale * cos(radians(SINGAPORE_LATITUDE))
+
+    def count_within(latitude: float, longitude: float, radius_m: float) -> int:
+        radius_squared = radius_m * radius_m
+        count = 0
+        for taxi_longitude, taxi_latitude in positions:
+            dx = (taxi_longitude - longitude) * x_scale
+            dy = (taxi_latitude - latitude) * y_scale
+            if dx * dx + dy * dy <= radius_squared:
+                count += 1
+        return count
+
+    return count_within
+
+def microseconds_per_query(
+    query: Callable[[float, float], object],
+    points: list[tuple[float, float]],
+) -> float:
+    """Run a query around every point, and measure the average time taken."""
+    begin = perf_counter()
+    for latitude, longitude in points:
+        query(latitude, longitude)
+    return (perf_counter() - begin) / len(points) * 1e6
+
+def measure(
+    taxis: int,
+    points: list[tuple[float, float]],
+    random: Random,
+) -> None:
+    """Build a grid of a fleet, and print the time taken by each query."""
+    data = taxi_availability(taxis, random)
+    grid = TaxiGrid()
+    begin = perf_counter()
+    grid.update(data)
+    rebuild = perf_counter() - begin
+
+    count = microseconds_per_query(
+        lambda lat, lon: grid.count_within(lat, lon, RADIUS_M),
+        points,
+    )
+    bbox = microseconds_per_query(
+        lambda lat, lon: grid.within_bbox(
+            lat - 0.0045, lon - 0.0045, lat + 0.0045, lon + 0.0045,
+        ),
+        points,
+    )
+    nearest = microseconds_per_query(
+        lambda lat, lon: grid.nearest(lat, lon, 5),
+        points,
+    )
+    scan_query = scan_count_within(data['features'][0]['geometry']['coordinates'])
+    scan = microseconds_per_query(
+        lambda lat, lon: scan_query(lat, lon, RADIUS_M),
+        points[:20],
+    )
+    print(
+        f'{taxis:>7} {rebuild * 1000:>7.1f} ms {count:>6.1f} us '
+        f'{bbox:>6.1f} us {nearest:>6.1f} us {scan:>7.0f} us',
+    )
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    random = Random(0)
+    points = [
+        (random.uniform(1.25, 1.45), random.uniform(103.6, 104.0))
+        for _ in range(QUERIES)
+    ]
+
+    print(
+        f'{"taxis":>7} {"rebuild":>10} {"count":>9} {"bbox":>9} '
+        f'{"nearest":>9} {"scan":>10}',
+    )
+    for taxis in FLEET_SIZES:
+        measure(taxis, points, random)
+
+if __name__ == '__main__':
+    main()
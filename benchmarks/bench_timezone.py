@@ -0,0 +1,94 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare ``datetime_from_string()`` against the previous implementation, \
+    which tried ``datetime.strptime()`` with every allowed date format.
+
+Run with ``python -m benchmarks.bench_timezone``.
+"""
+
+from datetime import date, datetime, time
+from re import fullmatch, match
+from timeit import timeit
+
+from datagovsg.timezone import (
+    ALLOWED_DATE_FORMATS,
+    datetime_as_sgt,
+    datetime_from_string,
+)
+
+from .mocks import mock_strings
+
+def legacy_datetime_from_string(val: str) -> datetime | date | time:
+    """Previous implementation of ``datetime_from_string()``."""
+    dt_datetime = None
+    dt_format = ''
+    for date_format in ALLOWED_DATE_FORMATS:
+        try:
+            if date_format == '%H%M' and len(val) != 4:
+                raise ValueError('val is not a 4-digit time')
+            if date_format == '%H:%M' and len(val) != 5:
+                raise ValueError('val is not a 5-digit time')
+
+            dt_datetime = datetime.strptime(val, date_format)
+            dt_format = date_format
+        except ValueError:
+            continue
+
+    if dt_datetime is None:
+        raise ValueError('val is not a recognised datetime string')
+
+    dt_datetime_sgt = datetime_as_sgt(dt_datetime)
+    if match('%H:?%M', dt_format) is not None:
+        return dt_datetime_sgt.time()
+    if fullmatch('%Y-?%m-?%d', dt_format) is not None \
+        or dt_format == '%d/%m/%Y':
+        return dt_datetime_sgt.date()
+    return dt_datetime_sgt
+
+def parse_all(parse, strings: list[str]) -> list:
+    """Parse every string, keeping ``None`` for unrecognised strings."""
+    results = []
+    for val in strings:
+        try:
+            results.append(parse(val))
+        except ValueError:
+            results.append(None)
+    return results
+
+def main(number: int=5) -> None:
+    """Run the benchmark and print the results."""
+    strings = mock_strings()
+
+    legacy_results = parse_all(legacy_datetime_from_string, strings)
+    results = parse_all(datetime_from_string, strings)
+    assert results == legacy_results, 'results differ from legacy parser'
+
+    legacy_seconds = timeit(
+        lambda: parse_all(legacy_datetime_from_string, strings),
+        number=number,
+    )
+    seconds = timeit(
+        lambda: parse_all(datetime_from_string, strings),
+        number=number,
+    )
+
+    parsed = sum(1 for result in results if result is not None)
+    print(f'{len(strings)} strings from mock responses, {parsed} parsed')
+    print(f'legacy strptime loop: {legacy_seconds / number * 1000:.2f} ms')
+    print(f'shape-dispatched parser: {seconds / number * 1000:.2f} ms')
+    print(f'speedup: {legacy_seconds / seconds:.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for reusing the test suite's mock responses in benchmarks."""
+
+from inspect import getmembers, isclass
+from typing import Any, Iterator
+
+from tests.mocks import (
+    api_response_datagovsg,
+    api_response_economy,
+    api_response_environment,
+    api_response_housing,
+    api_response_transport,
+)
+
+MOCK_MODULES = (
+    api_response_datagovsg,
+    api_response_economy,
+    api_response_environment,
+    api_response_housing,
+    api_response_transport,
+)
+
+def mock_responses() -> Iterator[tuple[str, Any]]:
+    """Yield the name and JSON value of every mock response.
+
+    :return: Iterator of (mock class name, JSON value).
+    :rtype: Iterator[tuple[str, Any]]
+    """
+    for module in MOCK_MODULES:
+        for name, mock_class in getmembers(module, isclass):
+            if name.startswith('APIResponse'):
+                yield name, mock_class.json()
+
+def mock_strings() -> list[str]:
+    """Collect every string value found in the mock responses.
+
+    :return: All string values, including duplicates.
+    :rtype: list[str]
+    """
+    strings: list[str] = []
+
+    def collect(value: Any) -> None:
+        if isinstance(value, dict):
+            for v in value.values():
+                collect(v)
+        elif isinstance(value, list):
+            for v in value:
+                collect(v)
+        elif isinstance(value, str):
+            strings.append(value)
+
+    for _, value in mock_responses():
+        collect(value)
+
+    return strings
@@ -0,0 +1,59 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local HTTP server that stands in for the Data.gov.sg APIs in benchmarks."""
+
+from contextlib import contextmanager
+from json import dumps
+from time import sleep
+from typing import Any, Callable, Iterator, TypeAlias
+from urllib.parse import parse_qs, urlsplit
+
+from tests.stub_server import StubHandler, stub_server as serve_stub
+
+Route: TypeAlias = Callable[[str, dict[str, list[str]]], tuple[int, Any]]
+
+@contextmanager
+def stub_server(route: Route, delay: float=0) -> Iterator[str]:
+    """Serve JSON responses from ``route`` on a local port.
+
+    :param route: Function that takes the request's path and query \
+        parameters, and returns the (status code, JSON value) to respond with. \
+        The JSON value may be given as already encoded bytes.
+    :type route: Route
+
+    :param delay: Number of seconds to wait before responding, to stand in \
+        for network latency. Defaults to 0.
+    :type delay: float
+
+    :return: Iterator of the server's base URL, e.g. "http://127.0.0.1:8000".
+    :rtype: Iterator[str]
+    """
+
+    def do_get(handler: StubHandler) -> None:
+        """Respond to a GET request with ``route``."""
+        url = urlsplit(handler.path)
+        status_code, value = route(url.path, parse_qs(url.query))
+        body = value if isinstance(value, bytes) else dumps(value).encode()
+        if delay:
+            sleep(delay)
+        handler.respond(status_code, body)
+
+    with serve_stub(do_get) as url:
+        yield url
+
+__all__ = [
+    'Route',
+    'stub_server',
+]
@@ -0,0 +1,34 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous clients, which require the ``aio`` extra.
+
+.. code-block:: python
+
+    from datagovsg.aio import Environment
+"""
+
+from .datagovsg import DataGovSg
+from .economy import Client as Economy
+from .environment import Client as Environment
+from .housing import Client as Housing
+from .transport import Client as Transport
+
+__all__ = [
+    'DataGovSg',
+    'Economy',
+    'Environment',
+    'Housing',
+    'Transport',
+]
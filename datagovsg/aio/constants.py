@@ -0,0 +1,40 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Constants for the asynchronous clients."""
+
+CACHE_BACKEND_SQLITE = 'sqlite'
+CACHE_BACKEND_FILESYSTEM = 'filesystem'
+CACHE_BACKEND_MEMORY = 'memory'
+CACHE_BACKENDS = (
+    CACHE_BACKEND_SQLITE,
+    CACHE_BACKEND_FILESYSTEM,
+    CACHE_BACKEND_MEMORY,
+)
+
+AIO_IMPORT_ERROR_MESSAGE = 'datagovsg.aio requires aiohttp and ' \
+    'aiohttp-client-cache. Install them with: pip install datagovsg[aio]'
+INVALID_CACHE_BACKEND_ERROR_MESSAGE = \
+    f'cache_backend must be one of {", ".join(CACHE_BACKENDS)}, or an ' \
+    'aiohttp_client_cache.CacheBackend.'
+
+__all__ = [
+    'CACHE_BACKEND_SQLITE',
+    'CACHE_BACKEND_FILESYSTEM',
+    'CACHE_BACKEND_MEMORY',
+    'CACHE_BACKENDS',
+
+    'AIO_IMPORT_ERROR_MESSAGE',
+    'INVALID_CACHE_BACKEND_ERROR_MESSAGE',
+]
@@ -0,0 +1,697 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous client mixin for interacting with all of the API endpoints."""
+
+from asyncio import Semaphore, create_task, gather, sleep
+from datetime import datetime, timedelta, timezone
+from typing import Any, Self
+
+from requests import ConnectionError as RequestsConnectionError
+from requests import RequestException, Response
+from requests.structures import CaseInsensitiveDict
+
+from ..constants import (
+    AIO_CACHE_NAME,
+    FETCH_MANY_MAX_WORKERS,
+    INVALID_POOL_SIZE_ERROR_MESSAGE,
+    JSON_DECODER_STDLIB,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+    USER_AGENT,
+)
+from ..datagovsg import DataGovSg as SyncDataGovSg
+from ..decoders import JsonDecoder, decode_error_json, get_json_decoder
+from ..exceptions import APIError
+from ..expiry import find_update_time, seconds_until_next_update
+from ..ratelimit import get_rate_limiter
+from ..resultcache import (
+    ResultCache,
+    seconds_until_expiry,
+)
+from ..types import FetchCall, PoolStatsDict, Url
+from ..validation import (
+    boundary_typechecked,
+    check_validation_level,
+    internal_typechecked,
+)
+
+from .constants import (
+    AIO_IMPORT_ERROR_MESSAGE,
+    CACHE_BACKEND_FILESYSTEM,
+    CACHE_BACKEND_MEMORY,
+    CACHE_BACKEND_SQLITE,
+    INVALID_CACHE_BACKEND_ERROR_MESSAGE,
+)
+
+try:
+    from aiohttp import (
+        ClientConnectionError,
+        ClientResponse,
+        TCPConnector,
+        TraceConfig,
+    )
+    from aiohttp_client_cache import (
+        CacheBackend,
+        CachedResponse,
+        CachedSession,
+        FileBackend,
+        SQLiteBackend,
+    )
+except ImportError as error:
+    raise ImportError(AIO_IMPORT_ERROR_MESSAGE) from error
+
+class DataGovSg(SyncDataGovSg):
+    """Asynchronous client mixin for other asynchronous API Clients.
+
+    It has the same public methods as ``datagovsg.datagovsg.DataGovSg``, \
+        except that ``send_request()`` and ``fetch_many()`` are coroutines.
+
+    The constructor sets the following:
+
+    - Connection retries using exponential backoff.
+    - Cache (cache duration/expiry is set in ``send_request()``).
+    - API key that can be used with api.data.gov.sg.
+    - User-agent header.
+
+    The HTTP session is opened on the first request, in the running event \
+        loop. Close it with ``close()``, or use the client as an \
+        asynchronous context manager:
+
+    .. code-block:: python
+
+        async with Environment() as environment:
+            psi = await environment.psi()
+
+    :param api_key: The assigned API key for api.data.gov.sg. Defaults to None.
+    :type api_key: str or None
+
+    :param cache_backend: Cache backend name or instance to use. The names \
+        "sqlite", "filesystem" and "memory" are allowed. Refer to \
+        https://aiohttp-client-cache.readthedocs.io/en/stable/backends.html \
+        for more information about instances. Defaults to "sqlite".
+    :type cache_backend: str or CacheBackend
+
+    :param validation_level: Which of this client's methods are type-checked: \
+        "full" (all methods), "boundary" (only the public client methods) or \
+        "off" (none). Defaults to the ``DATAGOVSG_VALIDATION_LEVEL`` \
+        environment variable at import time, or "full" if that is not set.
+    :type validation_level: str or None
+
+    :param pool_maxsize: Number of connections to open per host at the same \
+        time. If None, then there is no limit per host. Defaults to None.
+    :type pool_maxsize: int or None
+
+    :param result_cache: In-memory cache of sanitised results, which is \
+        checked before the cache backend. It may be shared with other \
+        clients. The results of the Environment clients, and of lazy \
+        clients, are not kept, as they are sanitised after \
+        ``send_request()``. (Refer to ``datagovsg.resultcache``.) If None, \
+        then results are not kept in memory. Defaults to None.
+    :type result_cache: ResultCache or None
+
+    :param json_decoder: Decoder of the responses' JSON bodies: "json" (the \
+        standard library), "orjson" or "msgspec". Defaults to "json".
+    :type json_decoder: str
+
+    :param lazy: If True, then methods that return large responses return \
+        read-only proxies that sanitise values only when they are read. \
+        (Refer to ``datagovsg.lazy``.) Defaults to False.
+    :type lazy: bool
+
+    :raises ValueError: ``cache_backend`` is not an allowed name, \
+        ``validation_level`` is not one of "full", "boundary" or "off", \
+        ``pool_maxsize`` is less than 1, or ``json_decoder`` is not one of \
+        "json", "orjson" or "msgspec".
+    :raises ImportError: The package of ``json_decoder`` is not installed.
+    """
+
+    # pylint: disable=invalid-overridden-method
+
+    @boundary_typechecked
+    def __init__(
+        self,
+        api_key: str | None=None,
+        cache_backend: str | CacheBackend='sqlite',
+        validation_level: str | None=None,
+        pool_maxsize: int | None=None,
+        result_cache: ResultCache | None=None,
+        json_decoder: str=JSON_DECODER_STDLIB,
+        lazy: bool=False,
+    ) -> None:
+        """Constructor method"""
+        # pylint: disable=super-init-not-called,too-many-arguments
+        # pylint: disable=too-many-positional-arguments
+        if validation_level is not None:
+            self.validation_level = check_validation_level(validation_level)
+
+        self.result_cache = result_cache
+        self.decode_json = get_json_decoder(json_decoder)
+        self.json_decoder = json_decoder
+        self.lazy = lazy
+
+        if pool_maxsize is not None and pool_maxsize < 1:
+            raise ValueError(INVALID_POOL_SIZE_ERROR_MESSAGE)
+        self.pool_maxsize = pool_maxsize
+        self.__pool_stats: PoolStatsDict = {
+            'connections_opened': 0,
+            'connections_reused': 0,
+        }
+
+        self.headers = {
+            'Accept': 'application/json',
+            'User-Agent': USER_AGENT,
+        }
+        if api_key is not None:
+            self.headers['x-api-key'] = api_key
+
+        self.cache = _create_cache(cache_backend)
+        self.session: CachedSession | None = None
+
+    async def __aenter__(self) -> Self:
+        """Enter the asynchronous context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit the asynchronous context manager and close the session."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session and the cache, if they are open.
+
+        :return: None
+        """
+        if self.session is not None:
+            session = self.session
+            self.session = None
+            await session.close()
+
+    @boundary_typechecked
+    async def send_request(
+        self,
+        url: Url,
+        params: dict | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        sanitise_schema: Any=None,
+        raw: bool=False,
+        update_cadence: int | None=None,
+    ) -> Any:
+        """Send a request to an endpoint and return its response.
+
+        The parameters and the returned value are the same as those of the \
+            synchronous ``send_request()``.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL. \
+            Parameter names **must** match the names required by the \
+            endpoints, particularly with typecase (e.g. camelCase). Defaults \
+            to {}.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to 0, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If true, then the response's values are sanitised \
+            using the ``sanitise_data()`` method. Sanitised results are also \
+            kept in the client's ``result_cache``, if any, for up to \
+            ``cache_duration`` seconds, and are then read-only. (Refer to \
+            ``datagovsg.resultcache``.) Defaults to True.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising when that response value is a ``dict``. \
+            Defaults to [].
+        :type sanitise_ignore_keys: list[str]
+
+        :param sanitise_schema: The expected type of the response value. If \
+            set, then the response's values are sanitised using the \
+            ``sanitise_data_with_schema()`` method instead, and \
+            ``sanitise_ignore_keys`` is not used. Defaults to None.
+        :type sanitise_schema: Any
+
+        :param raw: If True, then the response's body is returned as-is, \
+            without decoding or sanitising it. The response is still checked \
+            for errors. Defaults to False.
+        :type raw: bool
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates. If set, then the response expires from the cache when \
+            the endpoint is next expected to update. (Refer to \
+            ``datagovsg.expiry``.) Defaults to None.
+        :type update_cadence: int or None
+
+        :raises APIError: The API reported an error.
+        :raises HTTPError: Error occurred during the request process.
+        :raises ConnectionError: The request could not connect, after every \
+            retry. (It is ``requests.ConnectionError``.)
+
+        :return: Results from the response, or its body if ``raw`` is True.
+        :rtype: Any
+        """
+        request = self.prepare_request(
+            url=url,
+            params=params,
+            cache_duration=cache_duration,
+            sanitise=sanitise,
+            sanitise_ignore_keys=sanitise_ignore_keys,
+            sanitise_schema=sanitise_schema,
+            raw=raw,
+            update_cadence=update_cadence,
+        )
+        if request.is_cached:
+            return request.result
+
+        response_value, ttl = await self.__collect_response_value(
+            **request.collect_kwargs,
+        )
+        return self.request_result(request, response_value, ttl)
+
+    @boundary_typechecked
+    async def fetch_many(
+        self,
+        calls: list[FetchCall],
+        max_workers: int=FETCH_MANY_MAX_WORKERS,
+    ) -> list[Any]:
+        """Call several of this client's methods concurrently.
+
+        The calls run as tasks in the running event loop, with at most \
+            ``max_workers`` of them waiting for a response at the same time.
+
+        If a call raises ``APIError`` or a ``requests`` \
+            ``RequestException``, e.g. ``HTTPError`` or ``ConnectionError``, \
+            then that error is returned in place of the call's result, and the \
+            other calls carry on. Any other error is raised straight away, \
+            once the other calls have been cancelled.
+
+        :param calls: Pairs of (method name, key-value arguments), e.g. \
+            ``('air_temperature', {'date': date(2026, 1, 12)})``.
+        :type calls: list[FetchCall]
+
+        :param max_workers: The most number of calls to run at the same time. \
+            Defaults to 8.
+        :type max_workers: int
+
+        :raises ValueError: ``max_workers`` is less than 1.
+        :raises AttributeError: A method name is not a method of this client.
+
+        :return: The result or the error of each call, in the order of \
+            ``calls``.
+        :rtype: list[Any]
+        """
+        methods = self.bind_calls(calls, max_workers)
+        semaphore = Semaphore(max_workers)
+
+        async def fetch(method: Any, kwargs: dict[str, Any]) -> Any:
+            async with semaphore:
+                try:
+                    return await method(**kwargs)
+                except (APIError, RequestException) as error:
+                    return error
+
+        tasks = [create_task(fetch(method, kwargs)) for method, kwargs in methods]
+        try:
+            return list(await gather(*tasks))
+        except BaseException:
+            # Do not leave the other calls running after fetch_many() returns
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+            raise
+
+    @internal_typechecked
+    def pool_stats(self) -> PoolStatsDict:
+        """Count the connections opened and reused by this client's session.
+
+        :return: Connection pool statistics.
+        :rtype: PoolStatsDict
+        """
+        return PoolStatsDict(**self.__pool_stats)
+
+# private
+
+    @internal_typechecked
+    async def __collect_response_value(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        raw: bool=False,
+        update_cadence: int | None=None,
+    ) -> tuple[Any, float]:
+        """Collect response value from an endpoint.
+
+        The cache is read first, so that a cached response is returned \
+            without waiting for the rate limiter. Otherwise, every try waits \
+            for its rate limiter first. (Refer to ``datagovsg.ratelimit``.) \
+            Connection errors and responses with a status code in \
+            ``RETRY_STATUS_FORCELIST`` are retried with exponential backoff.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param raw: If True, then return the response's body instead of its \
+            decoded JSON value. Defaults to False.
+        :type raw: bool
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates, or None. Defaults to None.
+        :type update_cadence: int or None
+
+        :raises APIError: The API reported an error.
+        :raises HTTPError: Error occurred during the request process.
+        :raises ConnectionError: The request could not connect, after every \
+            retry. (It is ``requests.ConnectionError``.)
+
+        :return: Results from the response, or its body if ``raw`` is True, \
+            and the number of seconds until the response expires from the \
+            cache.
+        :rtype: tuple[Any, float]
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if self.session is None:
+            self.session = self.__create_session()
+
+        if cache_duration > 0:
+            # Expired responses are deleted, and not returned
+            cached_response = await self.cache.get_response(
+                self.cache.create_key('GET', url, params=params),
+            )
+            if cached_response is not None:
+                return await self.__value_and_ttl(
+                    url,
+                    params,
+                    cached_response,
+                    cache_duration,
+                    raw,
+                    update_cadence,
+                )
+
+        rate_limiter = get_rate_limiter(
+            url,
+            api_key=self.headers.get('x-api-key'),
+        )
+
+        retry = 0
+        while True:
+            is_last_try = retry == RETRY_TOTAL
+            if rate_limiter is not None:
+                delay = rate_limiter.reserve()
+                if delay > 0:
+                    await sleep(delay)
+            try:
+                async with self.session.get(
+                    url,
+                    params=params,
+                    expire_after=cache_duration,
+                ) as response:
+                    # e.g. an identical request was cached while this one
+                    # waited
+                    if rate_limiter is not None and response.from_cache:
+                        rate_limiter.refund()
+                    if response.status not in RETRY_STATUS_FORCELIST \
+                        or is_last_try:
+                        return await self.__value_and_ttl(
+                            url,
+                            params,
+                            response,
+                            cache_duration,
+                            raw,
+                            update_cadence,
+                        )
+            except ClientConnectionError as error:
+                # Raise the same errors as the synchronous clients
+                if is_last_try:
+                    raise RequestsConnectionError(str(error)) from error
+
+            await sleep(RETRY_BACKOFF_FACTOR * (2 ** retry))
+            retry += 1
+
+    @internal_typechecked
+    async def __value_and_ttl(
+        self,
+        url: Url,
+        params: dict,
+        response: ClientResponse | CachedResponse,
+        cache_duration: int,
+        raw: bool,
+        update_cadence: int | None,
+    ) -> tuple[Any, float]:
+        """Get the value of a response, and the number of seconds until it \
+            expires from the cache.
+
+        :param url: The endpoint URL that the request was sent to.
+        :type url: Url
+
+        :param params: List of parameters that were passed to the endpoint URL.
+        :type params: dict
+
+        :param response: The response, which may be from the cache.
+        :type response: ClientResponse or CachedResponse
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param raw: If True, then return the response's body instead of its \
+            decoded JSON value.
+        :type raw: bool
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates, or None.
+        :type update_cadence: int or None
+
+        :raises APIError: The API reported an error.
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: Results from the response, or its body if ``raw`` is True, \
+            and the number of seconds until the response expires from the \
+            cache.
+        :rtype: tuple[Any, float]
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        ttl = seconds_until_expiry(
+            getattr(response, 'expires', None),
+            cache_duration,
+        )
+        response_value = await _response_value(
+            response,
+            self.decode_json,
+            raw=raw,
+        )
+        if update_cadence is not None and not raw and cache_duration > 0:
+            ttl = await self.__expire_at_next_update(
+                url,
+                params,
+                response,
+                response_value,
+                ttl,
+                cache_duration,
+                update_cadence,
+            )
+        return response_value, ttl
+
+    @internal_typechecked
+    async def __expire_at_next_update(
+        self,
+        url: Url,
+        params: dict,
+        response: ClientResponse | CachedResponse,
+        response_value: Any,
+        ttl: float,
+        cache_duration: int,
+        update_cadence: int,
+    ) -> float:
+        """Move the expiry of a stored response to when its endpoint is next \
+            expected to update, if that is sooner.
+
+        :param url: The endpoint URL that the request was sent to.
+        :type url: Url
+
+        :param params: List of parameters that were passed to the endpoint URL.
+        :type params: dict
+
+        :param response: The response.
+        :type response: ClientResponse or CachedResponse
+
+        :param response_value: The response's JSON value.
+        :type response_value: Any
+
+        :param ttl: Number of seconds until the response expires from the \
+            cache.
+        :type ttl: float
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates.
+        :type update_cadence: int
+
+        :return: The number of seconds until the response expires from the \
+            cache.
+        :rtype: float
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        update_ttl = seconds_until_next_update(
+            find_update_time(response_value),
+            update_cadence,
+            cache_duration,
+        )
+        if update_ttl < ttl and not response.from_cache:
+            # Fresh responses are stored with an expiry of cache_duration
+            expires = datetime.now(timezone.utc).replace(tzinfo=None) \
+                + timedelta(seconds=update_ttl)
+            await self.cache.save_response(
+                response,
+                cache_key=self.cache.create_key('GET', url, params=params),
+                expires=expires,
+            )
+        return min(ttl, update_ttl)
+
+    def __create_session(self) -> CachedSession:
+        """Create the HTTP session in the running event loop.
+
+        :return: The session.
+        :rtype: CachedSession
+        """
+        async def on_connection_create_end(*_args: Any) -> None:
+            self.__pool_stats['connections_opened'] += 1
+
+        async def on_connection_reuseconn(*_args: Any) -> None:
+            self.__pool_stats['connections_reused'] += 1
+
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+
+        return CachedSession(
+            cache=self.cache,
+            connector=TCPConnector(limit_per_host=self.pool_maxsize or 0),
+            headers=self.headers,
+            trace_configs=[trace_config],
+        )
+
+# private
+
+def _create_cache(cache_backend: str | CacheBackend) -> CacheBackend:
+    """Create the cache backend for a session.
+
+    :param cache_backend: Cache backend name or instance.
+    :type cache_backend: str or CacheBackend
+
+    :raises ValueError: ``cache_backend`` is not an allowed name.
+
+    :return: The cache backend.
+    :rtype: CacheBackend
+    """
+    if isinstance(cache_backend, CacheBackend):
+        return cache_backend
+    if cache_backend == CACHE_BACKEND_SQLITE:
+        return SQLiteBackend(AIO_CACHE_NAME)
+    if cache_backend == CACHE_BACKEND_FILESYSTEM:
+        return FileBackend(AIO_CACHE_NAME)
+    if cache_backend == CACHE_BACKEND_MEMORY:
+        return CacheBackend(AIO_CACHE_NAME)
+    raise ValueError(INVALID_CACHE_BACKEND_ERROR_MESSAGE)
+
+async def _response_value(
+    response: ClientResponse | CachedResponse,
+    decode_json: JsonDecoder,
+    raw: bool=False,
+) -> Any:
+    """Get the value of a response, after checking it for errors.
+
+    :param response: The response.
+    :type response: ClientResponse or CachedResponse
+
+    :param decode_json: Decoder of the response's JSON body.
+    :type decode_json: JsonDecoder
+
+    :param raw: If True, then return the response's body instead of its \
+        decoded JSON value. Defaults to False.
+    :type raw: bool
+
+    :raises APIError: The API reported an error.
+    :raises HTTPError: Error occurred during the request process.
+
+    :return: Results from the response, or its body if ``raw`` is True.
+    :rtype: Any
+    """
+    content = await response.read()
+
+    response_json = {}
+    if raw:
+        response_json = decode_error_json(
+            response.status,
+            content,
+            decode_json,
+        )
+    elif content.strip():
+        try:
+            response_json = decode_json(content)
+        except ValueError:
+            pass
+    if response_json is None:
+        response_json = {}
+
+    response_value = DataGovSg.check_response_value(
+        response.status,
+        response_json,
+        raise_for_status=lambda: _requests_response(
+            response,
+            content,
+        ).raise_for_status(),
+    )
+
+    return content if raw else response_value
+
+def _requests_response(
+    response: ClientResponse | CachedResponse,
+    content: bytes,
+) -> Response:
+    """Copy a response into a ``requests`` response, so that errors about it \
+        have the same ``response`` as errors of the synchronous clients.
+
+    :param response: The response.
+    :type response: ClientResponse or CachedResponse
+
+    :param content: The response's body.
+    :type content: bytes
+
+    :return: The ``requests`` response.
+    :rtype: Response
+    """
+    requests_response = Response()
+    requests_response.status_code = response.status
+    requests_response.reason = response.reason or ''
+    requests_response.url = str(response.url)
+    requests_response.headers = CaseInsensitiveDict(response.headers)
+    # The body has already been read, so it is set instead of being streamed
+    requests_response._content = content # pylint: disable=protected-access
+    return requests_response
+
+__all__ = [
+    'DataGovSg',
+]
@@ -0,0 +1,106 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous client for interacting with the Economy APIs."""
+
+from typing import Unpack
+
+from ..validation import boundary_typechecked
+
+from ..economy.endpoints import (
+    designs_request,
+    patents_request,
+    trademarks_request,
+)
+from ..economy.types_args import EconomyArgsDict
+from ..economy.types import EconomyDict
+
+from .datagovsg import DataGovSg
+
+class Client(DataGovSg):
+    """Interact with the economy-related endpoints asynchronously.
+
+    Reference: \
+        https://data.gov.sg/datasets?formats=API&topics=economy
+    """
+
+    @boundary_typechecked
+    async def designs(self, **kwargs: Unpack[EconomyArgsDict]) -> EconomyDict:
+        """Get design applications lodged with IPOS in Singapore.
+
+        Updated daily from IPOS.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EconomyArgsDict
+
+        :raises ValueError: ``lodgement_date`` argument is not between 1 \
+            August 2018 and 31 October 2020 (start and end dates inclusive).
+
+        :return: Design application information. (Cached for 12 hours.)
+        :rtype: EconomyDict
+        """
+        designs: EconomyDict
+
+        designs = await self.send_request(**designs_request(self, kwargs))
+
+        return designs
+
+    @boundary_typechecked
+    async def patents(self, **kwargs: Unpack[EconomyArgsDict]) -> EconomyDict:
+        """Get patent applications lodged with IPOS in Singapore.
+
+        Updated daily from IPOS.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EconomyArgsDict
+
+        :raises ValueError: ``lodgement_date`` argument is not between 1 \
+            August 2018 and 31 October 2020 (start and end dates inclusive).
+
+        :return: Patent application information. (Cached for 12 hours.)
+        :rtype: EconomyDict
+        """
+        patents: EconomyDict
+
+        patents = await self.send_request(**patents_request(self, kwargs))
+
+        return patents
+
+    @boundary_typechecked
+    async def trademarks(self, **kwargs: Unpack[EconomyArgsDict]) -> EconomyDict:
+        """Get trademark applications lodged with IPOS in Singapore.
+
+        Updated daily from IPOS.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EconomyArgsDict
+
+        :raises ValueError: ``lodgement_date`` argument is not between 1 \
+            August 2018 and 31 October 2020 (start and end dates inclusive).
+
+        :return: Trademark application information. (Cached for 12 hours.)
+        :rtype: EconomyDict
+        """
+        trademarks: EconomyDict
+
+        trademarks = await self.send_request(**trademarks_request(self, kwargs))
+
+        return trademarks
+
+__all__ = [
+    'Client',
+]
@@ -0,0 +1,564 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous client for interacting with the Environment APIs."""
+
+from typing import Any, AsyncIterator, Unpack
+
+from ..validation import boundary_typechecked
+
+from ..environment.endpoints import (
+    EndpointDict,
+    build_request,
+    page_request,
+    page_result,
+    air_temperature_request,
+    flood_alerts_request,
+    four_day_weather_forecast_request,
+    lightning_request,
+    pm25_request,
+    psi_request,
+    rainfall_request,
+    relative_humidity_request,
+    twenty_four_hour_weather_forecast_request,
+    two_hour_weather_forecast_request,
+    uv_index_request,
+    wbgt_request,
+    wind_direction_request,
+    wind_speed_request,
+)
+from ..environment.pagination import (
+    MetadataIndex,
+    merge_page,
+    next_page_params,
+    page_readings,
+)
+from ..environment.types_args import (
+    EnvironmentArgsDict,
+    EnvironmentMethod,
+    WeatherArgsDict,
+)
+from ..environment.types import (
+    EnvironmentReadingDict,
+    PM25Dict,
+    PSIDict,
+    UVIndexDict,
+    WeatherDict,
+    WeatherForecastTwoHourDict,
+    WeatherForecastTwentyFourHourDict,
+    WeatherForecastFourDayDict,
+)
+
+from .datagovsg import DataGovSg
+
+class Client(DataGovSg):
+    """Interact with the environment-related endpoints asynchronously.
+
+    Reference: \
+        https://data.gov.sg/datasets?formats=API&topics=environment
+    """
+
+    @boundary_typechecked
+    async def air_temperature(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> EnvironmentReadingDict:
+        """Get air temperature readings across Singapore.
+
+        Has per-minute readings from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 May 2016 \
+            12:00am (inclusive).
+
+        :return: Air Temperature Information. (Cached until the next \
+            update, for up to 1 minute.)
+        :rtype: EnvironmentReadingDict
+        """
+        air_temperature: EnvironmentReadingDict
+
+        air_temperature = await self.__collect_environment_data(
+            *air_temperature_request(self, kwargs),
+        )
+
+        return air_temperature
+
+    @boundary_typechecked
+    async def flood_alerts(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict]
+    ) -> WeatherDict:
+        """Get flood alert information across Singapore.
+
+        Update frequency is not specified, so defaults to half hourly.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :return: Flood alert Information. (Cached for 30 minutse.)
+        :rtype: WeatherDict
+        """
+        flood_alerts: WeatherDict
+
+        flood_alerts = await self.__collect_environment_data(
+            *flood_alerts_request(self, kwargs),
+        )
+
+        return flood_alerts
+
+    @boundary_typechecked
+    async def lightning(self, **kwargs: Unpack[WeatherArgsDict]) -> WeatherDict:
+        """Retrieve the latest lightning observation.
+
+        Update frequency is not specified, so defaults to half hourly.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: WeatherArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 February 2025 \
+            12:00am (inclusive).
+
+        :return: Lightning Information. (Cached for 30 minutse.)
+        :rtype: WeatherDict
+        """
+        lightning: WeatherDict
+
+        lightning = await self.__collect_environment_data(
+            *lightning_request(self, kwargs),
+        )
+
+        return lightning
+
+    @boundary_typechecked
+    async def pm25(self, **kwargs: Unpack[EnvironmentArgsDict]) -> PM25Dict:
+        """Retrieve the latest PM2.5 information in Singapore.
+
+        Updated hourly from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 February 2016 \
+            12:00am (inclusive).
+
+        :return: PM 2.5 Information. (Cached until the next update, for \
+            up to 1 hour.)
+        :rtype: PM25Dict
+        """
+        pm25: PM25Dict
+
+        pm25 = await self.__collect_environment_data(
+            *pm25_request(self, kwargs),
+        )
+
+        return pm25
+
+    @boundary_typechecked
+    async def psi(self, **kwargs: Unpack[EnvironmentArgsDict]) -> PSIDict:
+        """Retrieve the latest PSI information in Singapore.
+
+        Updated hourly from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 February 2016 \
+            12:00am (inclusive).
+
+        :return: PSI Information. (Cached until the next update, for up \
+            to 1 hour.)
+        :rtype: PSIDict
+        """
+        psi: PSIDict
+
+        psi = await self.__collect_environment_data(
+            *psi_request(self, kwargs),
+        )
+
+        return psi
+
+    @boundary_typechecked
+    async def rainfall(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> EnvironmentReadingDict:
+        """Get rainfall readings across Singapore.
+
+        5-minute readings from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 December 2016 \
+            12:00am (inclusive).
+
+        :return: Rainfall Information. (Cached until the next update, for \
+            up to 5 minutes.)
+        :rtype: EnvironmentReadingDict
+        """
+        rainfall: EnvironmentReadingDict
+
+        rainfall = await self.__collect_environment_data(
+            *rainfall_request(self, kwargs),
+        )
+
+        return rainfall
+
+    @boundary_typechecked
+    async def relative_humidity(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> EnvironmentReadingDict:
+        """Get relative humidity readings.
+
+        Has per-minute readings from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 November 2016 \
+            12:00am (inclusive).
+
+        :return: Relative Humidity Information. (Cached until the next \
+            update, for up to 1 minute.)
+        :rtype: EnvironmentReadingDict
+        """
+        relative_humidity: EnvironmentReadingDict
+
+        relative_humidity = await self.__collect_environment_data(
+            *relative_humidity_request(self, kwargs),
+        )
+
+        return relative_humidity
+
+    @boundary_typechecked
+    async def uv_index(self, **kwargs: Unpack[EnvironmentArgsDict]) -> UVIndexDict:
+        """Retrieve the latest UV index information in Singapore.
+
+        Updated every hour between 7 AM and 7 PM everyday. The UV index value \
+            is averaged over the preceding hour.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 March 2016 \
+            12:00am (inclusive).
+
+        :return: UV Index Information. (Cached until the next update, \
+            for up to 1 hour.)
+        :rtype: UVIndexDict
+        """
+        uv_index: UVIndexDict
+
+        uv_index = await self.__collect_environment_data(
+            *uv_index_request(self, kwargs),
+        )
+
+        return uv_index
+
+    @boundary_typechecked
+    async def wbgt(self, **kwargs: Unpack[WeatherArgsDict]) -> WeatherDict:
+        """Retrieve the latest WBGT data for accurate heat stress assessment.
+
+        Update frequency is not specified, so defaults to half hourly.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: WeatherArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 February 2025 \
+            12:00am (inclusive).
+
+        :return: Wet Bulb Globe Temperature Information. (Cached for 30 \
+            minutse.)
+        :rtype: WeatherDict
+        """
+        wbgt: WeatherDict
+
+        wbgt = await self.__collect_environment_data(
+            *wbgt_request(self, kwargs),
+        )
+
+        return wbgt
+
+    @boundary_typechecked
+    async def two_hour_weather_forecast(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> WeatherForecastTwoHourDict:
+        """Retrieve the latest two hour weather forecast.
+
+        Updated half-hourly from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 March 2016 \
+            12:00am (inclusive).
+
+        :return: 2 Hour Weather Forecast. (Cached until the next update, \
+            for up to 30 minutes.)
+        :rtype: WeatherForecastTwoHourDict
+        """
+        two_hour_weather_forecast: WeatherForecastTwoHourDict
+
+        two_hour_weather_forecast = await self.__collect_environment_data(
+            *two_hour_weather_forecast_request(self, kwargs),
+        )
+
+        return two_hour_weather_forecast
+
+    @boundary_typechecked
+    async def twenty_four_hour_weather_forecast(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> WeatherForecastTwentyFourHourDict:
+        """Retrieve the latest 24 hour weather forecast.
+
+        Updated multiple times throughout the day.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 March 2016 \
+            12:00am (inclusive).
+
+        :return: 24 Hour Weather Forecast. (Cached for 1 hour.)
+        :rtype: WeatherForecastTwentyFourHourDict
+        """
+        twenty_four_hour_weather_forecast: WeatherForecastTwentyFourHourDict
+
+        twenty_four_hour_weather_forecast = await self.__collect_environment_data(
+            *twenty_four_hour_weather_forecast_request(self, kwargs),
+        )
+
+        return twenty_four_hour_weather_forecast
+
+    @boundary_typechecked
+    async def four_day_weather_forecast(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> WeatherForecastFourDayDict:
+        """Retrieve the latest 4 day weather forecast.
+
+        Updated twice a day from NEA. The forecast is for the next 4 days.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 March 2016 \
+            12:00am (inclusive).
+
+        :return: 4 Day Weather Forecast. (Cached until the next update, \
+            for up to 12 hours.)
+        :rtype: WeatherForecastFourDayDict
+        """
+        four_day_weather_forecast: WeatherForecastFourDayDict
+
+        four_day_weather_forecast = await self.__collect_environment_data(
+            *four_day_weather_forecast_request(self, kwargs),
+        )
+
+        return four_day_weather_forecast
+
+    @boundary_typechecked
+    async def wind_direction(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> EnvironmentReadingDict:
+        """Get wind direction readings across Singapore.
+
+        Has per-minute readings from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 November 2016 \
+            12:00am (inclusive).
+
+        :return: Wind Direction Information. (Cached until the next \
+            update, for up to 1 minute.)
+        :rtype: EnvironmentReadingDict
+        """
+        wind_direction: EnvironmentReadingDict
+
+        wind_direction = await self.__collect_environment_data(
+            *wind_direction_request(self, kwargs),
+        )
+
+        return wind_direction
+
+    @boundary_typechecked
+    async def wind_speed(
+        self,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> EnvironmentReadingDict:
+        """Get wind speed readings across Singapore.
+
+        Has per-minute readings from NEA.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``date`` argument is before 1 December 2016 \
+            12:00am (inclusive).
+
+        :return: Wind Speed Information. (Cached until the next update, \
+            for up to 1 minute.)
+        :rtype: EnvironmentReadingDict
+        """
+        wind_speed: EnvironmentReadingDict
+
+        wind_speed = await self.__collect_environment_data(
+            *wind_speed_request(self, kwargs),
+        )
+
+        return wind_speed
+
+    @boundary_typechecked
+    def iter_pages(
+        self,
+        method: EnvironmentMethod,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> AsyncIterator[Any]:
+        """Get the pages of a method's data one at a time, instead of all of \
+            the pages compiled into one big list.
+
+        Each page is requested only when the previous page has been used, so \
+            memory use does not grow with the number of pages. Each page is \
+            the method's return type for that page alone, e.g. its \
+            ``stations`` are those of that page only.
+
+        .. code-block:: python
+
+            async with Environment() as environment:
+                async for page in environment.iter_pages('rainfall', date=date(2026, 1, 12)):
+                    print(len(page['readings']))
+
+        :param method: Name of the method, e.g. "air_temperature".
+        :type method: EnvironmentMethod
+
+        :param kwargs: Key-value arguments of the method.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``method`` is not a method of this client, or the \
+            method's ``date`` argument is out of range.
+
+        :return: Asynchronous iterator of the data of each page.
+        :rtype: AsyncIterator[Any]
+        """
+        endpoint, params = build_request(self, method, kwargs)
+        return self.__iter_environment_pages(endpoint, params)
+
+    @boundary_typechecked
+    def iter_readings(
+        self,
+        method: EnvironmentMethod,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> AsyncIterator[Any]:
+        """Get a method's readings one at a time, across all of its pages.
+
+        The readings are the ``items``, ``readings`` or ``records`` of each \
+            page, whichever the method returns. Pages are requested as in \
+            ``iter_pages()``.
+
+        :param method: Name of the method, e.g. "air_temperature".
+        :type method: EnvironmentMethod
+
+        :param kwargs: Key-value arguments of the method.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``method`` is not a method of this client, or the \
+            method's ``date`` argument is out of range.
+
+        :return: Asynchronous iterator of the readings.
+        :rtype: AsyncIterator[Any]
+        """
+        pages = self.iter_pages(method, **kwargs)
+        return (reading async for page in pages for reading in page_readings(page))
+
+    # private
+
+    async def __iter_environment_pages(
+        self,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        """Get the pages of environment data from an endpoint, one at a time.
+
+        :param endpoint: The endpoint to send the requests to.
+        :type endpoint: EndpointDict
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :return: Asynchronous iterator of the data of each page.
+        :rtype: AsyncIterator[Any]
+        """
+        while True:
+            response = await self.send_request(**page_request(endpoint, params))
+            data, pagination_token = page_result(self, endpoint, response)
+            yield data
+            if pagination_token is None:
+                return
+
+            # Collect the next page of data
+            params = next_page_params(params, pagination_token)
+
+    async def __collect_environment_data(
+        self,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
+    ) -> Any:
+        """Get environment data from an endpoint.
+
+        If there are pages of data, then compile all of those pages into one \
+            big list.
+
+        :param endpoint: The endpoint to send the requests to.
+        :type endpoint: EndpointDict
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :return: data from the endpoint, compiling all pages of readings.
+        :rtype: Any (but really a dict)
+        """
+        pages = self.__iter_environment_pages(endpoint, params)
+
+        data = await anext(pages)
+        index: MetadataIndex = {}
+        async for page_data in pages:
+            merge_page(data, page_data, index)
+
+        return data
+
+__all__ = [
+    'Client',
+]
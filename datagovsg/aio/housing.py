@@ -0,0 +1,118 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous client for interacting with the Housing APIs."""
+
+from typing import Unpack
+
+from ..lazy import LazySequence
+from ..validation import boundary_typechecked
+
+from ..housing.endpoints import (
+    carpark_availability_columns_request,
+    carpark_availability_request,
+    carpark_availability_result,
+)
+from ..housing.columns import carpark_availability_columns
+from ..housing.types_args import HousingArgsDict
+from ..housing.types import (
+    CarparkAvailabilityColumnsDict,
+    CarparkAvailabilityItemDict,
+)
+
+from .datagovsg import DataGovSg
+
+class Client(DataGovSg):
+    """Interact with the housing-related endpoints asynchronously.
+
+    Reference: \
+        https://data.gov.sg/datasets?formats=API&topics=housing
+    """
+
+    @boundary_typechecked
+    async def carpark_availability(
+        self,
+        **kwargs: Unpack[HousingArgsDict],
+    ) -> list[CarparkAvailabilityItemDict] | LazySequence:
+        """Get the latest carpark availability in Singapore.
+
+        Retrieved every minute.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: HousingArgsDict
+
+        :raises ValueError: ``date_time`` argument is before 1 January 2018 \
+            12:00am (inclusive).
+
+        :return: Available carpark spaces, as a read-only proxy if the client \
+            is lazy. (Cached until the next update, for up to 1 minute.)
+        :rtype: list[CarparkAvailabilityItemDict] or LazySequence
+        """
+        carpark_availability: list[CarparkAvailabilityItemDict] | LazySequence
+
+        data = await self.send_request(
+            **carpark_availability_request(self, kwargs),
+        )
+
+        carpark_availability = carpark_availability_result(self, data)
+
+        return carpark_availability
+
+    @boundary_typechecked
+    async def carpark_availability_columns(
+        self,
+        **kwargs: Unpack[HousingArgsDict],
+    ) -> CarparkAvailabilityColumnsDict:
+        """Get the latest carpark availability in Singapore, as columns of \
+            NumPy arrays with one row per carpark and lot type.
+
+        The columns are built from the response without sanitising it, and \
+            take much less memory than ``carpark_availability()``. E.g. the \
+            occupancy of every carpark lot in Singapore is:
+
+        .. code-block:: python
+
+            import numpy
+            columns = housing.carpark_availability_columns()
+            total_lots = columns['total_lots']
+            total_lots = numpy.where(total_lots > 0, total_lots, numpy.nan)
+            occupancy = 1 - columns['lots_available'] / total_lots
+
+        Counts that are missing or cannot be read are NaN, so the occupancy \
+            of those carparks, and of carparks without lots, is NaN.
+
+        Requires ``numpy``, e.g. with the ``numpy`` extra.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: HousingArgsDict
+
+        :raises ValueError: ``date_time`` argument is before 1 January 2018 \
+            12:00am (inclusive).
+        :raises ImportError: ``numpy`` is not installed.
+
+        :return: Available carpark spaces. (Cached until the next update, \
+            for up to 1 minute.)
+        :rtype: CarparkAvailabilityColumnsDict
+        """
+        data = await self.send_request(
+            **carpark_availability_columns_request(self, kwargs),
+        )
+
+        return carpark_availability_columns(data.get('items', []))
+
+__all__ = [
+    'Client',
+]
@@ -0,0 +1,137 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous client for interacting with the Transport APIs."""
+
+from typing import Unpack
+
+from ..lazy import LazySequence
+from ..validation import boundary_typechecked
+
+from ..transport.endpoints import (
+    taxi_availability_array_request,
+    taxi_availability_array_result,
+    taxi_availability_request,
+    traffic_images_request,
+    traffic_images_result,
+)
+from ..transport.types_args import TransportArgsDict
+from ..transport.types import (
+    TaxiAvailabilityArrayDict,
+    TaxiAvailabilityDict,
+    TrafficImagesItemDict,
+)
+
+from .datagovsg import DataGovSg
+
+class Client(DataGovSg):
+    """Interact with the transport-related endpoints asynchronously.
+
+    Reference: \
+        https://data.gov.sg/datasets?formats=API&topics=transport
+    """
+
+    @boundary_typechecked
+    async def taxi_availability(
+        self,
+        **kwargs: Unpack[TransportArgsDict],
+    ) -> TaxiAvailabilityDict:
+        """Get locations of available taxis in Singapore.
+
+        Retrieved every 30 seconds from LTA's Datamall.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: TransportArgsDict
+
+        :return: GeoJSON of the taxi availabilities. (Cached until the next \
+            update, for up to 30 seconds.)
+        :rtype: TaxiAvailabilityDict
+        """
+        taxi_availability: TaxiAvailabilityDict
+
+        taxi_availability = await self.send_request(
+            **taxi_availability_request(self, kwargs),
+        )
+
+        return taxi_availability
+
+    @boundary_typechecked
+    async def taxi_availability_array(
+        self,
+        **kwargs: Unpack[TransportArgsDict],
+    ) -> TaxiAvailabilityArrayDict:
+        """Get locations of available taxis in Singapore, with the \
+            coordinates of each feature as a NumPy array of ``float64`` with \
+            shape (N, 2).
+
+        The coordinates are parsed straight from the response into the \
+            array, which takes much less time and memory than the lists of \
+            ``taxi_availability()``. E.g. the taxis in a bounding box are:
+
+        .. code-block:: python
+
+            data = transport.taxi_availability_array()
+            positions = data['features'][0]['geometry']['coordinates']
+            longitudes, latitudes = positions[:, 0], positions[:, 1]
+            in_box = (latitudes > 1.28) & (latitudes < 1.3)
+            in_box &= (longitudes > 103.84) & (longitudes < 103.86)
+
+        Requires ``numpy``, e.g. with the ``numpy`` extra.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: TransportArgsDict
+
+        :raises ImportError: ``numpy`` is not installed.
+        :raises ValueError: A position does not have 2 numbers.
+
+        :return: GeoJSON of the taxi availabilities. (Cached for 30 seconds.)
+        :rtype: TaxiAvailabilityArrayDict
+        """
+        content = await self.send_request(
+            **taxi_availability_array_request(self, kwargs),
+        )
+
+        return taxi_availability_array_result(self, content)
+
+    @boundary_typechecked
+    async def traffic_images(
+        self,
+        **kwargs: Unpack[TransportArgsDict],
+    ) -> list[TrafficImagesItemDict] | LazySequence:
+        """Get the latest images from traffic cameras all around Singapore.
+
+        Retrieved every 20 seconds from LTA's Datamall. But it is recommended \
+            to retrieve the data every minute.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: TransportArgsDict
+
+        :return: Images from traffic cameras, as a read-only proxy if the \
+            client is lazy. (Cached for 1 minute.)
+        :rtype: list[TrafficImagesItemDict] or LazySequence
+        """
+        traffic_images: list[TrafficImagesItemDict] | LazySequence
+
+        data = await self.send_request(**traffic_images_request(self, kwargs))
+
+        traffic_images = traffic_images_result(self, data)
+
+        return traffic_images
+
+__all__ = [
+    'Client',
+]
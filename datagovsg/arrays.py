@@ -0,0 +1,212 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Convert the values of responses into NumPy arrays.
+
+The methods that return arrays need ``numpy``, which is installed with the \
+    ``numpy`` extra:
+
+.. code-block:: shell
+
+    python -m pip install datagovsg[numpy]
+
+Strings are converted once per distinct string, as responses repeat the same \
+    strings many times.
+"""
+
+from datetime import date, datetime
+from math import nan
+from types import ModuleType
+from typing import Any, Callable
+
+from .constants import (
+    INVALID_POSITIONS_ERROR_MESSAGE,
+    NUMPY_IMPORT_ERROR_MESSAGE,
+)
+from .timezone import datetime_from_string
+from .validation import internal_typechecked
+
+@internal_typechecked
+def import_numpy() -> ModuleType:
+    """Import ``numpy``.
+
+    :raises ImportError: ``numpy`` is not installed.
+
+    :return: The ``numpy`` module.
+    :rtype: ModuleType
+    """
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        import numpy
+    except ImportError as error:
+        raise ImportError(NUMPY_IMPORT_ERROR_MESSAGE) from error
+    return numpy
+
+@internal_typechecked
+def count_array(values: list[Any]) -> Any:
+    """Convert integers or integer strings into an array of ``float64``.
+
+    Values that are missing or cannot be converted are NaN, instead of an \
+        integer that looks valid, so that they stay missing in the results \
+        of arithmetic on the array.
+
+    :param values: Integers or integer strings.
+    :type values: list[Any]
+
+    :raises ImportError: ``numpy`` is not installed.
+
+    :return: The array. Values that cannot be converted are NaN.
+    :rtype: numpy.ndarray
+    """
+    numpy = import_numpy()
+    return _convert_distinct(numpy, values, _to_count, numpy.float64)
+
+@internal_typechecked
+def datetime64_array(values: list[Any]) -> Any:
+    """Convert date/time strings into an array of ``datetime64[s]`` in SGT.
+
+    ``datetime64`` has no timezone, so the values are the local date-times in \
+        SGT, as with ``datagovsg.timezone.datetime_from_string()``, e.g. \
+        "2025-01-12T15:59:00" is ``numpy.datetime64('2025-01-12T15:59:00')``.
+
+    :param values: Date/time strings.
+    :type values: list[Any]
+
+    :raises ImportError: ``numpy`` is not installed.
+
+    :return: The array. Values that cannot be converted are ``NaT``.
+    :rtype: numpy.ndarray
+    """
+    numpy = import_numpy()
+    return _convert_distinct(
+        numpy,
+        values,
+        _to_sgt_datetime,
+        'datetime64[s]',
+    )
+
+@internal_typechecked
+def position_array(positions: Any) -> Any:
+    """Convert positions into an array of ``float64`` with shape (N, 2).
+
+    :param positions: Positions, e.g. ``[[103.62403, 1.28675]]``.
+    :type positions: Any (but is really list[list[float]])
+
+    :raises ImportError: ``numpy`` is not installed.
+    :raises ValueError: A position does not have 2 numbers.
+
+    :return: The array.
+    :rtype: numpy.ndarray
+    """
+    numpy = import_numpy()
+    return numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 2)
+
+@internal_typechecked
+def position_array_from_json(content: bytes) -> Any:
+    """Parse a JSON array of positions straight into an array of ``float64`` \
+        with shape (N, 2), without building a list for every position.
+
+    :param content: The JSON array, e.g. ``b'[[103.62403,1.28675]]'``.
+    :type content: bytes
+
+    :raises ImportError: ``numpy`` is not installed.
+    :raises ValueError: ``content`` is not an array of positions with 2 \
+        numbers each.
+
+    :return: The array.
+    :rtype: numpy.ndarray
+    """
+    numpy = import_numpy()
+
+    # e.g. b'[[,],[,]]' for 2 positions, once the numbers are deleted
+    skeleton = content.translate(None, _BLANKS_AND_NUMBERS)
+    positions = skeleton.count(b'[') - 1
+    if skeleton != (b'[[,]' + b',[,]' * (positions - 1) + b']' \
+            if positions > 0 else b'[]'):
+        raise ValueError(INVALID_POSITIONS_ERROR_MESSAGE)
+
+    # Keep blanks, so that numbers with only blanks between them, e.g. "1 2",
+    # are not read as one number
+    text = content.translate(None, _BRACKETS).decode()
+    try:
+        values = numpy.fromstring(text, dtype=numpy.float64, sep=',') \
+            if positions > 0 else numpy.empty(0)
+    except ValueError as error:
+        raise ValueError(INVALID_POSITIONS_ERROR_MESSAGE) from error
+    if values.size != positions * 2:
+        raise ValueError(INVALID_POSITIONS_ERROR_MESSAGE)
+    return values.reshape(-1, 2)
+
+# private
+
+_BRACKETS = b'[]'
+_BLANKS_AND_NUMBERS = b' \t\r\n0123456789+-.eE'
+
+def _convert_distinct(
+    numpy: ModuleType,
+    values: list[Any],
+    convert: Callable[[str], Any],
+    dtype: Any,
+) -> Any:
+    """Convert each distinct value once, and spread the results into an array.
+
+    :param numpy: The ``numpy`` module.
+    :type numpy: ModuleType
+
+    :param values: Values to convert.
+    :type values: list[Any]
+
+    :param convert: Function that converts the string of a value.
+    :type convert: Callable[[str], Any]
+
+    :param dtype: Type of the array.
+    :type dtype: Any
+
+    :return: The array.
+    :rtype: numpy.ndarray
+    """
+    distinct, inverse = numpy.unique(
+        numpy.asarray(values, dtype=str),
+        return_inverse=True,
+    )
+    converted = numpy.array([convert(str(v)) for v in distinct], dtype=dtype)
+    return converted[inverse]
+
+def _to_count(value: str) -> float:
+    """Convert an integer string to a float, or NaN."""
+    try:
+        return float(int(value))
+    except ValueError:
+        return nan
+
+def _to_sgt_datetime(value: str) -> datetime | str:
+    """Convert a string to a naive datetime in SGT, or "NaT"."""
+    try:
+        dt = datetime_from_string(value)
+    except ValueError:
+        return 'NaT'
+
+    if isinstance(dt, datetime):
+        return dt.replace(tzinfo=None)
+    if isinstance(dt, date):
+        return datetime(dt.year, dt.month, dt.day)
+    return 'NaT'
+
+__all__ = [
+    'count_array',
+    'datetime64_array',
+    'import_numpy',
+    'position_array',
+    'position_array_from_json',
+]
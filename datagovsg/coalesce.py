@@ -0,0 +1,142 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Coalesce concurrent identical requests into one request.
+
+When many threads make the same request at the same time, e.g. right after \
+    its cached response expires, only the first of them sends it. The others \
+    wait for it to finish, and share its result, or have its exception \
+    raised too. This is shared by all of the clients in the process.
+
+Count the requests that were sent and coalesced with ``coalesce_stats()``:
+
+.. code-block:: python
+
+    from datagovsg.coalesce import coalesce_stats
+    stats = coalesce_stats()
+    print(f"{stats['coalesced']} of {stats['requests']} requests coalesced")
+"""
+
+from collections.abc import Callable, Hashable
+from threading import Event, Lock
+from typing import Any
+
+from .types import CoalesceStatsDict
+from .validation import internal_typechecked
+
+@internal_typechecked
+def coalesce(
+    key: Hashable,
+    fetch: Callable[[], Any],
+    share: Callable[[Any], Any] | None=None,
+) -> Any:
+    """Call a function, unless a call with the same key is already in \
+        flight, in which case wait for that call and share its outcome.
+
+    If the outcome is mutable, then pass ``share`` so that every caller that \
+        shared the call gets a copy of it, and none of them can change \
+        another's. A call that was not shared returns its outcome as is.
+
+    :param key: Key of the request, e.g. its URL and canonical parameters.
+    :type key: Hashable
+
+    :param fetch: Function that sends the request.
+    :type fetch: Callable[[], Any]
+
+    :param share: Function that copies the result of ``fetch`` for each \
+        caller, if the call was shared, or None to share the result itself.
+    :type share: Callable[[Any], Any] or None
+
+    :raises Exception: Whatever ``fetch`` raised, in every caller that \
+        shared the call.
+
+    :return: The result of ``fetch``.
+    :rtype: Any
+    """
+    with _calls_lock:
+        call = _calls.get(key)
+        leader = call is None
+        if call is None:
+            call = _calls[key] = _Call()
+        else:
+            call.shared = True
+            _stats['coalesced'] += 1
+        _stats['requests'] += 1
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result if share is None else share(call.result)
+
+    try:
+        call.result = fetch()
+    except BaseException as error:
+        call.error = error
+        raise
+    finally:
+        with _calls_lock:
+            del _calls[key]
+        call.done.set()
+    if call.shared and share is not None:
+        return share(call.result)
+    return call.result
+
+@internal_typechecked
+def coalesce_stats() -> CoalesceStatsDict:
+    """Count the requests that were made and coalesced, and the requests \
+        that are in flight.
+
+    :return: Coalescing statistics, since the process started or the last \
+        ``reset_coalesce_stats()``.
+    :rtype: CoalesceStatsDict
+    """
+    with _calls_lock:
+        return {**_stats, 'in_flight': len(_calls)}
+
+@internal_typechecked
+def reset_coalesce_stats() -> None:
+    """Set the counts of ``coalesce_stats()`` back to 0.
+
+    :return: None
+    """
+    with _calls_lock:
+        _stats['requests'] = 0
+        _stats['coalesced'] = 0
+
+# private
+
+class _Call:
+    """Outcome of a call that is in flight, for the callers waiting on it."""
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('done', 'result', 'error', 'shared')
+
+    def __init__(self) -> None:
+        """Constructor method"""
+        self.done = Event()
+        self.shared = False
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+_calls: dict[Hashable, _Call] = {}
+_calls_lock = Lock()
+_stats = {'requests': 0, 'coalesced': 0}
+
+__all__ = [
+    'coalesce',
+    'coalesce_stats',
+    'reset_coalesce_stats',
+]
@@ -22,6 +22,7 @@ BASE_V1_API_ENDPOINT = 'https://api.data.gov.sg/v1'
 BASE_V2_API_ENDPOINT = 'https://api-open.data.gov.sg/v2/real-time/api'
 
 CACHE_NAME = f'{NAME}_cache'
+AIO_CACHE_NAME = f'{NAME}_aio_cache'
 
 CACHE_THIRTY_SECONDS = 30
 CACHE_ONE_MINUTE = CACHE_THIRTY_SECONDS * 2
@@ -31,8 +32,80 @@ CACHE_ONE_HOUR = CACHE_ONE_MINUTE * 60
 CACHE_TWELVE_HOURS = CACHE_ONE_HOUR * 12
 CACHE_ONE_DAY = CACHE_ONE_HOUR * 24
 
+UPDATE_LATE_RETRY_SECONDS = 10
+UPDATE_TIMESTAMP_KEYS = ('update_timestamp', 'updatedTimestamp', 'timestamp')
+UPDATE_TIMESTAMP_MAX_DEPTH = 4
+
+JSON_DECODER_STDLIB = 'json'
+JSON_DECODER_ORJSON = 'orjson'
+JSON_DECODER_MSGSPEC = 'msgspec'
+JSON_DECODERS = (
+    JSON_DECODER_STDLIB,
+    JSON_DECODER_ORJSON,
+    JSON_DECODER_MSGSPEC,
+)
+
+BOUNDED_CACHE_BACKEND = 'bounded'
+BOUNDED_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+
+RATE_LIMIT_RATE = 5.0
+RATE_LIMIT_CAPACITY = 10
+
+RESULT_CACHE_MAX_ENTRIES = 256
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+SANITISE_CACHE_MAX_ENTRIES = 4096
+
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.1
+RETRY_STATUS_FORCELIST = (500, 502, 503, 504)
+
+EARTH_RADIUS_M = 6371008.8
+SINGAPORE_LATITUDE = 1.3521
+
+FETCH_MANY_MAX_WORKERS = 8
+INVALID_JSON_DECODER_ERROR_MESSAGE = \
+    f'json_decoder must be one of {", ".join(JSON_DECODERS)}.'
+INVALID_MAX_WORKERS_ERROR_MESSAGE = 'max_workers must be at least 1.'
+JSON_DECODER_IMPORT_ERROR_MESSAGE_FORMAT = 'json_decoder "{0}" requires ' \
+    '{0}. Install it with: pip install datagovsg[{0}]'
+NUMPY_IMPORT_ERROR_MESSAGE = 'Arrays require numpy. Install it with: ' \
+    'pip install datagovsg[numpy]'
+INVALID_NEAREST_COUNT_ERROR_MESSAGE = 'k must be at least 1.'
+INVALID_BOUNDED_CACHE_SIZE_ERROR_MESSAGE = 'max_bytes must be at least 1.'
+INVALID_POOL_SIZE_ERROR_MESSAGE = \
+    'pool_connections and pool_maxsize must be at least 1.'
+INVALID_POSITIONS_ERROR_MESSAGE = \
+    'content must be a JSON array of positions with 2 numbers each.'
+INVALID_RATE_LIMIT_ERROR_MESSAGE = \
+    'rate must be more than 0 and capacity must be at least 1.'
+INVALID_RESULT_CACHE_SIZE_ERROR_MESSAGE = \
+    'max_entries and max_bytes must be at least 1.'
+INVALID_SANITISE_CACHE_SIZE_ERROR_MESSAGE = \
+    'max_entries must be at least 0.'
+INVALID_STALE_WHILE_REVALIDATE_ERROR_MESSAGE = \
+    'stale_while_revalidate must be at least 0.'
+READ_ONLY_RESULT_ERROR_MESSAGE = 'Cached results are read-only. Copy them ' \
+    'first, e.g. with copy.deepcopy().'
+
 USER_AGENT = f'Data.gov.sg Python package/{VERSION} https://pypi.org/project/{NAME}'
 
+VALIDATION_LEVEL_ENVIRONMENT_VARIABLE = 'DATAGOVSG_VALIDATION_LEVEL'
+
+VALIDATION_LEVEL_FULL = 'full'
+VALIDATION_LEVEL_BOUNDARY = 'boundary'
+VALIDATION_LEVEL_OFF = 'off'
+VALIDATION_LEVELS = (
+    VALIDATION_LEVEL_OFF,
+    VALIDATION_LEVEL_BOUNDARY,
+    VALIDATION_LEVEL_FULL,
+)
+INVALID_VALIDATION_LEVEL_ERROR_MESSAGE = \
+    f'validation_level must be one of {", ".join(VALIDATION_LEVELS)}.'
+
 __all__ = [
     'NAME',
 
@@ -40,6 +113,7 @@ __all__ = [
     'BASE_V2_API_ENDPOINT',
 
     'CACHE_NAME',
+    'AIO_CACHE_NAME',
 
     'CACHE_THIRTY_SECONDS',
     'CACHE_ONE_MINUTE',
@@ -49,5 +123,58 @@ __all__ = [
     'CACHE_TWELVE_HOURS',
     'CACHE_ONE_DAY',
 
+    'UPDATE_LATE_RETRY_SECONDS',
+    'UPDATE_TIMESTAMP_KEYS',
+    'UPDATE_TIMESTAMP_MAX_DEPTH',
+
+    'JSON_DECODER_STDLIB',
+    'JSON_DECODER_ORJSON',
+    'JSON_DECODER_MSGSPEC',
+    'JSON_DECODERS',
+
+    'BOUNDED_CACHE_BACKEND',
+    'BOUNDED_CACHE_MAX_BYTES',
+
+    'POOL_CONNECTIONS',
+    'POOL_MAXSIZE',
+
+    'RATE_LIMIT_RATE',
+    'RATE_LIMIT_CAPACITY',
+
+    'RESULT_CACHE_MAX_ENTRIES',
+    'RESULT_CACHE_MAX_BYTES',
+
+    'SANITISE_CACHE_MAX_ENTRIES',
+
+    'RETRY_TOTAL',
+    'RETRY_BACKOFF_FACTOR',
+    'RETRY_STATUS_FORCELIST',
+
+    'EARTH_RADIUS_M',
+    'SINGAPORE_LATITUDE',
+
+    'FETCH_MANY_MAX_WORKERS',
+    'INVALID_JSON_DECODER_ERROR_MESSAGE',
+    'INVALID_MAX_WORKERS_ERROR_MESSAGE',
+    'JSON_DECODER_IMPORT_ERROR_MESSAGE_FORMAT',
+    'NUMPY_IMPORT_ERROR_MESSAGE',
+    'INVALID_NEAREST_COUNT_ERROR_MESSAGE',
+    'INVALID_BOUNDED_CACHE_SIZE_ERROR_MESSAGE',
+    'INVALID_POOL_SIZE_ERROR_MESSAGE',
+    'INVALID_POSITIONS_ERROR_MESSAGE',
+    'INVALID_RATE_LIMIT_ERROR_MESSAGE',
+    'INVALID_RESULT_CACHE_SIZE_ERROR_MESSAGE',
+    'INVALID_SANITISE_CACHE_SIZE_ERROR_MESSAGE',
+    'INVALID_STALE_WHILE_REVALIDATE_ERROR_MESSAGE',
+    'READ_ONLY_RESULT_ERROR_MESSAGE',
+
     'USER_AGENT',
+
+    'VALIDATION_LEVEL_ENVIRONMENT_VARIABLE',
+
+    'VALIDATION_LEVEL_FULL',
+    'VALIDATION_LEVEL_BOUNDARY',
+    'VALIDATION_LEVEL_OFF',
+    'VALIDATION_LEVELS',
+    'INVALID_VALIDATION_LEVEL_ERROR_MESSAGE',
 ]
@@ -14,23 +14,90 @@
 
 """Client mixin for interacting with all of the API endpoints."""
 
-from datetime import date, datetime
-from typing import Any
-
-from requests import codes as requests_codes
-from requests.adapters import HTTPAdapter, Retry
-from requests_cache import BaseCache, CachedSession
-from typeguard import check_type, typechecked, TypeCheckError
-
-from .constants import CACHE_NAME, USER_AGENT
+# pylint: disable=too-many-lines
+
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, NamedTuple
+
+from requests import (
+    Request,
+    RequestException,
+    codes as requests_codes,
+)
+from requests_cache import BaseCache
+from typeguard import check_type
+
+from .constants import (
+    FETCH_MANY_MAX_WORKERS,
+    INVALID_MAX_WORKERS_ERROR_MESSAGE,
+    INVALID_STALE_WHILE_REVALIDATE_ERROR_MESSAGE,
+    JSON_DECODER_STDLIB,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    USER_AGENT,
+)
+from .coalesce import coalesce
+from .decoders import decode_error_json, get_json_decoder
 from .exceptions import APIError
+from .expiry import find_update_time, seconds_until_next_update
+from .lazy import sanitise_lazily
+from .ratelimit import get_rate_limiter
+from .resultcache import (
+    copy_result,
+    freeze_result,
+    ResultCache,
+    result_key,
+    seconds_until_expiry,
+)
+from .revalidate import refresh_in_background, seconds_since
+from .sanitiser import compile_sanitiser, sanitise_string, sanitise_tree
+from .sessions import create_session, get_session, pool_stats
 from .timezone import (
     datetime_as_sgt,
-    datetime_from_string,
     datetime_to_string,
+    floor_datetime,
     is_datetime_between_range,
 )
-from .types import Url
+from .types import FetchCall, PoolStatsDict, Url
+from .validation import (
+    DEFAULT_VALIDATION_LEVEL,
+    boundary_typechecked,
+    check_validation_level,
+    internal_typechecked,
+)
+
+class PendingRequest(NamedTuple):
+    """Request of ``send_request()``, from ``DataGovSg.prepare_request()``."""
+
+    url: Url
+    params: dict
+    cache_duration: int
+    sanitise: bool
+    sanitise_ignore_keys: list[str]
+    sanitise_schema: Any
+    raw: bool
+    update_cadence: int | None
+    result_key: Hashable | None
+    """Key of the sanitised result in the client's ``result_cache``, or \
+        None if the result is not kept there."""
+    is_cached: bool = False
+    """Whether the sanitised result was found in the ``result_cache``."""
+    result: Any = None
+    """The sanitised result, if ``is_cached`` is True."""
+
+    @property
+    def collect_kwargs(self) -> dict[str, Any]:
+        """Key-value arguments to collect the response value with."""
+        return {
+            'url': self.url,
+            'params': self.params,
+            'cache_duration': self.cache_duration,
+            'raw': self.raw,
+            'update_cadence': self.update_cadence,
+        }
 
 class DataGovSg:
     """Client mixin for other API Clients.
@@ -42,7 +109,10 @@ class DataGovSg:
 
     - Connection retries using exponential backoff. \
         (Reference: https://stackoverflow.com/a/35504626.)
-    - Cache (cache duration/expiry is set in ``send_request()``).
+    - Connection pools, which are shared between clients by default. \
+        (Refer to ``datagovsg.sessions``.)
+    - Cache (cache duration/expiry is set in ``send_request()``, and may \
+        follow the endpoint's updates; refer to ``datagovsg.expiry``).
     - API key that can be used with api.data.gov.sg. \
         Create a key for api.data.gov.sg: \
         https://guide.data.gov.sg/developer-guide/api-overview/how-to-request-an-api-key.
@@ -53,45 +123,123 @@ class DataGovSg:
 
     :param cache_backend: Cache backend name or instance to use. Refer to \
         https://requests-cache.readthedocs.io/en/stable/user_guide/backends.html \
-        for more information and allowed values. Defaults to "sqlite".
+        for more information and allowed values. "bounded" keeps responses \
+        in memory within a limit on their size. (Refer to \
+        ``datagovsg.memorycache``.) Defaults to "sqlite".
     :type cache_backend: str or BaseCache
+
+    :param validation_level: Which of this client's methods are type-checked: \
+        "full" (all methods), "boundary" (only the public client methods) or \
+        "off" (none). Defaults to the ``DATAGOVSG_VALIDATION_LEVEL`` \
+        environment variable at import time, or "full" if that is not set.
+    :type validation_level: str or None
+
+    :param pool_connections: Number of hosts to keep a connection pool for. \
+        Defaults to 10.
+    :type pool_connections: int
+
+    :param pool_maxsize: Number of connections to keep open per host. Should \
+        be at least the number of threads that send requests at the same \
+        time, e.g. ``max_workers`` of ``fetch_many()``. Defaults to 10.
+    :type pool_maxsize: int
+
+    :param share_session: If True, then the session and its connection pools \
+        are shared with other clients that have the same API key, cache \
+        backend and pool sizes. Defaults to True.
+    :type share_session: bool
+
+    :param result_cache: In-memory cache of sanitised results, which is \
+        checked before the cache backend. It may be shared with other \
+        clients. The results of the Environment clients, and of lazy \
+        clients, are not kept, as they are sanitised after \
+        ``send_request()``. (Refer to ``datagovsg.resultcache``.) If None, \
+        then results are not kept in memory. Defaults to None.
+    :type result_cache: ResultCache or None
+
+    :param json_decoder: Decoder of the responses' JSON bodies: "json" (the \
+        standard library), "orjson" or "msgspec". The last two must be \
+        installed, e.g. with the ``orjson`` or ``msgspec`` extra. (Refer to \
+        ``datagovsg.decoders``.) Defaults to "json".
+    :type json_decoder: str
+
+    :param lazy: If True, then methods that return large responses return \
+        read-only proxies that sanitise values only when they are read. \
+        (Refer to ``datagovsg.lazy``.) Defaults to False.
+    :type lazy: bool
+
+    :param stale_while_revalidate: Most number of seconds that a response \
+        may have expired from the cache and still be returned straight away, \
+        while it is refreshed in a background thread. Only one refresh runs \
+        for a response at a time. (Refer to ``datagovsg.revalidate``.) If 0, \
+        then expired responses are always refreshed before they are \
+        returned. Defaults to 0.
+    :type stale_while_revalidate: int
+
+    :param on_stale: Function that is called whenever an expired response \
+        is returned, with the endpoint URL, the parameters and the number of \
+        seconds since the response was fetched. Defaults to None.
+    :type on_stale: Callable[[Url, dict, float], Any] or None
+
+    :raises ValueError: ``validation_level`` is not one of "full", \
+        "boundary" or "off", ``pool_connections`` or ``pool_maxsize`` is \
+        less than 1, ``json_decoder`` is not one of "json", "orjson" or \
+        "msgspec", or ``stale_while_revalidate`` is less than 0.
+    :raises ImportError: The package of ``json_decoder`` is not installed.
     """
 
-    @typechecked
+    # pylint: disable=too-many-instance-attributes
+
+    validation_level: str = DEFAULT_VALIDATION_LEVEL
+    result_cache: ResultCache | None = None
+    lazy: bool = False
+    stale_while_revalidate: int = 0
+    on_stale: Callable[[Url, dict, float], Any] | None = None
+
+    @boundary_typechecked
     def __init__(
         self,
         api_key: str | None=None,
         cache_backend: str | BaseCache='sqlite',
+        validation_level: str | None=None,
+        pool_connections: int=POOL_CONNECTIONS,
+        pool_maxsize: int=POOL_MAXSIZE,
+        share_session: bool=True,
+        result_cache: ResultCache | None=None,
+        json_decoder: str=JSON_DECODER_STDLIB,
+        lazy: bool=False,
+        stale_while_revalidate: int=0,
+        on_stale: Callable[[Url, dict, float], Any] | None=None,
     ) -> None:
         """Constructor method"""
-        headers = {
-            'Accept': 'application/json',
-            'User-Agent': USER_AGENT,
-        }
-        if api_key is not None:
-            headers['x-api-key'] = api_key
-
-        retries = Retry(
-            total=5,
-            backoff_factor=0.1,
-            status_forcelist=[500, 502, 503, 504]
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if validation_level is not None:
+            self.validation_level = check_validation_level(validation_level)
+
+        if stale_while_revalidate < 0:
+            raise ValueError(INVALID_STALE_WHILE_REVALIDATE_ERROR_MESSAGE)
+
+        self.result_cache = result_cache
+        self.decode_json = get_json_decoder(json_decoder)
+        self.json_decoder = json_decoder
+        self.lazy = lazy
+        self.stale_while_revalidate = stale_while_revalidate
+        self.on_stale = on_stale
+
+        session_factory = get_session if share_session else create_session
+        self.session = session_factory(
+            api_key=api_key,
+            cache_backend=cache_backend,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
         )
 
-        self.session = CachedSession(
-            CACHE_NAME,
-            backend=cache_backend,
-            stale_if_error=False,
-        )
-        self.session.mount('https://', HTTPAdapter(max_retries=retries))
-        self.session.headers.update(headers)
-
-    @typechecked
+    @internal_typechecked
     def __repr__(self) -> str:
         """String representation"""
         return f'{self.__class__} ({USER_AGENT})'
 
     @staticmethod
-    @typechecked
+    @internal_typechecked
     def validate_date(
         kwargs: Any,
         date_key: str,
@@ -137,18 +285,22 @@ class DataGovSg:
                 raise ValueError(error_message)
 
     @staticmethod
-    @typechecked
+    @internal_typechecked
     def build_params(
         params_expected_type: Any,
         original_params: Any,
         default_params: dict[str, Any] | None=None,
         key_map: dict[str, str] | None=None,
         remove_none_values: bool=True,
+        time_resolution: int | None=None,
     ) -> dict[str, Any]:
         """Build the list of parameters that are compatible for use with the \
             endpoint URLs, e.g. camelCase parameter names instead of Python's \
             snake_case, datetime objects to strings.
 
+        The parameters are sorted by name, so that requests for the same data \
+            share one cache entry.
+
         :param params_expected_type: The expected type of \
             ``original_params``. Should be one of the importable types from \
             the client's ``types_args``.
@@ -170,6 +322,13 @@ class DataGovSg:
             are removed from the returned parameters. Defaults to True.
         :type remove_none_values: bool
 
+        :param time_resolution: Number of seconds between the snapshots of the \
+            endpoint's data. If set, then datetime parameters are rounded down \
+            to it, so that requests for times within one snapshot share one \
+            cache entry and one request to the endpoint. Dates are left as-is. \
+            Defaults to None.
+        :type time_resolution: int or None
+
         :return: The set of parameters that can be used with the API endpoints.
         :rtype: dict
         """
@@ -192,16 +351,242 @@ class DataGovSg:
         for key, value in joined_params.items():
             param_key = key_map[key] if key in key_map else key
 
+            if time_resolution is not None and isinstance(value, datetime):
+                value = floor_datetime(
+                    value,
+                    time_resolution,
+                )
+
             # Convert date and datetime to ISO format strings
             # Leave all other types as-is
+            if isinstance(value, (date, datetime)):
+                value = datetime_to_string(value)
+            params[param_key] = value
+
+        return dict(sorted(params.items()))
+
+    @staticmethod
+    @internal_typechecked
+    def check_response_value(
+        status_code: int,
+        response_json: Any,
+        raise_for_status: Callable[[], Any],
+    ) -> Any:
+        """Check the status code and JSON value of a response for errors.
+
+        :param status_code: The response's HTTP status code.
+        :type status_code: int
+
+        :param response_json: The response's JSON value, or {} if the response \
+            is not JSON.
+        :type response_json: Any (but is really dict[str, Any])
+
+        :param raise_for_status: Function that raises ``HTTPError`` for the \
+            response. It is called when the status code is not 200 and is not \
+            an error that is reported by the API.
+        :type raise_for_status: Callable[[], Any]
+
+        :raises APIError: The API reported an error.
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: The response value.
+        :rtype: Any
+        """
+        if status_code == requests_codes['bad_request'] \
+            or status_code == requests_codes['not_found'] \
+            or status_code == requests_codes['too_many_requests']:
+            error_message = response_json.get(
+                'errorMsg',
+                'Unexpected error occurred',
+            )
+            raise APIError(
+                message=error_message,
+                data=response_json,
+            )
+
+        if status_code != requests_codes['ok']:
+            raise_for_status()
+
+        # handle Data.gov.sg API's default response
+        if response_json.get('code', 0) != 0:
+            error_message = response_json.get(
+                'message',
+                'Unexpected error occurred',
+            )
+            raise APIError(
+                message=error_message,
+                data=response_json,
+            )
+
+        return response_json
+
+    @internal_typechecked
+    def bind_calls(
+        self,
+        calls: list[FetchCall],
+        max_workers: int,
+    ) -> list[tuple[Callable[..., Any], dict[str, Any]]]:
+        """Look up the methods of the calls of ``fetch_many()``.
+
+        :param calls: Pairs of (method name, key-value arguments).
+        :type calls: list[FetchCall]
+
+        :param max_workers: The most number of calls to run at the same time.
+        :type max_workers: int
+
+        :raises ValueError: ``max_workers`` is less than 1.
+        :raises AttributeError: A method name is not a method of this client.
+
+        :return: Pairs of (method, key-value arguments).
+        :rtype: list[tuple[Callable[..., Any], dict[str, Any]]]
+        """
+        if max_workers < 1:
+            raise ValueError(INVALID_MAX_WORKERS_ERROR_MESSAGE)
+
+        return [(getattr(self, method), kwargs) for method, kwargs in calls]
+
+    @internal_typechecked
+    def prepare_request(
+        self,
+        url: Url,
+        params: dict | None,
+        cache_duration: int,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        sanitise_schema: Any,
+        raw: bool,
+        update_cadence: int | None,
+    ) -> PendingRequest:
+        """Fill in the defaults of a request of ``send_request()``, and look \
+            up its sanitised result in the client's ``result_cache``.
+
+        The parameters are the same as those of ``send_request()``.
+
+        :return: The request.
+        :rtype: PendingRequest
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if params is None:
+            params = {}
+
+        if sanitise_ignore_keys is None:
+            sanitise_ignore_keys = []
+
+        key: Hashable | None = None
+        if self.result_cache is not None and sanitise and not raw \
+            and cache_duration > 0:
+            key = result_key(
+                url,
+                params,
+                sanitise_ignore_keys,
+                sanitise_schema,
+            )
+
+        request = PendingRequest(
+            url,
+            params,
+            cache_duration,
+            sanitise,
+            sanitise_ignore_keys,
+            sanitise_schema,
+            raw,
+            None if raw else update_cadence,
+            key,
+        )
+        if key is not None:
             try:
-                params[param_key] = datetime_to_string(value)
-            except TypeCheckError:
-                params[param_key] = value
+                return request._replace(
+                    is_cached=True,
+                    result=self.result_cache[key],
+                )
+            except KeyError:
+                pass
+
+        return request
+
+    @internal_typechecked
+    def request_result(
+        self,
+        request: PendingRequest,
+        response_value: Any,
+        ttl: float,
+    ) -> Any:
+        """Sanitise the response value of a request of ``send_request()``, \
+            and keep it in the client's ``result_cache`` if the request's \
+            result is kept there.
+
+        :param request: The request, from ``prepare_request()``.
+        :type request: PendingRequest
+
+        :param response_value: The response value, or the response's body if \
+            the request is raw.
+        :type response_value: Any
+
+        :param ttl: Number of seconds until the response expires from the \
+            cache.
+        :type ttl: float
+
+        :return: Results from the response, or its body if the request is raw.
+        :rtype: Any
+        """
+        if request.raw:
+            return response_value
+
+        data = self.sanitise_response_value(
+            response_value,
+            request.sanitise,
+            request.sanitise_ignore_keys,
+            request.sanitise_schema,
+        )
+
+        if request.result_key is not None:
+            data = freeze_result(data)
+            self.result_cache.set(request.result_key, data, ttl)
 
-        return params
+        return data
+
+    @internal_typechecked
+    def sanitise_response_value(
+        self,
+        response_value: Any,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str],
+        sanitise_schema: Any,
+    ) -> Any:
+        """Sanitise the value of a response as ``send_request()`` was asked to.
+
+        :param response_value: The response value.
+        :type response_value: Any
+
+        :param sanitise: If true, then the response's values are sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: Keys to ignore during sanitising, if \
+            ``sanitise_schema`` is None.
+        :type sanitise_ignore_keys: list[str]
+
+        :param sanitise_schema: The expected type of the response value, or \
+            None.
+        :type sanitise_schema: Any
+
+        :return: The response value, sanitised if ``sanitise`` is true.
+        :rtype: Any
+        """
+        if not sanitise:
+            return response_value
+
+        if sanitise_schema is not None:
+            return self.sanitise_data_with_schema(
+                response_value,
+                schema=sanitise_schema,
+            )
 
-    @typechecked
+        return self.sanitise_data(
+            response_value,
+            ignore_keys=sanitise_ignore_keys,
+        )
+
+    @internal_typechecked
     def sanitise_data(
         self,
         value: Any,
@@ -219,6 +604,11 @@ class DataGovSg:
             appropriately.
         - Finally: Leave the value as-is.
 
+        Dicts and lists are walked by ``datagovsg.sanitiser.sanitise_tree()`` \
+            without recursion, and strings are converted with \
+            ``datagovsg.sanitiser.sanitise_string()``, which keeps the \
+            converted values of repeated strings in a memo.
+
         :param value: Value to sanitise.
         :type value: Any
 
@@ -227,7 +617,8 @@ class DataGovSg:
         :type iterate: bool
 
         :param ignore_keys: List of dict keys to ignore when sanitising, if \
-            value is a ``dict``. Defaults to [].
+            value is a ``dict``. A key of ``*`` matches any one key. \
+            Defaults to [].
         :type ignore_keys: list[str]
 
         :param key_path: Current path of key in the dict. Defaults to blank \
@@ -237,72 +628,63 @@ class DataGovSg:
         :return: The sanitised value.
         :rtype: Any
         """
-        if ignore_keys is None:
-            ignore_keys = []
-
         if iterate:
-            if isinstance(value, list):
-                return [
-                    self.sanitise_data(
-                        v,
-                        iterate=iterate,
-                        ignore_keys=ignore_keys,
-                        key_path=f'{key_path}[]'
-                    ) for v in value
-                ]
-
-            if isinstance(value, dict):
-                sanitised_dict = {}
-                for k, v in value.items():
-                    current_key_path = '.'.join([key_path, k]) \
-                        if key_path else k
-                    if current_key_path in ignore_keys:
-                        sanitised_dict[k] = v
-                    else:
-                        sanitised_dict[k] = self.sanitise_data(
-                            v,
-                            iterate=iterate,
-                            ignore_keys=ignore_keys,
-                            key_path=current_key_path,
-                        )
-                return sanitised_dict
+            return sanitise_tree(value, ignore_keys, key_path)
 
         if not isinstance(value, str):
             return value
 
-        if ',' in value:
-            # Convert to tuple with numbers.
-            split_value = value.split(',')
-            tuple_value = tuple(
-                self.sanitise_data(
-                    v.strip(),
-                    iterate=False,
-                ) for v in split_value
-            )
-            values_are_int = all(isinstance(v, int) for v in tuple_value)
-            values_are_float = all(isinstance(v, float) for v in tuple_value)
-            if (values_are_int or values_are_float):
-                return tuple_value
+        return sanitise_string(value)
 
-        try:
-            # pylint: disable=broad-exception-caught
+    @internal_typechecked
+    def sanitise_data_with_schema(self, value: Any, schema: Any) -> Any:
+        """Sanitise a value according to its declared type.
 
-            # Convert to a date/datetime.
-            return datetime_from_string(value)
-        except Exception:
-            try:
-                # Convert to an integer
-                return int(value)
-            except Exception:
-                try:
-                    # Convert to a float
-                    return float(value)
-                except Exception:
-                    pass
-
-        return value
-
-    @typechecked
+        Unlike ``sanitise_data()``, the types of values are not guessed. Only \
+            strings in fields that are declared as ``datetime``, ``date``, \
+            ``time``, ``int`` or ``float`` in ``schema`` are converted, and \
+            everything else is left as-is.
+
+        :param value: Value to sanitise.
+        :type value: Any
+
+        :param schema: The expected type of ``value``, e.g. a ``TypedDict`` \
+            from a client's ``types`` module, or a ``list`` of one.
+        :type schema: Any
+
+        :return: The sanitised value.
+        :rtype: Any
+        """
+        sanitise = compile_sanitiser(schema)
+        return sanitise(value)
+
+    @internal_typechecked
+    def sanitise_data_lazily(
+        self,
+        value: Any,
+        ignore_keys: list[str] | None=None,
+    ) -> Any:
+        """Sanitise a value only when its contents are read.
+
+        Values are converted as with ``sanitise_data()``, but dicts and lists \
+            are wrapped in read-only proxies that convert each value the \
+            first time that it is read. (Refer to ``datagovsg.lazy``.)
+
+        :param value: Value to sanitise. It must not be changed afterwards.
+        :type value: Any
+
+        :param ignore_keys: List of keys to ignore in the value, as in \
+            ``sanitise_data()``. Defaults to [].
+        :type ignore_keys: list[str] or None
+
+        :return: The proxy, or the sanitised value if it is not a dict or a \
+            list.
+        :rtype: Any
+        """
+        sanitise_value = partial(self.sanitise_data, iterate=False)
+        return sanitise_lazily(value, sanitise_value, ignore_keys)
+
+    @boundary_typechecked
     def send_request(
         self,
         url: Url,
@@ -310,6 +692,9 @@ class DataGovSg:
         cache_duration: int=0,
         sanitise: bool=True,
         sanitise_ignore_keys: list[str] | None=None,
+        sanitise_schema: Any=None,
+        raw: bool=False,
+        update_cadence: int | None=None,
     ) -> Any:
         """Send a request to an endpoint and return its response.
 
@@ -332,7 +717,10 @@ class DataGovSg:
         :type cache_duration: int
 
         :param sanitise: If true, then the response's values are sanitised \
-            using the ``sanitise_data()`` method. Defaults to True.
+            using the ``sanitise_data()`` method. Sanitised results are also \
+            kept in the client's ``result_cache``, if any, for up to \
+            ``cache_duration`` seconds, and are then read-only. (Refer to \
+            ``datagovsg.resultcache``.) Defaults to True.
         :type sanitise: bool
 
         :param sanitise_ignore_keys: List of keys to ignore in the response \
@@ -340,43 +728,145 @@ class DataGovSg:
             Defaults to [].
         :type sanitise_ignore_keys: list[str]
 
+        :param sanitise_schema: The expected type of the response value. If \
+            set, then the response's values are sanitised using the \
+            ``sanitise_data_with_schema()`` method instead, and \
+            ``sanitise_ignore_keys`` is not used. Defaults to None.
+        :type sanitise_schema: Any
+
+        :param raw: If True, then the response's body is returned as-is, \
+            without decoding or sanitising it, e.g. to forward it to another \
+            client. The response is still checked for errors, usually \
+            without decoding the body. Defaults to False.
+        :type raw: bool
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates. If set, then the response expires from the cache when \
+            the endpoint is next expected to update, as found from the time \
+            in its payload, but after at most ``cache_duration`` seconds. \
+            (Refer to ``datagovsg.expiry``.) It is not used if ``raw`` is \
+            True. Defaults to None.
+        :type update_cadence: int or None
+
+        :raises APIError: The API reported an error.
         :raises HTTPError: Error occurred during the request process.
+        :raises ConnectionError: The request could not connect, after every \
+            retry. (It is ``requests.ConnectionError``.)
 
-        :return: Results from the response.
+        :return: Results from the response, or its body if ``raw`` is True.
         :rtype: Any
         """
-        data: Any
+        request = self.prepare_request(
+            url,
+            params,
+            cache_duration,
+            sanitise,
+            sanitise_ignore_keys,
+            sanitise_schema,
+            raw,
+            update_cadence,
+        )
+        if request.is_cached:
+            return request.result
 
-        if params is None:
-            params = {}
+        response_value, ttl = self.__collect_response_value(
+            **request.collect_kwargs,
+        )
+        return self.request_result(request, response_value, ttl)
 
-        if sanitise_ignore_keys is None:
-            sanitise_ignore_keys = []
+    @boundary_typechecked
+    def fetch_many(
+        self,
+        calls: list[FetchCall],
+        max_workers: int=FETCH_MANY_MAX_WORKERS,
+    ) -> list[Any]:
+        """Call several of this client's methods concurrently, e.g. to get \
+            the air temperature, rainfall and wind speed of the same date.
+
+        The calls run on a pool of at most ``max_workers`` threads, which \
+            share this client's session and connection pool.
+
+        If a call raises ``APIError`` or a ``requests`` \
+            ``RequestException``, e.g. ``HTTPError`` or ``ConnectionError``, \
+            then that error is returned in place of the call's result, and the \
+            other calls carry on. Any other error is raised after all of the \
+            calls have finished.
+
+        .. code-block:: python
+
+            environment = Environment()
+            air_temperature, rainfall = environment.fetch_many([
+                ('air_temperature', {'date': date(2026, 1, 12)}),
+                ('rainfall', {'date': date(2026, 1, 12)}),
+            ])
+
+        :param calls: Pairs of (method name, key-value arguments), e.g. \
+            ``('air_temperature', {'date': date(2026, 1, 12)})``.
+        :type calls: list[FetchCall]
+
+        :param max_workers: The most number of calls to run at the same time. \
+            Defaults to 8.
+        :type max_workers: int
+
+        :raises ValueError: ``max_workers`` is less than 1.
+        :raises AttributeError: A method name is not a method of this client.
+
+        :return: The result or the error of each call, in the order of \
+            ``calls``.
+        :rtype: list[Any]
+        """
+        methods = self.bind_calls(calls, max_workers)
+        if not methods:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(methods)),
+        ) as executor:
+            futures = [
+                executor.submit(method, **kwargs) for method, kwargs in methods
+            ]
+
+        results: list[Any] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except (APIError, RequestException) as error:
+                results.append(error)
 
-        response_val = self.__collect_response_value(
-            url,
-            params=params,
-            cache_duration=cache_duration,
-        )
+        return results
 
-        data = self.sanitise_data(
-            response_val,
-            ignore_keys=sanitise_ignore_keys,
-        ) if sanitise else response_val
+    @internal_typechecked
+    def pool_stats(self) -> PoolStatsDict:
+        """Count the connections opened and reused by this client's session.
 
-        return data
+        If the session is shared, then the counts include the requests of the \
+            other clients that share it.
+
+        :return: Connection pool statistics.
+        :rtype: PoolStatsDict
+        """
+        return pool_stats(self.session)
 
 # private
 
-    @typechecked
+    @internal_typechecked
     def __collect_response_value(
         self,
         url: Url,
         params: dict,
         cache_duration: int,
-    ) -> Any:
+        raw: bool=False,
+        update_cadence: int | None=None,
+        serve_stale: bool=True,
+    ) -> tuple[Any, float]:
         """Collect response value from an endpoint.
 
+        The cache is read first, so that a cached response is returned \
+            without waiting for the rate limiter, as is a stale response with \
+            ``stale_while_revalidate``. Otherwise, concurrent identical \
+            requests are sent only once, and share its result or exception. \
+            (Refer to ``datagovsg.coalesce``.)
+
         :param url: The endpoint URL to send the request to.
         :type url: Url
 
@@ -386,55 +876,346 @@ class DataGovSg:
         :param cache_duration: Number of seconds before the cache expires.
         :type cache_duration: int
 
+        :param raw: If True, then return the response's body instead of its \
+            decoded JSON value. Defaults to False.
+        :type raw: bool
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates, or None. Defaults to None.
+        :type update_cadence: int or None
+
+        :param serve_stale: If False, then a stale response is not returned, \
+            e.g. when it is being refreshed. Defaults to True.
+        :type serve_stale: bool
+
+        :raises APIError: The API reported an error.
         :raises HTTPError: Error occurred during the request process.
 
-        :return: Results from the response.
-        :rtype: Any
+        :return: Results from the response, or its body if ``raw`` is True, \
+            and the number of seconds until the response expires from the \
+            cache.
+        :rtype: tuple[Any, float]
         """
-        response_value: Any
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        is_cached = False
+        if cache_duration > 0:
+            response, is_cached = self.__cached_response(
+                url,
+                params,
+                cache_duration,
+                update_cadence,
+                serve_stale,
+            )
+            if response is not None:
+                return self.__response_value(
+                    response,
+                    cache_duration,
+                    raw,
+                    update_cadence,
+                )
+
+        key = (
+            id(self.session),
+            url,
+            tuple(sorted((k, str(v)) for k, v in params.items())),
+            cache_duration,
+            raw,
+            update_cadence,
+        )
+        return coalesce(
+            key,
+            partial(
+                self.__fetch_response_value,
+                url,
+                params,
+                cache_duration,
+                raw,
+                update_cadence,
+                read_cache=is_cached or cache_duration <= 0,
+            ),
+            share=_copy_response_value,
+        )
+
+    @internal_typechecked
+    def __fetch_response_value(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        raw: bool,
+        update_cadence: int | None,
+        read_cache: bool=True,
+    ) -> tuple[Any, float]:
+        """Send a request, after waiting for its rate limiter, and collect \
+            the response value. (Refer to ``datagovsg.ratelimit``.)
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param raw: If True, then return the response's body instead of its \
+            decoded JSON value.
+        :type raw: bool
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates, or None.
+        :type update_cadence: int or None
+
+        :param read_cache: If False, then the cache has just been read and \
+            has no response, so it is not read again. Defaults to True.
+        :type read_cache: bool
+
+        :raises APIError: The API reported an error.
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: Results from the response, or its body if ``raw`` is True, \
+            and the number of seconds until the response expires from the \
+            cache.
+        :rtype: tuple[Any, float]
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        rate_limiter = get_rate_limiter(
+            url,
+            api_key=self.session.headers.get('x-api-key'),
+        )
+        if rate_limiter is not None:
+            rate_limiter.acquire()
 
         response = self.session.get(
             url,
             params=params,
             expire_after=cache_duration,
+            force_refresh=not read_cache,
         )
 
-        response_json = {}
-        try:
-            response_json = response.json()
-        except ValueError:
-            pass
+        # e.g. an identical request was cached while this one waited
+        if rate_limiter is not None and getattr(response, 'from_cache', False):
+            rate_limiter.refund()
 
-        if response.status_code == requests_codes['bad_request'] \
-            or response.status_code == requests_codes['not_found'] \
-            or response.status_code == requests_codes['too_many_requests']:
-            error_message = response_json.get(
-                'errorMsg',
-                'Unexpected error occurred',
+        return self.__response_value(
+            response,
+            cache_duration,
+            raw,
+            update_cadence,
+        )
+
+    @internal_typechecked
+    def __response_value(
+        self,
+        response: Any,
+        cache_duration: int,
+        raw: bool,
+        update_cadence: int | None,
+    ) -> tuple[Any, float]:
+        """Decode and check a response, and move its expiry in the cache to \
+            the endpoint's next update. (Refer to ``datagovsg.expiry``.)
+
+        :param response: The response, which may be from the cache.
+        :type response: requests.Response or CachedResponse
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param raw: If True, then return the response's body instead of its \
+            decoded JSON value.
+        :type raw: bool
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates, or None.
+        :type update_cadence: int or None
+
+        :raises APIError: The API reported an error.
+        :raises HTTPError: Error occurred during the request process.
+
+        :return: Results from the response, or its body if ``raw`` is True, \
+            and the number of seconds until the response expires from the \
+            cache.
+        :rtype: tuple[Any, float]
+        """
+        response_value: Any
+
+        response_json = {}
+        if raw:
+            response_json = decode_error_json(
+                response.status_code,
+                response.content,
+                self.decode_json,
             )
-            raise APIError(
-                message=error_message,
-                data=response_json,
+        else:
+            try:
+                if self.json_decoder == JSON_DECODER_STDLIB:
+                    response_json = response.json()
+                else:
+                    response_json = self.decode_json(response.content)
+            except ValueError:
+                pass
+
+        response_value = self.check_response_value(
+            response.status_code,
+            response_json,
+            # Only look up raise_for_status() when it is needed
+            # pylint: disable-next=unnecessary-lambda
+            raise_for_status=lambda: response.raise_for_status(),
+        )
+        if raw:
+            response_value = response.content
+
+        ttl = seconds_until_expiry(
+            getattr(response, 'expires', None),
+            cache_duration,
+        )
+
+        if update_cadence is not None and not raw and cache_duration > 0:
+            update_ttl = seconds_until_next_update(
+                find_update_time(response_value),
+                update_cadence,
+                cache_duration,
             )
+            expires = getattr(response, 'expires', None)
+            if update_ttl < ttl and expires is not None \
+                and not getattr(response, 'from_cache', False):
+                # Move the stored response's expiry to the next update
+                self.session.cache.save_response(
+                    response,
+                    cache_key=response.cache_key,
+                    expires=expires - timedelta(seconds=ttl - update_ttl),
+                )
+            ttl = min(ttl, update_ttl)
+
+        return response_value, ttl
+
+    @internal_typechecked
+    def __cached_response(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        update_cadence: int | None,
+        serve_stale: bool,
+    ) -> tuple[Any, bool]:
+        """Get the cached response of a request, if it has not expired or \
+            has expired for at most ``stale_while_revalidate`` seconds.
 
-        if response.status_code != requests_codes['ok']:
-            response.raise_for_status()
+        A stale response is refreshed in a background thread, unless it is \
+            already being refreshed, and ``on_stale`` is called.
 
-        # handle Data.gov.sg API's default response
-        if response_json.get('code', 0) != 0:
-            error_message = response_json.get(
-                'message',
-                'Unexpected error occurred',
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates, or None.
+        :type update_cadence: int or None
+
+        :param serve_stale: If False, then a stale response is not returned.
+        :type serve_stale: bool
+
+        :return: The cached response, or None if the request must be sent, \
+            and whether the cache has a response for the request at all.
+        :rtype: tuple[CachedResponse or None, bool]
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        cache = self.session.cache
+        key = cache.create_key(
+            self.session.prepare_request(Request('GET', url, params=params)),
+        )
+        response = cache.get_response(key)
+        if response is None:
+            return None, False
+
+        ttl = seconds_until_expiry(
+            response.expires,
+            cache_duration,
+        )
+        if ttl > 0:
+            return response, True
+        if not serve_stale or -ttl > self.stale_while_revalidate:
+            return None, True
+
+        refresh_in_background(
+            (id(cache), key),
+            partial(
+                self.__refresh_response,
+                url,
+                params,
+                cache_duration,
+                update_cadence,
+            ),
+        )
+        if self.on_stale is not None:
+            self.on_stale(
+                url,
+                params,
+                seconds_since(response.created_at),
             )
-            raise APIError(
-                message=error_message,
-                data=response_json,
+        return response, True
+
+    @internal_typechecked
+    def __refresh_response(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        update_cadence: int | None,
+    ) -> None:
+        """Send a request again to refresh its stale cached response.
+
+        Errors are not raised, as nobody is waiting for the refresh. The \
+            stale response is returned until it is too old, and then the \
+            request is sent again when it is next made.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param update_cadence: Number of seconds between the endpoint's \
+            updates, or None.
+        :type update_cadence: int or None
+
+        :return: None
+        """
+        try:
+            self.__collect_response_value(
+                url,
+                params=params,
+                cache_duration=cache_duration,
+                update_cadence=update_cadence,
+                serve_stale=False,
             )
+        except (APIError, RequestException):
+            pass
 
-        response_value = response_json
+# private
+
+def _copy_response_value(response_value: tuple[Any, float]) -> tuple[Any, float]:
+    """Copy a response value that is shared by coalesced requests, so that \
+        their callers cannot change each other's.
 
-        return response_value
+    :param response_value: The response value and its time to live.
+    :type response_value: tuple[Any, float]
+
+    :return: A copy of the response value, and its time to live.
+    :rtype: tuple[Any, float]
+    """
+    value, ttl = response_value
+    return copy_result(value), ttl
 
 __all__ = [
     'DataGovSg',
+    'PendingRequest',
 ]
@@ -0,0 +1,137 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decode the JSON bodies of responses.
+
+The clients decode with the standard library's ``json`` module by default. \
+    ``orjson`` and ``msgspec`` are faster, and are used if they are chosen \
+    with the ``json_decoder`` argument of a client and are installed:
+
+.. code-block:: python
+
+    from datagovsg import Transport
+    transport = Transport(json_decoder='orjson')
+"""
+
+from functools import cache
+from json import loads
+from re import compile as re_compile
+from typing import Any, Callable, TypeAlias
+
+from .constants import (
+    INVALID_JSON_DECODER_ERROR_MESSAGE,
+    JSON_DECODER_IMPORT_ERROR_MESSAGE_FORMAT,
+    JSON_DECODER_MSGSPEC,
+    JSON_DECODER_ORJSON,
+    JSON_DECODER_STDLIB,
+)
+from .validation import internal_typechecked
+
+JsonDecoder: TypeAlias = Callable[[bytes], Any]
+"""Function that decodes a JSON body, and raises ``ValueError`` if it cannot."""
+
+# Data.gov.sg responses start with their "code", e.g. {"code":0,"data":...}
+_LEADING_CODE_PATTERN = re_compile(rb'\s*\{\s*"code"\s*:\s*(-?\d+)\s*[,}]')
+
+@cache
+@internal_typechecked
+def get_json_decoder(name: str) -> JsonDecoder:
+    """Get a JSON decoder by name.
+
+    :param name: Name of the decoder: "json", "orjson" or "msgspec".
+    :type name: str
+
+    :raises ValueError: ``name`` is not one of "json", "orjson" or "msgspec".
+    :raises ImportError: The decoder's package is not installed.
+
+    :return: The decoder.
+    :rtype: JsonDecoder
+    """
+    if name == JSON_DECODER_STDLIB:
+        return loads
+
+    if name == JSON_DECODER_ORJSON:
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from orjson import loads as orjson_loads
+        except ImportError as error:
+            raise ImportError(
+                JSON_DECODER_IMPORT_ERROR_MESSAGE_FORMAT.format(name),
+            ) from error
+        return orjson_loads
+
+    if name == JSON_DECODER_MSGSPEC:
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from msgspec import DecodeError, json as msgspec_json
+        except ImportError as error:
+            raise ImportError(
+                JSON_DECODER_IMPORT_ERROR_MESSAGE_FORMAT.format(name),
+            ) from error
+
+        decode = msgspec_json.Decoder().decode
+
+        def msgspec_loads(content: bytes) -> Any:
+            try:
+                return decode(content)
+            except DecodeError as error:
+                raise ValueError(str(error)) from error
+
+        return msgspec_loads
+
+    raise ValueError(INVALID_JSON_DECODER_ERROR_MESSAGE)
+
+@internal_typechecked
+def decode_error_json(
+    status_code: int,
+    content: bytes,
+    decode_json: JsonDecoder,
+) -> Any:
+    """Decode only as much of a response's JSON body as is needed to check it \
+        for errors, i.e. its ``code`` and, if there is an error, the rest.
+
+    A successful body is usually not decoded at all: its ``code`` is read \
+        from the start of the body, or the body has no ``code``.
+
+    :param status_code: The response's HTTP status code.
+    :type status_code: int
+
+    :param content: The response's body.
+    :type content: bytes
+
+    :param decode_json: Decoder for the body, if it needs to be decoded.
+    :type decode_json: JsonDecoder
+
+    :return: A JSON value to pass to ``DataGovSg.check_response_value()``, or \
+        {} if the body is not JSON.
+    :rtype: Any (but is really dict[str, Any])
+    """
+    if status_code == 200:
+        match = _LEADING_CODE_PATTERN.match(content)
+        if match is not None and int(match[1]) == 0:
+            return {'code': 0}
+        if match is None and b'"code"' not in content:
+            return {}
+
+    try:
+        response_json = decode_json(content)
+    except ValueError:
+        return {}
+    return response_json if isinstance(response_json, dict) else {}
+
+__all__ = [
+    'JsonDecoder',
+    'decode_error_json',
+    'get_json_decoder',
+]
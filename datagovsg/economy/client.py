@@ -16,20 +16,13 @@
 
 from typing import Unpack
 
-from typeguard import typechecked
-
-from ..constants import CACHE_TWELVE_HOURS
 from ..datagovsg import DataGovSg
+from ..validation import boundary_typechecked
 
-from .constants import (
-    IPOS_DESIGNS_API_ENDPOINT,
-    IPOS_PATENTS_API_ENDPOINT,
-    IPOS_TRADEMARKS_API_ENDPOINT,
-
-    MIN_DATETIME,
-    MAX_DATETIME,
-
-    INVALID_DATE_ERROR_MESSAGE,
+from .endpoints import (
+    designs_request,
+    patents_request,
+    trademarks_request,
 )
 from .types_args import EconomyArgsDict
 from .types import EconomyDict
@@ -41,7 +34,7 @@ class Client(DataGovSg):
         https://data.gov.sg/datasets?formats=API&topics=economy
     """
 
-    @typechecked
+    @boundary_typechecked
     def designs(self, **kwargs: Unpack[EconomyArgsDict]) -> EconomyDict:
         """Get design applications lodged with IPOS in Singapore.
 
@@ -57,30 +50,13 @@ class Client(DataGovSg):
         :return: Design application information. (Cached for 12 hours.)
         :rtype: EconomyDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='lodgement_date',
-            error_message=INVALID_DATE_ERROR_MESSAGE,
-            min_dt=MIN_DATETIME,
-            max_dt=MAX_DATETIME,
-        )
-
         designs: EconomyDict
 
-        params = self.build_params(
-            params_expected_type=EconomyArgsDict,
-            original_params=kwargs,
-        )
-
-        designs = self.send_request(
-            IPOS_DESIGNS_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_TWELVE_HOURS,
-        )
+        designs = self.send_request(**designs_request(self, kwargs))
 
         return designs
 
-    @typechecked
+    @boundary_typechecked
     def patents(self, **kwargs: Unpack[EconomyArgsDict]) -> EconomyDict:
         """Get patent applications lodged with IPOS in Singapore.
 
@@ -96,30 +72,13 @@ class Client(DataGovSg):
         :return: Patent application information. (Cached for 12 hours.)
         :rtype: EconomyDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='lodgement_date',
-            error_message=INVALID_DATE_ERROR_MESSAGE,
-            min_dt=MIN_DATETIME,
-            max_dt=MAX_DATETIME,
-        )
-
         patents: EconomyDict
 
-        params = self.build_params(
-            params_expected_type=EconomyArgsDict,
-            original_params=kwargs,
-        )
-
-        patents = self.send_request(
-            IPOS_PATENTS_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_TWELVE_HOURS,
-        )
+        patents = self.send_request(**patents_request(self, kwargs))
 
         return patents
 
-    @typechecked
+    @boundary_typechecked
     def trademarks(self, **kwargs: Unpack[EconomyArgsDict]) -> EconomyDict:
         """Get trademark applications lodged with IPOS in Singapore.
 
@@ -135,26 +94,9 @@ class Client(DataGovSg):
         :return: Trademark application information. (Cached for 12 hours.)
         :rtype: EconomyDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='lodgement_date',
-            error_message=INVALID_DATE_ERROR_MESSAGE,
-            min_dt=MIN_DATETIME,
-            max_dt=MAX_DATETIME,
-        )
-
         trademarks: EconomyDict
 
-        params = self.build_params(
-            params_expected_type=EconomyArgsDict,
-            original_params=kwargs,
-        )
-
-        trademarks = self.send_request(
-            IPOS_TRADEMARKS_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_TWELVE_HOURS,
-        )
+        trademarks = self.send_request(**trademarks_request(self, kwargs))
 
         return trademarks
 
@@ -0,0 +1,140 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Requests of the Economy client's methods.
+
+Each method's request is built by its own function here, which validates the \
+    method's arguments and returns the arguments of ``send_request()``. The \
+    synchronous and asynchronous clients share these functions, so that they \
+    send the same requests.
+"""
+
+from typing import Any
+
+from ..constants import CACHE_TWELVE_HOURS
+from ..datagovsg import DataGovSg
+from ..types import RequestDict, Url
+from ..validation import internal_typechecked
+
+from .constants import (
+    IPOS_DESIGNS_API_ENDPOINT,
+    IPOS_PATENTS_API_ENDPOINT,
+    IPOS_TRADEMARKS_API_ENDPOINT,
+
+    MIN_DATETIME,
+    MAX_DATETIME,
+
+    INVALID_DATE_ERROR_MESSAGE,
+)
+from .types_args import EconomyArgsDict
+
+@internal_typechecked
+def designs_request(client: DataGovSg, kwargs: Any) -> RequestDict:
+    """Build the request of ``designs()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EconomyArgsDict)
+
+    :raises ValueError: ``lodgement_date`` argument is not between 1 \
+        August 2018 and 31 October 2020 (start and end dates inclusive).
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    return _ipos_request(client, kwargs, IPOS_DESIGNS_API_ENDPOINT)
+
+@internal_typechecked
+def patents_request(client: DataGovSg, kwargs: Any) -> RequestDict:
+    """Build the request of ``patents()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EconomyArgsDict)
+
+    :raises ValueError: ``lodgement_date`` argument is not between 1 \
+        August 2018 and 31 October 2020 (start and end dates inclusive).
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    return _ipos_request(client, kwargs, IPOS_PATENTS_API_ENDPOINT)
+
+@internal_typechecked
+def trademarks_request(client: DataGovSg, kwargs: Any) -> RequestDict:
+    """Build the request of ``trademarks()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EconomyArgsDict)
+
+    :raises ValueError: ``lodgement_date`` argument is not between 1 \
+        August 2018 and 31 October 2020 (start and end dates inclusive).
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    return _ipos_request(client, kwargs, IPOS_TRADEMARKS_API_ENDPOINT)
+
+# private
+
+def _ipos_request(client: DataGovSg, kwargs: Any, url: Url) -> RequestDict:
+    """Build the request of an IPOS endpoint, which all take the same \
+        arguments.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EconomyArgsDict)
+
+    :param url: The endpoint URL to send the request to.
+    :type url: Url
+
+    :raises ValueError: ``lodgement_date`` argument is not between 1 \
+        August 2018 and 31 October 2020 (start and end dates inclusive).
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='lodgement_date',
+        error_message=INVALID_DATE_ERROR_MESSAGE,
+        min_dt=MIN_DATETIME,
+        max_dt=MAX_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EconomyArgsDict,
+        original_params=kwargs,
+    )
+
+    return {
+        'url': url,
+        'params': params,
+        'cache_duration': CACHE_TWELVE_HOURS,
+    }
+
+__all__ = [
+    'designs_request',
+    'patents_request',
+    'trademarks_request',
+]
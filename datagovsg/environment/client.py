@@ -14,71 +14,47 @@
 
 """Client for interacting with the Environment APIs."""
 
-from time import sleep
-from typing import Any, Unpack
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from time import perf_counter
+from typing import Any, Iterator, Unpack
 
-from typeguard import typechecked
-
-from ..constants import (
-    CACHE_ONE_MINUTE,
-    CACHE_FIVE_MINUTES,
-    CACHE_THIRTY_MINUTES,
-    CACHE_ONE_HOUR,
-    CACHE_TWELVE_HOURS,
-)
 from ..datagovsg import DataGovSg
-from ..types import Url
-
-from .constants import (
-    AIR_TEMPERATURE_API_ENDPOINT,
-    FOUR_DAY_WEATHER_FORECAST_API_ENDPOINT,
-    PM25_API_ENDPOINT,
-    PSI_API_ENDPOINT,
-    RAINFALL_API_ENDPOINT,
-    RELATIVE_HUMIDITY_API_ENDPOINT,
-    TWENTY_FOUR_HOUR_WEATHER_FORECAST_API_ENDPOINT,
-    TWO_HOUR_WEATHER_FORECAST_API_ENDPOINT,
-    UV_INDEX_API_ENDPOINT,
-    WIND_DIRECTION_API_ENDPOINT,
-    WIND_SPEED_API_ENDPOINT,
-
-    WEATHER_API_ENDPOINT,
-    FLOOD_ALERTS_API_ENDPOINT,
-
-    LIGHTNING_DEFAULT_PARAMS,
-    WBGT_DEFAULT_PARAMS,
-
-    WIND_SPEED_SANITISE_IGNORE_KEYS,
-
-    AIR_TEMPERATURE_MIN_DATETIME,
-    FOUR_DAY_WEATHER_FORECAST_MIN_DATETIME,
-    LIGHTNING_MIN_DATETIME,
-    PM25_MIN_DATETIME,
-    PSI_MIN_DATETIME,
-    RAINFALL_MIN_DATETIME,
-    RELATIVE_HUMIDITY_MIN_DATETIME,
-    UV_MIN_DATETIME,
-    TWENTY_FOUR_HOUR_WEATHER_FORECAST_MIN_DATETIME,
-    TWO_HOUR_WEATHER_FORECAST_MIN_DATETIME,
-    WBGT_MIN_DATETIME,
-    WIND_DIRECTION_MIN_DATETIME,
-    WIND_SPEED_MIN_DATETIME,
-
-    INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE,
-    INVALID_FOUR_DAY_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
-    INVALID_LIGHTNING_DATETIME_ERROR_MESSAGE,
-    INVALID_PM25_DATETIME_ERROR_MESSAGE,
-    INVALID_PSI_DATETIME_ERROR_MESSAGE,
-    INVALID_RAINFALL_DATETIME_ERROR_MESSAGE,
-    INVALID_RELATIVE_HUMIDITY_DATETIME_ERROR_MESSAGE,
-    INVALID_TWENTY_FOUR_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
-    INVALID_TWO_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
-    INVALID_UV_DATETIME_ERROR_MESSAGE,
-    INVALID_WBGT_DATETIME_ERROR_MESSAGE,
-    INVALID_WIND_DIRECTION_DATETIME_ERROR_MESSAGE,
-    INVALID_WIND_SPEED_DATETIME_ERROR_MESSAGE,
+from ..types import PipelineStatsDict
+from ..validation import boundary_typechecked, internal_typechecked
+
+from .endpoints import (
+    EndpointDict,
+    build_request,
+    page_request,
+    page_result,
+    air_temperature_request,
+    flood_alerts_request,
+    four_day_weather_forecast_request,
+    lightning_request,
+    pm25_request,
+    psi_request,
+    rainfall_request,
+    relative_humidity_request,
+    twenty_four_hour_weather_forecast_request,
+    two_hour_weather_forecast_request,
+    uv_index_request,
+    wbgt_request,
+    wind_direction_request,
+    wind_speed_request,
+)
+from .pagination import (
+    MetadataIndex,
+    get_pagination_token,
+    merge_page,
+    next_page_params,
+    page_readings,
+)
+from .types_args import (
+    EnvironmentArgsDict,
+    EnvironmentMethod,
+    WeatherArgsDict,
 )
-from .types_args import EnvironmentArgsDict, WeatherArgsDict
 from .types import (
     EnvironmentReadingDict,
     PM25Dict,
@@ -95,9 +71,31 @@ class Client(DataGovSg):
 
     Reference: \
         https://data.gov.sg/datasets?formats=API&topics=environment
+
+    Takes the same arguments as ``DataGovSg``, and:
+
+    :param pipeline: If True, then the next page of data is requested in a \
+        background thread as soon as its pagination token is known, while \
+        the current page is sanitised and merged. Refer to \
+        ``pipeline_stats()`` for how much time this saved. Defaults to False.
+    :type pipeline: bool
     """
 
-    @typechecked
+    @boundary_typechecked
+    def __init__(self, *args: Any, pipeline: bool=False, **kwargs: Any) -> None:
+        """Constructor method"""
+        super().__init__(*args, **kwargs)
+
+        self.pipeline = pipeline
+        self.__pipeline_stats: PipelineStatsDict = {
+            'pages_prefetched': 0,
+            'fetch_seconds': 0.0,
+            'wait_seconds': 0.0,
+            'hidden_seconds': 0.0,
+        }
+        self.__pipeline_stats_lock = Lock()
+
+    @boundary_typechecked
     def air_temperature(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -113,32 +111,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 May 2016 \
             12:00am (inclusive).
 
-        :return: Air Temperature Information. (Cached for 1 minute.)
+        :return: Air Temperature Information. (Cached until the next \
+            update, for up to 1 minute.)
         :rtype: EnvironmentReadingDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE,
-            min_dt=AIR_TEMPERATURE_MIN_DATETIME,
-        )
-
         air_temperature: EnvironmentReadingDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         air_temperature = self.__collect_environment_data(
-            AIR_TEMPERATURE_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_MINUTE,
+            *air_temperature_request(self, kwargs),
         )
 
         return air_temperature
 
-    @typechecked
+    @boundary_typechecked
     def flood_alerts(
         self,
         **kwargs: Unpack[EnvironmentArgsDict]
@@ -156,20 +141,13 @@ class Client(DataGovSg):
         """
         flood_alerts: WeatherDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         flood_alerts = self.__collect_environment_data(
-            FLOOD_ALERTS_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_THIRTY_MINUTES,
+            *flood_alerts_request(self, kwargs),
         )
 
         return flood_alerts
 
-    @typechecked
+    @boundary_typechecked
     def lightning(self, **kwargs: Unpack[WeatherArgsDict]) -> WeatherDict:
         """Retrieve the latest lightning observation.
 
@@ -185,30 +163,15 @@ class Client(DataGovSg):
         :return: Lightning Information. (Cached for 30 minutse.)
         :rtype: WeatherDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_LIGHTNING_DATETIME_ERROR_MESSAGE,
-            min_dt=LIGHTNING_MIN_DATETIME,
-        )
-
         lightning: WeatherDict
 
-        params = self.build_params(
-            params_expected_type=WeatherArgsDict,
-            original_params=kwargs,
-            default_params=LIGHTNING_DEFAULT_PARAMS,
-        )
-
         lightning = self.__collect_environment_data(
-            WEATHER_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_THIRTY_MINUTES,
+            *lightning_request(self, kwargs),
         )
 
         return lightning
 
-    @typechecked
+    @boundary_typechecked
     def pm25(self, **kwargs: Unpack[EnvironmentArgsDict]) -> PM25Dict:
         """Retrieve the latest PM2.5 information in Singapore.
 
@@ -221,32 +184,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 February 2016 \
             12:00am (inclusive).
 
-        :return: PM 2.5 Information. (Cached for 1 hour.)
+        :return: PM 2.5 Information. (Cached until the next update, for \
+            up to 1 hour.)
         :rtype: PM25Dict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_PM25_DATETIME_ERROR_MESSAGE,
-            min_dt=PM25_MIN_DATETIME,
-        )
-
         pm25: PM25Dict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         pm25 = self.__collect_environment_data(
-            PM25_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_HOUR,
+            *pm25_request(self, kwargs),
         )
 
         return pm25
 
-    @typechecked
+    @boundary_typechecked
     def psi(self, **kwargs: Unpack[EnvironmentArgsDict]) -> PSIDict:
         """Retrieve the latest PSI information in Singapore.
 
@@ -259,32 +209,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 February 2016 \
             12:00am (inclusive).
 
-        :return: PSI Information. (Cached for 1 hour.)
+        :return: PSI Information. (Cached until the next update, for up \
+            to 1 hour.)
         :rtype: PSIDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_PSI_DATETIME_ERROR_MESSAGE,
-            min_dt=PSI_MIN_DATETIME,
-        )
-
         psi: PSIDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         psi = self.__collect_environment_data(
-            PSI_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_HOUR,
+            *psi_request(self, kwargs),
         )
 
         return psi
 
-    @typechecked
+    @boundary_typechecked
     def rainfall(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -300,32 +237,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 December 2016 \
             12:00am (inclusive).
 
-        :return: Rainfall Information. (Cached for 5 minutes.)
+        :return: Rainfall Information. (Cached until the next update, for \
+            up to 5 minutes.)
         :rtype: EnvironmentReadingDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_RAINFALL_DATETIME_ERROR_MESSAGE,
-            min_dt=RAINFALL_MIN_DATETIME,
-        )
-
         rainfall: EnvironmentReadingDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         rainfall = self.__collect_environment_data(
-            RAINFALL_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_FIVE_MINUTES,
+            *rainfall_request(self, kwargs),
         )
 
         return rainfall
 
-    @typechecked
+    @boundary_typechecked
     def relative_humidity(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -341,32 +265,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 November 2016 \
             12:00am (inclusive).
 
-        :return: Relative Humidity Information. (Cached for 1 minute.)
+        :return: Relative Humidity Information. (Cached until the next \
+            update, for up to 1 minute.)
         :rtype: EnvironmentReadingDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_RELATIVE_HUMIDITY_DATETIME_ERROR_MESSAGE,
-            min_dt=RELATIVE_HUMIDITY_MIN_DATETIME,
-        )
-
         relative_humidity: EnvironmentReadingDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         relative_humidity = self.__collect_environment_data(
-            RELATIVE_HUMIDITY_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_MINUTE,
+            *relative_humidity_request(self, kwargs),
         )
 
         return relative_humidity
 
-    @typechecked
+    @boundary_typechecked
     def uv_index(self, **kwargs: Unpack[EnvironmentArgsDict]) -> UVIndexDict:
         """Retrieve the latest UV index information in Singapore.
 
@@ -380,32 +291,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 March 2016 \
             12:00am (inclusive).
 
-        :return: UV Index Information. (Cached for 1 hour.)
+        :return: UV Index Information. (Cached until the next update, \
+            for up to 1 hour.)
         :rtype: UVIndexDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_UV_DATETIME_ERROR_MESSAGE,
-            min_dt=UV_MIN_DATETIME,
-        )
-
         uv_index: UVIndexDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         uv_index = self.__collect_environment_data(
-            UV_INDEX_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_HOUR,
+            *uv_index_request(self, kwargs),
         )
 
         return uv_index
 
-    @typechecked
+    @boundary_typechecked
     def wbgt(self, **kwargs: Unpack[WeatherArgsDict]) -> WeatherDict:
         """Retrieve the latest WBGT data for accurate heat stress assessment.
 
@@ -422,30 +320,15 @@ class Client(DataGovSg):
             minutse.)
         :rtype: WeatherDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_WBGT_DATETIME_ERROR_MESSAGE,
-            min_dt=WBGT_MIN_DATETIME,
-        )
-
         wbgt: WeatherDict
 
-        params = self.build_params(
-            params_expected_type=WeatherArgsDict,
-            original_params=kwargs,
-            default_params=WBGT_DEFAULT_PARAMS,
-        )
-
         wbgt = self.__collect_environment_data(
-            WEATHER_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_THIRTY_MINUTES,
+            *wbgt_request(self, kwargs),
         )
 
         return wbgt
 
-    @typechecked
+    @boundary_typechecked
     def two_hour_weather_forecast(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -461,33 +344,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 March 2016 \
             12:00am (inclusive).
 
-        :return: 2 Hour Weather Forecast. (Cached for 30 minutes.)
+        :return: 2 Hour Weather Forecast. (Cached until the next update, \
+            for up to 30 minutes.)
         :rtype: WeatherForecastTwoHourDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=\
-                INVALID_TWO_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
-            min_dt=TWO_HOUR_WEATHER_FORECAST_MIN_DATETIME,
-        )
-
         two_hour_weather_forecast: WeatherForecastTwoHourDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         two_hour_weather_forecast = self.__collect_environment_data(
-            TWO_HOUR_WEATHER_FORECAST_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_THIRTY_MINUTES,
+            *two_hour_weather_forecast_request(self, kwargs),
         )
 
         return two_hour_weather_forecast
 
-    @typechecked
+    @boundary_typechecked
     def twenty_four_hour_weather_forecast(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -506,30 +375,15 @@ class Client(DataGovSg):
         :return: 24 Hour Weather Forecast. (Cached for 1 hour.)
         :rtype: WeatherForecastTwentyFourHourDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=\
-                INVALID_TWENTY_FOUR_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
-            min_dt=TWENTY_FOUR_HOUR_WEATHER_FORECAST_MIN_DATETIME,
-        )
-
         twenty_four_hour_weather_forecast: WeatherForecastTwentyFourHourDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         twenty_four_hour_weather_forecast = self.__collect_environment_data(
-            TWENTY_FOUR_HOUR_WEATHER_FORECAST_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_HOUR,
+            *twenty_four_hour_weather_forecast_request(self, kwargs),
         )
 
         return twenty_four_hour_weather_forecast
 
-    @typechecked
+    @boundary_typechecked
     def four_day_weather_forecast(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -545,33 +399,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 March 2016 \
             12:00am (inclusive).
 
-        :return: 4 Day Weather Forecast. (Cached for 12 hours.)
+        :return: 4 Day Weather Forecast. (Cached until the next update, \
+            for up to 12 hours.)
         :rtype: WeatherForecastFourDayDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=\
-                INVALID_FOUR_DAY_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
-            min_dt=FOUR_DAY_WEATHER_FORECAST_MIN_DATETIME,
-        )
-
         four_day_weather_forecast: WeatherForecastFourDayDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         four_day_weather_forecast = self.__collect_environment_data(
-            FOUR_DAY_WEATHER_FORECAST_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_TWELVE_HOURS,
+            *four_day_weather_forecast_request(self, kwargs),
         )
 
         return four_day_weather_forecast
 
-    @typechecked
+    @boundary_typechecked
     def wind_direction(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -587,32 +427,19 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 November 2016 \
             12:00am (inclusive).
 
-        :return: Wind Direction Information. (Cached for 1 minute.)
+        :return: Wind Direction Information. (Cached until the next \
+            update, for up to 1 minute.)
         :rtype: EnvironmentReadingDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_WIND_DIRECTION_DATETIME_ERROR_MESSAGE,
-            min_dt=WIND_DIRECTION_MIN_DATETIME,
-        )
-
         wind_direction: EnvironmentReadingDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
-        )
-
         wind_direction = self.__collect_environment_data(
-            WIND_DIRECTION_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_MINUTE,
+            *wind_direction_request(self, kwargs),
         )
 
         return wind_direction
 
-    @typechecked
+    @boundary_typechecked
     def wind_speed(
         self,
         **kwargs: Unpack[EnvironmentArgsDict],
@@ -628,117 +455,297 @@ class Client(DataGovSg):
         :raises ValueError: ``date`` argument is before 1 December 2016 \
             12:00am (inclusive).
 
-        :return: Wind Speed Information. (Cached for 1 minute.)
+        :return: Wind Speed Information. (Cached until the next update, \
+            for up to 1 minute.)
         :rtype: EnvironmentReadingDict
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date',
-            error_message=INVALID_WIND_SPEED_DATETIME_ERROR_MESSAGE,
-            min_dt=WIND_SPEED_MIN_DATETIME,
-        )
-
         wind_speed: EnvironmentReadingDict
 
-        params = self.build_params(
-            params_expected_type=EnvironmentArgsDict,
-            original_params=kwargs,
+        wind_speed = self.__collect_environment_data(
+            *wind_speed_request(self, kwargs),
         )
 
-        data = self.__collect_environment_data(
-            WIND_SPEED_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_MINUTE,
-            sanitise=False,
-        )
+        return wind_speed
+
+    @boundary_typechecked
+    def iter_pages(
+        self,
+        method: EnvironmentMethod,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> Iterator[Any]:
+        """Get the pages of a method's data one at a time, instead of all of \
+            the pages compiled into one big list.
 
-        wind_speed = self.sanitise_data(
-            data,
-            ignore_keys=WIND_SPEED_SANITISE_IGNORE_KEYS,
+        Each page is requested only when the previous page has been used, so \
+            memory use does not grow with the number of pages. Each page is \
+            the method's return type for that page alone, e.g. its \
+            ``stations`` are those of that page only.
+
+        .. code-block:: python
+
+            environment = Environment()
+            for page in environment.iter_pages('rainfall', date=date(2026, 1, 12)):
+                print(len(page['readings']))
+
+        :param method: Name of the method, e.g. "air_temperature".
+        :type method: EnvironmentMethod
+
+        :param kwargs: Key-value arguments of the method.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``method`` is not a method of this client, or the \
+            method's ``date`` argument is out of range.
+
+        :return: Iterator of the data of each page.
+        :rtype: Iterator[Any]
+        """
+        return self.__iter_environment_pages(
+            *build_request(self, method, kwargs),
         )
 
-        return wind_speed
+    @boundary_typechecked
+    def iter_readings(
+        self,
+        method: EnvironmentMethod,
+        **kwargs: Unpack[EnvironmentArgsDict],
+    ) -> Iterator[Any]:
+        """Get a method's readings one at a time, across all of its pages.
+
+        The readings are the ``items``, ``readings`` or ``records`` of each \
+            page, whichever the method returns. Pages are requested as in \
+            ``iter_pages()``.
+
+        .. code-block:: python
+
+            environment = Environment()
+            for reading in environment.iter_readings('air_temperature', date=date(2026, 1, 12)):
+                print(reading['timestamp'])
+
+        :param method: Name of the method, e.g. "air_temperature".
+        :type method: EnvironmentMethod
+
+        :param kwargs: Key-value arguments of the method.
+        :type kwargs: EnvironmentArgsDict
+
+        :raises ValueError: ``method`` is not a method of this client, or the \
+            method's ``date`` argument is out of range.
+
+        :return: Iterator of the readings.
+        :rtype: Iterator[Any]
+        """
+        pages = self.iter_pages(method, **kwargs)
+        return (reading for page in pages for reading in page_readings(page))
+
+    @boundary_typechecked
+    def pipeline_stats(self) -> PipelineStatsDict:
+        """Measure the time saved by requesting pages in the background, when \
+            ``pipeline`` is True.
+
+        The time of a prefetched page's request is hidden when it overlaps \
+            with sanitising and merging the previous page, instead of being \
+            waited for. The measurements add up over all of this client's \
+            requests.
+
+        :return: Pipeline statistics.
+        :rtype: PipelineStatsDict
+        """
+        with self.__pipeline_stats_lock:
+            return self.__pipeline_stats.copy()
 
     # private
 
-    def __collect_environment_data(
+    @internal_typechecked
+    def __iter_environment_pages(
+        self,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
+    ) -> Iterator[Any]:
+        """Get the pages of environment data from an endpoint, one at a time.
+
+        :param endpoint: The endpoint to send the requests to.
+        :type endpoint: EndpointDict
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :return: Iterator of the data of each page.
+        :rtype: Iterator[Any]
+        """
+        if self.pipeline:
+            responses = self.__prefetch_environment_responses(endpoint, params)
+        else:
+            responses = self.__fetch_environment_responses(endpoint, params)
+
+        for response in responses:
+            data, _ = page_result(self, endpoint, response)
+            yield data
+
+    @internal_typechecked
+    def __fetch_environment_responses(
+        self,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
+    ) -> Iterator[Any]:
+        """Get the unsanitised responses of each page from an endpoint, one \
+            at a time.
+
+        :param endpoint: The endpoint to send the requests to.
+        :type endpoint: EndpointDict
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :return: Iterator of the response of each page.
+        :rtype: Iterator[Any]
+        """
+        while True:
+            response = self.__fetch_environment_response(endpoint, params)
+            yield response
+
+            pagination_token = get_pagination_token(response.get('data', {}))
+            if pagination_token is None:
+                return
+
+            # Collect the next page of data
+            params = next_page_params(params, pagination_token)
+
+    @internal_typechecked
+    def __prefetch_environment_responses(
+        self,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
+    ) -> Iterator[Any]:
+        """Get the unsanitised responses of each page from an endpoint, one \
+            at a time, requesting the next page in the background while the \
+            current page is being used.
+
+        At most one page is requested ahead of the current page, so memory \
+            use stays the same as without prefetching.
+
+        :param endpoint: The endpoint to send the requests to.
+        :type endpoint: EndpointDict
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :return: Iterator of the response of each page.
+        :rtype: Iterator[Any]
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            response = self.__fetch_environment_response(endpoint, params)
+            while True:
+                pagination_token = get_pagination_token(
+                    response.get('data', {}),
+                )
+                if pagination_token is None:
+                    yield response
+                    return
+
+                # Collect the next page of data while this page is being used
+                params = next_page_params(params, pagination_token)
+                future = executor.submit(
+                    self.__time_environment_response,
+                    endpoint,
+                    params,
+                )
+                yield response
+
+                response = self.__wait_for_environment_response(future)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @internal_typechecked
+    def __fetch_environment_response(
         self,
-        url: Url,
-        params: dict,
-        cache_duration: int,
-        sanitise=True,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
     ) -> Any:
-        """Get environment data from the specified endpoint URL.
+        """Get the unsanitised response of one page from an endpoint.
 
-        If there are pages of data, then compile all of those pages into one \
-            big list.
+        :param endpoint: The endpoint to send the request to.
+        :type endpoint: EndpointDict
 
-        (Since this method has to call `send_request()`, so the parameters \
-            are similar to that method's.)
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
 
-        :param url: The endpoint URL to send the request to.
-        :type url: Url
+        :return: Response of the page.
+        :rtype: Any
+        """
+        return self.send_request(**page_request(endpoint, params))
+
+    @internal_typechecked
+    def __time_environment_response(
+        self,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
+    ) -> tuple[Any, float]:
+        """Get the unsanitised response of one page from an endpoint, and the \
+            time taken to get it.
+
+        :param endpoint: The endpoint to send the request to.
+        :type endpoint: EndpointDict
 
         :param params: List of parameters to be passed to the endpoint URL.
         :type params: dict
 
-        :param cache_duration: Number of seconds before the cache expires.
-        :type cache_duration: int
+        :return: Response of the page, and the number of seconds taken.
+        :rtype: tuple[Any, float]
+        """
+        start = perf_counter()
+        response = self.__fetch_environment_response(endpoint, params)
+        return response, perf_counter() - start
 
-        :param sanitise: If true, then the response's values are sanitised \
-            using the ``sanitise_data()`` method. Defaults to True.
-        :type iterate: bool
+    @internal_typechecked
+    def __wait_for_environment_response(self, future: Future) -> Any:
+        """Wait for a prefetched page, and measure the time hidden by \
+            prefetching it.
+
+        :param future: Future of the prefetched page's response and the time \
+            taken to get it.
+        :type future: Future
+
+        :return: Response of the page.
+        :rtype: Any
+        """
+        start = perf_counter()
+        response, fetch_seconds = future.result()
+        wait_seconds = perf_counter() - start
+
+        with self.__pipeline_stats_lock:
+            stats = self.__pipeline_stats
+            stats['pages_prefetched'] += 1
+            stats['fetch_seconds'] += fetch_seconds
+            stats['wait_seconds'] += wait_seconds
+            stats['hidden_seconds'] += max(fetch_seconds - wait_seconds, 0.0)
+
+        return response
+
+    def __collect_environment_data(
+        self,
+        endpoint: EndpointDict,
+        params: dict[str, Any],
+    ) -> Any:
+        """Get environment data from an endpoint.
+
+        If there are pages of data, then compile all of those pages into one \
+            big list.
+
+        :param endpoint: The endpoint to send the requests to.
+        :type endpoint: EndpointDict
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
 
         :return: data from the endpoint, compiling all pages of readings.
         :rtype: Any (but really a dict)
         """
-        response = self.send_request(
-            url,
-            params=params,
-            cache_duration=cache_duration,
-            sanitise=sanitise,
-        )
+        pages = self.__iter_environment_pages(endpoint, params)
 
-        data = response.get('data', {})
-
-        if 'paginationToken' in data:
-            pagination_token = data.pop('paginationToken')
-
-            # Collect the next page of data and append it to this one
-            params['paginationToken'] = pagination_token
-
-            # Sleep for a bit to avoid hitting the rate limit
-            sleep(0.5)
-
-            response_data = self.__collect_environment_data(
-                url,
-                params=params,
-                cache_duration=cache_duration,
-                sanitise=sanitise,
-            )
-
-            data_items_name = ''
-            if 'items' in data and 'items' in response_data:
-                data_items_name = 'items'
-            elif 'readings' in data and 'readings' in response_data:
-                data_items_name = 'readings'
-            elif 'records' in data and 'records' in response_data:
-                data_items_name = 'records'
-            if data_items_name != '':
-                data[data_items_name].extend(response_data[data_items_name])
-
-            # Merge and keep unique values
-            data_centre_name = ''
-            if 'area_metadata' in data and 'area_metadata' in response_data:
-                data_centre_name = 'area_metadata'
-            elif 'regionMetadata' in data and 'regionMetadata' in response_data:
-                data_centre_name = 'regionMetadata'
-            elif 'stations' in data and 'stations' in response_data:
-                data_centre_name = 'stations'
-            if data_centre_name != '':
-                for data_centre in response_data[data_centre_name]:
-                    if data_centre not in data[data_centre_name]:
-                        data[data_centre_name].append(data_centre)
+        data = next(pages)
+        index: MetadataIndex = {}
+        for page_data in pages:
+            merge_page(data, page_data, index)
 
         return data
 
@@ -72,6 +72,9 @@ WBGT_MIN_DATETIME = datetime_as_sgt(datetime(2025, 2, 1, 0, 0, 0))
 WIND_DIRECTION_MIN_DATETIME = datetime_as_sgt(datetime(2016, 11, 1, 0, 0, 0))
 WIND_SPEED_MIN_DATETIME = datetime_as_sgt(datetime(2016, 12, 1, 0, 0, 0))
 
+INVALID_METHOD_ERROR_MESSAGE = 'method must be a method of the Environment ' \
+    'client, e.g. "air_temperature".'
+
 INVALID_DATETIME_ERROR_MESSAGE_FORMAT = 'date must be on or after {}.'
 INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE = \
     INVALID_DATETIME_ERROR_MESSAGE_FORMAT.format(
@@ -161,6 +164,8 @@ __all__ = [
     'WIND_DIRECTION_MIN_DATETIME',
     'WIND_SPEED_MIN_DATETIME',
 
+    'INVALID_METHOD_ERROR_MESSAGE',
+
     'INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE',
     'INVALID_FOUR_DAY_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE',
     'INVALID_LIGHTNING_DATETIME_ERROR_MESSAGE',
@@ -0,0 +1,809 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Requests of the Environment client's methods.
+
+Each method's request is built by its own function here, which validates the \
+    method's arguments and returns its endpoint and parameters. The \
+    synchronous and asynchronous clients share these functions, so that they \
+    send the same requests, and a method's response can be collected in one \
+    go or page by page.
+"""
+
+from typing import Any, Callable, NotRequired, TypedDict
+
+from ..constants import (
+    CACHE_ONE_MINUTE,
+    CACHE_FIVE_MINUTES,
+    CACHE_THIRTY_MINUTES,
+    CACHE_ONE_HOUR,
+    CACHE_TWELVE_HOURS,
+)
+from ..datagovsg import DataGovSg
+from ..types import RequestDict, Url
+from ..validation import internal_typechecked
+
+from .constants import (
+    INVALID_METHOD_ERROR_MESSAGE,
+
+    AIR_TEMPERATURE_API_ENDPOINT,
+    FOUR_DAY_WEATHER_FORECAST_API_ENDPOINT,
+    PM25_API_ENDPOINT,
+    PSI_API_ENDPOINT,
+    RAINFALL_API_ENDPOINT,
+    RELATIVE_HUMIDITY_API_ENDPOINT,
+    TWENTY_FOUR_HOUR_WEATHER_FORECAST_API_ENDPOINT,
+    TWO_HOUR_WEATHER_FORECAST_API_ENDPOINT,
+    UV_INDEX_API_ENDPOINT,
+    WIND_DIRECTION_API_ENDPOINT,
+    WIND_SPEED_API_ENDPOINT,
+
+    WEATHER_API_ENDPOINT,
+    FLOOD_ALERTS_API_ENDPOINT,
+
+    LIGHTNING_DEFAULT_PARAMS,
+    WBGT_DEFAULT_PARAMS,
+
+    AIR_TEMPERATURE_MIN_DATETIME,
+    FOUR_DAY_WEATHER_FORECAST_MIN_DATETIME,
+    LIGHTNING_MIN_DATETIME,
+    PM25_MIN_DATETIME,
+    PSI_MIN_DATETIME,
+    RAINFALL_MIN_DATETIME,
+    RELATIVE_HUMIDITY_MIN_DATETIME,
+    UV_MIN_DATETIME,
+    TWENTY_FOUR_HOUR_WEATHER_FORECAST_MIN_DATETIME,
+    TWO_HOUR_WEATHER_FORECAST_MIN_DATETIME,
+    WBGT_MIN_DATETIME,
+    WIND_DIRECTION_MIN_DATETIME,
+    WIND_SPEED_MIN_DATETIME,
+
+    INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE,
+    INVALID_FOUR_DAY_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
+    INVALID_LIGHTNING_DATETIME_ERROR_MESSAGE,
+    INVALID_PM25_DATETIME_ERROR_MESSAGE,
+    INVALID_PSI_DATETIME_ERROR_MESSAGE,
+    INVALID_RAINFALL_DATETIME_ERROR_MESSAGE,
+    INVALID_RELATIVE_HUMIDITY_DATETIME_ERROR_MESSAGE,
+    INVALID_TWENTY_FOUR_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
+    INVALID_TWO_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
+    INVALID_UV_DATETIME_ERROR_MESSAGE,
+    INVALID_WBGT_DATETIME_ERROR_MESSAGE,
+    INVALID_WIND_DIRECTION_DATETIME_ERROR_MESSAGE,
+    INVALID_WIND_SPEED_DATETIME_ERROR_MESSAGE,
+)
+from .pagination import pop_pagination_token
+from .types_args import EnvironmentArgsDict, WeatherArgsDict
+from .types import (
+    EnvironmentReadingDict,
+    PM25Dict,
+    PSIDict,
+    UVIndexDict,
+    WeatherDict,
+    WeatherForecastTwoHourDict,
+    WeatherForecastTwentyFourHourDict,
+    WeatherForecastFourDayDict,
+)
+
+class EndpointDict(TypedDict):
+    """Type definition for the endpoint of an Environment client method."""
+
+    url: Url
+    """The endpoint URL to send the request to."""
+    cache_duration: int
+    """Number of seconds before the cache expires."""
+    update_cadence: NotRequired[int]
+    """Number of seconds between the endpoint's updates, if they are \
+        regular."""
+    schema: Any
+    """The expected type of the response's data."""
+
+@internal_typechecked
+def air_temperature_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``air_temperature()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 May 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE,
+        min_dt=AIR_TEMPERATURE_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_ONE_MINUTE,
+    )
+
+    endpoint: EndpointDict = {
+        'url': AIR_TEMPERATURE_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_MINUTE,
+        'update_cadence': CACHE_ONE_MINUTE,
+        'schema': EnvironmentReadingDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def flood_alerts_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``flood_alerts()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+    )
+
+    endpoint: EndpointDict = {
+        'url': FLOOD_ALERTS_API_ENDPOINT,
+        'cache_duration': CACHE_THIRTY_MINUTES,
+        'schema': WeatherDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def lightning_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``lightning()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really WeatherArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 February 2025 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_LIGHTNING_DATETIME_ERROR_MESSAGE,
+        min_dt=LIGHTNING_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=WeatherArgsDict,
+        original_params=kwargs,
+        default_params=LIGHTNING_DEFAULT_PARAMS,
+    )
+
+    endpoint: EndpointDict = {
+        'url': WEATHER_API_ENDPOINT,
+        'cache_duration': CACHE_THIRTY_MINUTES,
+        'schema': WeatherDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def pm25_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``pm25()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 February 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_PM25_DATETIME_ERROR_MESSAGE,
+        min_dt=PM25_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_ONE_HOUR,
+    )
+
+    endpoint: EndpointDict = {
+        'url': PM25_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_HOUR,
+        'update_cadence': CACHE_ONE_HOUR,
+        'schema': PM25Dict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def psi_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``psi()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 February 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_PSI_DATETIME_ERROR_MESSAGE,
+        min_dt=PSI_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_ONE_HOUR,
+    )
+
+    endpoint: EndpointDict = {
+        'url': PSI_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_HOUR,
+        'update_cadence': CACHE_ONE_HOUR,
+        'schema': PSIDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def rainfall_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``rainfall()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 December 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_RAINFALL_DATETIME_ERROR_MESSAGE,
+        min_dt=RAINFALL_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_FIVE_MINUTES,
+    )
+
+    endpoint: EndpointDict = {
+        'url': RAINFALL_API_ENDPOINT,
+        'cache_duration': CACHE_FIVE_MINUTES,
+        'update_cadence': CACHE_FIVE_MINUTES,
+        'schema': EnvironmentReadingDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def relative_humidity_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``relative_humidity()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 November 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_RELATIVE_HUMIDITY_DATETIME_ERROR_MESSAGE,
+        min_dt=RELATIVE_HUMIDITY_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_ONE_MINUTE,
+    )
+
+    endpoint: EndpointDict = {
+        'url': RELATIVE_HUMIDITY_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_MINUTE,
+        'update_cadence': CACHE_ONE_MINUTE,
+        'schema': EnvironmentReadingDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def uv_index_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``uv_index()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 March 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_UV_DATETIME_ERROR_MESSAGE,
+        min_dt=UV_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_ONE_HOUR,
+    )
+
+    endpoint: EndpointDict = {
+        'url': UV_INDEX_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_HOUR,
+        'update_cadence': CACHE_ONE_HOUR,
+        'schema': UVIndexDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def wbgt_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``wbgt()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really WeatherArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 February 2025 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_WBGT_DATETIME_ERROR_MESSAGE,
+        min_dt=WBGT_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=WeatherArgsDict,
+        original_params=kwargs,
+        default_params=WBGT_DEFAULT_PARAMS,
+    )
+
+    endpoint: EndpointDict = {
+        'url': WEATHER_API_ENDPOINT,
+        'cache_duration': CACHE_THIRTY_MINUTES,
+        'schema': WeatherDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def two_hour_weather_forecast_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``two_hour_weather_forecast()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 March 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_TWO_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
+        min_dt=TWO_HOUR_WEATHER_FORECAST_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+    )
+
+    endpoint: EndpointDict = {
+        'url': TWO_HOUR_WEATHER_FORECAST_API_ENDPOINT,
+        'cache_duration': CACHE_THIRTY_MINUTES,
+        'update_cadence': CACHE_THIRTY_MINUTES,
+        'schema': WeatherForecastTwoHourDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def twenty_four_hour_weather_forecast_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``twenty_four_hour_weather_forecast()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 March 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=\
+            INVALID_TWENTY_FOUR_HOUR_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
+        min_dt=TWENTY_FOUR_HOUR_WEATHER_FORECAST_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+    )
+
+    endpoint: EndpointDict = {
+        'url': TWENTY_FOUR_HOUR_WEATHER_FORECAST_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_HOUR,
+        'schema': WeatherForecastTwentyFourHourDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def four_day_weather_forecast_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``four_day_weather_forecast()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 March 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_FOUR_DAY_WEATHER_FORECAST_DATETIME_ERROR_MESSAGE,
+        min_dt=FOUR_DAY_WEATHER_FORECAST_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+    )
+
+    endpoint: EndpointDict = {
+        'url': FOUR_DAY_WEATHER_FORECAST_API_ENDPOINT,
+        'cache_duration': CACHE_TWELVE_HOURS,
+        'update_cadence': CACHE_TWELVE_HOURS,
+        'schema': WeatherForecastFourDayDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def wind_direction_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``wind_direction()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 November 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_WIND_DIRECTION_DATETIME_ERROR_MESSAGE,
+        min_dt=WIND_DIRECTION_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_ONE_MINUTE,
+    )
+
+    endpoint: EndpointDict = {
+        'url': WIND_DIRECTION_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_MINUTE,
+        'update_cadence': CACHE_ONE_MINUTE,
+        'schema': EnvironmentReadingDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def wind_speed_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of ``wind_speed()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really EnvironmentArgsDict)
+
+    :raises ValueError: ``date`` argument is before 1 December 2016 \
+        12:00am (inclusive).
+
+    :return: The endpoint to send the request to, and the parameters \
+        to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date',
+        error_message=INVALID_WIND_SPEED_DATETIME_ERROR_MESSAGE,
+        min_dt=WIND_SPEED_MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=EnvironmentArgsDict,
+        original_params=kwargs,
+        time_resolution=CACHE_ONE_MINUTE,
+    )
+
+    endpoint: EndpointDict = {
+        'url': WIND_SPEED_API_ENDPOINT,
+        'cache_duration': CACHE_ONE_MINUTE,
+        'update_cadence': CACHE_ONE_MINUTE,
+        'schema': EnvironmentReadingDict,
+    }
+
+    return endpoint, params
+
+@internal_typechecked
+def page_request(
+    endpoint: EndpointDict,
+    params: dict[str, Any],
+) -> RequestDict:
+    """Build the request of one page of data from an endpoint.
+
+    The response is not sanitised, so that its pagination token can be read \
+        before its page is sanitised.
+
+    :param endpoint: The endpoint to send the request to.
+    :type endpoint: EndpointDict
+
+    :param params: List of parameters to be passed to the endpoint URL.
+    :type params: dict
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    request: RequestDict = {
+        'url': endpoint['url'],
+        'params': params,
+        'cache_duration': endpoint['cache_duration'],
+        'sanitise': False,
+    }
+    if 'update_cadence' in endpoint:
+        request['update_cadence'] = endpoint['update_cadence']
+
+    return request
+
+@internal_typechecked
+def page_result(
+    client: DataGovSg,
+    endpoint: EndpointDict,
+    response: Any,
+) -> tuple[Any, str | None]:
+    """Get the data of one page from its response.
+
+    :param client: The client that sent the request.
+    :type client: DataGovSg
+
+    :param endpoint: The endpoint that the request was sent to.
+    :type endpoint: EndpointDict
+
+    :param response: The response, from the request of ``page_request()``.
+    :type response: Any (but is really a dict)
+
+    :return: The page's sanitised data, without its pagination token, and \
+        the token of the next page, or None if this is the last page.
+    :rtype: tuple[Any, str or None]
+    """
+    data = client.sanitise_data_with_schema(
+        response.get('data', {}),
+        schema=endpoint['schema'],
+    )
+    return data, pop_pagination_token(data)
+
+REQUEST_BUILDERS: dict[
+    str,
+    Callable[[DataGovSg, Any], tuple[EndpointDict, dict[str, Any]]],
+] = {
+    'air_temperature': air_temperature_request,
+    'flood_alerts': flood_alerts_request,
+    'lightning': lightning_request,
+    'pm25': pm25_request,
+    'psi': psi_request,
+    'rainfall': rainfall_request,
+    'relative_humidity': relative_humidity_request,
+    'uv_index': uv_index_request,
+    'wbgt': wbgt_request,
+    'two_hour_weather_forecast': two_hour_weather_forecast_request,
+    'twenty_four_hour_weather_forecast': twenty_four_hour_weather_forecast_request,
+    'four_day_weather_forecast': four_day_weather_forecast_request,
+    'wind_direction': wind_direction_request,
+    'wind_speed': wind_speed_request,
+}
+"""Request builders of the Environment client's methods, by method name."""
+
+@internal_typechecked
+def build_request(
+    client: DataGovSg,
+    method: str,
+    kwargs: Any,
+) -> tuple[EndpointDict, dict[str, Any]]:
+    """Build the request of an Environment client method by its name.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param method: Name of the method, e.g. "air_temperature". Should be \
+        one of ``EnvironmentMethod``.
+    :type method: str
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really dict[str, Any])
+
+    :raises ValueError: ``method`` is not a method of the Environment client, \
+        or the ``date`` argument is out of range.
+
+    :return: The method's endpoint and the parameters to send.
+    :rtype: tuple[EndpointDict, dict[str, Any]]
+    """
+    if method not in REQUEST_BUILDERS:
+        raise ValueError(INVALID_METHOD_ERROR_MESSAGE)
+    return REQUEST_BUILDERS[method](client, kwargs)
+
+__all__ = [
+    'EndpointDict',
+    'REQUEST_BUILDERS',
+    'air_temperature_request',
+    'build_request',
+    'flood_alerts_request',
+    'four_day_weather_forecast_request',
+    'lightning_request',
+    'page_request',
+    'page_result',
+    'pm25_request',
+    'psi_request',
+    'rainfall_request',
+    'relative_humidity_request',
+    'twenty_four_hour_weather_forecast_request',
+    'two_hour_weather_forecast_request',
+    'uv_index_request',
+    'wbgt_request',
+    'wind_direction_request',
+    'wind_speed_request',
+]
@@ -0,0 +1,228 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Merge the pages of data returned by the Environment APIs."""
+
+from typing import Any, TypeAlias
+
+from ..validation import internal_typechecked
+
+PAGINATION_TOKEN_KEY = 'paginationToken'
+"""Key of the token in a page's data that points to the next page."""
+
+READING_KEYS = ('items', 'readings', 'records')
+"""Keys of the lists of readings in a page's data, in order of precedence."""
+
+METADATA_KEYS = ('area_metadata', 'regionMetadata', 'stations')
+"""Keys of the lists of metadata in a page's data, in order of precedence."""
+
+METADATA_ID_KEYS = {
+    'area_metadata': 'name',
+    'regionMetadata': 'name',
+    'stations': 'id',
+}
+"""Key of the ID of each item in a list of metadata, by key of the list."""
+
+MetadataIndex: TypeAlias = dict[str, dict[Any, list[Any]]]
+"""Items of the lists of metadata collected so far, by key of the list and \
+    then by ID of the item."""
+
+@internal_typechecked
+def get_pagination_token(data: Any) -> str | None:
+    """Get the pagination token of a page's data, without removing it.
+
+    :param data: The page's data.
+    :type data: Any (but really a dict)
+
+    :return: The token of the next page, or None if this is the last page.
+    :rtype: str or None
+    """
+    return data.get(PAGINATION_TOKEN_KEY, None)
+
+@internal_typechecked
+def pop_pagination_token(data: Any) -> str | None:
+    """Remove the pagination token from a page's data.
+
+    :param data: The page's data.
+    :type data: Any (but really a dict)
+
+    :return: The token of the next page, or None if this is the last page.
+    :rtype: str or None
+    """
+    return data.pop(PAGINATION_TOKEN_KEY, None)
+
+@internal_typechecked
+def next_page_params(
+    params: dict[str, Any],
+    pagination_token: str,
+) -> dict[str, Any]:
+    """Build the parameters of the request of the next page.
+
+    :param params: Parameters of the request of this page.
+    :type params: dict[str, Any]
+
+    :param pagination_token: The token of the next page, from this page's \
+        data.
+    :type pagination_token: str
+
+    :return: The parameters of the next page's request.
+    :rtype: dict[str, Any]
+    """
+    return params | {PAGINATION_TOKEN_KEY: pagination_token}
+
+@internal_typechecked
+def page_readings(page_data: Any) -> list[Any]:
+    """Get the readings of a page's data.
+
+    :param page_data: The page's data.
+    :type page_data: Any (but really a dict)
+
+    :return: The page's ``items``, ``readings`` or ``records``, or [] if it \
+        has none of them.
+    :rtype: list[Any]
+    """
+    for key in READING_KEYS:
+        if key in page_data:
+            return page_data[key]
+    return []
+
+@internal_typechecked
+def merge_page(
+    data: Any,
+    page_data: Any,
+    index: MetadataIndex | None=None,
+) -> None:
+    """Merge the data of the next page into the data collected so far.
+
+    Readings are appended, while metadata, e.g. stations, are appended \
+        only if they are not already in ``data``.
+
+    Metadata are looked up by their ID, e.g. a station's ``id``, so merging \
+        many pages takes time in proportion to the number of items, instead \
+        of comparing every item with every item collected so far. Items are \
+        still only left out if they are equal to an item in ``data``.
+
+    :param data: The data collected so far. This is changed in place.
+    :type data: Any (but really a dict)
+
+    :param page_data: The data of the next page.
+    :type page_data: Any (but really a dict)
+
+    :param index: Index of the metadata in ``data``. Pass the same dict, \
+        starting with an empty one, for every page merged into ``data``, so \
+        that the index is built only once. If None, then the index is built \
+        for this page only. Defaults to None.
+    :type index: MetadataIndex or None
+
+    :return: None
+    """
+    for key in READING_KEYS:
+        if key in data and key in page_data:
+            data[key].extend(page_data[key])
+            break
+
+    # Merge and keep unique values
+    for key in METADATA_KEYS:
+        if key in data and key in page_data:
+            if index is None:
+                index = {}
+            if key not in index:
+                index[key] = _index_metadata(data[key], METADATA_ID_KEYS[key])
+            _merge_metadata(
+                data[key],
+                page_data[key],
+                index[key],
+                METADATA_ID_KEYS[key],
+            )
+            break
+
+# private
+
+def _metadata_id(item: Any, id_key: str) -> Any:
+    """Get the ID of an item of metadata.
+
+    :param item: The item of metadata.
+    :type item: Any
+
+    :param id_key: Key of the item's ID.
+    :type id_key: str
+
+    :return: The item's ID, or None if it has none that can be looked up.
+    :rtype: Any
+    """
+    item_id = item.get(id_key) if isinstance(item, dict) else None
+    try:
+        hash(item_id)
+    except TypeError:
+        return None
+    return item_id
+
+def _index_metadata(items: list[Any], id_key: str) -> dict[Any, list[Any]]:
+    """Index a list of metadata by the IDs of its items.
+
+    :param items: The items of metadata.
+    :type items: list[Any]
+
+    :param id_key: Key of the items' IDs.
+    :type id_key: str
+
+    :return: The items, by ID.
+    :rtype: dict[Any, list[Any]]
+    """
+    index: dict[Any, list[Any]] = {}
+    for item in items:
+        index.setdefault(_metadata_id(item, id_key), []).append(item)
+    return index
+
+def _merge_metadata(
+    items: list[Any],
+    page_items: list[Any],
+    index: dict[Any, list[Any]],
+    id_key: str,
+) -> None:
+    """Append the items of metadata of a page that are not already in a \
+        list of metadata.
+
+    :param items: The items collected so far. This is changed in place.
+    :type items: list[Any]
+
+    :param page_items: The items of the page.
+    :type page_items: list[Any]
+
+    :param index: The items collected so far, by ID. This is changed in place.
+    :type index: dict[Any, list[Any]]
+
+    :param id_key: Key of the items' IDs.
+    :type id_key: str
+
+    :return: None
+    """
+    for item in page_items:
+        same_id_items = index.setdefault(_metadata_id(item, id_key), [])
+        if item not in same_id_items:
+            same_id_items.append(item)
+            items.append(item)
+
+__all__ = [
+    'METADATA_ID_KEYS',
+    'METADATA_KEYS',
+    'MetadataIndex',
+    'PAGINATION_TOKEN_KEY',
+    'READING_KEYS',
+    'get_pagination_token',
+    'merge_page',
+    'next_page_params',
+    'page_readings',
+    'pop_pagination_token',
+]
@@ -0,0 +1,293 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Find the stations or areas of an Environment response that are nearest to \
+    a point, and their latest readings.
+
+Station-based responses, e.g. of ``air_temperature()``, ``rainfall()``, \
+    ``relative_humidity()``, ``wind_direction()``, ``wind_speed()`` and \
+    ``wbgt()``, locate their readings by station. The forecasts of \
+    ``two_hour_weather_forecast()`` are located by the areas in its \
+    ``area_metadata``:
+
+.. code-block:: python
+
+    from datagovsg import Environment
+    from datagovsg.environment.stations import StationIndex
+    environment = Environment()
+    index = StationIndex(environment.air_temperature())
+    reading = index.reading_at(1.2839, 103.8515)
+    print(reading.station.name, reading.value)
+
+A response has at most about 60 stations or areas, so every query scans \
+    all of them. At that size, a scan is quicker than building a grid or a \
+    k-d tree for each response, unlike for the thousands of taxis of \
+    ``datagovsg.transport.spatial.TaxiGrid``.
+"""
+
+from heapq import nsmallest
+from math import cos, radians, sqrt
+from typing import Any, Iterable, NamedTuple
+
+from ..constants import (
+    EARTH_RADIUS_M,
+    INVALID_NEAREST_COUNT_ERROR_MESSAGE,
+    SINGAPORE_LATITUDE,
+)
+from ..validation import internal_typechecked
+
+class NearbyStation(NamedTuple):
+    """Station or area, and its distance from a point."""
+
+    id: str
+    """Station's ID, or area's name."""
+    name: str
+    """Station's or area's name."""
+    latitude: float
+    longitude: float
+    distance_m: float
+
+class StationReading(NamedTuple):
+    """Latest reading of a station or area."""
+
+    station: NearbyStation
+    value: Any
+    """Value of the reading, e.g. a temperature, or the forecast of an \
+        area."""
+    timestamp: Any
+    """Time of the reading, as in the response, or None."""
+
+class StationIndex:
+    """Index of the stations or areas of an Environment response, and of \
+        their latest readings.
+
+    Distances are measured on a flat plane around the latitude of \
+        Singapore, which is accurate to well within 0.1% across Singapore. \
+        Each query scans every station or area, of which there are few.
+
+    :param data: Response of a station-based method, e.g. \
+        ``Environment.air_temperature()``, or of \
+        ``Environment.two_hour_weather_forecast()``.
+    :type data: EnvironmentReadingDict or WeatherDict or \
+        WeatherForecastTwoHourDict
+    """
+
+    @internal_typechecked
+    def __init__(self, data: Any) -> None:
+        """Constructor method"""
+        stations, readings = _stations_and_readings(data)
+        self.__stations = _locate(stations.values())
+        self.__read_stations = [
+            station for station in self.__stations if station[0] in readings
+        ]
+        self.__readings = readings
+
+    def __len__(self) -> int:
+        """Count the stations or areas."""
+        return len(self.__stations)
+
+    @internal_typechecked
+    def nearest_station(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int=1,
+    ) -> list[NearbyStation]:
+        """Get the stations or areas that are nearest to a point.
+
+        :param latitude: Latitude of the point.
+        :type latitude: float
+
+        :param longitude: Longitude of the point.
+        :type longitude: float
+
+        :param k: Number of stations or areas to get. Defaults to 1.
+        :type k: int
+
+        :raises ValueError: ``k`` is less than 1.
+
+        :return: Up to ``k`` stations or areas, nearest first.
+        :rtype: list[NearbyStation]
+        """
+        if k < 1:
+            raise ValueError(INVALID_NEAREST_COUNT_ERROR_MESSAGE)
+
+        return [
+            _nearby(station, distance_squared)
+            for distance_squared, station in nsmallest(
+                k,
+                _distances(self.__stations, latitude, longitude),
+                key=lambda pair: pair[0],
+            )
+        ]
+
+    @internal_typechecked
+    def reading_at(
+        self,
+        latitude: float,
+        longitude: float,
+    ) -> StationReading | None:
+        """Get the latest reading of the nearest station or area that has a \
+            reading.
+
+        :param latitude: Latitude of the point.
+        :type latitude: float
+
+        :param longitude: Longitude of the point.
+        :type longitude: float
+
+        :return: The reading, or None if no station or area has a reading.
+        :rtype: StationReading or None
+        """
+        if not self.__read_stations:
+            return None
+
+        distance_squared, station = min(
+            _distances(self.__read_stations, latitude, longitude),
+            key=lambda pair: pair[0],
+        )
+        value, timestamp = self.__readings[station[0]]
+        return StationReading(
+            _nearby(station, distance_squared),
+            value,
+            timestamp,
+        )
+
+# private
+
+_Y_SCALE = radians(EARTH_RADIUS_M)
+_X_SCALE = _Y_SCALE * cos(radians(SINGAPORE_LATITUDE))
+
+_Station = tuple[str, str, float, float, float, float]
+"""ID, name, latitude, longitude, and projected x and y in metres of a \
+    station."""
+
+def _locate(
+    stations: Iterable[tuple[str, str, float, float]],
+) -> list[_Station]:
+    """Project the locations of a set of stations.
+
+    :param stations: ID, name, latitude and longitude of each station.
+    :type stations: Iterable[tuple[str, str, float, float]]
+
+    :return: The stations, with their projected locations.
+    :rtype: list[_Station]
+    """
+    return [
+        (
+            station_id,
+            name,
+            latitude,
+            longitude,
+            longitude * _X_SCALE,
+            latitude * _Y_SCALE,
+        )
+        for station_id, name, latitude, longitude in stations
+    ]
+
+def _distances(
+    stations: list[_Station],
+    latitude: float,
+    longitude: float,
+) -> list[tuple[float, _Station]]:
+    """Measure the squared distance from a point to every station."""
+    x = longitude * _X_SCALE
+    y = latitude * _Y_SCALE
+    return [
+        ((station[4] - x) ** 2 + (station[5] - y) ** 2, station)
+        for station in stations
+    ]
+
+def _nearby(station: _Station, distance_squared: float) -> NearbyStation:
+    """Describe a station at a distance from a point."""
+    return NearbyStation(
+        station[0],
+        station[1],
+        station[2],
+        station[3],
+        sqrt(distance_squared),
+    )
+
+def _location(value: dict, *keys: str) -> tuple[float, float] | None:
+    """Get the (latitude, longitude) under the first of ``keys`` of a dict."""
+    for key in keys:
+        location = value.get(key)
+        if isinstance(location, dict):
+            return float(location['latitude']), float(location['longitude'])
+    return None
+
+def _stations_and_readings(
+    data: Any,
+) -> tuple[
+    dict[str, tuple[str, str, float, float]],
+    dict[str, tuple[Any, Any]],
+]:
+    """Collect the stations or areas of a response, and their latest readings.
+
+    :param data: The response.
+    :type data: Any
+
+    :return: The (ID, name, latitude, longitude) of each station or area, \
+        and the (value, timestamp) of its latest reading, by ID.
+    :rtype: tuple[dict[str, tuple[str, str, float, float]], \
+        dict[str, tuple[Any, Any]]]
+    """
+    stations: dict[str, tuple[str, str, float, float]] = {}
+    readings: dict[str, tuple[Any, Any]] = {}
+
+    def read(station_id: str, value: Any, timestamp: Any) -> None:
+        latest = readings.get(station_id)
+        if latest is None or latest[1] is None \
+                or (timestamp is not None and timestamp >= latest[1]):
+            readings[station_id] = (value, timestamp)
+
+    # e.g. air_temperature()
+    for station in data.get('stations', []):
+        location = _location(station, 'location', 'labelLocation')
+        if location is not None:
+            station_id = str(station['id'])
+            stations[station_id] = \
+                (station_id, station.get('name', station_id), *location)
+    for reading in data.get('readings', []):
+        for datum in reading.get('data', []):
+            read(str(datum['stationId']), datum.get('value'), reading.get('timestamp'))
+
+    # e.g. two_hour_weather_forecast()
+    for area in data.get('area_metadata', []):
+        location = _location(area, 'label_location')
+        if location is not None:
+            stations[area['name']] = (area['name'], area['name'], *location)
+    for item in data.get('items', []):
+        for forecast in item.get('forecasts', []):
+            read(forecast['area'], forecast.get('forecast'), item.get('timestamp'))
+
+    # e.g. wbgt()
+    for record in data.get('records', []):
+        for reading in record.get('item', {}).get('readings', []):
+            station = reading.get('station')
+            location = _location(reading, 'location')
+            if not isinstance(station, dict) or location is None:
+                continue
+            station_id = str(station['id'])
+            stations[station_id] = \
+                (station_id, station.get('name', station_id), *location)
+            read(station_id, reading.get('wbgt'), record.get('datetime'))
+
+    return stations, readings
+
+__all__ = [
+    'NearbyStation',
+    'StationIndex',
+    'StationReading',
+]
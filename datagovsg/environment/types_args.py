@@ -15,7 +15,7 @@
 """Data.gov.sg custom types for Environment client methods' arguments."""
 
 from datetime import date, datetime
-from typing import NotRequired, TypedDict
+from typing import Literal, NotRequired, TypeAlias, TypedDict
 
 class EnvironmentArgsDict(TypedDict):
     """Type definition for Environment methods' input arguments"""
@@ -24,7 +24,9 @@ class EnvironmentArgsDict(TypedDict):
     """Filter for specific date or datetime.
 
     - Use ``date`` to retrieve all of the readings for that day.
-    - Use ``datetime`` to retrieve the latest readings at that moment in time.
+    - Use ``datetime`` to retrieve the latest readings at that moment in time. \
+        For endpoints with regular readings, it is rounded down to the \
+        interval between readings, e.g. the hour for ``psi()``.
 
     :example: date(2025, 1, 12)
     :example: datetime(2024, 7, 16, 23, 59, 0)
@@ -43,7 +45,26 @@ class WeatherArgsDict(EnvironmentArgsDict):
         need to set this. This is only for type checking purposes.
     """
 
+EnvironmentMethod: TypeAlias = Literal[
+    'air_temperature',
+    'flood_alerts',
+    'lightning',
+    'pm25',
+    'psi',
+    'rainfall',
+    'relative_humidity',
+    'uv_index',
+    'wbgt',
+    'two_hour_weather_forecast',
+    'twenty_four_hour_weather_forecast',
+    'four_day_weather_forecast',
+    'wind_direction',
+    'wind_speed',
+]
+"""Names of the Environment client's methods, e.g. for ``iter_pages()``."""
+
 __all__ = [
     'EnvironmentArgsDict',
+    'EnvironmentMethod',
     'WeatherArgsDict',
 ]
@@ -0,0 +1,144 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Expire cached responses when their endpoint is next expected to update.
+
+A fixed ``cache_duration`` is counted from when a response is fetched, not \
+    from when its data was published. A response that is fetched just before \
+    the next update is kept for a full ``cache_duration`` after that update, \
+    and one that is fetched just after an update is refetched long before \
+    the following one.
+
+Endpoints that update on a regular cadence instead pass their \
+    ``update_cadence`` to ``send_request()``. The response is then kept \
+    until the time in its payload, e.g. ``timestamp`` or \
+    ``update_timestamp``, plus ``update_cadence``:
+
+.. code-block:: python
+
+    from datagovsg.expiry import find_update_time, seconds_until_next_update
+    updated = find_update_time({'items': [{'timestamp': '2026-01-12T00:15:36+08:00'}]})
+    ttl = seconds_until_next_update(updated, update_cadence=60, cache_duration=60)
+
+``cache_duration`` is still the longest that a response is kept.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+
+from .constants import (
+    UPDATE_LATE_RETRY_SECONDS,
+    UPDATE_TIMESTAMP_KEYS,
+    UPDATE_TIMESTAMP_MAX_DEPTH,
+)
+from .timezone import datetime_as_sgt
+from .validation import internal_typechecked
+
+@internal_typechecked
+def find_update_time(value: Any) -> datetime | None:
+    """Find when the data of a response was published.
+
+    The response is searched breadth first, down to \
+        ``UPDATE_TIMESTAMP_MAX_DEPTH`` dicts and lists, for the first of \
+        ``UPDATE_TIMESTAMP_KEYS``. Only the first item of every list is \
+        searched, as items are ordered from the latest, so large responses \
+        are not walked.
+
+    Timestamps are kept in their own timezone, e.g. "Z" or "+00:00", and \
+        timestamps without one are in SGT.
+
+    :param value: The response's JSON value.
+    :type value: Any
+
+    :return: The time, or None if the response does not have one.
+    :rtype: datetime or None
+    """
+    level = [value]
+    for _ in range(UPDATE_TIMESTAMP_MAX_DEPTH):
+        next_level: list[Any] = []
+        for item in level:
+            if isinstance(item, list):
+                if item:
+                    next_level.append(item[0])
+            elif isinstance(item, dict):
+                for key in UPDATE_TIMESTAMP_KEYS:
+                    updated = _to_datetime(item.get(key))
+                    if updated is not None:
+                        return updated
+                next_level.extend(
+                    v for v in item.values() if isinstance(v, (dict, list))
+                )
+        level = next_level
+    return None
+
+@internal_typechecked
+def seconds_until_next_update(
+    updated: datetime | None,
+    update_cadence: int,
+    cache_duration: int,
+) -> float:
+    """Get the number of seconds until an endpoint is next expected to update.
+
+    - If the next update is due: the time until then.
+    - If the next update is late by less than ``update_cadence``: \
+        ``UPDATE_LATE_RETRY_SECONDS``, so that the update is fetched soon \
+        after it is published.
+    - If it is later than that, e.g. the response is of an earlier date, or \
+        ``updated`` is None: ``cache_duration``.
+
+    :param updated: When the response's data was published, with a timezone, \
+        e.g. from ``find_update_time()``.
+    :type updated: datetime or None
+
+    :param update_cadence: Number of seconds between the endpoint's updates.
+    :type update_cadence: int
+
+    :param cache_duration: Number of seconds before the cache expires, as \
+        passed to ``send_request()``.
+    :type cache_duration: int
+
+    :return: The number of seconds, which is at most ``cache_duration``.
+    :rtype: float
+    """
+    if updated is None:
+        return float(cache_duration)
+
+    seconds = update_cadence \
+        + (updated - datetime.now(timezone.utc)).total_seconds()
+    if seconds > 0:
+        # Clocks that are ahead of the endpoint's could give more than a cadence
+        return float(min(seconds, update_cadence, cache_duration))
+    if seconds > -update_cadence:
+        return float(min(UPDATE_LATE_RETRY_SECONDS, cache_duration))
+    return float(cache_duration)
+
+# private
+
+_DATE_MAX_LENGTH = len('2026-01-12')
+
+def _to_datetime(value: Any) -> datetime | None:
+    """Convert a timestamp to a datetime, or None if it is not one."""
+    # Dates without a time, e.g. "2026-01-12" or "20260112", are not timestamps
+    if not isinstance(value, str) or len(value) <= _DATE_MAX_LENGTH:
+        return None
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return dt if dt.tzinfo is not None else datetime_as_sgt(dt)
+
+__all__ = [
+    'find_update_time',
+    'seconds_until_next_update',
+]
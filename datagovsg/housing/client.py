@@ -16,22 +16,21 @@
 
 from typing import Unpack
 
-from typeguard import typechecked
-
-from ..constants import CACHE_ONE_MINUTE
 from ..datagovsg import DataGovSg
+from ..lazy import LazySequence
+from ..validation import boundary_typechecked
 
-from .constants import (
-    CARPARK_AVAILABILITY_API_ENDPOINT,
-
-    CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
-
-    MIN_DATETIME,
-
-    INVALID_DATETIME_ERROR_MESSAGE,
+from .endpoints import (
+    carpark_availability_columns_request,
+    carpark_availability_request,
+    carpark_availability_result,
 )
+from .columns import carpark_availability_columns
 from .types_args import HousingArgsDict
-from .types import CarparkAvailabilityItemDict
+from .types import (
+    CarparkAvailabilityColumnsDict,
+    CarparkAvailabilityItemDict,
+)
 
 class Client(DataGovSg):
     """Interact with the housing-related endpoints.
@@ -40,11 +39,11 @@ class Client(DataGovSg):
         https://data.gov.sg/datasets?formats=API&topics=housing
     """
 
-    @typechecked
+    @boundary_typechecked
     def carpark_availability(
         self,
         **kwargs: Unpack[HousingArgsDict],
-    ) -> list[CarparkAvailabilityItemDict]:
+    ) -> list[CarparkAvailabilityItemDict] | LazySequence:
         """Get the latest carpark availability in Singapore.
 
         Retrieved every minute.
@@ -56,38 +55,62 @@ class Client(DataGovSg):
         :raises ValueError: ``date_time`` argument is before 1 January 2018 \
             12:00am (inclusive).
 
-        :return: Available carpark spaces. (Cached for 1 minute.)
-        :rtype: CarparkAvailabilityDict
+        :return: Available carpark spaces, as a read-only proxy if the client \
+            is lazy. (Cached until the next update, for up to 1 minute.)
+        :rtype: list[CarparkAvailabilityItemDict] or LazySequence
         """
-        self.validate_date(
-            kwargs=kwargs,
-            date_key='date_time',
-            error_message=INVALID_DATETIME_ERROR_MESSAGE,
-            min_dt=MIN_DATETIME,
+        carpark_availability: list[CarparkAvailabilityItemDict] | LazySequence
+
+        data = self.send_request(
+            **carpark_availability_request(self, kwargs),
         )
 
-        carpark_availability: list[CarparkAvailabilityItemDict]
+        carpark_availability = carpark_availability_result(self, data)
 
-        params = self.build_params(
-            params_expected_type=HousingArgsDict,
-            original_params=kwargs,
-        )
+        return carpark_availability
 
-        data = self.send_request(
-            CARPARK_AVAILABILITY_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_MINUTE,
-            sanitise=False,
-        )
+    @boundary_typechecked
+    def carpark_availability_columns(
+        self,
+        **kwargs: Unpack[HousingArgsDict],
+    ) -> CarparkAvailabilityColumnsDict:
+        """Get the latest carpark availability in Singapore, as columns of \
+            NumPy arrays with one row per carpark and lot type.
+
+        The columns are built from the response without sanitising it, and \
+            take much less memory than ``carpark_availability()``. E.g. the \
+            occupancy of every carpark lot in Singapore is:
 
-        items = data.get('items', [])
+        .. code-block:: python
 
-        carpark_availability = self.sanitise_data(
-            items,
-            ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+            import numpy
+            columns = housing.carpark_availability_columns()
+            total_lots = columns['total_lots']
+            total_lots = numpy.where(total_lots > 0, total_lots, numpy.nan)
+            occupancy = 1 - columns['lots_available'] / total_lots
+
+        Counts that are missing or cannot be read are NaN, so the occupancy \
+            of those carparks, and of carparks without lots, is NaN.
+
+        Requires ``numpy``, e.g. with the ``numpy`` extra.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: HousingArgsDict
+
+        :raises ValueError: ``date_time`` argument is before 1 January 2018 \
+            12:00am (inclusive).
+        :raises ImportError: ``numpy`` is not installed.
+
+        :return: Available carpark spaces. (Cached until the next update, \
+            for up to 1 minute.)
+        :rtype: CarparkAvailabilityColumnsDict
+        """
+        data = self.send_request(
+            **carpark_availability_columns_request(self, kwargs),
         )
 
-        return carpark_availability
+        return carpark_availability_columns(data.get('items', []))
 
 __all__ = [
     'Client',
@@ -0,0 +1,66 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Convert carpark availability into columns of NumPy arrays."""
+
+from typing import Any
+
+from ..arrays import count_array, datetime64_array, import_numpy
+from ..validation import internal_typechecked
+
+from .types import CarparkAvailabilityColumnsDict
+
+@internal_typechecked
+def carpark_availability_columns(items: Any) -> CarparkAvailabilityColumnsDict:
+    """Convert the items of a carpark availability response into columns, \
+        with one row per carpark and lot type.
+
+    :param items: The unsanitised ``items`` of the response.
+    :type items: Any (but is really list[dict])
+
+    :raises ImportError: ``numpy`` is not installed.
+
+    :return: The columns.
+    :rtype: CarparkAvailabilityColumnsDict
+    """
+    numpy = import_numpy()
+
+    carpark_numbers: list[Any] = []
+    lot_types: list[Any] = []
+    total_lots: list[Any] = []
+    lots_available: list[Any] = []
+    update_datetimes: list[Any] = []
+
+    for item in items:
+        for carpark in item.get('carpark_data', []):
+            carpark_number = carpark.get('carpark_number', '')
+            update_datetime = carpark.get('update_datetime', '')
+            for info in carpark.get('carpark_info', []):
+                carpark_numbers.append(carpark_number)
+                lot_types.append(info.get('lot_type', ''))
+                total_lots.append(info.get('total_lots', ''))
+                lots_available.append(info.get('lots_available', ''))
+                update_datetimes.append(update_datetime)
+
+    return {
+        'carpark_number': numpy.asarray(carpark_numbers, dtype=str),
+        'lot_type': numpy.asarray(lot_types, dtype=str),
+        'total_lots': count_array(total_lots),
+        'lots_available': count_array(lots_available),
+        'update_datetime': datetime64_array(update_datetimes),
+    }
+
+__all__ = [
+    'carpark_availability_columns',
+]
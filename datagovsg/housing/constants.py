@@ -16,7 +16,7 @@
 
 from datetime import datetime
 
-from ..constants import BASE_V1_API_ENDPOINT
+from ..constants import BASE_V1_API_ENDPOINT, CACHE_ONE_MINUTE
 from ..timezone import datetime_as_sgt
 
 TRANSPORT_API_ENDPOINT = f'{BASE_V1_API_ENDPOINT}/transport'
@@ -27,6 +27,8 @@ CARPARK_AVAILABILITY_API_ENDPOINT = \
 CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS = [
     '[].carpark_data[].carpark_number',
 ]
+CARPARK_AVAILABILITY_TIME_RESOLUTION = CACHE_ONE_MINUTE
+CARPARK_AVAILABILITY_UPDATE_CADENCE = CACHE_ONE_MINUTE
 
 MIN_DATETIME = datetime_as_sgt(datetime(2018, 1, 1, 0, 0, 0))
 
@@ -39,6 +41,8 @@ __all__ = [
     'CARPARK_AVAILABILITY_API_ENDPOINT',
 
     'CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS',
+    'CARPARK_AVAILABILITY_TIME_RESOLUTION',
+    'CARPARK_AVAILABILITY_UPDATE_CADENCE',
 
     'MIN_DATETIME',
     'INVALID_DATETIME_ERROR_MESSAGE',
@@ -0,0 +1,179 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Requests of the Housing client's methods.
+
+Each method's request is built by its own function here, which validates the \
+    method's arguments and returns the arguments of ``send_request()``. The \
+    method's result is then got from the response by its ``_result()`` \
+    function, if it has one. The synchronous and asynchronous clients share \
+    these functions, so that they send the same requests and return the same \
+    results.
+"""
+
+from typing import Any
+
+from ..constants import CACHE_ONE_MINUTE
+from ..datagovsg import DataGovSg
+from ..lazy import LazySequence
+from ..types import RequestDict
+from ..validation import internal_typechecked
+
+from .constants import (
+    CARPARK_AVAILABILITY_API_ENDPOINT,
+    CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+    CARPARK_AVAILABILITY_TIME_RESOLUTION,
+    CARPARK_AVAILABILITY_UPDATE_CADENCE,
+
+    MIN_DATETIME,
+
+    INVALID_DATETIME_ERROR_MESSAGE,
+)
+from .types_args import HousingArgsDict
+from .types import CarparkAvailabilityItemDict
+
+@internal_typechecked
+def carpark_availability_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> RequestDict:
+    """Build the request of ``carpark_availability()``.
+
+    The response is not sanitised if the client is lazy, so that it can be \
+        sanitised lazily by ``carpark_availability_result()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really HousingArgsDict)
+
+    :raises ValueError: ``date_time`` argument is before 1 January 2018 \
+        12:00am (inclusive).
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    request = _carpark_availability_request(client, kwargs)
+    if client.lazy:
+        request['sanitise'] = False
+    else:
+        request['sanitise_schema'] = dict[
+            str,
+            list[CarparkAvailabilityItemDict],
+        ]
+
+    return request
+
+@internal_typechecked
+def carpark_availability_result(
+    client: DataGovSg,
+    data: Any,
+) -> list[CarparkAvailabilityItemDict] | LazySequence:
+    """Get the result of ``carpark_availability()`` from its response.
+
+    :param client: The client that sent the request.
+    :type client: DataGovSg
+
+    :param data: The response, from the request of \
+        ``carpark_availability_request()``.
+    :type data: Any (but is really a dict)
+
+    :return: Available carpark spaces, as a read-only proxy if the client \
+        is lazy.
+    :rtype: list[CarparkAvailabilityItemDict] or LazySequence
+    """
+    if client.lazy:
+        return client.sanitise_data_lazily(
+            data.get('items', []),
+            ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        )
+
+    carpark_availability: list[CarparkAvailabilityItemDict]
+    carpark_availability = data.get('items', [])
+    return carpark_availability
+
+@internal_typechecked
+def carpark_availability_columns_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> RequestDict:
+    """Build the request of ``carpark_availability_columns()``.
+
+    The response is not sanitised.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really HousingArgsDict)
+
+    :raises ValueError: ``date_time`` argument is before 1 January 2018 \
+        12:00am (inclusive).
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    request = _carpark_availability_request(client, kwargs)
+    request['sanitise'] = False
+
+    return request
+
+# private
+
+def _carpark_availability_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> RequestDict:
+    """Build the request of the carpark availability endpoint, which both \
+        ``carpark_availability()`` and ``carpark_availability_columns()`` \
+        send.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really HousingArgsDict)
+
+    :raises ValueError: ``date_time`` argument is before 1 January 2018 \
+        12:00am (inclusive).
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    client.validate_date(
+        kwargs=kwargs,
+        date_key='date_time',
+        error_message=INVALID_DATETIME_ERROR_MESSAGE,
+        min_dt=MIN_DATETIME,
+    )
+
+    params = client.build_params(
+        params_expected_type=HousingArgsDict,
+        original_params=kwargs,
+        time_resolution=CARPARK_AVAILABILITY_TIME_RESOLUTION,
+    )
+
+    return {
+        'url': CARPARK_AVAILABILITY_API_ENDPOINT,
+        'params': params,
+        'cache_duration': CACHE_ONE_MINUTE,
+        'update_cadence': CARPARK_AVAILABILITY_UPDATE_CADENCE,
+    }
+
+__all__ = [
+    'carpark_availability_columns_request',
+    'carpark_availability_request',
+    'carpark_availability_result',
+]
@@ -15,7 +15,7 @@
 """Data.gov.sg custom types for Housing client methods' responses."""
 
 from datetime import datetime
-from typing import TypedDict
+from typing import Any, TypedDict
 
 # Carpark Availability
 
@@ -67,6 +67,41 @@ class CarparkAvailabilityItemDict(TypedDict):
     carpark_data: list[_CarparkAvailabilityItemDataDict]
     """Carpark availability information per carpark."""
 
+class CarparkAvailabilityColumnsDict(TypedDict):
+    """Type definition for the columns of carpark availability, with one \
+        row per carpark and lot type."""
+
+    carpark_number: Any
+    """NumPy array of carpark numbers.
+
+    :example: array(['HE12', 'HE12', 'HLM'], dtype='<U4')
+    """
+    lot_type: Any
+    """NumPy array of types of carpark lot.
+
+    :example: array(['C', 'Y', 'C'], dtype='<U1')
+    """
+    total_lots: Any
+    """NumPy array of ``float64`` total numbers of carpark lots. Numbers \
+        that are missing or cannot be read are NaN.
+
+    :example: array([105., 10., 583.])
+    """
+    lots_available: Any
+    """NumPy array of ``float64`` numbers of available carpark lots. \
+        Numbers that are missing or cannot be read are NaN.
+
+    :example: array([86., 0., nan])
+    """
+    update_datetime: Any
+    """NumPy array of ``datetime64[s]`` update date-times, in SGT, without \
+        a timezone. Date-times that cannot be read are ``NaT``.
+
+    :example: array(['2025-01-12T15:59:00', '2025-01-12T15:59:00', \
+        '2025-01-12T15:58:30'], dtype='datetime64[s]')
+    """
+
 __all__ = [
+    'CarparkAvailabilityColumnsDict',
     'CarparkAvailabilityItemDict',
 ]
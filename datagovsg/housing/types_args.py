@@ -21,7 +21,8 @@ class HousingArgsDict(TypedDict):
     """Type definition for carpark_availability() input arguments"""
 
     date_time: NotRequired[datetime]
-    """Retrieve the latest availability at that moment in time.
+    """Retrieve the latest availability at that moment in time. It is \
+        rounded down to the minute.
 
     :example: datetime(2024, 7, 16, 23, 59, 0)
     """
@@ -0,0 +1,192 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Match the key paths of values in a response against ``ignore_keys``.
+
+A key path names the dict keys and list items that lead to a value, e.g. \
+    ``[].carpark_data[].carpark_number`` is the ``carpark_number`` of every \
+    item of the ``carpark_data`` of every item of a list. A key of ``*`` \
+    matches any one key, e.g. ``[].*[].camera_id``.
+
+Key paths are compiled once into a trie, which is walked alongside the \
+    response, one dict key or list item at a time, so that no key path \
+    strings are built while sanitising:
+
+.. code-block:: python
+
+    from datagovsg.keypaths import compile_ignore_keys
+    root = compile_ignore_keys(('[].carpark_data[].carpark_number',))
+    node = root.item.keys['carpark_data'].item.keys['carpark_number']
+    assert node.ignore
+"""
+
+from functools import cache
+from typing import Self
+
+from .validation import internal_typechecked
+
+ANY_KEY = '*'
+"""Key in a key path that matches any one key."""
+
+LIST_ITEM = '[]'
+"""Step in a key path to every item of a list."""
+
+class IgnoreKeyNode:
+    """Node of a trie of key paths, for the values under one dict key or list \
+        item of a response.
+
+    The trie has no node for a value if no key path can match it or \
+        anything under it, so ``None`` means that nothing is ignored there.
+
+    :param ignore: If True, then the value is kept as-is.
+    :type ignore: bool
+
+    :param keys: Nodes of the dict keys under the value. The nodes of \
+        ``any_key`` are already merged into them.
+    :type keys: dict[str, IgnoreKeyNode]
+
+    :param any_key: Node of the dict keys that are not in ``keys``, or None.
+    :type any_key: IgnoreKeyNode or None
+
+    :param item: Node of the list items under the value, or None.
+    :type item: IgnoreKeyNode or None
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('ignore', 'keys', 'any_key', 'item')
+
+    def __init__(
+        self,
+        ignore: bool,
+        keys: dict[str, Self],
+        any_key: Self | None,
+        item: Self | None,
+    ) -> None:
+        """Constructor method"""
+        self.ignore = ignore
+        self.keys = keys
+        self.any_key = any_key
+        self.item = item
+
+    def key(self, key: str) -> Self | None:
+        """Get the node of a dict key under this value.
+
+        :param key: The dict key.
+        :type key: str
+
+        :return: The node, or None if nothing is ignored under the key.
+        :rtype: IgnoreKeyNode or None
+        """
+        return self.keys.get(key, self.any_key)
+
+@cache
+@internal_typechecked
+def compile_ignore_keys(ignore_keys: tuple[str, ...]) -> IgnoreKeyNode | None:
+    """Compile key paths into a trie.
+
+    Compiled tries are cached by ``ignore_keys``.
+
+    :param ignore_keys: Key paths of values to keep as-is, e.g. \
+        ``('[].carpark_data[].carpark_number',)``.
+    :type ignore_keys: tuple[str, ...]
+
+    :return: The root node of the trie, or None if there are no key paths.
+    :rtype: IgnoreKeyNode or None
+    """
+    return _compile(frozenset(_split_key_path(k) for k in ignore_keys))
+
+@internal_typechecked
+def find_ignore_node(
+    root: IgnoreKeyNode | None,
+    key_path: str,
+) -> IgnoreKeyNode | None:
+    """Walk a trie down to the node of a key path.
+
+    :param root: The root node of the trie, from ``compile_ignore_keys()``.
+    :type root: IgnoreKeyNode or None
+
+    :param key_path: Key path of the value, e.g. ``[].carpark_data``.
+    :type key_path: str
+
+    :return: The node of the value, or None if nothing is ignored under it.
+    :rtype: IgnoreKeyNode or None
+    """
+    node = root
+    for step in _split_key_path(key_path):
+        if node is None:
+            break
+        node = node.item if step == LIST_ITEM else node.key(step)
+    return node
+
+# private
+
+def _split_key_path(key_path: str) -> tuple[str, ...]:
+    """Split a key path into its dict keys and list items.
+
+    :param key_path: Key path, e.g. ``[].carpark_data[].carpark_number``.
+    :type key_path: str
+
+    :return: The steps, e.g. ``('[]', 'carpark_data', '[]', \
+        'carpark_number')``.
+    :rtype: tuple[str, ...]
+    """
+    steps: list[str] = []
+    for part in key_path.split('.') if key_path else []:
+        items = 0
+        while part.endswith(LIST_ITEM):
+            part = part[:-len(LIST_ITEM)]
+            items += 1
+        if part:
+            steps.append(part)
+        steps.extend([LIST_ITEM] * items)
+    return tuple(steps)
+
+@cache
+def _compile(paths: frozenset[tuple[str, ...]]) -> IgnoreKeyNode | None:
+    """Compile the rest of some key paths into a node.
+
+    Nodes are cached by ``paths``, so that equal subtries are shared.
+
+    :param paths: The steps of the key paths that are left to match.
+    :type paths: frozenset[tuple[str, ...]]
+
+    :return: The node, or None if ``paths`` is empty.
+    :rtype: IgnoreKeyNode or None
+    """
+    if not paths:
+        return None
+
+    def rest(step: str) -> frozenset[tuple[str, ...]]:
+        return frozenset(p[1:] for p in paths if p and p[0] == step)
+
+    any_key_paths = rest(ANY_KEY)
+    keys = {
+        p[0]: _compile(rest(p[0]) | any_key_paths)
+        for p in paths if p and p[0] not in (ANY_KEY, LIST_ITEM)
+    }
+    return IgnoreKeyNode(
+        ignore=() in paths,
+        keys=keys,
+        any_key=_compile(any_key_paths),
+        item=_compile(rest(LIST_ITEM)),
+    )
+
+__all__ = [
+    'ANY_KEY',
+    'LIST_ITEM',
+    'IgnoreKeyNode',
+    'compile_ignore_keys',
+    'find_ignore_node',
+]
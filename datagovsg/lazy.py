@@ -0,0 +1,256 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sanitise the values of a response only when they are read.
+
+``DataGovSg.sanitise_data()`` converts every value of a response before it is \
+    returned, even if only a few of them are read. With ``lazy=True``, the \
+    clients that return large responses, i.e. ``Housing.carpark_availability()`` \
+    and ``Transport.traffic_images()``, return read-only proxies over the \
+    response's JSON value instead:
+
+.. code-block:: python
+
+    from datagovsg import Housing
+    housing = Housing(lazy=True)
+    carpark_availability = housing.carpark_availability()
+    timestamp = carpark_availability[0]['timestamp']
+
+A value is converted the first time that it is read, and is remembered, so \
+    reading it again returns the same object. Dicts are read as ``LazyMapping`` \
+    and lists as ``LazySequence``, which compare equal to the dicts and lists \
+    that ``sanitise_data()`` would have returned.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any, Callable
+
+from .keypaths import IgnoreKeyNode, compile_ignore_keys
+from .validation import internal_typechecked
+
+class LazyMapping(Mapping):
+    """Read-only proxy over a dict, which sanitises its values when they are \
+        read.
+
+    :param value: The dict to read from. It must not be changed.
+    :type value: dict
+
+    :param sanitise_value: Function that sanitises a value that is not a dict \
+        or a list.
+    :type sanitise_value: Callable[[Any], Any]
+
+    :param ignore_node: Node of the dict in the trie of ``ignore_keys``, \
+        from ``datagovsg.keypaths.compile_ignore_keys()``, or None if \
+        nothing is ignored under it.
+    :type ignore_node: IgnoreKeyNode or None
+    """
+
+    __slots__ = (
+        '__value',
+        '__sanitise_value',
+        '__ignore_node',
+        '__sanitised',
+    )
+
+    def __init__(
+        self,
+        value: dict,
+        sanitise_value: Callable[[Any], Any],
+        ignore_node: IgnoreKeyNode | None,
+    ) -> None:
+        """Constructor method"""
+        self.__value = value
+        self.__sanitise_value = sanitise_value
+        self.__ignore_node = ignore_node
+        self.__sanitised: dict[Any, Any] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get a sanitised value, sanitising it if it has not been read yet."""
+        try:
+            return self.__sanitised[key]
+        except KeyError:
+            pass
+
+        value = self.__value[key]
+        node = self.__ignore_node
+        if node is not None:
+            node = node.key(key)
+        if node is None or not node.ignore:
+            value = _sanitise(value, self.__sanitise_value, node)
+
+        self.__sanitised[key] = value
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        """Check for a key without sanitising its value."""
+        return key in self.__value
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the keys."""
+        return iter(self.__value)
+
+    def __len__(self) -> int:
+        """Count the keys."""
+        return len(self.__value)
+
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+class LazySequence(Sequence):
+    """Read-only proxy over a list, which sanitises its items when they are \
+        read.
+
+    :param value: The list to read from. It must not be changed.
+    :type value: list
+
+    :param sanitise_value: Function that sanitises a value that is not a dict \
+        or a list.
+    :type sanitise_value: Callable[[Any], Any]
+
+    :param ignore_node: Node of the list in the trie of ``ignore_keys``, \
+        from ``datagovsg.keypaths.compile_ignore_keys()``, or None if \
+        nothing is ignored under it.
+    :type ignore_node: IgnoreKeyNode or None
+    """
+
+    __slots__ = (
+        '__value',
+        '__sanitise_value',
+        '__ignore_node',
+        '__sanitised',
+    )
+
+    def __init__(
+        self,
+        value: list,
+        sanitise_value: Callable[[Any], Any],
+        ignore_node: IgnoreKeyNode | None,
+    ) -> None:
+        """Constructor method"""
+        self.__value = value
+        self.__sanitise_value = sanitise_value
+        self.__ignore_node = ignore_node
+        self.__sanitised: dict[int, Any] = {}
+
+    def __getitem__(self, index: Any) -> Any:
+        """Get a sanitised item, sanitising it if it has not been read yet. \
+            A slice is returned as a list."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.__value)))]
+
+        if index < 0:
+            index += len(self.__value)
+        if index < 0 or index >= len(self.__value):
+            raise IndexError('list index out of range')
+        try:
+            return self.__sanitised[index]
+        except KeyError:
+            pass
+
+        node = self.__ignore_node
+        value = _sanitise(
+            self.__value[index],
+            self.__sanitise_value,
+            node.item if node is not None else None,
+        )
+
+        self.__sanitised[index] = value
+        return value
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the sanitised items."""
+        for index in range(len(self.__value)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """Count the items."""
+        return len(self.__value)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare with another list or sequence, item by item."""
+        if not isinstance(other, (list, tuple, LazySequence)):
+            return NotImplemented
+        return len(self) == len(other) \
+            and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}({list(self)!r})'
+
+@internal_typechecked
+def sanitise_lazily(
+    value: Any,
+    sanitise_value: Callable[[Any], Any],
+    ignore_keys: list[str] | None=None,
+) -> Any:
+    """Wrap a value in a proxy that sanitises its contents when they are read.
+
+    :param value: Value to sanitise. It must not be changed afterwards.
+    :type value: Any
+
+    :param sanitise_value: Function that sanitises a value that is not a dict \
+        or a list, e.g. ``sanitise_data()`` with ``iterate=False``.
+    :type sanitise_value: Callable[[Any], Any]
+
+    :param ignore_keys: Key paths of values that are returned as-is, as in \
+        ``DataGovSg.sanitise_data()``. Defaults to [].
+    :type ignore_keys: list[str] or None
+
+    :return: A ``LazyMapping`` if ``value`` is a dict, a ``LazySequence`` if \
+        it is a list, or else the sanitised value.
+    :rtype: Any
+    """
+    return _sanitise(
+        value,
+        sanitise_value,
+        compile_ignore_keys(tuple(ignore_keys or ())),
+    )
+
+# private
+
+def _sanitise(
+    value: Any,
+    sanitise_value: Callable[[Any], Any],
+    ignore_node: IgnoreKeyNode | None,
+) -> Any:
+    """Wrap a dict or list in a proxy, or else sanitise the value.
+
+    :param value: Value to sanitise.
+    :type value: Any
+
+    :param sanitise_value: Function that sanitises a value that is not a dict \
+        or a list.
+    :type sanitise_value: Callable[[Any], Any]
+
+    :param ignore_node: Node of the value in the trie of ``ignore_keys``, or \
+        None.
+    :type ignore_node: IgnoreKeyNode or None
+
+    :return: The proxy or sanitised value.
+    :rtype: Any
+    """
+    if isinstance(value, dict):
+        return LazyMapping(value, sanitise_value, ignore_node)
+    if isinstance(value, list):
+        return LazySequence(value, sanitise_value, ignore_node)
+    return sanitise_value(value)
+
+__all__ = [
+    'LazyMapping',
+    'LazySequence',
+    'sanitise_lazily',
+]
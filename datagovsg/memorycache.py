@@ -0,0 +1,303 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keep cached responses in memory, within a limit on their total size.
+
+The "sqlite" cache backend writes every response to disk and never removes \
+    expired responses, and the "memory" backend of ``requests-cache`` keeps \
+    every response forever. For long-running pollers, the "bounded" cache \
+    backend keeps responses in memory instead, up to 64 MiB:
+
+.. code-block:: python
+
+    from datagovsg import Transport
+    transport = Transport(cache_backend='bounded')
+    taxi_availability = transport.taxi_availability()
+    stats = transport.session.cache.stats()
+
+Pass a ``BoundedMemoryCache`` as ``cache_backend`` to change the limit, e.g. \
+    ``Transport(cache_backend=BoundedMemoryCache(max_bytes=16 * 1024 * 1024))``.
+
+When a new response does not fit, expired responses are removed first, \
+    earliest expiry first, and then least-recently-used responses. Expired \
+    responses are otherwise kept, so that they can still be served with \
+    ``stale_while_revalidate``.
+"""
+
+from collections import OrderedDict
+from heapq import heapify, heappop, heappush
+from math import inf
+from threading import Lock
+from time import time
+from typing import Any, Iterator, NamedTuple
+
+from requests_cache import BaseCache, CachedResponse
+from requests_cache.backends.base import BaseStorage
+
+from .constants import (
+    BOUNDED_CACHE_MAX_BYTES,
+    CACHE_NAME,
+    INVALID_BOUNDED_CACHE_SIZE_ERROR_MESSAGE,
+)
+from .types import BoundedCacheStatsDict
+from .validation import internal_typechecked
+
+class BoundedMemoryCache(BaseCache):
+    """Cache backend that keeps responses in memory, and removes expired and \
+        then least-recently-used responses to keep within ``max_bytes``.
+
+    The cache is safe to share between sessions and threads.
+
+    :param cache_name: Name of the cache. Defaults to "datagovsg_cache".
+    :type cache_name: str
+
+    :param max_bytes: Most number of bytes of responses to keep, counting \
+        their URLs, headers and bodies. Defaults to 64 MiB.
+    :type max_bytes: int
+
+    :raises ValueError: ``max_bytes`` is less than 1.
+    """
+
+    # There is no database file, so db_path is not implemented
+    # pylint: disable=abstract-method
+
+    @internal_typechecked
+    def __init__(
+        self,
+        cache_name: str=CACHE_NAME,
+        max_bytes: int=BOUNDED_CACHE_MAX_BYTES,
+        **kwargs: Any,
+    ) -> None:
+        """Constructor method"""
+        if max_bytes < 1:
+            raise ValueError(INVALID_BOUNDED_CACHE_SIZE_ERROR_MESSAGE)
+
+        super().__init__(cache_name=cache_name, **kwargs)
+        self.max_bytes = max_bytes
+        self.responses: _BoundedStorage = _BoundedStorage(max_bytes)
+
+    def get_response(
+        self,
+        key: str,
+        default: Any=None,
+    ) -> CachedResponse | None:
+        """Get a response, expired or not, and count the hit or miss.
+
+        :param key: Cache key of the response.
+        :type key: str
+
+        :param default: Value to return if there is no response for ``key``. \
+            Defaults to None.
+        :type default: Any
+
+        :return: The response, or ``default``.
+        :rtype: CachedResponse or None
+        """
+        response = super().get_response(key)
+        self.responses.count_lookup(response)
+        return default if response is None else response
+
+    @internal_typechecked
+    def stats(self) -> BoundedCacheStatsDict:
+        """Count the hits, misses and evictions of the cache, and measure its \
+            size.
+
+        :return: Cache statistics.
+        :rtype: BoundedCacheStatsDict
+        """
+        return self.responses.stats()
+
+# private
+
+class _Entry(NamedTuple):
+    """Response kept in a ``_BoundedStorage``."""
+
+    response: CachedResponse
+    size: int
+    expires_at: float
+    version: int
+
+class _BoundedStorage(BaseStorage):
+    """Responses kept in least-recently-used order, with their expiry times \
+        in a heap, so that expired responses are found without a scan.
+
+    Responses are kept as-is, without being serialised.
+
+    :param max_bytes: Most number of bytes of responses to keep.
+    :type max_bytes: int
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Constructor method"""
+        super().__init__(serializer=None)
+        self.max_bytes = max_bytes
+
+        self.__lock = Lock()
+        self.__entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.__expiries: list[tuple[float, int, str]] = []
+        self.__version = 0
+        self.__stats: BoundedCacheStatsDict = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'entries': 0,
+            'bytes': 0,
+        }
+
+    def __getitem__(self, key: str) -> CachedResponse:
+        """Get a response, without counting it as used."""
+        with self.__lock:
+            response = self.__entries[key].response
+        # The body has already been read, so rewind it, as with DictStorage
+        if getattr(response, 'raw', None):
+            response.raw.reset()
+        response.cache_key = key
+        return response
+
+    def __setitem__(self, key: str, response: CachedResponse) -> None:
+        """Keep a response, removing others to make space for it. A response \
+            that is bigger than ``max_bytes`` by itself is not kept."""
+        size = _response_size(response)
+        expires_at = response.expires.timestamp() \
+            if response.expires is not None else inf
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            if size > self.max_bytes:
+                return
+
+            self.__version += 1
+            self.__entries[key] = _Entry(
+                response,
+                size,
+                expires_at,
+                self.__version,
+            )
+            self.__stats['entries'] += 1
+            self.__stats['bytes'] += size
+            if expires_at != inf:
+                heappush(self.__expiries, (expires_at, self.__version, key))
+
+            now = time()
+            while self.__stats['bytes'] > self.max_bytes:
+                expired_key = self.__pop_expired_key(now)
+                self.__remove(
+                    expired_key if expired_key is not None \
+                        else next(iter(self.__entries)),
+                )
+                self.__stats['evictions'] += 1
+
+            # Drop the heap items of responses that were replaced or removed
+            if len(self.__expiries) > 2 * len(self.__entries) + 16:
+                self.__expiries = [
+                    item for item in self.__expiries
+                    if self.__is_current(item)
+                ]
+                heapify(self.__expiries)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a response."""
+        with self.__lock:
+            self.__remove(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over a copy of the keys, so that responses may be added \
+            and removed meanwhile."""
+        with self.__lock:
+            return iter(list(self.__entries))
+
+    def __len__(self) -> int:
+        """Count the responses."""
+        return len(self.__entries)
+
+    def clear(self) -> None:
+        """Remove all of the responses. The statistics are kept."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__expiries.clear()
+            self.__stats['entries'] = 0
+            self.__stats['bytes'] = 0
+
+    def count_lookup(self, response: CachedResponse | None) -> None:
+        """Count a hit or miss, and mark a response as the most recently used.
+
+        :param response: The response that was found, or None.
+        :type response: CachedResponse or None
+        """
+        with self.__lock:
+            if response is None:
+                self.__stats['misses'] += 1
+                return
+            self.__stats['hits'] += 1
+            key = getattr(response, 'cache_key', None)
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+
+    def stats(self) -> BoundedCacheStatsDict:
+        """Get a copy of the statistics."""
+        with self.__lock:
+            return self.__stats.copy()
+
+    # private
+
+    def __remove(self, key: str) -> None:
+        """Remove a response. The lock must be held.
+
+        :param key: Cache key of the response.
+        :type key: str
+
+        :raises KeyError: There is no response for ``key``.
+        """
+        entry = self.__entries.pop(key)
+        self.__stats['entries'] -= 1
+        self.__stats['bytes'] -= entry.size
+
+    def __pop_expired_key(self, now: float) -> str | None:
+        """Find the response that expired the earliest. The lock must be held.
+
+        :param now: The time now, in seconds since the epoch.
+        :type now: float
+
+        :return: Cache key of the response, or None if none has expired.
+        :rtype: str or None
+        """
+        while self.__expiries and self.__expiries[0][0] <= now:
+            item = heappop(self.__expiries)
+            if self.__is_current(item):
+                return item[2]
+        return None
+
+    def __is_current(self, item: tuple[float, int, str]) -> bool:
+        """Check that a heap item is of a response that is still kept."""
+        entry = self.__entries.get(item[2])
+        return entry is not None and entry.version == item[1]
+
+def _response_size(response: CachedResponse) -> int:
+    """Measure a response by its URL, headers and body.
+
+    :param response: The response.
+    :type response: CachedResponse
+
+    :return: Number of bytes.
+    :rtype: int
+    """
+    size = len(response.content or b'') + len(response.url or '')
+    for name, value in response.headers.items():
+        size += len(name) + len(value)
+    return size
+
+__all__ = [
+    'BoundedMemoryCache',
+]
@@ -0,0 +1,237 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Limit the rate of requests with token buckets that are shared by all \
+    clients in the process.
+
+There is one bucket per API key, or per host for requests without an API \
+    key. Every request takes a token from its bucket, and waits only if the \
+    bucket is empty, so requests are sent as fast as the rate limit allows.
+
+By default, each bucket allows 5 requests per second, with bursts of up to 10 \
+    requests. Change this with ``set_rate_limit()``, e.g. to match the quota \
+    of an API key:
+
+.. code-block:: python
+
+    from datagovsg.ratelimit import set_rate_limit
+    set_rate_limit(10, capacity=20)
+"""
+
+from threading import Lock
+from time import monotonic, sleep
+from urllib.parse import urlsplit
+
+from .constants import (
+    INVALID_RATE_LIMIT_ERROR_MESSAGE,
+    RATE_LIMIT_CAPACITY,
+    RATE_LIMIT_RATE,
+)
+from .types import Url
+from .validation import internal_typechecked
+
+_rate_limits: dict[str | None, tuple[float | None, int]] = {
+    None: (RATE_LIMIT_RATE, RATE_LIMIT_CAPACITY),
+}
+
+class TokenBucket:
+    """Token bucket that allows ``rate`` requests per second on average, with \
+        bursts of up to ``capacity`` requests.
+
+    Tokens are reserved ahead of time, so that synchronous and asynchronous \
+        clients can share a bucket: ``reserve()`` returns how long to wait, \
+        and the caller waits in whichever way suits it.
+
+    :param rate: Number of tokens added per second.
+    :type rate: float
+
+    :param capacity: Most number of tokens in the bucket.
+    :type capacity: int
+
+    :raises ValueError: ``rate`` is not more than 0, or ``capacity`` is less \
+        than 1.
+    """
+
+    @internal_typechecked
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Constructor method"""
+        self.__lock = Lock()
+        self.rate = 0.0
+        self.capacity = 0
+        self.configure(rate, capacity)
+        self.__tokens = float(self.capacity)
+        self.__updated = monotonic()
+
+    @internal_typechecked
+    def configure(self, rate: float, capacity: int) -> None:
+        """Change the rate and capacity of the bucket.
+
+        :param rate: Number of tokens added per second.
+        :type rate: float
+
+        :param capacity: Most number of tokens in the bucket.
+        :type capacity: int
+
+        :raises ValueError: ``rate`` is not more than 0, or ``capacity`` is \
+            less than 1.
+
+        :return: None
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError(INVALID_RATE_LIMIT_ERROR_MESSAGE)
+        with self.__lock:
+            self.rate = float(rate)
+            self.capacity = capacity
+
+    @internal_typechecked
+    def reserve(self) -> float:
+        """Take a token from the bucket, reserving one ahead of time if the \
+            bucket is empty.
+
+        :return: Number of seconds to wait before using the token.
+        :rtype: float
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(
+                self.__tokens + (now - self.__updated) * self.rate,
+                float(self.capacity),
+            )
+            self.__updated = now
+            self.__tokens -= 1
+            return max(-self.__tokens / self.rate, 0.0)
+
+    @internal_typechecked
+    def refund(self) -> None:
+        """Put back a token that was not used, e.g. because the response came \
+            from the cache.
+
+        :return: None
+        """
+        with self.__lock:
+            self.__tokens = min(self.__tokens + 1, float(self.capacity))
+
+    @internal_typechecked
+    def acquire(self) -> float:
+        """Take a token from the bucket, sleeping until it can be used.
+
+        :return: Number of seconds slept.
+        :rtype: float
+        """
+        delay = self.reserve()
+        if delay > 0:
+            sleep(delay)
+        return delay
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = Lock()
+
+@internal_typechecked
+def get_rate_limiter(url: Url, api_key: str | None=None) -> TokenBucket | None:
+    """Get the token bucket for a request, creating it on first use.
+
+    :param url: The endpoint URL that the request is sent to.
+    :type url: Url
+
+    :param api_key: The API key that the request is sent with, if any. \
+        Defaults to None.
+    :type api_key: str or None
+
+    :return: The token bucket, or None if requests are not rate-limited.
+    :rtype: TokenBucket or None
+    """
+    key = f'api_key:{api_key}' if api_key is not None \
+        else f'host:{urlsplit(url).netloc}'
+
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            rate, capacity = _rate_limits.get(key, _rate_limits[None])
+            if rate is None:
+                return None
+            bucket = TokenBucket(rate, capacity)
+            _buckets[key] = bucket
+        return bucket
+
+@internal_typechecked
+def set_rate_limit(
+    rate: float | None,
+    capacity: int=RATE_LIMIT_CAPACITY,
+    api_key: str | None=None,
+    host: str | None=None,
+) -> None:
+    """Set the rate limit of an API key or a host, or of all of them.
+
+    If neither ``api_key`` nor ``host`` is set, then the rate limit of every \
+        API key and host that was not set otherwise is changed.
+
+    :param rate: Number of requests allowed per second on average. If None, \
+        then requests are not rate-limited.
+    :type rate: float or None
+
+    :param capacity: Most number of requests allowed in a burst. Defaults to \
+        10.
+    :type capacity: int
+
+    :param api_key: The API key to set the rate limit of. Defaults to None.
+    :type api_key: str or None
+
+    :param host: The host, e.g. "api-open.data.gov.sg", to set the rate limit \
+        of, for requests without an API key. Defaults to None.
+    :type host: str or None
+
+    :raises ValueError: ``rate`` is not more than 0, or ``capacity`` is less \
+        than 1.
+
+    :return: None
+    """
+    if rate is not None and (rate <= 0 or capacity < 1):
+        raise ValueError(INVALID_RATE_LIMIT_ERROR_MESSAGE)
+
+    key: str | None = None
+    if api_key is not None:
+        key = f'api_key:{api_key}'
+    elif host is not None:
+        key = f'host:{host}'
+
+    with _buckets_lock:
+        _rate_limits[key] = (rate, capacity)
+        for bucket_key in list(_buckets):
+            if key is not None and bucket_key != key:
+                continue
+            if key is None and bucket_key in _rate_limits:
+                continue
+            if rate is None:
+                del _buckets[bucket_key]
+            else:
+                _buckets[bucket_key].configure(rate, capacity)
+
+@internal_typechecked
+def reset_rate_limits() -> None:
+    """Forget every token bucket and every rate limit that was set with \
+        ``set_rate_limit()``, going back to the default rate limit.
+
+    :return: None
+    """
+    with _buckets_lock:
+        _buckets.clear()
+        _rate_limits.clear()
+        _rate_limits[None] = (RATE_LIMIT_RATE, RATE_LIMIT_CAPACITY)
+
+__all__ = [
+    'TokenBucket',
+    'get_rate_limiter',
+    'reset_rate_limits',
+    'set_rate_limit',
+]
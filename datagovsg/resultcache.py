@@ -0,0 +1,425 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keep sanitised results in memory, in front of the clients' HTTP cache.
+
+A hit in the HTTP cache still reads the stored response, decodes its JSON \
+    and sanitises it again. A ``ResultCache`` skips all of that by keeping \
+    the final sanitised result of ``send_request()``, for as long as the \
+    response would have stayed in the HTTP cache.
+
+.. code-block:: python
+
+    from datagovsg import Housing
+    from datagovsg.resultcache import ResultCache
+    housing = Housing(result_cache=ResultCache())
+    carpark_availability = housing.carpark_availability()
+
+A result is kept once, with its dicts and lists frozen into ``FrozenDict`` \
+    and ``FrozenList``, and every hit returns that same object. They are \
+    read-only, as a result is shared by every caller, but are still dicts \
+    and lists, so they are read and compared as usual. Copy a result to \
+    change it, e.g. with ``copy.deepcopy()``, which returns plain dicts and \
+    lists.
+
+Only the results that ``send_request()`` sanitises are kept. The \
+    Environment clients, and the lazy clients (with ``lazy=True``), sanitise \
+    their responses after ``send_request()``, so their results are not kept.
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from copy import deepcopy
+from datetime import datetime, timezone
+from sys import getsizeof
+from threading import Lock
+from time import monotonic
+from typing import Any, NamedTuple
+
+from .constants import (
+    INVALID_RESULT_CACHE_SIZE_ERROR_MESSAGE,
+    READ_ONLY_RESULT_ERROR_MESSAGE,
+    RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_MAX_ENTRIES,
+)
+from .types import ResultCacheStatsDict, Url
+from .validation import internal_typechecked
+
+class FrozenDict(dict):
+    """Read-only dict of a result that is kept in a ``ResultCache``.
+
+    Changing it raises a ``TypeError``. ``copy.copy()``, ``copy.deepcopy()`` \
+        and ``pickle`` return plain dicts.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> Any:
+        """Refuse to change the dict."""
+        raise TypeError(READ_ONLY_RESULT_ERROR_MESSAGE)
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> dict:
+        """Copy into a plain dict."""
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        """Copy into a plain dict, with plain copies of its values."""
+        return {k: deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a plain dict."""
+        return (dict, (dict(self),))
+
+class FrozenList(list):
+    """Read-only list of a result that is kept in a ``ResultCache``.
+
+    Changing it raises a ``TypeError``. ``copy.copy()``, ``copy.deepcopy()`` \
+        and ``pickle`` return plain lists.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> Any:
+        """Refuse to change the list."""
+        raise TypeError(READ_ONLY_RESULT_ERROR_MESSAGE)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = _read_only
+    reverse = sort = _read_only
+
+    def __copy__(self) -> list:
+        """Copy into a plain list."""
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        """Copy into a plain list, with plain copies of its items."""
+        return [deepcopy(v, memo) for v in self]
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a plain list."""
+        return (list, (list(self),))
+
+class ResultCache:
+    """Least-recently-used cache of sanitised results, with a time to live \
+        per result.
+
+    The cache is safe to share between clients and threads.
+
+    :param max_entries: Most number of results to keep. Defaults to 256.
+    :type max_entries: int
+
+    :param max_bytes: Most number of bytes of results to keep, as estimated \
+        with ``sys.getsizeof()``. Defaults to 64 MiB.
+    :type max_bytes: int
+
+    :raises ValueError: ``max_entries`` or ``max_bytes`` is less than 1.
+    """
+
+    @internal_typechecked
+    def __init__(
+        self,
+        max_entries: int=RESULT_CACHE_MAX_ENTRIES,
+        max_bytes: int=RESULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Constructor method"""
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError(INVALID_RESULT_CACHE_SIZE_ERROR_MESSAGE)
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.__lock = Lock()
+        self.__entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self.__stats: ResultCacheStatsDict = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'entries': 0,
+            'bytes': 0,
+        }
+
+    def __getitem__(self, key: Hashable) -> Any:
+        """Get an unexpired result.
+
+        :param key: Key of the result, from ``result_key()``.
+        :type key: Hashable
+
+        :raises KeyError: There is no result for ``key``, or it has expired.
+
+        :return: The result, as frozen by ``freeze_result()``. It is shared \
+            by every caller.
+        :rtype: Any
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry.expires_at <= monotonic():
+                self.__remove(key)
+                entry = None
+
+            if entry is None:
+                self.__stats['misses'] += 1
+                raise KeyError(key)
+
+            self.__entries.move_to_end(key)
+            self.__stats['hits'] += 1
+            return entry.value
+
+    @internal_typechecked
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Keep a result for ``ttl`` seconds.
+
+        Least-recently-used results are removed to keep within \
+            ``max_entries`` and ``max_bytes``. A result that is bigger than \
+            ``max_bytes`` by itself is not kept.
+
+        :param key: Key of the result, from ``result_key()``.
+        :type key: Hashable
+
+        :param value: The result. It is kept as frozen by \
+            ``freeze_result()``, which does not copy a frozen result again.
+        :type value: Any
+
+        :param ttl: Number of seconds to keep the result for. If not more \
+            than 0, then the result is not kept.
+        :type ttl: float
+
+        :return: None
+        """
+        if ttl <= 0:
+            return
+
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+
+        value = freeze_result(value)
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+
+            self.__entries[key] = _Entry(value, size, monotonic() + ttl)
+            self.__stats['entries'] += 1
+            self.__stats['bytes'] += size
+
+            while self.__stats['entries'] > self.max_entries \
+                or self.__stats['bytes'] > self.max_bytes:
+                self.__remove(next(iter(self.__entries)))
+                self.__stats['evictions'] += 1
+
+    @internal_typechecked
+    def clear(self) -> None:
+        """Remove all of the results. The statistics are kept.
+
+        :return: None
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__stats['entries'] = 0
+            self.__stats['bytes'] = 0
+
+    @internal_typechecked
+    def stats(self) -> ResultCacheStatsDict:
+        """Count the hits, misses and evictions of the cache, and measure its \
+            size.
+
+        :return: Cache statistics.
+        :rtype: ResultCacheStatsDict
+        """
+        with self.__lock:
+            return self.__stats.copy()
+
+    # private
+
+    def __remove(self, key: Hashable) -> None:
+        """Remove a result. The lock must be held.
+
+        :param key: Key of the result.
+        :type key: Hashable
+
+        :return: None
+        """
+        entry = self.__entries.pop(key)
+        self.__stats['entries'] -= 1
+        self.__stats['bytes'] -= entry.size
+
+@internal_typechecked
+def copy_result(value: Any) -> Any:
+    """Copy the dicts and lists of a result, e.g. of ``send_request()``.
+
+    Their other values, e.g. strings, numbers, datetimes and tuples, are \
+        immutable, so they are shared with the copy.
+
+    :param value: The result.
+    :type value: Any
+
+    :return: A copy of the result.
+    :rtype: Any
+    """
+    return _copy_containers(value)
+
+@internal_typechecked
+def freeze_result(value: Any) -> Any:
+    """Freeze the dicts and lists of a result into ``FrozenDict`` and \
+        ``FrozenList``, so that it can be shared by every caller.
+
+    A result that is already frozen is returned as is. Its other values, \
+        e.g. strings, numbers, datetimes and tuples, are immutable, so they \
+        are not copied.
+
+    :param value: The result.
+    :type value: Any
+
+    :return: The frozen result.
+    :rtype: Any
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    return _freeze(value)
+
+@internal_typechecked
+def result_key(
+    url: Url,
+    params: dict,
+    sanitise_ignore_keys: list[str],
+    sanitise_schema: Any,
+) -> Hashable:
+    """Build the key of a sanitised result of ``send_request()``.
+
+    Parameters are sorted by name and their values are compared as strings, \
+        as they would be sent in the URL.
+
+    :param url: The endpoint URL.
+    :type url: Url
+
+    :param params: Parameters of the request.
+    :type params: dict
+
+    :param sanitise_ignore_keys: Keys that are ignored during sanitising.
+    :type sanitise_ignore_keys: list[str]
+
+    :param sanitise_schema: The expected type of the response value, or None.
+    :type sanitise_schema: Any
+
+    :return: The key.
+    :rtype: Hashable
+    """
+    return (
+        url,
+        tuple(sorted((str(k), str(v)) for k, v in params.items())),
+        tuple(sanitise_ignore_keys),
+        sanitise_schema,
+    )
+
+@internal_typechecked
+def seconds_until_expiry(expires: datetime | None, cache_duration: int) -> float:
+    """Get the number of seconds that a response stays in the HTTP cache.
+
+    :param expires: When the response expires from the HTTP cache, in UTC, \
+        or None if that is not known.
+    :type expires: datetime or None
+
+    :param cache_duration: Number of seconds before the cache expires, as \
+        passed to ``send_request()``.
+    :type cache_duration: int
+
+    :return: The smaller of ``cache_duration`` and the time until \
+        ``expires``.
+    :rtype: float
+    """
+    if expires is None:
+        return float(cache_duration)
+
+    now = datetime.now(timezone.utc)
+    if expires.tzinfo is None:
+        now = now.replace(tzinfo=None)
+    return min(float(cache_duration), (expires - now).total_seconds())
+
+# private
+
+class _Entry(NamedTuple):
+    """Result kept in a ``ResultCache``."""
+
+    value: Any
+    size: int
+    expires_at: float
+
+def _copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists in a value, and the dicts and lists in them.
+
+    :param value: The value.
+    :type value: Any
+
+    :return: The copy.
+    :rtype: Any
+    """
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
+def _freeze(value: Any) -> Any:
+    """Freeze the dicts and lists in a value, and the dicts and lists in them.
+
+    :param value: The value.
+    :type value: Any
+
+    :return: The frozen value.
+    :rtype: Any
+    """
+    if isinstance(value, dict):
+        return FrozenDict({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return FrozenList([_freeze(v) for v in value])
+    return value
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the number of bytes used by a value and its contents.
+
+    :param value: The value.
+    :type value: Any
+
+    :return: The sum of ``sys.getsizeof()`` of the value and its contents.
+    :rtype: int
+    """
+    size = 0
+    seen: set[int] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+
+        size += getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return size
+
+__all__ = [
+    'FrozenDict',
+    'FrozenList',
+    'ResultCache',
+    'copy_result',
+    'freeze_result',
+    'result_key',
+    'seconds_until_expiry',
+]
@@ -0,0 +1,122 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Refresh stale responses in the background, while they are still served.
+
+With ``stale_while_revalidate``, a client returns a response that has \
+    expired from the cache straight away, instead of waiting for the \
+    endpoint, and refreshes it in a background thread:
+
+.. code-block:: python
+
+    from datagovsg import Transport
+    transport = Transport(
+        stale_while_revalidate=60,
+        on_stale=lambda url, params, age: print(f'{url} is {age:.0f}s old'),
+    )
+    taxi_availability = transport.taxi_availability()
+
+Only one refresh runs for a response at a time, however many callers are \
+    served the stale response in the meantime. Refreshes are shared by all \
+    of the clients in the process.
+"""
+
+from collections.abc import Callable, Hashable
+from datetime import datetime, timezone
+from threading import Lock, Thread
+from typing import Any
+
+from .validation import internal_typechecked
+
+@internal_typechecked
+def refresh_in_background(key: Hashable, refresh: Callable[[], Any]) -> bool:
+    """Run a refresh in a background thread, unless a refresh with the same \
+        key is already running.
+
+    :param key: Key of the response to refresh.
+    :type key: Hashable
+
+    :param refresh: Function that refreshes the response. Its result is \
+        ignored.
+    :type refresh: Callable[[], Any]
+
+    :return: True if the refresh was started, or False if one is already \
+        running.
+    :rtype: bool
+    """
+    with _refreshes_lock:
+        if key in _refreshes:
+            return False
+        thread = Thread(target=_refresh, args=(key, refresh), daemon=True)
+        _refreshes[key] = thread
+    thread.start()
+    return True
+
+@internal_typechecked
+def wait_for_refreshes(timeout: float | None=None) -> None:
+    """Wait for the refreshes that are running to finish, e.g. before exiting.
+
+    :param timeout: Most number of seconds to wait for each refresh. If \
+        None, then wait until they finish. Defaults to None.
+    :type timeout: float or None
+
+    :return: None
+    """
+    with _refreshes_lock:
+        threads = list(_refreshes.values())
+    for thread in threads:
+        thread.join(timeout)
+
+@internal_typechecked
+def seconds_since(dt: datetime) -> float:
+    """Get the number of seconds since a time.
+
+    :param dt: The time. If it has no timezone, then it is in UTC.
+    :type dt: datetime
+
+    :return: The number of seconds.
+    :rtype: float
+    """
+    now = datetime.now(timezone.utc)
+    if dt.tzinfo is None:
+        now = now.replace(tzinfo=None)
+    return (now - dt).total_seconds()
+
+# private
+
+_refreshes: dict[Hashable, Thread] = {}
+_refreshes_lock = Lock()
+
+def _refresh(key: Hashable, refresh: Callable[[], Any]) -> None:
+    """Run a refresh, and forget it when it is done.
+
+    :param key: Key of the response to refresh.
+    :type key: Hashable
+
+    :param refresh: Function that refreshes the response.
+    :type refresh: Callable[[], Any]
+
+    :return: None
+    """
+    try:
+        refresh()
+    finally:
+        with _refreshes_lock:
+            del _refreshes[key]
+
+__all__ = [
+    'refresh_in_background',
+    'seconds_since',
+    'wait_for_refreshes',
+]
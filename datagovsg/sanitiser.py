@@ -0,0 +1,487 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compile sanitisers from the response types declared by the clients.
+
+Responses repeat the same strings many times, e.g. the ``update_datetime`` \
+    and ``lots_available`` of thousands of carparks. So the value that each \
+    string is converted to is kept in a least-recently-used memo that is \
+    shared by all clients in the process, and a repeated string costs only a \
+    lookup. There is one memo per kind of conversion (datetime, int, float, \
+    number and guessed type), each with up to 4096 strings by default. \
+    Measure them with ``sanitise_cache_stats()`` and resize them with \
+    ``set_sanitise_cache_size()``:
+
+.. code-block:: python
+
+    from datagovsg.sanitiser import sanitise_cache_stats, set_sanitise_cache_size
+    set_sanitise_cache_size(16384)
+"""
+
+from datetime import date, datetime, time
+from functools import cache, lru_cache
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Callable,
+    TypeAlias,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from .constants import (
+    INVALID_SANITISE_CACHE_SIZE_ERROR_MESSAGE,
+    SANITISE_CACHE_MAX_ENTRIES,
+)
+from .keypaths import IgnoreKeyNode, compile_ignore_keys, find_ignore_node
+from .timezone import datetime_from_string
+from .types import SanitiseCacheStatsDict
+from .validation import internal_typechecked
+
+Sanitiser: TypeAlias = Callable[[Any], Any]
+"""Function that returns a sanitised copy of its value."""
+
+@cache
+@internal_typechecked
+def compile_sanitiser(schema: Any) -> Sanitiser:
+    """Compile a sanitiser for values of the type ``schema``.
+
+    The type is walked once, and the returned sanitiser only converts the \
+        strings in fields that are declared as ``datetime``, ``date``, \
+        ``time``, ``int`` or ``float``. Every other value is passed through \
+        untouched, so there is no guessing of types and no need for keys to \
+        ignore.
+
+    Values that cannot be converted to their declared type are also passed \
+        through untouched. The returned sanitiser is never type-checked, \
+        whatever the validation level.
+
+    Compiled sanitisers are cached by ``schema``.
+
+    :param schema: The expected type of the values to sanitise, e.g. a \
+        ``TypedDict`` from a client's ``types`` module, or a ``list`` of one.
+    :type schema: Any
+
+    :return: Function that returns a sanitised copy of its value.
+    :rtype: Sanitiser
+    """
+    sanitiser = _compile(schema)
+    return sanitiser if sanitiser is not None else _sanitise_nothing
+
+@internal_typechecked
+def sanitise_string(value: str) -> Any:
+    """Convert a string to the type that it looks like, as \
+        ``DataGovSg.sanitise_data()`` does:
+
+    - A comma-separated list of integers or of floats to a tuple.
+    - A date/time string to a datetime, date or time in SGT timezone.
+    - An integer string to an integer.
+    - A float string to a float.
+
+    Converted values are kept in a memo, so converting the same string again \
+        returns the same value.
+
+    :param value: String to convert.
+    :type value: str
+
+    :return: The converted value, or ``value`` if it cannot be converted.
+    :rtype: Any
+    """
+    return _memos['guess'](value)
+
+@internal_typechecked
+def sanitise_tree(
+    value: Any,
+    ignore_keys: list[str] | None=None,
+    key_path: str='',
+) -> Any:
+    """Convert every string in a value, and in the dicts and lists in it, to \
+        the type that it looks like, as ``DataGovSg.sanitise_data()`` does.
+
+    The value is walked with a stack instead of recursion, so there is no \
+        limit to how deeply it may be nested, and ``ignore_keys`` is \
+        matched with a compiled trie instead of building the key path of \
+        every value. (Refer to ``datagovsg.keypaths``.)
+
+    :param value: Value to sanitise. It is not changed.
+    :type value: Any
+
+    :param ignore_keys: Key paths of values to keep as-is, which may contain \
+        ``*`` to match any one key. Defaults to [].
+    :type ignore_keys: list[str] or None
+
+    :param key_path: Key path of ``value`` itself, if it is part of a bigger \
+        value. Defaults to blank string.
+    :type key_path: str
+
+    :return: A sanitised copy of the value.
+    :rtype: Any
+    """
+    # pylint: disable=too-many-branches
+    convert = _memos['guess']
+    if isinstance(value, str):
+        return convert(value)
+    if not isinstance(value, (dict, list)):
+        return value
+
+    root = compile_ignore_keys(tuple(ignore_keys or ()))
+    if key_path:
+        root = find_ignore_node(root, key_path)
+
+    # Each entry is (container to put the sanitised value in, its key or
+    # index there, the value, and the value's node in the ignore_keys trie).
+    result = [value]
+    stack: list[tuple[Any, Any, Any, IgnoreKeyNode | None]] = [
+        (result, 0, value, root),
+    ]
+    while stack:
+        container, key, value, node = stack.pop()
+
+        if isinstance(value, dict):
+            sanitised: Any = dict(value)
+            container[key] = sanitised
+            for k, v in value.items():
+                child = None
+                if node is not None:
+                    child = node.keys.get(k, node.any_key)
+                    if child is not None and child.ignore:
+                        continue
+                if isinstance(v, str):
+                    sanitised[k] = convert(v)
+                elif isinstance(v, (dict, list)):
+                    stack.append((sanitised, k, v, child))
+        else:
+            sanitised = list(value)
+            container[key] = sanitised
+            child = node.item if node is not None else None
+            for i, v in enumerate(value):
+                if isinstance(v, str):
+                    sanitised[i] = convert(v)
+                elif isinstance(v, (dict, list)):
+                    stack.append((sanitised, i, v, child))
+
+    return result[0]
+
+@internal_typechecked
+def sanitise_cache_stats() -> SanitiseCacheStatsDict:
+    """Count the hits and misses of the memos of converted strings, and \
+        measure their size.
+
+    :return: Memo statistics, summed over every kind of conversion.
+    :rtype: SanitiseCacheStatsDict
+    """
+    stats: SanitiseCacheStatsDict = {
+        'hits': 0,
+        'misses': 0,
+        'entries': 0,
+        'max_entries': 0,
+    }
+    for memo in _memos.values():
+        info = memo.cache_info()
+        stats['hits'] += info.hits
+        stats['misses'] += info.misses
+        stats['entries'] += info.currsize
+        stats['max_entries'] = info.maxsize or 0
+    return stats
+
+@internal_typechecked
+def set_sanitise_cache_size(max_entries: int) -> None:
+    """Change the most number of converted strings that are kept per kind of \
+        conversion. The memos are emptied and their statistics are reset.
+
+    :param max_entries: Most number of converted strings to keep. If 0, then \
+        strings are always converted. Defaults to 4096 on import.
+    :type max_entries: int
+
+    :raises ValueError: ``max_entries`` is less than 0.
+
+    :return: None
+    """
+    if max_entries < 0:
+        raise ValueError(INVALID_SANITISE_CACHE_SIZE_ERROR_MESSAGE)
+
+    for kind, memo in list(_memos.items()):
+        _memos[kind] = lru_cache(maxsize=max_entries)(memo.__wrapped__)
+
+@internal_typechecked
+def clear_sanitise_cache() -> None:
+    """Empty the memos of converted strings and reset their statistics.
+
+    :return: None
+    """
+    for memo in _memos.values():
+        memo.cache_clear()
+
+# private
+
+def _compile(annotation: Any) -> Sanitiser | None:
+    """Compile a sanitiser for an annotation.
+
+    :param annotation: Type annotation to compile.
+    :type annotation: Any
+
+    :return: The sanitiser, or None if values of this type are never changed.
+    :rtype: Sanitiser or None
+    """
+    if annotation in (datetime, date, time):
+        return _sanitise_datetime
+    if annotation is int:
+        return _sanitise_int
+    if annotation is float:
+        return _sanitise_float
+    if is_typeddict(annotation):
+        return _compile_typeddict(annotation)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is list and args:
+        return _compile_list(args[0])
+    if origin is dict and len(args) == 2:
+        return _compile_dict(args[1])
+
+    if origin is Union or origin is UnionType:
+        members = tuple(arg for arg in args if arg is not NoneType)
+        if len(members) == 1:
+            return _compile(members[0])
+        if all(member in (int, float) for member in members):
+            return _sanitise_number
+        if all(member in (datetime, date, time) for member in members):
+            return _sanitise_datetime
+        if all(is_typeddict(member) for member in members):
+            return _compile_typeddict_union(members)
+
+    return None
+
+def _compile_list(item_annotation: Any) -> Sanitiser | None:
+    """Compile a sanitiser for a list.
+
+    :param item_annotation: Type annotation of the list's items.
+    :type item_annotation: Any
+
+    :return: The sanitiser, or None if the items are never changed.
+    :rtype: Sanitiser or None
+    """
+    sanitise_item = _compile(item_annotation)
+    if sanitise_item is None:
+        return None
+
+    def sanitise_list(value: Any) -> Any:
+        if not isinstance(value, list):
+            return value
+        return [sanitise_item(v) for v in value]
+
+    return sanitise_list
+
+def _compile_dict(value_annotation: Any) -> Sanitiser | None:
+    """Compile a sanitiser for a dict with values of the same type.
+
+    :param value_annotation: Type annotation of the dict's values.
+    :type value_annotation: Any
+
+    :return: The sanitiser, or None if the values are never changed.
+    :rtype: Sanitiser or None
+    """
+    sanitise_value = _compile(value_annotation)
+    if sanitise_value is None:
+        return None
+
+    def sanitise_dict(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        return {k: sanitise_value(v) for k, v in value.items()}
+
+    return sanitise_dict
+
+def _compile_typeddict_fields(
+    typeddict: Any,
+) -> tuple[tuple[str, Sanitiser], ...]:
+    """Compile sanitisers for the fields of a TypedDict.
+
+    :param typeddict: The TypedDict to compile.
+    :type typeddict: Any
+
+    :return: Pairs of (field name, sanitiser), for fields that may change.
+    :rtype: tuple[tuple[str, Sanitiser], ...]
+    """
+    field_sanitisers = []
+    for key, annotation in get_type_hints(typeddict).items():
+        sanitise_field = _compile(annotation)
+        if sanitise_field is not None:
+            field_sanitisers.append((key, sanitise_field))
+    return tuple(field_sanitisers)
+
+def _compile_typeddict(typeddict: Any) -> Sanitiser | None:
+    """Compile a sanitiser for a TypedDict.
+
+    :param typeddict: The TypedDict to compile.
+    :type typeddict: Any
+
+    :return: The sanitiser, or None if no field is ever changed.
+    :rtype: Sanitiser or None
+    """
+    field_sanitisers = _compile_typeddict_fields(typeddict)
+    if not field_sanitisers:
+        return None
+
+    def sanitise_dict(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        sanitised_dict = dict(value)
+        for key, sanitise_field in field_sanitisers:
+            if key in sanitised_dict:
+                sanitised_dict[key] = sanitise_field(sanitised_dict[key])
+        return sanitised_dict
+
+    return sanitise_dict
+
+def _compile_typeddict_union(typeddicts: tuple[Any, ...]) -> Sanitiser | None:
+    """Compile a sanitiser for a union of TypedDicts.
+
+    A value is sanitised as the first TypedDict whose required keys are all \
+        in the value, or as the first TypedDict if there is none.
+
+    :param typeddicts: The TypedDicts in the union.
+    :type typeddicts: tuple
+
+    :return: The sanitiser, or None if no field is ever changed.
+    :rtype: Sanitiser or None
+    """
+    members = tuple(
+        (
+            typeddict.__required_keys__,
+            _compile_typeddict(typeddict) or _sanitise_nothing,
+        ) for typeddict in typeddicts
+    )
+    if all(sanitise is _sanitise_nothing for _, sanitise in members):
+        return None
+
+    def sanitise_union(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        for required_keys, sanitise in members:
+            if required_keys <= value.keys():
+                return sanitise(value)
+        return members[0][1](value)
+
+    return sanitise_union
+
+def _sanitise_nothing(value: Any) -> Any:
+    """Return the value as-is."""
+    return value
+
+def _sanitise_datetime(value: Any) -> Any:
+    """Convert a string to a datetime, date or time, if possible."""
+    if not isinstance(value, str):
+        return value
+    return _memos['datetime'](value)
+
+def _sanitise_int(value: Any) -> Any:
+    """Convert a string to an integer, if possible."""
+    if not isinstance(value, str):
+        return value
+    return _memos['int'](value)
+
+def _sanitise_float(value: Any) -> Any:
+    """Convert a string to a float, if possible."""
+    if not isinstance(value, str):
+        return value
+    return _memos['float'](value)
+
+def _sanitise_number(value: Any) -> Any:
+    """Convert a string to an integer or, failing that, a float, if possible."""
+    if not isinstance(value, str):
+        return value
+    return _memos['number'](value)
+
+def _convert_datetime(value: str) -> Any:
+    """Convert a string to a datetime, date or time, if possible."""
+    try:
+        return datetime_from_string(value)
+    except ValueError:
+        return value
+
+def _convert_int(value: str) -> Any:
+    """Convert a string to an integer, if possible."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def _convert_float(value: str) -> Any:
+    """Convert a string to a float, if possible."""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+def _convert_number(value: str) -> Any:
+    """Convert a string to an integer or, failing that, a float, if possible."""
+    try:
+        return int(value)
+    except ValueError:
+        return _convert_float(value)
+
+def _convert_guess(value: str) -> Any:
+    """Convert a string to the type that it looks like, if possible."""
+    # pylint: disable=broad-exception-caught
+    if ',' in value:
+        # Convert to tuple with numbers.
+        tuple_value = tuple(
+            _memos['guess'](v.strip()) for v in value.split(',')
+        )
+        values_are_int = all(isinstance(v, int) for v in tuple_value)
+        values_are_float = all(isinstance(v, float) for v in tuple_value)
+        if values_are_int or values_are_float:
+            return tuple_value
+
+    try:
+        # Convert to a date/datetime.
+        return datetime_from_string(value)
+    except Exception:
+        try:
+            # Convert to an integer
+            return int(value)
+        except Exception:
+            try:
+                # Convert to a float
+                return float(value)
+            except Exception:
+                pass
+
+    return value
+
+_memos: dict[str, Any] = {
+    kind: lru_cache(maxsize=SANITISE_CACHE_MAX_ENTRIES)(convert)
+    for kind, convert in (
+        ('datetime', _convert_datetime),
+        ('int', _convert_int),
+        ('float', _convert_float),
+        ('number', _convert_number),
+        ('guess', _convert_guess),
+    )
+}
+
+__all__ = [
+    'Sanitiser',
+    'clear_sanitise_cache',
+    'compile_sanitiser',
+    'sanitise_cache_stats',
+    'sanitise_string',
+    'sanitise_tree',
+    'set_sanitise_cache_size',
+]
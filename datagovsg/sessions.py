@@ -0,0 +1,227 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Share HTTP sessions and their connection pools between clients.
+
+Clients with the same API key, cache backend and pool sizes share one \
+    ``CachedSession``, so connections to the API hosts are reused across \
+    clients, e.g. an ``Environment`` and a ``Transport`` client.
+"""
+
+from threading import Lock
+from typing import Any
+
+from requests.adapters import HTTPAdapter, Retry
+from requests_cache import DEFAULT_CACHE_NAME, BaseCache, CachedSession
+
+from .constants import (
+    BOUNDED_CACHE_BACKEND,
+    CACHE_NAME,
+    INVALID_POOL_SIZE_ERROR_MESSAGE,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+    USER_AGENT,
+)
+from .memorycache import BoundedMemoryCache
+from .types import PoolStatsDict
+from .validation import internal_typechecked
+
+_sessions: dict[tuple[Any, ...], CachedSession] = {}
+_sessions_lock = Lock()
+
+@internal_typechecked
+def create_session(
+    api_key: str | None=None,
+    cache_backend: str | BaseCache='sqlite',
+    pool_connections: int=POOL_CONNECTIONS,
+    pool_maxsize: int=POOL_MAXSIZE,
+) -> CachedSession:
+    """Create a new session that is not shared.
+
+    The session has:
+
+    - Connection retries using exponential backoff. \
+        (Reference: https://stackoverflow.com/a/35504626.)
+    - Cache (cache duration/expiry is set per request). The "bounded" \
+        cache backend is a ``datagovsg.memorycache.BoundedMemoryCache``.
+    - API key header, if ``api_key`` is set.
+    - User-agent header.
+
+    :param api_key: The assigned API key for api.data.gov.sg. Defaults to None.
+    :type api_key: str or None
+
+    :param cache_backend: Cache backend name or instance to use. Defaults to \
+        "sqlite".
+    :type cache_backend: str or BaseCache
+
+    :param pool_connections: Number of hosts to keep a connection pool for. \
+        Defaults to 10.
+    :type pool_connections: int
+
+    :param pool_maxsize: Number of connections to keep open per host. Should \
+        be at least the number of threads that send requests at the same time, \
+        e.g. ``max_workers`` of ``fetch_many()``. Defaults to 10.
+    :type pool_maxsize: int
+
+    :raises ValueError: ``pool_connections`` or ``pool_maxsize`` is less \
+        than 1.
+
+    :return: The session.
+    :rtype: CachedSession
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ValueError(INVALID_POOL_SIZE_ERROR_MESSAGE)
+
+    headers = {
+        'Accept': 'application/json',
+        'User-Agent': USER_AGENT,
+    }
+    if api_key is not None:
+        headers['x-api-key'] = api_key
+
+    if cache_backend == BOUNDED_CACHE_BACKEND:
+        cache_backend = BoundedMemoryCache(CACHE_NAME)
+
+    retries = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=list(RETRY_STATUS_FORCELIST),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+    )
+
+    # A backend instance is already named, and cannot be renamed
+    cache_name = CACHE_NAME if isinstance(cache_backend, str) \
+        else DEFAULT_CACHE_NAME
+    session = CachedSession(
+        cache_name,
+        backend=cache_backend,
+        stale_if_error=False,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+
+    return session
+
+@internal_typechecked
+def get_session(
+    api_key: str | None=None,
+    cache_backend: str | BaseCache='sqlite',
+    pool_connections: int=POOL_CONNECTIONS,
+    pool_maxsize: int=POOL_MAXSIZE,
+) -> CachedSession:
+    """Get the shared session for an API key, cache backend and pool sizes, \
+        creating it on first use.
+
+    The parameters are the same as those of ``create_session()``.
+
+    :param api_key: The assigned API key for api.data.gov.sg. Defaults to None.
+    :type api_key: str or None
+
+    :param cache_backend: Cache backend name or instance to use. Defaults to \
+        "sqlite".
+    :type cache_backend: str or BaseCache
+
+    :param pool_connections: Number of hosts to keep a connection pool for. \
+        Defaults to 10.
+    :type pool_connections: int
+
+    :param pool_maxsize: Number of connections to keep open per host. \
+        Defaults to 10.
+    :type pool_maxsize: int
+
+    :raises ValueError: ``pool_connections`` or ``pool_maxsize`` is less \
+        than 1.
+
+    :return: The shared session.
+    :rtype: CachedSession
+    """
+    # Cache backend instances are keyed by identity. The registry keeps them
+    # alive, so their ids are never reused by another instance.
+    key = (
+        api_key,
+        cache_backend if isinstance(cache_backend, str) else id(cache_backend),
+        pool_connections,
+        pool_maxsize,
+    )
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = create_session(
+                api_key=api_key,
+                cache_backend=cache_backend,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+            )
+            _sessions[key] = session
+    return session
+
+@internal_typechecked
+def close_sessions() -> None:
+    """Close all of the shared sessions, and forget them.
+
+    Clients that were created before this is called keep using their closed \
+        sessions, which open new connections as needed.
+
+    :return: None
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+@internal_typechecked
+def pool_stats(session: Any) -> PoolStatsDict:
+    """Count the connections opened and reused by a session's open \
+        connection pools.
+
+    Responses from the cache do not use a connection, so they are not counted.
+
+    :param session: The session.
+    :type session: Any (but really a requests.Session)
+
+    :return: Connection pool statistics.
+    :rtype: PoolStatsDict
+    """
+    connections_opened = 0
+    requests_sent = 0
+
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        pools = adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools.get(pool_key)
+            if pool is not None:
+                connections_opened += pool.num_connections
+                requests_sent += pool.num_requests
+
+    return {
+        'connections_opened': connections_opened,
+        'connections_reused': max(requests_sent - connections_opened, 0),
+    }
+
+__all__ = [
+    'close_sessions',
+    'create_session',
+    'get_session',
+    'pool_stats',
+]
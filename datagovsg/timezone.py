@@ -14,11 +14,19 @@
 
 """Standardise all datetime-related timezones to SGT (Singapore Time)."""
 
-from datetime import date, datetime, time
-from re import fullmatch, match
+from datetime import date, datetime, time, timedelta, timezone
+from re import (
+    IGNORECASE,
+    Match,
+    Pattern,
+    compile as re_compile,
+    escape,
+    fullmatch,
+    match,
+)
 from zoneinfo import ZoneInfo
 
-from typeguard import typechecked
+from .validation import internal_typechecked
 
 ALLOWED_DATE_FORMATS = (
     '%Y-%m-%dT%H:%M:%S.%f%z',
@@ -44,7 +52,86 @@ ALLOWED_DATE_FORMATS = (
     '%H%M',
 )
 
-@typechecked
+_SGT_TIMEZONE = ZoneInfo('Asia/Singapore')
+
+# Same regular expressions that ``datetime.strptime()`` uses for each directive.
+_DIRECTIVE_PATTERNS = {
+    'Y': r'(?P<Y>\d\d\d\d)',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    'f': r'(?P<f>[0-9]{1,6})',
+    'z': r'(?P<z>[+-]\d\d:?[0-5]\d(:?[0-5]\d(\.\d{1,6})?)?|(?-i:Z))',
+}
+
+_DATETIME_KIND = 'datetime'
+_DATE_KIND = 'date'
+_TIME_KIND = 'time'
+
+_WHITESPACE_PATTERN = re_compile(r'\s')
+
+def _compile_date_format(
+    date_format: str,
+) -> tuple[Pattern[str], str, int | None]:
+    """Compile a date format into the regular expression that \
+        ``datetime.strptime()`` would use for it.
+
+    :param date_format: One of ``ALLOWED_DATE_FORMATS``.
+    :type date_format: str
+
+    :return: The compiled regular expression, the kind of value that the \
+        format produces, and the exact string length required by the format \
+        (or None if any length is allowed).
+    :rtype: tuple[Pattern[str], str, int | None]
+    """
+    pattern = ''
+    is_directive = False
+    for char in date_format:
+        if is_directive:
+            pattern += _DIRECTIVE_PATTERNS[char]
+            is_directive = False
+        elif char == '%':
+            is_directive = True
+        elif char.isspace():
+            pattern += r'\s+'
+        else:
+            pattern += escape(char)
+
+    if match('%H:?%M', date_format) is not None:
+        kind = _TIME_KIND
+    elif fullmatch('%Y-?%m-?%d', date_format) is not None \
+        or date_format == '%d/%m/%Y':
+        kind = _DATE_KIND
+    else:
+        kind = _DATETIME_KIND
+
+    length = None
+    if date_format == '%H%M':
+        length = 4
+    elif date_format == '%H:%M':
+        length = 5
+
+    return re_compile(pattern, IGNORECASE), kind, length
+
+_COMPILED_DATE_FORMATS = tuple(
+    _compile_date_format(date_format) for date_format in ALLOWED_DATE_FORMATS
+)
+
+# Formats grouped by the shape of the strings that they can match. Each group
+# is in reverse order, so that the first match is the last matching format.
+_T_SEPARATOR_DATE_FORMATS = _COMPILED_DATE_FORMATS[7::-1]
+_SPACE_SEPARATOR_DATE_FORMATS = _COMPILED_DATE_FORMATS[11:7:-1]
+_SLASH_DATE_FORMATS = _COMPILED_DATE_FORMATS[14:15]
+_COLON_TIME_FORMATS = _COMPILED_DATE_FORMATS[19:14:-1]
+_NUMERIC_DATE_FORMATS = (
+    _COMPILED_DATE_FORMATS[20],
+    _COMPILED_DATE_FORMATS[13],
+    _COMPILED_DATE_FORMATS[12],
+)
+
+@internal_typechecked
 def datetime_as_sgt(dt: datetime) -> datetime:
     """Update a datetime to use the SGT timezone and return the datetime.
 
@@ -54,10 +141,10 @@ def datetime_as_sgt(dt: datetime) -> datetime:
     :return: The datetime in SGT timezone.
     :rtype: datetime
     """
-    dt_sg: datetime = dt.replace(tzinfo=ZoneInfo('Asia/Singapore'))
+    dt_sg: datetime = dt.replace(tzinfo=_SGT_TIMEZONE)
     return dt_sg
 
-@typechecked
+@internal_typechecked
 def datetime_from_string(val: str) -> datetime | date | time:
     """Convert a string into a datetime in SGT timezone.
 
@@ -84,6 +171,14 @@ def datetime_from_string(val: str) -> datetime | date | time:
     20. %H:%M
     21. %H%M
 
+    If the string matches more than one format, then the last matching \
+        format is used.
+
+    The shape of the string (separators, "T", whitespace) is classified \
+        first, so only the formats that could possibly match are tried, each \
+        with a precompiled regular expression that is equivalent to the one \
+        used by ``datetime.strptime()``.
+
     :param val: String to convert to a datetime.
     :type val: str
 
@@ -96,38 +191,38 @@ def datetime_from_string(val: str) -> datetime | date | time:
     dt: datetime | date | time
 
     dt_datetime = None
-    dt_format = ''
-    for date_format in ALLOWED_DATE_FORMATS:
-        try:
-            if date_format == '%H%M' and len(val) != 4:
-                raise ValueError('val is not a 4-digit time')
-            if date_format == '%H:%M' and len(val) != 5:
-                raise ValueError('val is not a 5-digit time')
+    dt_kind = ''
+    for pattern, kind, length in _candidate_date_formats(val):
+        if length is not None and len(val) != length:
+            continue
 
-            dt_datetime = datetime.strptime(val, date_format)
-            dt_format = date_format
+        found = pattern.match(val)
+        if found is None or found.end() != len(val):
+            continue
+
+        try:
+            dt_datetime = _datetime_from_match(found)
         except ValueError:
             continue
 
+        dt_kind = kind
+        break
+
     if dt_datetime is None:
         raise ValueError('val is not a recognised datetime string')
 
-    dt_datetime_sgt = datetime_as_sgt(dt_datetime)
-    dt_date_sgt = dt_datetime_sgt.date()
-    dt_time_sgt = dt_datetime_sgt.time()
+    dt_datetime_sgt = dt_datetime.replace(tzinfo=_SGT_TIMEZONE)
 
-    if match('%H:?%M', dt_format) is not None:
-        dt = dt_time_sgt
-    elif fullmatch('%Y-?%m-?%d', dt_format) is not None:
-        dt = dt_date_sgt
-    elif fullmatch('%d/%m/%Y', dt_format) is not None:
-        dt = dt_date_sgt
+    if dt_kind == _TIME_KIND:
+        dt = dt_datetime_sgt.time()
+    elif dt_kind == _DATE_KIND:
+        dt = dt_datetime_sgt.date()
     else:
         dt = dt_datetime_sgt
 
     return dt
 
-@typechecked
+@internal_typechecked
 def datetime_to_string(dt: datetime | date) -> str:
     """Convert a datetime to string.
 
@@ -142,7 +237,25 @@ def datetime_to_string(dt: datetime | date) -> str:
         else dt.strftime('%Y-%m-%d')
     return val
 
-@typechecked
+@internal_typechecked
+def floor_datetime(dt: datetime, resolution: int) -> datetime:
+    """Round a datetime down to a multiple of a number of seconds since \
+        midnight.
+
+    :param dt: Datetime to round down.
+    :type dt: datetime
+
+    :param resolution: Number of seconds to round down to, which should \
+        divide a day evenly, e.g. 30 or 3600.
+    :type resolution: int
+
+    :return: The rounded datetime, in the same timezone.
+    :rtype: datetime
+    """
+    seconds = (dt.hour * 3600 + dt.minute * 60 + dt.second) % resolution
+    return dt - timedelta(seconds=seconds, microseconds=dt.microsecond)
+
+@internal_typechecked
 def is_datetime_between_range(
     dt: datetime,
     min_dt: datetime,
@@ -177,9 +290,83 @@ def is_datetime_between_range(
 
     return result
 
+# private
+
+def _candidate_date_formats(
+    val: str,
+) -> tuple[tuple[Pattern[str], str, int | None], ...]:
+    """Classify the shape of a string and return the compiled date formats \
+        that could possibly match it.
+
+    :param val: String to classify.
+    :type val: str
+
+    :return: Compiled date formats, last allowed format first.
+    :rtype: tuple
+    """
+    if '/' in val:
+        return _SLASH_DATE_FORMATS
+    if 'T' in val or 't' in val:
+        return _T_SEPARATOR_DATE_FORMATS
+    if ':' in val:
+        if _WHITESPACE_PATTERN.search(val) is not None:
+            return _SPACE_SEPARATOR_DATE_FORMATS
+        return _COLON_TIME_FORMATS
+    return _NUMERIC_DATE_FORMATS
+
+def _datetime_from_match(found: Match[str]) -> datetime:
+    """Build a naive datetime from a date format match, validating it in the \
+        same way as ``datetime.strptime()``.
+
+    :param found: Match from one of the compiled date formats.
+    :type found: Match[str]
+
+    :raises ValueError: The matched values are out of range.
+
+    :return: The matched datetime, without any timezone.
+    :rtype: datetime
+    """
+    groups = found.groupdict()
+
+    fraction = groups.get('f')
+    microsecond = int(fraction + '0' * (6 - len(fraction))) \
+        if fraction is not None else 0
+
+    offset = found_offset = groups.get('z')
+    if offset is not None and offset != 'Z':
+        # The offset is only validated, since the datetime is set to SGT.
+        if offset[3] == ':':
+            offset = offset[:3] + offset[4:]
+            if len(offset) > 5:
+                if offset[5] != ':':
+                    raise ValueError(
+                        f'Inconsistent use of : in {found_offset}',
+                    )
+                offset = offset[:5] + offset[6:]
+        offset_seconds = int(offset[1:3]) * 3600 + int(offset[3:5]) * 60 \
+            + int(offset[5:7] or 0)
+        offset_fraction = offset[8:]
+        _ = timezone(timedelta(
+            seconds=offset_seconds,
+            microseconds=int(offset_fraction + '0' * (6 - len(offset_fraction))),
+        ))
+
+    dt = datetime(
+        int(groups.get('Y') or 1900),
+        int(groups.get('m') or 1),
+        int(groups.get('d') or 1),
+        int(groups.get('H') or 0),
+        int(groups.get('M') or 0),
+        int(groups.get('S') or 0),
+        microsecond,
+    )
+
+    return dt
+
 __all__ = [
     'datetime_as_sgt',
     'datetime_from_string',
     'datetime_to_string',
+    'floor_datetime',
     'is_datetime_between_range',
 ]
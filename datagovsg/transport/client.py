@@ -14,22 +14,46 @@
 
 """Client for interacting with the Transport APIs."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from os import PathLike
+from pathlib import Path
 from typing import Unpack
 
-from typeguard import typechecked
+from requests import RequestException
+from requests_cache import DO_NOT_CACHE
 
-from ..constants import CACHE_THIRTY_SECONDS, CACHE_ONE_MINUTE
+from ..constants import (
+    FETCH_MANY_MAX_WORKERS,
+    INVALID_MAX_WORKERS_ERROR_MESSAGE,
+    RATE_LIMIT_CAPACITY,
+)
 from ..datagovsg import DataGovSg
+from ..lazy import LazySequence
+from ..ratelimit import TokenBucket
+from ..validation import boundary_typechecked, internal_typechecked
 
-from .constants import (
-    TAXI_AVAILABILITY_API_ENDPOINT,
-    TRAFFIC_IMAGES_API_ENDPOINT,
-
-    TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS,
+from .constants import TRAFFIC_IMAGE_CHUNK_SIZE
+from .endpoints import (
+    taxi_availability_array_request,
+    taxi_availability_array_result,
+    taxi_availability_request,
+    traffic_images_request,
+    traffic_images_result,
+)
+from .images import (
+    TrafficImage,
+    load_md5_index,
+    save_md5_index,
+    store_image,
+    stored_md5,
+    traffic_images_to_store,
 )
 from .types_args import TransportArgsDict
 from .types import (
+    TaxiAvailabilityArrayDict,
     TaxiAvailabilityDict,
+    TrafficImagesDownloadDict,
     TrafficImagesItemDict,
 )
 
@@ -40,7 +64,7 @@ class Client(DataGovSg):
         https://data.gov.sg/datasets?formats=API&topics=transport
     """
 
-    @typechecked
+    @boundary_typechecked
     def taxi_availability(
         self,
         **kwargs: Unpack[TransportArgsDict],
@@ -53,29 +77,62 @@ class Client(DataGovSg):
             endpoint URL.
         :type kwargs: TransportArgsDict
 
-        :return: GeoJSON of the taxi availabilities. (Cached for 30 seconds.)
+        :return: GeoJSON of the taxi availabilities. (Cached until the next \
+            update, for up to 30 seconds.)
         :rtype: TaxiAvailabilityDict
         """
         taxi_availability: TaxiAvailabilityDict
 
-        params = self.build_params(
-            params_expected_type=TransportArgsDict,
-            original_params=kwargs,
-        )
-
         taxi_availability = self.send_request(
-            TAXI_AVAILABILITY_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_THIRTY_SECONDS,
+            **taxi_availability_request(self, kwargs),
         )
 
         return taxi_availability
 
-    @typechecked
+    @boundary_typechecked
+    def taxi_availability_array(
+        self,
+        **kwargs: Unpack[TransportArgsDict],
+    ) -> TaxiAvailabilityArrayDict:
+        """Get locations of available taxis in Singapore, with the \
+            coordinates of each feature as a NumPy array of ``float64`` with \
+            shape (N, 2).
+
+        The coordinates are parsed straight from the response into the \
+            array, which takes much less time and memory than the lists of \
+            ``taxi_availability()``. E.g. the taxis in a bounding box are:
+
+        .. code-block:: python
+
+            data = transport.taxi_availability_array()
+            positions = data['features'][0]['geometry']['coordinates']
+            longitudes, latitudes = positions[:, 0], positions[:, 1]
+            in_box = (latitudes > 1.28) & (latitudes < 1.3)
+            in_box &= (longitudes > 103.84) & (longitudes < 103.86)
+
+        Requires ``numpy``, e.g. with the ``numpy`` extra.
+
+        :param kwargs: Key-value arguments to be passed as parameters to the \
+            endpoint URL.
+        :type kwargs: TransportArgsDict
+
+        :raises ImportError: ``numpy`` is not installed.
+        :raises ValueError: A position does not have 2 numbers.
+
+        :return: GeoJSON of the taxi availabilities. (Cached for 30 seconds.)
+        :rtype: TaxiAvailabilityArrayDict
+        """
+        content = self.send_request(
+            **taxi_availability_array_request(self, kwargs),
+        )
+
+        return taxi_availability_array_result(self, content)
+
+    @boundary_typechecked
     def traffic_images(
         self,
         **kwargs: Unpack[TransportArgsDict],
-    ) -> list[TrafficImagesItemDict]:
+    ) -> list[TrafficImagesItemDict] | LazySequence:
         """Get the latest images from traffic cameras all around Singapore.
 
         Retrieved every 20 seconds from LTA's Datamall. But it is recommended \
@@ -85,31 +142,194 @@ class Client(DataGovSg):
             endpoint URL.
         :type kwargs: TransportArgsDict
 
-        :return: Images from traffic cameras. (Cached for 1 minute.)
-        :rtype: list[TrafficImagesItemDict]
+        :return: Images from traffic cameras, as a read-only proxy if the \
+            client is lazy. (Cached for 1 minute.)
+        :rtype: list[TrafficImagesItemDict] or LazySequence
         """
-        traffic_images: list[TrafficImagesItemDict]
+        traffic_images: list[TrafficImagesItemDict] | LazySequence
 
-        params = self.build_params(
-            params_expected_type=TransportArgsDict,
-            original_params=kwargs,
-        )
+        data = self.send_request(**traffic_images_request(self, kwargs))
 
-        data = self.send_request(
-            TRAFFIC_IMAGES_API_ENDPOINT,
-            params=params,
-            cache_duration=CACHE_ONE_MINUTE,
-            sanitise=False,
-        )
+        traffic_images = traffic_images_result(self, data)
+
+        return traffic_images
+
+    @boundary_typechecked
+    def download_traffic_images(
+        self,
+        directory: str | PathLike,
+        traffic_images: list[TrafficImagesItemDict] | LazySequence | None=None,
+        max_workers: int=FETCH_MANY_MAX_WORKERS,
+        rate_limit: float | None=None,
+    ) -> TrafficImagesDownloadDict:
+        """Download the latest image of every traffic camera into a directory.
+
+        Each image is stored as ``<camera_id>`` plus the suffix of the \
+            image's URL, or ``.jpg`` if the URL has no suffix that is safe \
+            to use, and is skipped if the MD5 hash of its ``image_metadata`` \
+            is the hash that it had when it was last downloaded, as kept in \
+            the directory's ``.md5.json``. \
+            Images of cameras whose IDs are not safe to use as file names \
+            are not downloaded, and are reported as failed. The other \
+            images are downloaded concurrently on a pool of at most \
+            ``max_workers`` threads, which share this client's session and \
+            connection pool, and are streamed to disk without being cached.
+
+        Images are not served by the API, so their downloads do not take \
+            tokens from the API's rate limit. (Refer to \
+            ``datagovsg.ratelimit``.) Set ``rate_limit`` to limit them \
+            separately.
 
-        items = data.get('items', [])
+        .. code-block:: python
 
-        traffic_images = self.sanitise_data(
-            items,
-            ignore_keys=TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS,
+            transport = Transport()
+            download = transport.download_traffic_images('traffic-images')
+            print(f"{download['bytes_saved']} bytes saved")
+
+        :param directory: Directory to store the images in. It is created if \
+            it does not exist.
+        :type directory: str or PathLike
+
+        :param traffic_images: Traffic images to download the images of. \
+            Defaults to those from ``traffic_images()``.
+        :type traffic_images: list[TrafficImagesItemDict] or LazySequence \
+            or None
+
+        :param max_workers: The most number of images to download at the \
+            same time. Defaults to 8.
+        :type max_workers: int
+
+        :param rate_limit: Number of images downloaded per second on \
+            average, with bursts of up to 10 images. If None, then downloads \
+            are not rate-limited. Defaults to None.
+        :type rate_limit: float or None
+
+        :raises ValueError: ``max_workers`` is less than 1, or \
+            ``rate_limit`` is not more than 0.
+
+        :return: Numbers of images and bytes downloaded and skipped, and the \
+            cameras whose images could not be downloaded.
+        :rtype: TrafficImagesDownloadDict
+        """
+        if max_workers < 1:
+            raise ValueError(INVALID_MAX_WORKERS_ERROR_MESSAGE)
+
+        rate_limiter = None
+        if rate_limit is not None:
+            rate_limiter = TokenBucket(rate_limit, RATE_LIMIT_CAPACITY)
+
+        if traffic_images is None:
+            traffic_images = self.traffic_images()
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        images = traffic_images_to_store(
+            traffic_images,
+            directory,
         )
+        md5_index = load_md5_index(directory)
 
-        return traffic_images
+        download: TrafficImagesDownloadDict = {
+            'downloaded': 0,
+            'skipped': 0,
+            'failed': [],
+            'bytes_downloaded': 0,
+            'bytes_saved': 0,
+        }
+        if not images:
+            return download
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(images)),
+        ) as executor:
+            results = list(executor.map(
+                partial(
+                    self.__download_traffic_image,
+                    md5_index=md5_index,
+                    rate_limiter=rate_limiter,
+                ),
+                images,
+            ))
+
+        for image, (is_downloaded, size) in zip(images, results):
+            if size is None:
+                download['failed'].append(image.camera_id)
+                continue
+
+            if is_downloaded:
+                download['downloaded'] += 1
+                download['bytes_downloaded'] += size
+            else:
+                download['skipped'] += 1
+                download['bytes_saved'] += size
+
+            if image.path is not None and image.md5 is not None:
+                md5_index[image.path.name] = image.md5.lower()
+            elif image.path is not None:
+                md5_index.pop(image.path.name, None)
+
+        save_md5_index(directory, md5_index)
+
+        return download
+
+# private
+
+    @internal_typechecked
+    def __download_traffic_image(
+        self,
+        image: TrafficImage,
+        md5_index: dict[str, str],
+        rate_limiter: TokenBucket | None,
+    ) -> tuple[bool, int | None]:
+        """Download an image, unless the stored image has the same hash.
+
+        The hash of the stored image is looked up in ``md5_index``. It is \
+            only read from the stored image if the image is not in the index, \
+            e.g. if it was stored before the index was kept.
+
+        :param image: The image.
+        :type image: TrafficImage
+
+        :param md5_index: MD5 hash of each stored image's file name, from \
+            ``datagovsg.transport.images.load_md5_index()``.
+        :type md5_index: dict[str, str]
+
+        :param rate_limiter: Token bucket that the download waits for, or \
+            None if downloads are not rate-limited.
+        :type rate_limiter: TokenBucket or None
+
+        :return: Whether the image was downloaded, and its number of bytes, \
+            or None if it could not be downloaded.
+        :rtype: tuple[bool, int or None]
+        """
+        if image.path is None:
+            return False, None
+
+        if image.md5 is not None and image.path.exists():
+            image_md5 = md5_index.get(image.path.name)
+            if image_md5 is None:
+                image_md5 = stored_md5(image.path)
+            if image_md5 == image.md5.lower():
+                return False, image.path.stat().st_size
+
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        try:
+            with self.session.get(
+                image.url,
+                stream=True,
+                expire_after=DO_NOT_CACHE,
+            ) as response:
+                response.raise_for_status()
+                size = store_image(
+                    response.iter_content(TRAFFIC_IMAGE_CHUNK_SIZE),
+                    image.path,
+                )
+        except RequestException:
+            return False, None
+
+        return True, size
 
 __all__ = [
     'Client',
@@ -14,20 +14,48 @@
 
 """Constants for all Traffic-related APIs."""
 
-from ..constants import BASE_V1_API_ENDPOINT
+from ..constants import BASE_V1_API_ENDPOINT, CACHE_THIRTY_SECONDS
 
 TRANSPORT_API_ENDPOINT = f'{BASE_V1_API_ENDPOINT}/transport'
 
 TAXI_AVAILABILITY_API_ENDPOINT = f'{TRANSPORT_API_ENDPOINT}/taxi-availability'
 TRAFFIC_IMAGES_API_ENDPOINT = f'{TRANSPORT_API_ENDPOINT}/traffic-images'
 
+TAXI_AVAILABILITY_TIME_RESOLUTION = CACHE_THIRTY_SECONDS
+TAXI_AVAILABILITY_UPDATE_CADENCE = CACHE_THIRTY_SECONDS
+
 TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS = [
     '[].cameras[].camera_id',
 ]
 
+TRAFFIC_IMAGE_CHUNK_SIZE = 64 * 1024
+TRAFFIC_IMAGE_SUFFIX = '.jpg'
+TRAFFIC_IMAGE_CAMERA_ID_PATTERN = r'[A-Za-z0-9_-]+'
+TRAFFIC_IMAGE_SUFFIX_PATTERN = r'\.[A-Za-z0-9]+'
+TRAFFIC_IMAGE_MD5_INDEX = '.md5.json'
+
+TAXI_GRID_CELL_SIZE_M = 250.0
+
+INVALID_CELL_SIZE_ERROR_MESSAGE = 'cell_size_m must be more than 0.'
+INVALID_RADIUS_ERROR_MESSAGE = 'radius_m must be at least 0.'
+
 __all__ = [
     'TAXI_AVAILABILITY_API_ENDPOINT',
     'TRAFFIC_IMAGES_API_ENDPOINT',
 
+    'TAXI_AVAILABILITY_TIME_RESOLUTION',
+    'TAXI_AVAILABILITY_UPDATE_CADENCE',
+
     'TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS',
-]
\ No newline at end of file
+
+    'TRAFFIC_IMAGE_CHUNK_SIZE',
+    'TRAFFIC_IMAGE_SUFFIX',
+    'TRAFFIC_IMAGE_CAMERA_ID_PATTERN',
+    'TRAFFIC_IMAGE_SUFFIX_PATTERN',
+    'TRAFFIC_IMAGE_MD5_INDEX',
+
+    'TAXI_GRID_CELL_SIZE_M',
+
+    'INVALID_CELL_SIZE_ERROR_MESSAGE',
+    'INVALID_RADIUS_ERROR_MESSAGE',
+]
@@ -0,0 +1,120 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Convert taxi availability into NumPy arrays of coordinates."""
+
+from re import compile as re_compile
+from typing import Any, Callable
+
+from ..arrays import import_numpy, position_array, position_array_from_json
+from ..validation import internal_typechecked
+
+@internal_typechecked
+def taxi_availability_array(
+    content: bytes,
+    decode_json: Callable[[bytes], Any],
+) -> Any:
+    """Decode the body of a taxi availability response, with the \
+        ``coordinates`` of each feature as an array of ``float64`` with \
+        shape (N, 2).
+
+    The coordinates are parsed straight from ``content`` into the arrays, \
+        so no list is built for any taxi. Only the rest of the response, \
+        which is small, is decoded with ``decode_json``.
+
+    :param content: The body of the response.
+    :type content: bytes
+
+    :param decode_json: Function that decodes JSON, e.g. \
+        ``DataGovSg.decode_json``.
+    :type decode_json: Callable[[bytes], Any]
+
+    :raises ImportError: ``numpy`` is not installed.
+    :raises ValueError: A position does not have 2 numbers.
+
+    :return: The unsanitised response.
+    :rtype: Any (but is really TaxiAvailabilityArrayDict)
+    """
+    import_numpy()
+    arrays: list[Any] = []
+    try:
+        data = decode_json(_replace_coordinates(content, arrays))
+    except ValueError:
+        # e.g. coordinates that are not positions, so decode them as-is
+        arrays = []
+        data = decode_json(content)
+
+    for feature in data.get('features', []) if isinstance(data, dict) else []:
+        geometry = feature.get('geometry') if isinstance(feature, dict) else None
+        if not isinstance(geometry, dict) or 'coordinates' not in geometry:
+            continue
+        coordinates = geometry['coordinates']
+        geometry['coordinates'] = arrays[coordinates] \
+            if isinstance(coordinates, int) and arrays \
+            else position_array(coordinates)
+
+    return data
+
+# private
+
+_COORDINATES_PATTERN = re_compile(rb'"coordinates"\s*:\s*\[')
+_EMPTY_END_PATTERN = re_compile(rb'\s*\]')
+_POSITIONS_END_PATTERN = re_compile(rb'\]\s*\]')
+
+def _replace_coordinates(content: bytes, arrays: list[Any]) -> bytes:
+    """Parse each array of ``coordinates`` into ``arrays``, and replace it \
+        with its index in ``arrays``.
+
+    The end of an array of positions is the first ``]]``, or its ``]`` if \
+        it is empty, so the positions are not matched one by one.
+
+    :param content: The body of the response.
+    :type content: bytes
+
+    :param arrays: List to append the arrays to.
+    :type arrays: list[Any]
+
+    :raises ValueError: An array of ``coordinates`` is not an array of \
+        positions with 2 numbers each.
+
+    :return: The body, e.g. with ``"coordinates":0`` instead of the first \
+        array.
+    :rtype: bytes
+    """
+    parts: list[bytes] = []
+    end = 0
+    for match in _COORDINATES_PATTERN.finditer(content):
+        if match.start() < end:
+            continue
+        array_start = match.end() - 1
+        empty_end = _EMPTY_END_PATTERN.match(content, match.end())
+        if empty_end is not None:
+            array_end = empty_end.end()
+        else:
+            positions_end = _POSITIONS_END_PATTERN.search(content, match.end())
+            if positions_end is None:
+                break
+            array_end = positions_end.end()
+
+        arrays.append(position_array_from_json(content[array_start:array_end]))
+        parts.append(content[end:match.start()])
+        parts.append(b'"coordinates":%d' % (len(arrays) - 1))
+        end = array_end
+
+    parts.append(content[end:])
+    return b''.join(parts)
+
+__all__ = [
+    'taxi_availability_array',
+]
@@ -0,0 +1,203 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Requests of the Transport client's methods.
+
+Each method's request is built by its own function here, which validates the \
+    method's arguments and returns the arguments of ``send_request()``. The \
+    method's result is then got from the response by its ``_result()`` \
+    function, if it has one. The synchronous and asynchronous clients share \
+    these functions, so that they send the same requests and return the same \
+    results.
+"""
+
+from typing import Any
+
+from ..constants import CACHE_THIRTY_SECONDS, CACHE_ONE_MINUTE
+from ..datagovsg import DataGovSg
+from ..lazy import LazySequence
+from ..types import RequestDict
+from ..validation import internal_typechecked
+
+from .constants import (
+    TAXI_AVAILABILITY_API_ENDPOINT,
+    TAXI_AVAILABILITY_TIME_RESOLUTION,
+    TAXI_AVAILABILITY_UPDATE_CADENCE,
+    TRAFFIC_IMAGES_API_ENDPOINT,
+    TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS,
+)
+from .coordinates import taxi_availability_array
+from .types_args import TransportArgsDict
+from .types import (
+    TaxiAvailabilityArrayDict,
+    TaxiAvailabilityDict,
+    TrafficImagesItemDict,
+)
+
+@internal_typechecked
+def taxi_availability_request(client: DataGovSg, kwargs: Any) -> RequestDict:
+    """Build the request of ``taxi_availability()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really TransportArgsDict)
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    params = client.build_params(
+        params_expected_type=TransportArgsDict,
+        original_params=kwargs,
+        time_resolution=TAXI_AVAILABILITY_TIME_RESOLUTION,
+    )
+
+    return {
+        'url': TAXI_AVAILABILITY_API_ENDPOINT,
+        'params': params,
+        'cache_duration': CACHE_THIRTY_SECONDS,
+        'update_cadence': TAXI_AVAILABILITY_UPDATE_CADENCE,
+        'sanitise_schema': TaxiAvailabilityDict,
+    }
+
+@internal_typechecked
+def taxi_availability_array_request(
+    client: DataGovSg,
+    kwargs: Any,
+) -> RequestDict:
+    """Build the request of ``taxi_availability_array()``.
+
+    The response's body is returned as-is, so that its coordinates can be \
+        parsed by ``taxi_availability_array_result()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really TransportArgsDict)
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    params = client.build_params(
+        params_expected_type=TransportArgsDict,
+        original_params=kwargs,
+        time_resolution=TAXI_AVAILABILITY_TIME_RESOLUTION,
+    )
+
+    return {
+        'url': TAXI_AVAILABILITY_API_ENDPOINT,
+        'params': params,
+        'cache_duration': CACHE_THIRTY_SECONDS,
+        'raw': True,
+    }
+
+@internal_typechecked
+def taxi_availability_array_result(
+    client: DataGovSg,
+    content: bytes,
+) -> TaxiAvailabilityArrayDict:
+    """Get the result of ``taxi_availability_array()`` from its response.
+
+    :param client: The client that sent the request.
+    :type client: DataGovSg
+
+    :param content: The response's body, from the request of \
+        ``taxi_availability_array_request()``.
+    :type content: bytes
+
+    :raises ImportError: ``numpy`` is not installed.
+    :raises ValueError: A position does not have 2 numbers.
+
+    :return: GeoJSON of the taxi availabilities.
+    :rtype: TaxiAvailabilityArrayDict
+    """
+    data = taxi_availability_array(content, client.decode_json)
+
+    taxi_availability: TaxiAvailabilityArrayDict
+    taxi_availability = client.sanitise_data_with_schema(
+        data,
+        schema=TaxiAvailabilityArrayDict,
+    )
+    return taxi_availability
+
+@internal_typechecked
+def traffic_images_request(client: DataGovSg, kwargs: Any) -> RequestDict:
+    """Build the request of ``traffic_images()``.
+
+    The response is not sanitised if the client is lazy, so that it can be \
+        sanitised lazily by ``traffic_images_result()``.
+
+    :param client: The client that sends the request.
+    :type client: DataGovSg
+
+    :param kwargs: Key-value arguments of the method.
+    :type kwargs: Any (but is really TransportArgsDict)
+
+    :return: The arguments of ``send_request()``.
+    :rtype: RequestDict
+    """
+    params = client.build_params(
+        params_expected_type=TransportArgsDict,
+        original_params=kwargs,
+    )
+
+    request: RequestDict = {
+        'url': TRAFFIC_IMAGES_API_ENDPOINT,
+        'params': params,
+        'cache_duration': CACHE_ONE_MINUTE,
+    }
+    if client.lazy:
+        request['sanitise'] = False
+    else:
+        request['sanitise_schema'] = dict[str, list[TrafficImagesItemDict]]
+
+    return request
+
+@internal_typechecked
+def traffic_images_result(
+    client: DataGovSg,
+    data: Any,
+) -> list[TrafficImagesItemDict] | LazySequence:
+    """Get the result of ``traffic_images()`` from its response.
+
+    :param client: The client that sent the request.
+    :type client: DataGovSg
+
+    :param data: The response, from the request of \
+        ``traffic_images_request()``.
+    :type data: Any (but is really a dict)
+
+    :return: Images from traffic cameras, as a read-only proxy if the client \
+        is lazy.
+    :rtype: list[TrafficImagesItemDict] or LazySequence
+    """
+    if client.lazy:
+        return client.sanitise_data_lazily(
+            data.get('items', []),
+            ignore_keys=TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS,
+        )
+
+    traffic_images: list[TrafficImagesItemDict]
+    traffic_images = data.get('items', [])
+    return traffic_images
+
+__all__ = [
+    'taxi_availability_array_request',
+    'taxi_availability_array_result',
+    'taxi_availability_request',
+    'traffic_images_request',
+    'traffic_images_result',
+]
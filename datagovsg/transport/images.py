@@ -0,0 +1,217 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Store the images of traffic cameras on disk.
+
+Each camera's latest image is stored in a directory as ``<camera_id>`` plus \
+    the suffix of the image's URL, or ``.jpg`` if the URL has no suffix that \
+    is safe to use. Camera IDs come from the API, so an image is only stored \
+    if its camera ID is made of letters, digits, ``_`` and ``-``, and cannot \
+    name a path outside the directory.
+
+The MD5 hash in each image's ``image_metadata`` is kept in an index file, \
+    ``.md5.json``, in the directory. An image is only downloaded again if its \
+    hash differs from the hash in the index, so stored images are not read \
+    again on every poll.
+"""
+
+import re
+from hashlib import md5
+from json import JSONDecodeError, dumps, loads
+from os import replace
+from pathlib import Path, PurePosixPath
+from typing import Any, Iterable, NamedTuple
+from urllib.parse import urlsplit
+
+from ..types import Url
+from ..validation import internal_typechecked
+
+from .constants import (
+    TRAFFIC_IMAGE_CAMERA_ID_PATTERN,
+    TRAFFIC_IMAGE_CHUNK_SIZE,
+    TRAFFIC_IMAGE_MD5_INDEX,
+    TRAFFIC_IMAGE_SUFFIX,
+    TRAFFIC_IMAGE_SUFFIX_PATTERN,
+)
+
+class TrafficImage(NamedTuple):
+    """Image of a traffic camera, and where to store it."""
+
+    camera_id: str
+    url: Url
+    md5: str | None
+    path: Path | None
+    """Path to store the image at, or None if the camera ID is not safe to \
+        use as a file name."""
+
+@internal_typechecked
+def traffic_images_to_store(
+    traffic_images: Any,
+    directory: Path,
+) -> list[TrafficImage]:
+    """List the latest image of each camera in a traffic images response.
+
+    :param traffic_images: Traffic images, from \
+        ``Transport.traffic_images()``.
+    :type traffic_images: list[TrafficImagesItemDict] or LazySequence
+
+    :param directory: Directory to store the images in.
+    :type directory: Path
+
+    :return: The images, one per camera. The ``path`` of an image is None if \
+        its camera ID is not safe to use as a file name.
+    :rtype: list[TrafficImage]
+    """
+    images: dict[str, TrafficImage] = {}
+    for item in traffic_images:
+        for camera in item.get('cameras', []):
+            camera_id = str(camera['camera_id'])
+            url = camera['image']
+            images[camera_id] = TrafficImage(
+                camera_id,
+                url,
+                camera.get('image_metadata', {}).get('md5'),
+                _image_path(directory, camera_id, url),
+            )
+    return list(images.values())
+
+@internal_typechecked
+def load_md5_index(directory: Path) -> dict[str, str]:
+    """Read the MD5 hashes of the images that were stored in a directory.
+
+    :param directory: Directory of the images.
+    :type directory: Path
+
+    :return: MD5 hash, in lowercase hexadecimal, of each image's file name. \
+        Empty if the index does not exist or cannot be read.
+    :rtype: dict[str, str]
+    """
+    try:
+        index = loads((directory / TRAFFIC_IMAGE_MD5_INDEX).read_bytes())
+    except (OSError, JSONDecodeError, UnicodeDecodeError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    return {k: v for k, v in index.items() if isinstance(v, str)}
+
+@internal_typechecked
+def save_md5_index(directory: Path, index: dict[str, str]) -> None:
+    """Write the MD5 hashes of the images that are stored in a directory.
+
+    :param directory: Directory of the images.
+    :type directory: Path
+
+    :param index: MD5 hash of each image's file name.
+    :type index: dict[str, str]
+
+    :return: None
+    """
+    store_image(
+        [dumps(index, sort_keys=True).encode()],
+        directory / TRAFFIC_IMAGE_MD5_INDEX,
+    )
+
+@internal_typechecked
+def stored_md5(path: Path) -> str | None:
+    """Hash a stored image.
+
+    :param path: Path of the image.
+    :type path: Path
+
+    :return: The MD5 hash of the image, in hexadecimal, or None if it is not \
+        stored.
+    :rtype: str or None
+    """
+    try:
+        with path.open('rb') as file:
+            image_hash = md5(usedforsecurity=False)
+            while chunk := file.read(TRAFFIC_IMAGE_CHUNK_SIZE):
+                image_hash.update(chunk)
+    except FileNotFoundError:
+        return None
+    return image_hash.hexdigest()
+
+@internal_typechecked
+def store_image(chunks: Iterable[bytes], path: Path) -> int:
+    """Write an image to disk as its chunks arrive.
+
+    The chunks are written to a ``.part`` file next to ``path``, which \
+        replaces ``path`` once every chunk is written. If a chunk cannot be \
+        read, then the ``.part`` file is removed and the stored image is \
+        kept.
+
+    :param chunks: Chunks of the image, e.g. from \
+        ``requests.Response.iter_content()``.
+    :type chunks: Iterable[bytes]
+
+    :param path: Path to store the image at.
+    :type path: Path
+
+    :return: Number of bytes written.
+    :rtype: int
+    """
+    part_path = path.with_name(f'{path.name}.part')
+    size = 0
+    try:
+        with part_path.open('wb') as file:
+            for chunk in chunks:
+                file.write(chunk)
+                size += len(chunk)
+        replace(part_path, path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    return size
+
+# private
+
+_CAMERA_ID_PATTERN = re.compile(TRAFFIC_IMAGE_CAMERA_ID_PATTERN)
+_SUFFIX_PATTERN = re.compile(TRAFFIC_IMAGE_SUFFIX_PATTERN)
+
+def _image_path(directory: Path, camera_id: str, url: Url) -> Path | None:
+    """Build the path to store a camera's image at.
+
+    :param directory: Directory to store the image in.
+    :type directory: Path
+
+    :param camera_id: ID of the camera.
+    :type camera_id: str
+
+    :param url: URL of the image, whose suffix is kept if it is safe.
+    :type url: Url
+
+    :return: The path, or None if the camera ID is not safe to use as a file \
+        name.
+    :rtype: Path or None
+    """
+    if not _CAMERA_ID_PATTERN.fullmatch(camera_id):
+        return None
+
+    suffix = PurePosixPath(urlsplit(url).path).suffix
+    if not _SUFFIX_PATTERN.fullmatch(suffix):
+        suffix = TRAFFIC_IMAGE_SUFFIX
+
+    path = directory / f'{camera_id}{suffix}'
+    if path.resolve().parent != directory.resolve():
+        return None
+    return path
+
+__all__ = [
+    'TrafficImage',
+    'load_md5_index',
+    'save_md5_index',
+    'store_image',
+    'stored_md5',
+    'traffic_images_to_store',
+]
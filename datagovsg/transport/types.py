@@ -15,7 +15,7 @@
 """Data.gov.sg custom types for Transport client methods' responses."""
 
 from datetime import datetime
-from typing import NotRequired, TypedDict
+from typing import Any, NotRequired, TypedDict
 
 from ..types import Url
 
@@ -114,6 +114,47 @@ class TaxiAvailabilityDict(TypedDict):
     features: list[_TaxiAvailabilityFeatureDict]
     """Locations of available taxis."""
 
+class _TaxiAvailabilityFeatureGeometryArrayDict(TypedDict):
+    """Type definition for _TaxiAvailabilityFeatureArrayDict"""
+
+    type: str
+    """Type. One of:
+
+    - "MultiPoint"
+    """
+    coordinates: Any
+    """NumPy array of ``float64`` with shape (N, 2), of positions \
+        (longitude, latitude).
+
+    :example: array([[103.62403, 1.28675], [103.63601, 1.27377]])
+    """
+
+class _TaxiAvailabilityFeatureArrayDict(TypedDict):
+    """Type definition for TaxiAvailabilityArrayDict"""
+
+    type: str
+    """Type.
+
+    :example: "Feature"
+    """
+    geometry: _TaxiAvailabilityFeatureGeometryArrayDict
+    """Geometry."""
+    properties: _TaxiAvailabilityFeaturePropertiesDict
+    """Additional meta-data from Data.gov.sg."""
+
+class TaxiAvailabilityArrayDict(TypedDict):
+    """Type definition for taxi_availability_array()"""
+
+    type: str
+    """A GeoJSON representing the locations of available taxis in Singapore.
+
+    :example: "FeatureCollection"
+    """
+    crs: _TaxiAvailabilityCrsDict
+    """The coordinate reference system used."""
+    features: list[_TaxiAvailabilityFeatureArrayDict]
+    """Locations of available taxis."""
+
 # Traffic Images
 
 class _TrafficImagesItemCameraMetadataDict(TypedDict):
@@ -188,7 +229,39 @@ class TrafficImagesItemDict(TypedDict):
     cameras: list[_TrafficImagesItemCameraDict]
     """Camera information and images."""
 
+class TrafficImagesDownloadDict(TypedDict):
+    """Type definition for download_traffic_images()"""
+
+    downloaded: int
+    """Number of images that were downloaded.
+
+    :example: 12
+    """
+    skipped: int
+    """Number of images that were not downloaded, because the stored image \
+        has the same MD5 hash.
+
+    :example: 78
+    """
+    failed: list[str]
+    """Camera IDs of the images that could not be downloaded.
+
+    :example: ["1001"]
+    """
+    bytes_downloaded: int
+    """Number of bytes of the images that were downloaded.
+
+    :example: 614400
+    """
+    bytes_saved: int
+    """Number of bytes of the images that were skipped.
+
+    :example: 3993600
+    """
+
 __all__ = [
+    'TaxiAvailabilityArrayDict',
     'TaxiAvailabilityDict',
+    'TrafficImagesDownloadDict',
     'TrafficImagesItemDict',
 ]
@@ -23,7 +23,8 @@ class TransportArgsDict(TypedDict):
     """
 
     date_time: NotRequired[datetime]
-    """Retrieve the latest availability at that moment in time.
+    """Retrieve the latest availability at that moment in time. For \
+        ``taxi_availability()``, it is rounded down to 30 seconds.
 
     :example: datetime(2024, 7, 16, 23, 59, 0)
     """
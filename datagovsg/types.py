@@ -14,11 +14,190 @@
 
 """Data.gov.sg custom types for client methods' responses."""
 
-from typing import TypeAlias
+from typing import Any, NotRequired, TypeAlias, TypedDict
+
+FetchCall: TypeAlias = tuple[str, dict[str, Any]]
+"""Name of a client method and the key-value arguments to call it with."""
 
 Url: TypeAlias = str
 """URL of link."""
 
+class BoundedCacheStatsDict(TypedDict):
+    """Type definition for the statistics of a bounded cache of responses."""
+
+    hits: int
+    """Number of responses that were found in the cache, expired or not.
+
+    :example: 950
+    """
+    misses: int
+    """Number of responses that were not found in the cache.
+
+    :example: 50
+    """
+    evictions: int
+    """Number of responses that were removed to keep within the cache's \
+        limit.
+
+    :example: 12
+    """
+    entries: int
+    """Number of responses in the cache.
+
+    :example: 38
+    """
+    bytes: int
+    """Number of bytes of responses in the cache.
+
+    :example: 4194304
+    """
+
+class CoalesceStatsDict(TypedDict):
+    """Type definition for the statistics of coalesced requests."""
+
+    requests: int
+    """Number of requests that were made, including coalesced requests.
+
+    :example: 50
+    """
+    coalesced: int
+    """Number of requests that waited for an identical request in flight \
+        instead of being sent.
+
+    :example: 49
+    """
+    in_flight: int
+    """Number of requests that are being sent now.
+
+    :example: 0
+    """
+
+class PipelineStatsDict(TypedDict):
+    """Type definition for the time saved by requesting pages in the \
+        background."""
+
+    pages_prefetched: int
+    """Number of pages that were requested in the background while the \
+        previous page was being sanitised and merged.
+
+    :example: 19
+    """
+    fetch_seconds: float
+    """Number of seconds taken to request the prefetched pages.
+
+    :example: 1.43
+    """
+    wait_seconds: float
+    """Number of seconds spent waiting for the prefetched pages to arrive.
+
+    :example: 1.08
+    """
+    hidden_seconds: float
+    """Number of seconds of requests that overlapped with sanitising and \
+        merging, i.e. that were hidden from the total time taken.
+
+    :example: 0.35
+    """
+
+class PoolStatsDict(TypedDict):
+    """Type definition for the statistics of a session's connection pools."""
+
+    connections_opened: int
+    """Number of connections that were opened.
+
+    :example: 2
+    """
+    connections_reused: int
+    """Number of requests that reused an open connection.
+
+    :example: 98
+    """
+
+class RequestDict(TypedDict):
+    """Type definition for the request of a client method, as the \
+        key-value arguments of ``send_request()``.
+
+    The synchronous and asynchronous clients build their methods' requests \
+        with the same functions, and only differ in how they send them.
+    """
+
+    url: Url
+    """The endpoint URL to send the request to."""
+    params: dict[str, Any]
+    """Parameters to be passed to the endpoint URL."""
+    cache_duration: int
+    """Number of seconds before the cache expires."""
+    update_cadence: NotRequired[int]
+    """Number of seconds between the endpoint's updates, if they are \
+        regular."""
+    sanitise: NotRequired[bool]
+    """Whether the response's values are sanitised."""
+    sanitise_schema: NotRequired[Any]
+    """The expected type of the response value."""
+    raw: NotRequired[bool]
+    """Whether the response's body is returned as-is."""
+
+class ResultCacheStatsDict(TypedDict):
+    """Type definition for the statistics of a cache of sanitised results."""
+
+    hits: int
+    """Number of results that were found in the cache.
+
+    :example: 950
+    """
+    misses: int
+    """Number of results that were not found in the cache, or had expired.
+
+    :example: 50
+    """
+    evictions: int
+    """Number of results that were removed to keep within the cache's limits.
+
+    :example: 3
+    """
+    entries: int
+    """Number of results in the cache.
+
+    :example: 12
+    """
+    bytes: int
+    """Estimated number of bytes used by the results in the cache.
+
+    :example: 1048576
+    """
+
+class SanitiseCacheStatsDict(TypedDict):
+    """Type definition for the statistics of the memos of converted strings."""
+
+    hits: int
+    """Number of strings whose converted value was found in a memo.
+
+    :example: 9800
+    """
+    misses: int
+    """Number of strings that had to be converted.
+
+    :example: 200
+    """
+    entries: int
+    """Number of converted values in the memos.
+
+    :example: 200
+    """
+    max_entries: int
+    """Most number of converted values kept per kind of conversion.
+
+    :example: 4096
+    """
+
 __all__ = [
+    'BoundedCacheStatsDict',
+    'CoalesceStatsDict',
+    'FetchCall',
+    'PipelineStatsDict',
+    'PoolStatsDict',
+    'RequestDict',
+    'ResultCacheStatsDict',
+    'SanitiseCacheStatsDict',
     'Url',
 ]
@@ -0,0 +1,186 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Control which functions and methods are type-checked by typeguard.
+
+There are three validation levels:
+
+- ``"full"``: Every function and method is type-checked. (Default.)
+- ``"boundary"``: Only the public client methods are type-checked.
+- ``"off"``: Nothing is type-checked.
+
+The default validation level is read from the ``DATAGOVSG_VALIDATION_LEVEL`` \
+    environment variable when the package is imported. Module-level functions \
+    and static methods, e.g. in ``datagovsg.timezone``, are only instrumented \
+    if that default is ``"full"``. Client methods follow the validation level \
+    of their client, which can be set per client with the ``validation_level`` \
+    argument.
+
+While a method runs, the functions that it calls follow its validation level \
+    too, e.g. the sanitisers calling ``datetime_from_string()`` per string \
+    are not type-checked for a client at ``"off"``, even if the default is \
+    ``"full"``. The bodies of generator methods run after the method has \
+    returned, so they follow the validation level of their caller instead.
+"""
+
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from os import getenv
+from typing import Any, Callable
+
+from typeguard import typechecked
+
+from .constants import (
+    INVALID_VALIDATION_LEVEL_ERROR_MESSAGE,
+    VALIDATION_LEVEL_ENVIRONMENT_VARIABLE,
+    VALIDATION_LEVEL_BOUNDARY,
+    VALIDATION_LEVEL_FULL,
+    VALIDATION_LEVELS,
+)
+
+def check_validation_level(validation_level: str) -> str:
+    """Check that a validation level is allowed.
+
+    :param validation_level: The validation level to check.
+    :type validation_level: str
+
+    :raises ValueError: ``validation_level`` is not one of ``"full"``, \
+        ``"boundary"`` or ``"off"``.
+
+    :return: The validation level.
+    :rtype: str
+    """
+    if validation_level not in VALIDATION_LEVELS:
+        raise ValueError(INVALID_VALIDATION_LEVEL_ERROR_MESSAGE)
+    return validation_level
+
+DEFAULT_VALIDATION_LEVEL = check_validation_level(
+    getenv(VALIDATION_LEVEL_ENVIRONMENT_VARIABLE, VALIDATION_LEVEL_FULL),
+)
+
+def boundary_typechecked(func: Callable) -> Callable:
+    """Type-check a public client method when the validation level is \
+        ``"boundary"`` or ``"full"``.
+
+    :param func: The function or method to decorate.
+    :type func: Callable
+
+    :return: The decorated function or method.
+    :rtype: Callable
+    """
+    return _typechecked_from_level(func, VALIDATION_LEVEL_BOUNDARY)
+
+def internal_typechecked(func: Callable) -> Callable:
+    """Type-check an internal function or method only when the validation \
+        level is ``"full"``.
+
+    :param func: The function or method to decorate.
+    :type func: Callable
+
+    :return: The decorated function or method.
+    :rtype: Callable
+    """
+    return _typechecked_from_level(func, VALIDATION_LEVEL_FULL)
+
+# private
+
+_current_validation_level: ContextVar[str] = ContextVar(
+    'validation_level',
+    default=DEFAULT_VALIDATION_LEVEL,
+)
+
+def _is_method(func: Callable) -> bool:
+    """Check if a function is a method, i.e. its first argument is ``self``."""
+    code = getattr(func, '__code__', None)
+    return code is not None and code.co_varnames[:1] == ('self',)
+
+def _method_validation_level(instance: Any) -> str:
+    """Get the validation level of a method's instance, or of the method that \
+        is running, or the default, if the instance has none."""
+    level = getattr(instance, 'validation_level', None)
+    return _current_validation_level.get() if level is None else level
+
+def _typechecked_from_level(func: Callable, min_level: str) -> Callable:
+    """Type-check a function or method from a minimum validation level.
+
+    Methods, i.e. functions whose first argument is ``self``, check their \
+        instance's ``validation_level`` on every call, and set it as the \
+        validation level of the functions that they call. Instances without \
+        a ``validation_level`` use that of the method that is running, or \
+        the default. Coroutine methods \
+        stay coroutine functions. Other functions are only instrumented if \
+        ``DEFAULT_VALIDATION_LEVEL`` is at least ``min_level``, so they have \
+        no overhead otherwise. If they are, then they check the validation \
+        level of the method that is running, or the default, on every call.
+
+    :param func: The function or method to decorate.
+    :type func: Callable
+
+    :param min_level: The lowest validation level that type-checks ``func``.
+    :type min_level: str
+
+    :return: The decorated function or method.
+    :rtype: Callable
+    """
+    levels = frozenset(VALIDATION_LEVELS[VALIDATION_LEVELS.index(min_level):])
+
+    if not _is_method(func):
+        if DEFAULT_VALIDATION_LEVEL not in levels:
+            return func
+        checked_function = typechecked(func)
+
+        @wraps(func)
+        def function(*args: Any, **kwargs: Any) -> Any:
+            if _current_validation_level.get() in levels:
+                return checked_function(*args, **kwargs)
+            return func(*args, **kwargs)
+
+        return function
+
+    checked_method = typechecked(func)
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_method(self: Any, *args: Any, **kwargs: Any) -> Any:
+            level = _method_validation_level(self)
+            token = _current_validation_level.set(level)
+            try:
+                if level in levels:
+                    return await checked_method(self, *args, **kwargs)
+                return await func(self, *args, **kwargs)
+            finally:
+                _current_validation_level.reset(token)
+
+        return async_method
+
+    @wraps(func)
+    def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        level = _method_validation_level(self)
+        token = _current_validation_level.set(level)
+        try:
+            if level in levels:
+                return checked_method(self, *args, **kwargs)
+            return func(self, *args, **kwargs)
+        finally:
+            _current_validation_level.reset(token)
+
+    return method
+
+__all__ = [
+    'DEFAULT_VALIDATION_LEVEL',
+    'boundary_typechecked',
+    'check_validation_level',
+    'internal_typechecked',
+]
@@ -0,0 +1,36 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring
+
+"""Fixtures that are shared by all tests."""
+
+import pytest
+
+from datagovsg.ratelimit import reset_rate_limits, set_rate_limit
+
+from .stub_server import stub_server
+
+@pytest.fixture(autouse=True)
+def no_rate_limit():
+    # Mocked and local requests do not need to be rate-limited.
+    set_rate_limit(None)
+    yield
+    reset_rate_limits()
+
+@pytest.fixture(scope='module')
+def stub_url(stub_do_get):
+    # Each module that uses the stub server gives its do_GET() as stub_do_get
+    with stub_server(stub_do_get) as url:
+        yield url
@@ -17,6 +17,14 @@
 from datetime import date, datetime
 from typing import NotRequired, TypedDict
 
+class _MockSanitiseItemDict(TypedDict):
+    """Type definition for MockSanitiseDict"""
+    id: str
+    count: int
+    ratio: float
+    low_high: int | float
+
+
 class MockArgsDict(TypedDict):
     """Type definition for unit testing"""
     foobar: str
@@ -25,6 +33,15 @@ class MockArgsDict(TypedDict):
     meaning_of_universe: NotRequired[int]
     none_value: NotRequired[None]
 
+class MockSanitiseDict(TypedDict):
+    """Type definition for unit testing"""
+    timestamp: datetime
+    day: date
+    label: str
+    items: list[_MockSanitiseItemDict]
+    optional_count: NotRequired[int | None]
+
 __all__ = [
     'MockArgsDict',
+    'MockSanitiseDict',
 ]
@@ -0,0 +1,86 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Local HTTP server that stands in for the Data.gov.sg APIs in tests and \
+    benchmarks."""
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import Any, Callable, Iterator
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Respond to requests with the ``do_GET()`` that is given to \
+        ``stub_server()``."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def respond(
+        self,
+        status_code: int,
+        body: bytes,
+        content_type: str='application/json',
+    ) -> None:
+        """Send a response.
+
+        :param status_code: The response's HTTP status code.
+        :type status_code: int
+
+        :param body: The response's body.
+        :type body: bytes
+
+        :param content_type: The response's content type. Defaults to \
+            "application/json".
+        :type content_type: str
+
+        :return: None
+        """
+        self.send_response(status_code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """Do not log requests."""
+
+@contextmanager
+def stub_server(do_get: Callable[[StubHandler], None]) -> Iterator[str]:
+    """Serve requests on a local port.
+
+    :param do_get: Function that responds to a GET request, given the \
+        request's handler, e.g. with ``handler.respond()``.
+    :type do_get: Callable[[StubHandler], None]
+
+    :return: Iterator of the server's base URL, e.g. "http://127.0.0.1:8000".
+    :rtype: Iterator[str]
+    """
+    handler = type('Handler', (StubHandler,), {'do_GET': do_get})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        host, port = server.server_address[:2]
+        yield f'http://{host}:{port}'
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+__all__ = [
+    'StubHandler',
+    'stub_server',
+]
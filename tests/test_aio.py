@@ -0,0 +1,579 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the asynchronous clients are working properly."""
+
+from asyncio import all_tasks, gather, run, sleep
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from json import loads
+from time import perf_counter
+from zoneinfo import ZoneInfo
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aiohttp_client_cache import SQLiteBackend
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError
+from requests_cache import CachedSession
+from typeguard import check_type
+
+from datagovsg import Environment as SyncEnvironment
+from datagovsg import Transport as SyncTransport
+from datagovsg.aio import Environment, Housing, Transport
+from datagovsg.aio import datagovsg as aio_datagovsg
+from datagovsg.aio.constants import INVALID_CACHE_BACKEND_ERROR_MESSAGE
+from datagovsg.environment import endpoints as environment_endpoints
+from datagovsg.environment.constants import INVALID_PSI_DATETIME_ERROR_MESSAGE
+from datagovsg.environment.types import EnvironmentReadingDict, PSIDict
+from datagovsg.exceptions import APIError
+from datagovsg.lazy import LazySequence
+from datagovsg.ratelimit import set_rate_limit
+from datagovsg.resultcache import ResultCache
+from datagovsg.housing import endpoints as housing_endpoints
+from datagovsg.housing.types import CarparkAvailabilityItemDict
+from datagovsg.transport import endpoints as transport_endpoints
+from datagovsg.transport.types import (
+    TaxiAvailabilityDict,
+    TrafficImagesItemDict,
+)
+
+from .mocks.api_response_datagovsg import APIResponseNotFound
+from .mocks.api_response_environment import (
+    APIResponseAirTemperaturePage1,
+    APIResponseAirTemperaturePage2,
+    APIResponseAirTemperaturePage3,
+    APIResponsePSI,
+)
+from .mocks.api_response_housing import APIResponseCarparkAvailability
+from .mocks.api_response_transport import (
+    APIResponseTaxiAvailability,
+    APIResponseTrafficImages,
+)
+
+BAD_DATETIME = datetime(
+    2000, 1, 1, 0, 0, 0,
+    tzinfo=ZoneInfo('Asia/Singapore'),
+)
+CONCURRENT_CALLS = 50
+STUB_SERVER_DELAY = 0.2
+
+TEST_DATA = [
+    (
+        Environment,
+        environment_endpoints,
+        'PSI_API_ENDPOINT',
+        'psi',
+        PSIDict,
+        APIResponsePSI,
+    ),
+    (
+        Housing,
+        housing_endpoints,
+        'CARPARK_AVAILABILITY_API_ENDPOINT',
+        'carpark_availability',
+        list[CarparkAvailabilityItemDict],
+        APIResponseCarparkAvailability,
+    ),
+    (
+        Transport,
+        transport_endpoints,
+        'TAXI_AVAILABILITY_API_ENDPOINT',
+        'taxi_availability',
+        TaxiAvailabilityDict,
+        APIResponseTaxiAvailability,
+    ),
+    (
+        Transport,
+        transport_endpoints,
+        'TRAFFIC_IMAGES_API_ENDPOINT',
+        'traffic_images',
+        list[TrafficImagesItemDict],
+        APIResponseTrafficImages,
+    ),
+]
+
+@asynccontextmanager
+async def stub_server(handler):
+    app = web.Application()
+    app.router.add_get('/{path:.*}', handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield server
+    finally:
+        await server.close()
+
+def json_handler(mocked_response, delay=0):
+    async def handler(request):
+        if delay:
+            await sleep(delay)
+        response = mocked_response()
+        return web.json_response(response.json(), status=response.status_code)
+
+    return handler
+
+@pytest.mark.parametrize(
+    (
+        'client_class',
+        'module',
+        'endpoint_name',
+        'method',
+        'expected_type',
+        'mocked_response',
+    ),
+    TEST_DATA,
+)
+def test_aio_methods(
+    client_class,
+    module,
+    endpoint_name,
+    method,
+    expected_type,
+    mocked_response,
+    monkeypatch,
+):
+    async def main():
+        async with stub_server(json_handler(mocked_response)) as server:
+            monkeypatch.setattr(
+                module,
+                endpoint_name,
+                str(server.make_url('/endpoint')),
+            )
+            async with client_class(cache_backend='memory') as client:
+                return await getattr(client, method)()
+
+    data = run(main())
+
+    assert check_type(data, expected_type) == data
+
+def test_aio_methods_match_sync_methods(monkeypatch):
+    async def main():
+        async with stub_server(json_handler(APIResponsePSI)) as server:
+            monkeypatch.setattr(
+                environment_endpoints,
+                'PSI_API_ENDPOINT',
+                str(server.make_url('/psi')),
+            )
+            async with Environment(cache_backend='memory') as client:
+                return await client.psi()
+
+    def mock_requests_get(*args, **kwargs):
+        return APIResponsePSI()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    assert run(main()) == SyncEnvironment(cache_backend='memory').psi()
+
+def test_aio_lazy(monkeypatch):
+    async def main():
+        async with stub_server(json_handler(APIResponseTrafficImages)) as server:
+            monkeypatch.setattr(
+                transport_endpoints,
+                'TRAFFIC_IMAGES_API_ENDPOINT',
+                str(server.make_url('/traffic-images')),
+            )
+            async with Transport(cache_backend='memory', lazy=True) as client:
+                return await client.traffic_images()
+
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseTrafficImages()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    data = run(main())
+
+    assert isinstance(data, LazySequence)
+    assert data == SyncTransport(cache_backend='memory').traffic_images()
+
+def test_aio_carpark_availability_columns(monkeypatch):
+    pytest.importorskip('numpy')
+
+    async def main():
+        handler = json_handler(APIResponseCarparkAvailability)
+        async with stub_server(handler) as server:
+            monkeypatch.setattr(
+                housing_endpoints,
+                'CARPARK_AVAILABILITY_API_ENDPOINT',
+                str(server.make_url('/carpark-availability')),
+            )
+            async with Housing(cache_backend='memory') as client:
+                return await client.carpark_availability_columns()
+
+    columns = run(main())
+
+    assert columns['carpark_number'].tolist() == ['HE12']
+    assert columns['lots_available'].tolist() == [31]
+
+def test_aio_taxi_availability_array(monkeypatch):
+    pytest.importorskip('numpy')
+
+    async def main():
+        handler = json_handler(APIResponseTaxiAvailability)
+        async with stub_server(handler) as server:
+            monkeypatch.setattr(
+                transport_endpoints,
+                'TAXI_AVAILABILITY_API_ENDPOINT',
+                str(server.make_url('/taxi-availability')),
+            )
+            async with Transport(cache_backend='memory') as client:
+                return await client.taxi_availability_array()
+
+    data = run(main())
+
+    assert data['features'][0]['geometry']['coordinates'].tolist() == \
+        [[103.63601, 1.27377]]
+    assert data['features'][0]['properties']['taxi_count'] == 1661
+
+def test_aio_concurrent_calls():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await sleep(STUB_SERVER_DELAY)
+        in_flight -= 1
+        return web.json_response({'n': request.query['n']})
+
+    async def main():
+        async with stub_server(handler) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(cache_backend='memory') as client:
+                start = perf_counter()
+                data = await gather(*(
+                    client.send_request(url, params={'n': n}, sanitise=False)
+                    for n in range(CONCURRENT_CALLS)
+                ))
+                return data, perf_counter() - start
+
+    data, elapsed = run(main())
+
+    assert data == [{'n': str(n)} for n in range(CONCURRENT_CALLS)]
+    assert max_in_flight == CONCURRENT_CALLS
+    assert elapsed < STUB_SERVER_DELAY * CONCURRENT_CALLS / 5
+
+def test_aio_cache():
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        return web.json_response({'calls': calls})
+
+    async def main():
+        async with stub_server(handler) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(cache_backend='memory') as client:
+                return [
+                    await client.send_request(url, cache_duration=60)
+                    for _ in range(3)
+                ]
+
+    assert run(main()) == [{'calls': 1}] * 3
+    assert calls == 1
+
+def test_aio_cache_hits_do_not_take_tokens(tmp_path):
+    async def handler(request):
+        return web.json_response({'path': request.path})
+
+    async def main():
+        async with stub_server(handler) as server:
+            urls = [str(server.make_url(f'/{n}')) for n in range(20)]
+            cache = SQLiteBackend(str(tmp_path / 'cache'))
+            async with Environment(cache_backend=cache) as client:
+                for url in urls:
+                    await client.send_request(url, cache_duration=60)
+
+                set_rate_limit(1, capacity=1)
+                start = perf_counter()
+                await gather(*[
+                    client.send_request(url, cache_duration=60)
+                    for url in urls
+                ])
+                return perf_counter() - start
+
+    assert run(main()) < 0.5
+
+def test_aio_update_cadence():
+    async def handler(request):
+        updated = datetime.now(ZoneInfo('Asia/Singapore')) \
+            - timedelta(seconds=50)
+        return web.json_response({
+            'items': [{'timestamp': updated.isoformat(timespec='seconds')}],
+        })
+
+    async def main():
+        async with stub_server(handler) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(cache_backend='memory') as client:
+                await client.send_request(
+                    url,
+                    cache_duration=60,
+                    update_cadence=60,
+                )
+                async with client.session.get(
+                    url,
+                    expire_after=60,
+                ) as response:
+                    return response.from_cache, response.expires
+
+    from_cache, expires = run(main())
+
+    assert from_cache
+    expected_expires = datetime.now(timezone.utc).replace(tzinfo=None) \
+        + timedelta(seconds=10)
+    assert abs((expires - expected_expires).total_seconds()) < 2
+
+def test_aio_result_cache():
+    async def handler(request):
+        return web.json_response({'calls': 1})
+
+    async def main():
+        async with stub_server(handler) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(
+                cache_backend='memory',
+                result_cache=cache,
+            ) as client:
+                return [
+                    await client.send_request(url, cache_duration=60)
+                    for _ in range(3)
+                ]
+
+    cache = ResultCache()
+    data = run(main())
+
+    assert data[0] == {'calls': 1}
+    assert data[1] is data[0]
+    assert data[2] is data[0]
+    assert cache.stats()['hits'] == 2
+
+def test_aio_send_request_raw():
+    async def main():
+        async with stub_server(json_handler(APIResponsePSI)) as server:
+            url = str(server.make_url('/psi'))
+            async with Environment(cache_backend='memory') as client:
+                return await client.send_request(url, raw=True)
+
+    data = run(main())
+
+    assert isinstance(data, bytes)
+    assert loads(data) == APIResponsePSI.json()
+
+def test_aio_send_request_raw_with_api_error():
+    async def main():
+        async with stub_server(json_handler(APIResponseNotFound)) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(cache_backend='memory') as client:
+                return await client.send_request(url, raw=True)
+
+    with pytest.raises(APIError):
+        run(main())
+
+def test_aio_air_temperature_with_pagination(monkeypatch):
+    pages = {
+        None: APIResponseAirTemperaturePage1,
+        'b2Zmc2V0PTI1': APIResponseAirTemperaturePage2,
+        'b2Zmc2V0PTUw': APIResponseAirTemperaturePage3,
+    }
+
+    async def handler(request):
+        pagination_token = request.query.get('paginationToken', None)
+        return web.json_response(pages[pagination_token]().json())
+
+    async def main():
+        async with stub_server(handler) as server:
+            monkeypatch.setattr(
+                environment_endpoints,
+                'AIR_TEMPERATURE_API_ENDPOINT',
+                str(server.make_url('/air-temperature')),
+            )
+            async with Environment(cache_backend='memory') as client:
+                return await client.air_temperature()
+
+    data = run(main())
+
+    assert check_type(data, EnvironmentReadingDict) == data
+    assert len(data['stations']) == 8
+    assert len(data['readings']) == 9
+
+def test_aio_iter_pages_and_readings(monkeypatch):
+    pages = {
+        None: APIResponseAirTemperaturePage1,
+        'b2Zmc2V0PTI1': APIResponseAirTemperaturePage2,
+        'b2Zmc2V0PTUw': APIResponseAirTemperaturePage3,
+    }
+
+    async def handler(request):
+        pagination_token = request.query.get('paginationToken', None)
+        return web.json_response(pages[pagination_token]().json())
+
+    async def main():
+        async with stub_server(handler) as server:
+            monkeypatch.setattr(
+                environment_endpoints,
+                'AIR_TEMPERATURE_API_ENDPOINT',
+                str(server.make_url('/air-temperature')),
+            )
+            async with Environment(cache_backend='memory') as client:
+                pages = [
+                    page async for page in client.iter_pages('air_temperature')
+                ]
+                readings = [
+                    reading
+                    async for reading in client.iter_readings('air_temperature')
+                ]
+                return pages, readings
+
+    pages, readings = run(main())
+
+    assert len(pages) == 3
+    for page in pages:
+        assert check_type(page, EnvironmentReadingDict) == page
+    assert len(readings) == 9
+
+def test_aio_api_error():
+    async def main():
+        async with stub_server(json_handler(APIResponseNotFound)) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(cache_backend='memory') as client:
+                await client.send_request(url)
+
+    with pytest.raises(APIError):
+        run(main())
+
+def test_aio_http_error_after_retries(monkeypatch):
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        return web.Response(status=503)
+
+    async def main():
+        async with stub_server(handler) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(cache_backend='memory') as client:
+                await client.send_request(url)
+
+    monkeypatch.setattr(aio_datagovsg, 'RETRY_BACKOFF_FACTOR', 0)
+
+    with pytest.raises(HTTPError, match='503 Server Error') as excinfo:
+        run(main())
+    assert calls == aio_datagovsg.RETRY_TOTAL + 1
+    assert excinfo.value.response.status_code == 503
+    assert excinfo.value.response.url.endswith('/endpoint')
+
+def test_aio_connection_error_after_retries(monkeypatch):
+    async def main():
+        async with stub_server(json_handler(APIResponsePSI)) as server:
+            url = str(server.make_url('/endpoint'))
+        async with Environment(cache_backend='memory') as client:
+            with pytest.raises(RequestsConnectionError):
+                await client.send_request(url)
+            return await client.fetch_many([
+                ('send_request', {'url': url}),
+                ('send_request', {'url': url, 'params': {'a': 1}}),
+            ])
+
+    monkeypatch.setattr(aio_datagovsg, 'RETRY_BACKOFF_FACTOR', 0)
+
+    data = run(main())
+
+    assert len(data) == 2
+    assert all(isinstance(error, RequestsConnectionError) for error in data)
+
+def test_aio_methods_with_bad_date():
+    async def main():
+        async with Environment(cache_backend='memory') as client:
+            await client.psi(date=BAD_DATETIME)
+
+    with pytest.raises(ValueError) as excinfo:
+        run(main())
+    assert str(excinfo.value) == INVALID_PSI_DATETIME_ERROR_MESSAGE
+
+def test_aio_invalid_cache_backend():
+    with pytest.raises(ValueError) as excinfo:
+        _ = Environment(cache_backend='bad_cache_backend')
+    assert str(excinfo.value) == INVALID_CACHE_BACKEND_ERROR_MESSAGE
+
+def test_aio_fetch_many(monkeypatch):
+    async def handler(request):
+        if request.path == '/not-found':
+            return await json_handler(APIResponseNotFound)(request)
+        return await json_handler(APIResponsePSI)(request)
+
+    async def main():
+        async with stub_server(handler) as server:
+            monkeypatch.setattr(
+                environment_endpoints,
+                'PSI_API_ENDPOINT',
+                str(server.make_url('/psi')),
+            )
+            async with Environment(cache_backend='memory') as client:
+                return await client.fetch_many([
+                    ('psi', {}),
+                    ('send_request', {'url': str(server.make_url('/not-found'))}),
+                    ('psi', {}),
+                ], max_workers=2)
+
+    data = run(main())
+
+    assert len(data) == 3
+    assert check_type(data[0], PSIDict) == data[0]
+    assert isinstance(data[1], APIError)
+    assert data[2] == data[0]
+
+def test_aio_fetch_many_cancels_other_calls_on_error():
+    async def handler(request):
+        await sleep(5)
+        return await json_handler(APIResponsePSI)(request)
+
+    async def main():
+        async with stub_server(handler) as server:
+            url = str(server.make_url('/slow'))
+            async with Environment(cache_backend='memory') as client:
+                with pytest.raises(ValueError):
+                    await client.fetch_many([
+                        ('send_request', {'url': url}),
+                        ('psi', {'date': BAD_DATETIME}),
+                    ])
+                return [
+                    task for task in all_tasks() \
+                        if task.get_coro().__qualname__.endswith('<locals>.fetch')
+                ]
+
+    assert not run(main())
+
+def test_aio_pool_stats():
+    async def handler(request):
+        return web.json_response({})
+
+    async def main():
+        async with stub_server(handler) as server:
+            url = str(server.make_url('/endpoint'))
+            async with Environment(cache_backend='memory') as client:
+                for _ in range(3):
+                    await client.send_request(url)
+                return client.pool_stats()
+
+    assert run(main()) == {
+        'connections_opened': 1,
+        'connections_reused': 2,
+    }
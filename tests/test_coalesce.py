@@ -0,0 +1,194 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that concurrent identical requests are sent only once."""
+
+from json import dumps
+from threading import Event, Thread
+from time import monotonic, sleep
+
+import pytest
+
+from datagovsg import Housing
+from datagovsg.coalesce import coalesce, coalesce_stats, reset_coalesce_stats
+from datagovsg.exceptions import APIError
+
+THREADS = 20
+
+CALLS = []
+RELEASE = Event()
+
+@pytest.fixture(scope='module')
+def stub_do_get():
+    def do_get(handler):
+        CALLS.append(handler.path)
+        RELEASE.wait(5)
+        if handler.path.startswith('/busy'):
+            status = 429
+            body = dumps({'code': 429, 'message': 'Too many requests'})
+        else:
+            status = 200
+            body = dumps({'items': [{'path': handler.path}]})
+        handler.respond(status, body.encode())
+
+    return do_get
+
+@pytest.fixture
+def stub(stub_url):
+    CALLS.clear()
+    RELEASE.clear()
+    reset_coalesce_stats()
+    yield stub_url
+    RELEASE.set()
+
+def wait_for_coalesced(count):
+    deadline = monotonic() + 5
+    while coalesce_stats()['coalesced'] < count and monotonic() < deadline:
+        sleep(0.01)
+
+def send_concurrently(client, url, params=None, sanitise=True):
+    outcomes = [None] * THREADS
+
+    def send(i):
+        try:
+            outcomes[i] = client.send_request(
+                url,
+                params=params,
+                sanitise=sanitise,
+            )
+        except APIError as error:
+            outcomes[i] = error
+
+    threads = [Thread(target=send, args=(i,)) for i in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    wait_for_coalesced(THREADS - 1)
+    RELEASE.set()
+    for thread in threads:
+        thread.join(5)
+    return outcomes
+
+def test_send_request_coalesces_identical_requests(stub):
+    client = Housing(cache_backend='memory', share_session=False)
+
+    outcomes = send_concurrently(client, f'{stub}/ok', params={'b': 2, 'a': 1})
+
+    assert len(CALLS) == 1
+    assert all(o == outcomes[0] for o in outcomes)
+    assert len({id(o) for o in outcomes}) == THREADS
+    assert coalesce_stats() == {
+        'requests': THREADS,
+        'coalesced': THREADS - 1,
+        'in_flight': 0,
+    }
+
+def test_send_request_coalesced_results_are_copies(stub):
+    # pylint: disable=unsubscriptable-object
+    client = Housing(cache_backend='memory', share_session=False)
+
+    outcomes = send_concurrently(client, f'{stub}/ok', sanitise=False)
+    outcomes[0]['items'][0]['path'] = None
+
+    assert len(CALLS) == 1
+    assert all(o == {'items': [{'path': '/ok'}]} for o in outcomes[1:])
+    assert len({id(o['items']) for o in outcomes}) == THREADS
+
+def test_send_request_shares_exception(stub):
+    client = Housing(cache_backend='memory', share_session=False)
+
+    outcomes = send_concurrently(client, f'{stub}/busy')
+
+    assert len(CALLS) == 1
+    assert all(isinstance(o, APIError) for o in outcomes)
+    assert coalesce_stats()['coalesced'] == THREADS - 1
+
+def test_send_request_does_not_coalesce_different_params(stub):
+    client = Housing(cache_backend='memory', share_session=False)
+    RELEASE.set()
+
+    threads = [
+        Thread(
+            target=client.send_request,
+            args=(f'{stub}/ok',),
+            kwargs={'params': {'page': i}},
+        )
+        for i in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(CALLS) == 3
+    assert coalesce_stats()['coalesced'] == 0
+
+def test_coalesce_shares_result():
+    reset_coalesce_stats()
+    release = Event()
+    results = []
+
+    def fetch():
+        release.wait(5)
+        return object()
+
+    threads = [
+        Thread(target=lambda: results.append(coalesce('key', fetch)))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    wait_for_coalesced(2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == 3
+    assert results[0] is results[1] is results[2]
+    assert coalesce('key', lambda: 'new') == 'new'
+    assert coalesce_stats() == {'requests': 4, 'coalesced': 2, 'in_flight': 0}
+
+def test_coalesce_shares_copies_of_result():
+    reset_coalesce_stats()
+    release = Event()
+    result = {'items': []}
+    results = []
+
+    def fetch():
+        release.wait(5)
+        return result
+
+    threads = [
+        Thread(
+            target=lambda: results.append(coalesce('key', fetch, share=dict)),
+        )
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    wait_for_coalesced(2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == 3
+    assert all(r == result and r is not result for r in results)
+    assert len({id(r) for r in results}) == 3
+    assert coalesce('key', lambda: result, share=dict) is result
+
+def test_coalesce_raises_exception():
+    with pytest.raises(ValueError):
+        _ = coalesce('key', lambda: int('not a number'))
+    assert coalesce_stats()['in_flight'] == 0
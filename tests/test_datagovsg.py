@@ -26,8 +26,12 @@ from requests import HTTPError
 from requests_cache import CachedSession
 
 from datagovsg.datagovsg import DataGovSg
-from datagovsg.constants import USER_AGENT
+from datagovsg.constants import (
+    INVALID_MAX_WORKERS_ERROR_MESSAGE,
+    USER_AGENT,
+)
 from datagovsg.exceptions import APIError
+from datagovsg.transport.types import TrafficImagesItemDict
 
 from .mocks.types_args import MockArgsDict
 from .mocks.api_response_datagovsg import (
@@ -287,6 +291,40 @@ def test_build_params(
     )
     assert params == expected_params
 
+def test_build_params_with_time_resolution(client):
+    params = client.build_params(
+        MockArgsDict,
+        {
+            'foobar': 'foo bar',
+            'date': GOOD_DATE,
+            'datetime': GOOD_DATETIME,
+        },
+        time_resolution=60,
+    )
+    assert params == {
+        'date': GOOD_DATE_STR,
+        'datetime': '2019-07-13T04:56:00',
+        'foobar': 'foo bar',
+    }
+    assert list(params) == ['date', 'datetime', 'foobar']
+
+def test_build_params_sorts_params(client):
+    params = client.build_params(
+        MockArgsDict,
+        {
+            'foobar': 'foo bar',
+            'datetime': GOOD_DATETIME,
+            'date': GOOD_DATE,
+        },
+        {
+            'meaning_of_universe': 42,
+        },
+        {
+            'meaning_of_universe': 'meaningOfUniverse',
+        },
+    )
+    assert list(params) == ['date', 'datetime', 'foobar', 'meaningOfUniverse']
+
 @pytest.mark.parametrize(
     ('kwargs', 'expected_result'),
     [
@@ -398,6 +436,24 @@ def test_send_request_with_sanitise_ignored_keys(
     camera_id = response_content['items'][0]['cameras'][0].get('camera_id', None)
     assert isinstance(camera_id, str)
 
+def test_send_request_with_sanitise_schema(
+    client,
+    monkeypatch,
+):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseTrafficImages()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    response_content = client.send_request(
+        'https://api.data.gov.sg/v1/transport/traffic-images',
+        sanitise_schema=dict[str, list[TrafficImagesItemDict]],
+    )
+
+    camera = response_content['items'][0]['cameras'][0]
+    assert isinstance(camera['camera_id'], str)
+    assert isinstance(camera['timestamp'], datetime)
+
 def test_send_request_with_invalid_endpoint(client):
     with pytest.raises(HTTPError):
         _ = client.send_request(
@@ -428,3 +484,36 @@ def test_send_request_with_error_response(
         send_error_request()
 
     assert error_value in str(excinfo.value)
+
+def test_fetch_many(client, monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        if args[1].endswith('/not-found'):
+            return APIResponseNotFound()
+        return APIResponseTrafficImages()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    data = client.fetch_many([
+        ('send_request', {'url': 'https://api.data.gov.sg/v1/foo'}),
+        ('send_request', {'url': 'https://api.data.gov.sg/v1/not-found'}),
+        ('send_request', {'url': 'https://api.data.gov.sg/v1/bar'}),
+    ])
+
+    assert len(data) == 3
+    assert data[0] == client.send_request('https://api.data.gov.sg/v1/foo')
+    assert isinstance(data[1], APIError)
+    assert 'Data not found' in str(data[1])
+    assert data[2] == data[0]
+
+def test_fetch_many_with_no_calls(client):
+    assert client.fetch_many([]) == []
+
+def test_fetch_many_with_invalid_method(client):
+    with pytest.raises(AttributeError):
+        _ = client.fetch_many([('foo', {})])
+
+def test_fetch_many_with_invalid_max_workers(client):
+    with pytest.raises(ValueError) as excinfo:
+        _ = client.fetch_many([], max_workers=0)
+
+    assert str(excinfo.value) == INVALID_MAX_WORKERS_ERROR_MESSAGE
@@ -0,0 +1,139 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the JSON decoders and raw responses are working properly."""
+
+import sys
+from json import dumps, loads
+
+import pytest
+from requests_cache import CachedSession
+
+from datagovsg import Transport
+from datagovsg.constants import (
+    INVALID_JSON_DECODER_ERROR_MESSAGE,
+    JSON_DECODER_IMPORT_ERROR_MESSAGE_FORMAT,
+)
+from datagovsg.decoders import decode_error_json, get_json_decoder
+from datagovsg.exceptions import APIError
+
+from .mocks.api_response_datagovsg import (
+    APIResponseDefault,
+    APIResponseNotFound,
+)
+from .mocks.api_response_transport import APIResponseTaxiAvailability
+
+URL = 'https://api.data.gov.sg/v1/transport/taxi-availability'
+
+def with_content(mocked_response):
+    class MockedResponseWithContent(mocked_response):
+        content = dumps(mocked_response.json()).encode()
+
+    return MockedResponseWithContent
+
+def refuse_to_decode(content):
+    raise AssertionError('the body should not be decoded')
+
+def test_get_json_decoder():
+    assert get_json_decoder('json') is loads
+
+@pytest.mark.parametrize('name', ['orjson', 'msgspec'])
+def test_optional_json_decoders(name):
+    pytest.importorskip(name)
+    decode_json = get_json_decoder(name)
+    content = dumps(APIResponseTaxiAvailability.json()).encode()
+
+    assert decode_json(content) == loads(content)
+    with pytest.raises(ValueError):
+        decode_json(b'{"code":')
+
+def test_get_json_decoder_with_invalid_name():
+    with pytest.raises(ValueError) as excinfo:
+        _ = get_json_decoder('simplejson')
+    assert str(excinfo.value) == INVALID_JSON_DECODER_ERROR_MESSAGE
+
+def test_get_json_decoder_not_installed(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'msgspec', None)
+    get_json_decoder.cache_clear()
+
+    with pytest.raises(ImportError) as excinfo:
+        _ = get_json_decoder('msgspec')
+    assert str(excinfo.value) == \
+        JSON_DECODER_IMPORT_ERROR_MESSAGE_FORMAT.format('msgspec')
+
+    get_json_decoder.cache_clear()
+
+@pytest.mark.parametrize(
+    ('content', 'expected_json'),
+    [
+        (b'{"code":0,"data":{"items":[]}}', {'code': 0}),
+        (b' { "code" : 0 }', {'code': 0}),
+        (b'{"items":[],"api_info":{"status":"healthy"}}', {}),
+    ],
+)
+def test_decode_error_json_without_decoding(content, expected_json):
+    assert decode_error_json(200, content, refuse_to_decode) == expected_json
+
+@pytest.mark.parametrize(
+    ('status_code', 'content', 'expected_json'),
+    [
+        (200, b'{"code":1,"message":"..."}', {'code': 1, 'message': '...'}),
+        (200, b'{"data":{"code":1},"code":0}', {'data': {'code': 1}, 'code': 0}),
+        (404, b'{"code":17}', {'code': 17}),
+        (500, b'Internal Server Error', {}),
+    ],
+)
+def test_decode_error_json_with_decoding(status_code, content, expected_json):
+    assert decode_error_json(status_code, content, loads) == expected_json
+
+def test_send_request_with_json_decoder(monkeypatch):
+    pytest.importorskip('orjson')
+
+    def mock_requests_get(*args, **kwargs):
+        return with_content(APIResponseTaxiAvailability)()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    assert Transport(json_decoder='orjson').taxi_availability() == \
+        Transport().taxi_availability()
+
+def test_send_request_raw(monkeypatch):
+    mocked_response = with_content(APIResponseTaxiAvailability)
+
+    def mock_requests_get(*args, **kwargs):
+        return mocked_response()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    data = Transport().send_request(URL, raw=True)
+
+    assert data is mocked_response.content
+
+@pytest.mark.parametrize(
+    'mocked_response',
+    [
+        APIResponseDefault,
+        APIResponseNotFound,
+    ],
+)
+def test_send_request_raw_with_api_error(mocked_response, monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return with_content(mocked_response)()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    with pytest.raises(APIError):
+        _ = Transport().send_request(URL, raw=True)
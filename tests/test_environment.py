@@ -25,9 +25,13 @@ from zoneinfo import ZoneInfo
 import pytest
 from dotenv import load_dotenv
 from requests_cache import CachedSession
-from typeguard import check_type
+from typeguard import check_type, TypeCheckError
 
 from datagovsg import Environment
+from datagovsg.environment.constants import (
+    INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE,
+    INVALID_METHOD_ERROR_MESSAGE,
+)
 from datagovsg.environment.types import (
     EnvironmentReadingDict,
     PM25Dict,
@@ -75,6 +79,8 @@ TEST_DATETIME = datetime.combine(
 TEST_DATE_YESTERDAY = TEST_DATE - timedelta(days=1)
 TEST_DATE_STRING = TEST_DATE.strftime('%Y-%m-%d')
 TEST_DATETIME_STRING = TEST_DATETIME.strftime('%Y-%m-%dT%H:%M:%S')
+TEST_DATETIME_HOUR_STRING = TEST_DATETIME.strftime('%Y-%m-%dT%H:00:00')
+TEST_HOURLY_METHODS = ['pm25', 'psi', 'uv_index']
 
 TEST_DATA = [
     (
@@ -148,6 +154,8 @@ TEST_DATA = [
         APIResponseWindSpeed,
     ),
 ]
+PIPELINE_DELAY = 0.1
+
 TEST_METHODS_AND_EXPECTED_TYPES = [
     (method, expected_type) for method, expected_type, _ in TEST_DATA
 ]
@@ -221,7 +229,10 @@ def test_environment_methods_with_datetime(
 
     client.send_request.assert_called_once()
     _, kwargs = client.send_request.call_args
-    assert kwargs['params']['date'] == TEST_DATETIME_STRING
+    if method in TEST_HOURLY_METHODS:
+        assert kwargs['params']['date'] == TEST_DATETIME_HOUR_STRING
+    else:
+        assert kwargs['params']['date'] == TEST_DATETIME_STRING
 
 def test_air_temperature_with_pagination(client, monkeypatch):
     def mock_requests_get(*args, **kwargs):
@@ -291,3 +302,104 @@ def test_uv_index_with_pagination(client, monkeypatch):
     data = client.uv_index()
 
     assert len(data['records']) == 13
+
+def mock_air_temperature_pages(*args, **kwargs):
+    params = kwargs.get('params', {})
+    pagination_token = params.get('paginationToken', None)
+    if pagination_token is None:
+        return APIResponseAirTemperaturePage1()
+    elif pagination_token == 'b2Zmc2V0PTI1':
+        return APIResponseAirTemperaturePage2()
+    elif pagination_token == 'b2Zmc2V0PTUw':
+        return APIResponseAirTemperaturePage3()
+
+def test_iter_pages(client, monkeypatch):
+    monkeypatch.setattr(CachedSession, 'get', mock_air_temperature_pages)
+
+    pages = list(client.iter_pages('air_temperature'))
+
+    assert len(pages) == 3
+    for page in pages:
+        assert check_type(page, EnvironmentReadingDict) == page
+        assert 'paginationToken' not in page
+
+def test_iter_pages_is_lazy(client, monkeypatch):
+    monkeypatch.setattr(CachedSession, 'get', mock_air_temperature_pages)
+
+    original_send_request = client.send_request
+    client.send_request = Mock(side_effect=original_send_request)
+
+    pages = client.iter_pages('air_temperature')
+    client.send_request.assert_not_called()
+
+    _ = next(pages)
+    client.send_request.assert_called_once()
+
+    _ = list(pages)
+    assert client.send_request.call_count == 3
+
+def test_iter_readings(client, monkeypatch):
+    monkeypatch.setattr(CachedSession, 'get', mock_air_temperature_pages)
+
+    readings = list(client.iter_readings('air_temperature'))
+
+    assert readings == client.air_temperature()['readings']
+
+def test_iter_pages_with_invalid_method(client):
+    with pytest.raises(TypeCheckError):
+        _ = client.iter_pages('send_request')
+
+    unchecked_client = Environment(validation_level='off')
+    with pytest.raises(ValueError) as excinfo:
+        _ = unchecked_client.iter_pages('send_request')
+    assert str(excinfo.value) == INVALID_METHOD_ERROR_MESSAGE
+
+def test_iter_pages_with_invalid_date(client):
+    with pytest.raises(ValueError) as excinfo:
+        _ = client.iter_pages('air_temperature', date=date(2000, 1, 1))
+    assert str(excinfo.value) == INVALID_AIR_TEMPERATURE_DATETIME_ERROR_MESSAGE
+
+def test_pipeline_matches_no_pipeline(monkeypatch):
+    monkeypatch.setattr(CachedSession, 'get', mock_air_temperature_pages)
+
+    pipelined_client = Environment(cache_backend='memory', pipeline=True)
+    data = pipelined_client.air_temperature()
+
+    assert data == Environment(cache_backend='memory').air_temperature()
+    assert pipelined_client.pipeline_stats()['pages_prefetched'] == 2
+
+def test_pipeline_hides_request_time(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        sleep(PIPELINE_DELAY)
+        return mock_air_temperature_pages(*args, **kwargs)
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = Environment(cache_backend='memory', pipeline=True)
+    for _ in client.iter_pages('air_temperature'):
+        # stand in for sanitising and merging a big page
+        sleep(PIPELINE_DELAY)
+
+    stats = client.pipeline_stats()
+    assert stats['pages_prefetched'] == 2
+    assert stats['hidden_seconds'] > PIPELINE_DELAY
+    assert stats['hidden_seconds'] <= stats['fetch_seconds']
+
+def test_pipeline_stops_when_iteration_stops(monkeypatch):
+    monkeypatch.setattr(CachedSession, 'get', mock_air_temperature_pages)
+
+    # The prefetch of the next page may outlive the test, so keep it off the
+    # shared session, where it would be coalesced with other tests' requests
+    client = Environment(
+        cache_backend='memory',
+        share_session=False,
+        pipeline=True,
+    )
+    original_send_request = client.send_request
+    client.send_request = Mock(side_effect=original_send_request)
+
+    pages = client.iter_pages('air_temperature')
+    _ = next(pages)
+    pages.close()
+
+    assert client.send_request.call_count <= 2
@@ -0,0 +1,181 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that responses expire when their endpoints next update."""
+
+from datetime import datetime, timedelta, timezone
+from json import dumps
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from datagovsg import Housing
+from datagovsg.constants import UPDATE_LATE_RETRY_SECONDS
+from datagovsg.expiry import find_update_time, seconds_until_next_update
+from datagovsg.resultcache import ResultCache
+from datagovsg.timezone import datetime_as_sgt
+
+from .mocks.api_response_environment import (
+    APIResponseFourDayWeatherForecast,
+    APIResponsePM25,
+)
+from .mocks.api_response_housing import APIResponseCarparkAvailability
+from .mocks.api_response_transport import APIResponseTaxiAvailability
+
+UPDATED_SECONDS_AGO = 50
+
+@pytest.fixture(scope='module')
+def stub_do_get():
+    def do_get(handler):
+        updated = datetime.now(ZoneInfo('Asia/Singapore')) \
+            - timedelta(seconds=UPDATED_SECONDS_AGO)
+        handler.respond(200, dumps({
+            'items': [{
+                'timestamp': updated.isoformat(timespec='seconds'),
+                'carpark_data': [],
+            }],
+        }).encode())
+
+    return do_get
+
+def sgt(*args):
+    return datetime_as_sgt(datetime(*args))
+
+@pytest.mark.parametrize(
+    ('value', 'expected_time'),
+    [
+        (APIResponseCarparkAvailability.json(), sgt(2026, 1, 12, 0, 15, 36)),
+        (APIResponseTaxiAvailability.json(), sgt(2026, 1, 12, 0, 14, 56)),
+        (APIResponsePM25.json(), sgt(2026, 1, 12, 10, 46, 6)),
+        (
+            APIResponseFourDayWeatherForecast.json(),
+            sgt(2026, 1, 12, 5, 20, 43),
+        ),
+        ({'items': [{'update_timestamp': '2026-01-12T05:20:43'}]}, \
+            sgt(2026, 1, 12, 5, 20, 43)),
+        ({'items': [{'timestamp': '2026-01-12 05:20:43'}]}, \
+            sgt(2026, 1, 12, 5, 20, 43)),
+        ({'items': [{'timestamp': '2026-01-11T21:20:43Z'}]}, \
+            sgt(2026, 1, 12, 5, 20, 43)),
+        ({'items': [{'timestamp': '2026-01-11T21:20:43+00:00'}]}, \
+            sgt(2026, 1, 12, 5, 20, 43)),
+        ({'items': [{'timestamp': '2026-01-12T05:20:43.5+08:00'}]}, \
+            sgt(2026, 1, 12, 5, 20, 43, 500000)),
+    ],
+)
+def test_find_update_time(value, expected_time):
+    assert find_update_time(value) == expected_time
+
+@pytest.mark.parametrize(
+    'tz',
+    [
+        timezone.utc,
+        ZoneInfo('Asia/Singapore'),
+        timezone(timedelta(hours=-5)),
+    ],
+)
+def test_seconds_until_next_update_of_timestamp(tz):
+    updated = datetime.now(tz) - timedelta(seconds=UPDATED_SECONDS_AGO)
+    timestamp = updated.isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+    seconds = seconds_until_next_update(
+        find_update_time({'items': [{'timestamp': timestamp}]}),
+        update_cadence=60,
+        cache_duration=120,
+    )
+
+    assert seconds == pytest.approx(60 - UPDATED_SECONDS_AGO, abs=1)
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        {},
+        [],
+        {'items': []},
+        {'items': [{'timestamp': 'not a datetime'}]},
+        {'items': [{'timestamp': '2026-01-12'}]},
+        {'items': [{'timestamp': '20260112'}]},
+        {'items': [{'timestamp': 1768166443}]},
+        {'a': {'b': {'c': {'d': {'timestamp': '2026-01-12T05:20:43'}}}}},
+    ],
+)
+def test_find_update_time_without_time(value):
+    assert find_update_time(value) is None
+
+@pytest.mark.parametrize(
+    ('updated_seconds_ago', 'expected_seconds'),
+    [
+        (50, 10),
+        (0, 60),
+        (-30, 60),
+        (70, UPDATE_LATE_RETRY_SECONDS),
+        (130, 120),
+    ],
+)
+def test_seconds_until_next_update(updated_seconds_ago, expected_seconds):
+    updated = datetime.now(timezone.utc) \
+        - timedelta(seconds=updated_seconds_ago)
+
+    seconds = seconds_until_next_update(
+        updated,
+        update_cadence=60,
+        cache_duration=120,
+    )
+
+    assert seconds == pytest.approx(expected_seconds, abs=1)
+
+def test_seconds_until_next_update_is_at_most_cache_duration():
+    updated = datetime.now(timezone.utc)
+
+    assert seconds_until_next_update(
+        updated,
+        update_cadence=60,
+        cache_duration=30,
+    ) == 30
+    assert seconds_until_next_update(
+        None,
+        update_cadence=60,
+        cache_duration=30,
+    ) == 30
+
+def test_send_request_expires_at_next_update(stub_url):
+    result_cache = ResultCache()
+    client = Housing(
+        cache_backend='memory',
+        share_session=False,
+        result_cache=result_cache,
+    )
+
+    client.send_request(stub_url, cache_duration=60, update_cadence=60)
+    response = client.session.get(stub_url, expire_after=60)
+
+    assert response.from_cache
+    expected_expires = datetime.now(timezone.utc).replace(tzinfo=None) \
+        + timedelta(seconds=60 - UPDATED_SECONDS_AGO)
+    expires = response.expires.replace(tzinfo=None)
+    assert abs((expires - expected_expires).total_seconds()) < 2
+    assert result_cache.stats()['entries'] == 1
+
+def test_send_request_without_update_cadence(stub_url):
+    client = Housing(cache_backend='memory', share_session=False)
+
+    client.send_request(stub_url, cache_duration=60)
+    response = client.session.get(stub_url, expire_after=60)
+
+    expected_expires = datetime.now(timezone.utc).replace(tzinfo=None) \
+        + timedelta(seconds=60)
+    expires = response.expires.replace(tzinfo=None)
+    assert abs((expires - expected_expires).total_seconds()) < 2
@@ -16,7 +16,8 @@
 
 """Test that the Housing class is working properly."""
 
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
 from os import getenv
 from unittest.mock import Mock
 from zoneinfo import ZoneInfo
@@ -27,8 +28,17 @@ from requests_cache import CachedSession
 from typeguard import check_type
 
 from datagovsg import Housing
-from datagovsg.housing.constants import INVALID_DATETIME_ERROR_MESSAGE
-from datagovsg.housing.types import CarparkAvailabilityItemDict
+from datagovsg.constants import NUMPY_IMPORT_ERROR_MESSAGE
+from datagovsg.housing.columns import carpark_availability_columns
+from datagovsg.housing.constants import (
+    CARPARK_AVAILABILITY_TIME_RESOLUTION,
+    INVALID_DATETIME_ERROR_MESSAGE,
+)
+from datagovsg.housing.types import (
+    CarparkAvailabilityColumnsDict,
+    CarparkAvailabilityItemDict,
+)
+from datagovsg.timezone import floor_datetime
 
 from .mocks.api_response_housing import APIResponseCarparkAvailability
 
@@ -36,7 +46,8 @@ BAD_DATETIME = datetime(
     2000, 1, 1, 0, 0, 0,
     tzinfo=ZoneInfo('Asia/Singapore'),
 )
-GOOD_DATETIME = datetime.now(ZoneInfo('Asia/Singapore'))
+GOOD_DATETIME = datetime.now(ZoneInfo('Asia/Singapore')) \
+    .replace(second=0, microsecond=0)
 GOOD_DATETIME_STRING = GOOD_DATETIME.strftime('%Y-%m-%dT%H:%M:%S')
 
 TEST_DATA = [
@@ -97,6 +108,53 @@ def test_housing_methods_with_good_datetime(
     _, kwargs = client.send_request.call_args
     assert kwargs['params']['date_time'] == GOOD_DATETIME_STRING
 
+@pytest.mark.parametrize(
+    ('method', 'mock_response_method'),
+    TEST_METHODS_AND_MOCK_RESPONSE_METHODS,
+)
+def test_housing_methods_with_seconds_in_datetime(
+    client,
+    method,
+    mock_response_method,
+    monkeypatch,
+):
+    def mock_requests_get(*args, **kwargs):
+        return mock_response_method()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    monkeypatch.setattr(
+        client,
+        'send_request',
+        Mock(side_effect=client.send_request),
+    )
+
+    date_time = GOOD_DATETIME.replace(second=59)
+    _ = getattr(client, method, None)(date_time=date_time)
+
+    assert floor_datetime(date_time, CARPARK_AVAILABILITY_TIME_RESOLUTION) \
+        == GOOD_DATETIME
+    _, kwargs = client.send_request.call_args
+    assert kwargs['params']['date_time'] == GOOD_DATETIME_STRING
+
+def test_carpark_availability_rounds_datetime(monkeypatch):
+    calls = []
+
+    def mock_requests_get(*args, **kwargs):
+        calls.append(kwargs['params'])
+        return APIResponseCarparkAvailability()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = Housing(cache_backend='memory')
+    date_time = datetime(
+        2026, 1, 12, 0, 15, 20,
+        tzinfo=ZoneInfo('Asia/Singapore'),
+    )
+    _ = client.carpark_availability(date_time=date_time)
+    _ = client.carpark_availability(date_time=date_time + timedelta(seconds=1))
+
+    assert calls == [{'date_time': '2026-01-12T00:15:00'}] * 2
+
 @pytest.mark.parametrize(
     ('method'),
     TEST_METHODS,
@@ -106,3 +164,125 @@ def test_economy_methods_with_bad_datetime(client, method):
         _ = getattr(client, method, None)(date_time=BAD_DATETIME)
 
     assert str(excinfo.value) == INVALID_DATETIME_ERROR_MESSAGE
+
+def test_carpark_availability_columns(monkeypatch):
+    numpy = pytest.importorskip('numpy')
+
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseCarparkAvailability()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = Housing(cache_backend='memory')
+    columns = client.carpark_availability_columns()
+    carpark_availability = client.carpark_availability()
+
+    assert check_type(columns, CarparkAvailabilityColumnsDict) == columns
+    rows = [
+        (carpark, info)
+        for item in carpark_availability
+        for carpark in item['carpark_data']
+        for info in carpark['carpark_info']
+    ]
+    assert columns['carpark_number'].tolist() == \
+        [carpark['carpark_number'] for carpark, _ in rows]
+    assert columns['lot_type'].tolist() == [info['lot_type'] for _, info in rows]
+    assert columns['total_lots'].tolist() == \
+        [info['total_lots'] for _, info in rows]
+    assert columns['lots_available'].tolist() == \
+        [info['lots_available'] for _, info in rows]
+    assert columns['update_datetime'].tolist() == [
+        carpark['update_datetime'].replace(tzinfo=None)
+        for carpark, _ in rows
+    ]
+    assert columns['update_datetime'].dtype == numpy.dtype('datetime64[s]')
+
+def test_carpark_availability_columns_with_bad_values():
+    numpy = pytest.importorskip('numpy')
+
+    columns = carpark_availability_columns([
+        {
+            'carpark_data': [
+                {
+                    'carpark_info': [
+                        {'total_lots': '10', 'lot_type': 'C', 'lots_available': '-'},
+                        {'total_lots': 5, 'lot_type': 'Y', 'lots_available': '5'},
+                    ],
+                    'carpark_number': 'A1',
+                    'update_datetime': 'not a date',
+                },
+                {
+                    'carpark_info': [],
+                    'carpark_number': 'A2',
+                    'update_datetime': '2026-01-12T00:14:30',
+                },
+            ],
+        },
+    ])
+
+    assert columns['carpark_number'].tolist() == ['A1', 'A1']
+    assert columns['total_lots'].tolist() == [10, 5]
+    assert columns['total_lots'].dtype == numpy.dtype('float64')
+    assert numpy.isnan(columns['lots_available'][0])
+    assert columns['lots_available'][1] == 5
+    assert numpy.isnat(columns['update_datetime']).all()
+
+def test_carpark_availability_columns_occupancy():
+    numpy = pytest.importorskip('numpy')
+
+    columns = carpark_availability_columns([
+        {
+            'carpark_data': [
+                {
+                    'carpark_info': [
+                        {'total_lots': '10', 'lot_type': 'C', 'lots_available': '4'},
+                        {'total_lots': '10', 'lot_type': 'C', 'lots_available': ''},
+                        {'lot_type': 'C', 'lots_available': '4'},
+                        {'total_lots': '0', 'lot_type': 'C', 'lots_available': '0'},
+                    ],
+                    'carpark_number': 'A1',
+                    'update_datetime': '2026-01-12T00:14:30',
+                },
+            ],
+        },
+    ])
+
+    # As in the docstring of carpark_availability_columns()
+    total_lots = columns['total_lots']
+    total_lots = numpy.where(total_lots > 0, total_lots, numpy.nan)
+    occupancy = 1 - columns['lots_available'] / total_lots
+
+    assert occupancy[0] == pytest.approx(0.6)
+    assert numpy.isnan(occupancy[1:]).all()
+
+def test_carpark_availability_columns_are_in_sgt():
+    numpy = pytest.importorskip('numpy')
+
+    columns = carpark_availability_columns([
+        {
+            'carpark_data': [
+                {
+                    'carpark_info': [
+                        {'total_lots': '10', 'lot_type': 'C', 'lots_available': '1'},
+                    ],
+                    'carpark_number': update_datetime,
+                    'update_datetime': update_datetime,
+                }
+                for update_datetime in ('2026-01-12T00:14:30', '2026-01-12')
+            ],
+        },
+    ])
+
+    assert columns['update_datetime'].tolist() == [
+        datetime(2026, 1, 12, 0, 14, 30),
+        datetime(2026, 1, 12),
+    ]
+    assert columns['update_datetime'][0] == \
+        numpy.datetime64('2026-01-12T00:14:30')
+
+def test_carpark_availability_columns_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    with pytest.raises(ImportError) as excinfo:
+        _ = carpark_availability_columns([])
+    assert str(excinfo.value) == NUMPY_IMPORT_ERROR_MESSAGE
@@ -0,0 +1,322 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,too-few-public-methods,unused-argument
+
+"""Test that the images of traffic cameras are downloaded properly."""
+
+from datetime import datetime
+from hashlib import md5
+from threading import Lock
+
+import pytest
+from requests_cache import CachedSession
+
+from datagovsg import Transport
+from datagovsg import ratelimit
+from datagovsg.constants import (
+    INVALID_MAX_WORKERS_ERROR_MESSAGE,
+    INVALID_RATE_LIMIT_ERROR_MESSAGE,
+    RATE_LIMIT_CAPACITY,
+)
+from datagovsg.transport import client as transport_client
+from datagovsg.transport.constants import TRAFFIC_IMAGE_MD5_INDEX
+from datagovsg.transport.images import (
+    load_md5_index,
+    store_image,
+    stored_md5,
+    traffic_images_to_store,
+)
+
+from .mocks.api_response_transport import APIResponseTrafficImages
+
+IMAGES = {
+    f'/images/{camera_id}.jpg': bytes([camera_id % 256]) * (1000 + camera_id)
+    for camera_id in range(1, 21)
+}
+
+REQUESTED: list[str] = []
+REQUESTED_LOCK = Lock()
+
+@pytest.fixture(scope='module')
+def stub_do_get():
+    def do_get(handler):
+        with REQUESTED_LOCK:
+            REQUESTED.append(handler.path)
+        body = IMAGES.get(handler.path)
+        handler.respond(
+            404 if body is None else 200,
+            body or b'',
+            content_type='image/jpeg',
+        )
+
+    return do_get
+
+@pytest.fixture
+def requested():
+    REQUESTED.clear()
+    return REQUESTED
+
+def traffic_images(stub_url, paths):
+    return [
+        {
+            'timestamp': datetime(2026, 1, 12, 0, 14, 51),
+            'cameras': [
+                {
+                    'timestamp': datetime(2026, 1, 12, 0, 11, 11),
+                    'camera_id': path.split('/')[-1].split('.')[0],
+                    'image': f'{stub_url}{path}',
+                    'image_metadata': {
+                        'height': 240,
+                        'width': 320,
+                        'md5': md5(IMAGES.get(path, b'')).hexdigest(),
+                    },
+                    'location': {'latitude': 1.345996, 'longitude': 103.69016},
+                } for path in paths
+            ],
+        },
+    ]
+
+def test_download_traffic_images(stub_url, requested, tmp_path):
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, IMAGES)
+
+    download = client.download_traffic_images(tmp_path, images)
+
+    assert download == {
+        'downloaded': len(IMAGES),
+        'skipped': 0,
+        'failed': [],
+        'bytes_downloaded': sum(len(image) for image in IMAGES.values()),
+        'bytes_saved': 0,
+    }
+    assert sorted(requested) == sorted(IMAGES)
+    for path, image in IMAGES.items():
+        assert (tmp_path / path.split('/')[-1]).read_bytes() == image
+    assert not list(tmp_path.glob('*.part'))
+
+def test_download_traffic_images_skips_unchanged_images(
+    stub_url,
+    requested,
+    tmp_path,
+):
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, IMAGES)
+    _ = client.download_traffic_images(tmp_path, images)
+    requested.clear()
+
+    changed = images[0]['cameras'][0]
+    changed['image_metadata']['md5'] = md5(b'new image').hexdigest()
+    download = client.download_traffic_images(tmp_path, images, max_workers=2)
+
+    assert requested == ['/images/1.jpg']
+    assert download['downloaded'] == 1
+    assert download['skipped'] == len(IMAGES) - 1
+    assert download['bytes_saved'] == \
+        sum(len(image) for image in IMAGES.values()) - len(IMAGES['/images/1.jpg'])
+
+def test_download_traffic_images_skips_without_reading_stored_images(
+    stub_url,
+    requested,
+    tmp_path,
+    monkeypatch,
+):
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, IMAGES)
+    _ = client.download_traffic_images(tmp_path, images)
+    requested.clear()
+
+    def refuse_to_hash(path):
+        raise AssertionError('the stored image should not be read')
+
+    monkeypatch.setattr(transport_client, 'stored_md5', refuse_to_hash)
+    download = client.download_traffic_images(tmp_path, images)
+
+    assert not requested
+    assert download['skipped'] == len(IMAGES)
+    assert load_md5_index(tmp_path) == {
+        path.split('/')[-1]: md5(image).hexdigest()
+        for path, image in IMAGES.items()
+    }
+
+def test_download_traffic_images_without_md5_index(
+    stub_url,
+    requested,
+    tmp_path,
+):
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, IMAGES)
+    _ = client.download_traffic_images(tmp_path, images)
+    (tmp_path / TRAFFIC_IMAGE_MD5_INDEX).unlink()
+    requested.clear()
+
+    download = client.download_traffic_images(tmp_path, images)
+
+    assert not requested
+    assert download['skipped'] == len(IMAGES)
+    assert (tmp_path / TRAFFIC_IMAGE_MD5_INDEX).exists()
+
+@pytest.mark.parametrize(
+    'camera_id',
+    [
+        '../../x',
+        'a/b',
+        '..',
+        '',
+        '1001.jpg',
+        '1001\n',
+    ],
+)
+def test_download_traffic_images_with_unsafe_camera_id(
+    camera_id,
+    stub_url,
+    requested,
+    tmp_path,
+):
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, ['/images/1.jpg'])
+    images[0]['cameras'][0]['camera_id'] = camera_id
+    directory = tmp_path / 'a' / 'b' / 'images'
+
+    download = client.download_traffic_images(directory, images)
+
+    assert download['failed'] == [camera_id]
+    assert not requested
+    assert [p.name for p in tmp_path.rglob('*') if p.is_file()] == \
+        [TRAFFIC_IMAGE_MD5_INDEX]
+
+def test_traffic_images_to_store_with_unsafe_suffix(stub_url, tmp_path):
+    images = traffic_images(stub_url, ['/images/1.jpg'])
+    images[0]['cameras'][0]['image'] = f'{stub_url}/images/1.j%2Fpg'
+
+    images_to_store = traffic_images_to_store(images, tmp_path)
+
+    assert [image.path for image in images_to_store] == [tmp_path / '1.jpg']
+
+def test_download_traffic_images_with_missing_image(stub_url, tmp_path):
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, ['/images/1.jpg', '/images/404.jpg'])
+
+    download = client.download_traffic_images(tmp_path, images)
+
+    assert download['failed'] == ['404']
+    assert download['downloaded'] == 1
+    assert not (tmp_path / '404.jpg').exists()
+
+def test_download_traffic_images_from_traffic_images(
+    stub_url,
+    tmp_path,
+    monkeypatch,
+):
+    get = CachedSession.get
+
+    class MockedResponse(APIResponseTrafficImages):
+        @staticmethod
+        def json():
+            data = APIResponseTrafficImages.json()
+            data['items'][0]['cameras'][0]['image'] = \
+                f'{stub_url}/images/2.jpg'
+            return data
+
+    def mock_requests_get(self, url, *args, **kwargs):
+        if url.startswith(stub_url):
+            return get(self, url, *args, **kwargs)
+        return MockedResponse()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    download = Transport(cache_backend='memory').download_traffic_images(
+        tmp_path / 'images',
+    )
+
+    assert download['downloaded'] == 1
+    assert (tmp_path / 'images' / '6708.jpg').read_bytes() == \
+        IMAGES['/images/2.jpg']
+
+def test_download_traffic_images_with_invalid_max_workers(tmp_path):
+    with pytest.raises(ValueError) as excinfo:
+        _ = Transport(cache_backend='memory').download_traffic_images(
+            tmp_path,
+            [],
+            max_workers=0,
+        )
+    assert str(excinfo.value) == INVALID_MAX_WORKERS_ERROR_MESSAGE
+
+def test_download_traffic_images_without_api_rate_limit(
+    stub_url,
+    requested,
+    tmp_path,
+    monkeypatch,
+):
+    slept = []
+    monkeypatch.setattr(ratelimit, 'sleep', slept.append)
+    # Allow only one API request to the stub server's host
+    ratelimit.set_rate_limit(0.001, capacity=1)
+
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, IMAGES)
+
+    download = client.download_traffic_images(tmp_path, images)
+
+    assert download['downloaded'] == len(IMAGES)
+    assert not slept
+    rate_limiter = ratelimit.get_rate_limiter(stub_url)
+    assert rate_limiter is not None
+    assert rate_limiter.reserve() == 0
+
+def test_download_traffic_images_with_rate_limit(
+    stub_url,
+    requested,
+    tmp_path,
+    monkeypatch,
+):
+    slept = []
+    monkeypatch.setattr(ratelimit, 'sleep', slept.append)
+
+    client = Transport(cache_backend='memory')
+    images = traffic_images(stub_url, IMAGES)
+
+    download = client.download_traffic_images(
+        tmp_path,
+        images,
+        rate_limit=0.01,
+    )
+
+    assert download['downloaded'] == len(IMAGES)
+    assert len(slept) == len(IMAGES) - RATE_LIMIT_CAPACITY
+
+def test_download_traffic_images_with_invalid_rate_limit(tmp_path):
+    with pytest.raises(ValueError) as excinfo:
+        _ = Transport(cache_backend='memory').download_traffic_images(
+            tmp_path,
+            [],
+            rate_limit=0,
+        )
+    assert str(excinfo.value) == INVALID_RATE_LIMIT_ERROR_MESSAGE
+
+def test_store_image_keeps_stored_image_on_error(tmp_path):
+    path = tmp_path / '1.jpg'
+    path.write_bytes(b'old image')
+
+    def chunks():
+        yield b'new '
+        raise OSError('connection lost')
+
+    with pytest.raises(OSError):
+        _ = store_image(chunks(), path)
+
+    assert path.read_bytes() == b'old image'
+    assert not (tmp_path / '1.jpg.part').exists()
+    assert stored_md5(path) == md5(b'old image').hexdigest()
+    assert stored_md5(tmp_path / '2.jpg') is None
@@ -0,0 +1,67 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the key paths of ignore_keys are matched properly."""
+
+import pytest
+
+from datagovsg.keypaths import compile_ignore_keys, find_ignore_node
+
+IGNORE_KEYS = (
+    '[].carpark_data[].carpark_number',
+    '[].*[].camera_id',
+    'a.b',
+)
+
+@pytest.mark.parametrize(
+    ('key_path', 'ignore'),
+    [
+        ('[].carpark_data[].carpark_number', True),
+        ('[].carpark_data[].update_datetime', False),
+        ('[].carpark_data[]', False),
+        ('[].cameras[].camera_id', True),
+        ('[].carpark_data[].camera_id', True),
+        ('[].cameras.camera_id', False),
+        ('a.b', True),
+        ('a', False),
+        ('b', False),
+    ],
+)
+def test_find_ignore_node(key_path, ignore):
+    node = find_ignore_node(compile_ignore_keys(IGNORE_KEYS), key_path)
+
+    assert (node is not None and node.ignore) == ignore
+
+def test_find_ignore_node_without_match():
+    root = compile_ignore_keys(IGNORE_KEYS)
+
+    assert find_ignore_node(root, 'b') is None
+    assert find_ignore_node(root, 'a.c.d') is None
+    assert find_ignore_node(root, '[].cameras[].location') is None
+
+def test_compile_ignore_keys_merges_any_key():
+    root = compile_ignore_keys(IGNORE_KEYS)
+    carpark = root.item.key('carpark_data').item
+
+    assert carpark.key('carpark_number').ignore
+    assert carpark.key('camera_id').ignore
+    assert carpark.key('update_datetime') is None
+
+def test_compile_ignore_keys_without_keys():
+    assert compile_ignore_keys(()) is None
+
+def test_compile_ignore_keys_is_cached():
+    assert compile_ignore_keys(IGNORE_KEYS) is compile_ignore_keys(IGNORE_KEYS)
@@ -0,0 +1,178 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the lazy sanitisation proxies are working properly."""
+
+from datetime import datetime
+
+import pytest
+from requests_cache import CachedSession
+
+from datagovsg import Housing, Transport
+from datagovsg.datagovsg import DataGovSg
+from datagovsg.housing.constants import (
+    CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+)
+from datagovsg.lazy import LazyMapping, LazySequence
+
+from .mocks.api_response_housing import APIResponseCarparkAvailability
+from .mocks.api_response_transport import APIResponseTrafficImages
+
+CARPARK_AVAILABILITY_ITEMS = [
+    {
+        'timestamp': '2026-01-12T00:15:36+08:00',
+        'carpark_data': [
+            {
+                'carpark_info': [
+                    {'total_lots': '105', 'lot_type': 'C', 'lots_available': '31'},
+                ],
+                'carpark_number': '1234',
+                'update_datetime': '2026-01-12T00:14:30',
+            },
+            {
+                'carpark_info': [],
+                'carpark_number': '5678',
+                'update_datetime': 'not a datetime',
+            },
+        ],
+    },
+]
+
+@pytest.fixture(scope='module')
+def client():
+    return DataGovSg()
+
+@pytest.fixture
+def counting_client(monkeypatch):
+    client = DataGovSg()
+    sanitised = []
+    sanitise_data = DataGovSg.sanitise_data
+
+    def counting_sanitise_data(self, value, *args, **kwargs):
+        if not kwargs.get('iterate', True):
+            sanitised.append(value)
+        return sanitise_data(self, value, *args, **kwargs)
+
+    monkeypatch.setattr(DataGovSg, 'sanitise_data', counting_sanitise_data)
+    return client, sanitised
+
+@pytest.mark.parametrize(
+    ('client_class', 'method', 'mocked_response'),
+    [
+        (Housing, 'carpark_availability', APIResponseCarparkAvailability),
+        (Transport, 'traffic_images', APIResponseTrafficImages),
+    ],
+)
+def test_lazy_client_matches_eager_client(
+    client_class,
+    method,
+    mocked_response,
+    monkeypatch,
+):
+    def mock_requests_get(*args, **kwargs):
+        return mocked_response()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    data = getattr(client_class(cache_backend='memory', lazy=True), method)()
+
+    assert isinstance(data, LazySequence)
+    assert data == getattr(client_class(cache_backend='memory'), method)()
+
+def test_sanitise_data_lazily_matches_sanitise_data(client):
+    data = client.sanitise_data_lazily(
+        CARPARK_AVAILABILITY_ITEMS,
+        ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+    )
+
+    assert data == client.sanitise_data(
+        CARPARK_AVAILABILITY_ITEMS,
+        ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+    )
+
+def test_sanitise_data_lazily_keeps_ignore_keys(client):
+    data = client.sanitise_data_lazily(
+        CARPARK_AVAILABILITY_ITEMS,
+        ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+    )
+    carpark = data[0]['carpark_data'][0]
+
+    assert carpark['carpark_number'] == '1234'
+    assert carpark['carpark_info'][0]['total_lots'] == 105
+    assert isinstance(carpark['update_datetime'], datetime)
+    assert data[0]['carpark_data'][1]['update_datetime'] == 'not a datetime'
+
+def test_sanitise_data_lazily_only_sanitises_read_values(counting_client):
+    client, sanitised = counting_client
+    data = client.sanitise_data_lazily(CARPARK_AVAILABILITY_ITEMS)
+
+    assert not sanitised
+
+    timestamp = data[0]['timestamp']
+    assert sanitised == ['2026-01-12T00:15:36+08:00']
+
+    assert data[-1]['timestamp'] is timestamp
+    assert len(sanitised) == 1
+
+def test_sanitise_data_lazily_memoises_proxies(client):
+    data = client.sanitise_data_lazily(CARPARK_AVAILABILITY_ITEMS)
+
+    assert isinstance(data[0], LazyMapping)
+    assert data[0] is data[0]
+    assert data[0]['carpark_data'] is data[0]['carpark_data']
+    assert data[0:1] == [data[0]]
+    assert 'carpark_data' in data[0]
+    assert list(data[0]) == ['timestamp', 'carpark_data']
+
+def test_sanitise_data_lazily_with_out_of_range_index(client):
+    data = client.sanitise_data_lazily(CARPARK_AVAILABILITY_ITEMS)
+    carpark_data = data[0]['carpark_data']
+
+    assert carpark_data[-len(carpark_data)] == carpark_data[0]
+    with pytest.raises(IndexError):
+        _ = carpark_data[-len(carpark_data) - 1]
+    with pytest.raises(IndexError):
+        _ = carpark_data[len(carpark_data)]
+
+def test_sanitise_data_lazily_is_read_only(client):
+    data = client.sanitise_data_lazily(CARPARK_AVAILABILITY_ITEMS)
+
+    with pytest.raises(TypeError):
+        data[0] = {}
+    with pytest.raises(TypeError):
+        data[0]['timestamp'] = None
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '42',
+        '1.5, 103.8',
+        None,
+    ],
+)
+def test_sanitise_data_lazily_with_scalar(client, value):
+    assert client.sanitise_data_lazily(value) == \
+        client.sanitise_data(value)
+
+def test_sanitise_data_lazily_with_any_key(client):
+    data = client.sanitise_data_lazily(
+        CARPARK_AVAILABILITY_ITEMS,
+        ignore_keys=['[].carpark_data[].*'],
+    )
+
+    assert data[0]['carpark_data'][0]['update_datetime'] == \
+        '2026-01-12T00:14:30'
+    assert isinstance(data[0]['timestamp'], datetime)
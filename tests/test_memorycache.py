@@ -0,0 +1,146 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the bounded memory cache backend is working properly."""
+
+from datetime import datetime, timedelta, timezone
+from json import dumps
+
+import pytest
+from requests import Request
+
+from datagovsg import Housing
+from datagovsg.constants import INVALID_BOUNDED_CACHE_SIZE_ERROR_MESSAGE
+from datagovsg.memorycache import BoundedMemoryCache
+
+@pytest.fixture(scope='module')
+def stub_do_get():
+    def do_get(handler):
+        body = dumps({'items': [{'path': handler.path, 'data': 'x' * 1000}]})
+        handler.respond(200, body.encode())
+
+    return do_get
+
+@pytest.fixture(scope='module')
+def response_size(stub_url):
+    cache = BoundedMemoryCache()
+    client = Housing(cache_backend=cache, share_session=False)
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+    return cache.stats()['bytes']
+
+def bounded_client(max_bytes):
+    cache = BoundedMemoryCache(max_bytes=max_bytes)
+    return Housing(cache_backend=cache, share_session=False), cache
+
+def is_cached(client, url):
+    cache = client.session.cache
+    key = cache.create_key(client.session.prepare_request(Request('GET', url)))
+    return key in cache.responses
+
+def expire(client, url):
+    cache = client.session.cache
+    key = cache.create_key(client.session.prepare_request(Request('GET', url)))
+    cache.save_response(
+        cache.responses[key],
+        cache_key=key,
+        expires=datetime.now(timezone.utc) - timedelta(seconds=10),
+    )
+
+def test_cache_backend_bounded():
+    client = Housing(cache_backend='bounded', share_session=False)
+
+    assert isinstance(client.session.cache, BoundedMemoryCache)
+
+def test_bounded_cache_counts_hits_and_misses(stub_url, response_size):
+    client, cache = bounded_client(10 * response_size)
+
+    first = client.send_request(f'{stub_url}/a', cache_duration=60)
+    second = client.send_request(f'{stub_url}/a', cache_duration=60)
+
+    assert first == second
+    assert cache.stats() == {
+        'hits': 1,
+        'misses': 1,
+        'evictions': 0,
+        'entries': 1,
+        'bytes': response_size,
+    }
+
+def test_bounded_cache_evicts_least_recently_used(stub_url, response_size):
+    client, cache = bounded_client(2 * response_size + response_size // 2)
+
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+    client.send_request(f'{stub_url}/b', cache_duration=60)
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+    client.send_request(f'{stub_url}/c', cache_duration=60)
+
+    assert is_cached(client, f'{stub_url}/a')
+    assert not is_cached(client, f'{stub_url}/b')
+    assert is_cached(client, f'{stub_url}/c')
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 2
+    assert stats['bytes'] == 2 * response_size
+
+def test_bounded_cache_evicts_expired_first(stub_url, response_size):
+    client, cache = bounded_client(2 * response_size + response_size // 2)
+
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+    client.send_request(f'{stub_url}/b', cache_duration=60)
+    expire(client, f'{stub_url}/b')
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+    client.send_request(f'{stub_url}/c', cache_duration=60)
+
+    assert is_cached(client, f'{stub_url}/a')
+    assert not is_cached(client, f'{stub_url}/b')
+    assert is_cached(client, f'{stub_url}/c')
+    assert cache.stats()['evictions'] == 1
+
+def test_bounded_cache_keeps_expired_within_limit(stub_url, response_size):
+    client, cache = bounded_client(10 * response_size)
+
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+    expire(client, f'{stub_url}/a')
+    client.send_request(f'{stub_url}/b', cache_duration=60)
+
+    assert is_cached(client, f'{stub_url}/a')
+    assert cache.stats()['evictions'] == 0
+
+def test_bounded_cache_skips_response_bigger_than_limit(
+    stub_url,
+    response_size,
+):
+    client, cache = bounded_client(response_size - 1)
+
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+
+    assert cache.stats()['entries'] == 0
+    assert cache.stats()['bytes'] == 0
+
+def test_bounded_cache_clear(stub_url, response_size):
+    client, cache = bounded_client(10 * response_size)
+    client.send_request(f'{stub_url}/a', cache_duration=60)
+
+    cache.clear()
+
+    assert cache.stats()['entries'] == 0
+    assert cache.stats()['bytes'] == 0
+    assert cache.stats()['misses'] == 1
+
+def test_bounded_cache_max_bytes_is_less_than_1():
+    with pytest.raises(ValueError) as excinfo:
+        _ = BoundedMemoryCache(max_bytes=0)
+    assert str(excinfo.value) == INVALID_BOUNDED_CACHE_SIZE_ERROR_MESSAGE
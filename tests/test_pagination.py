@@ -0,0 +1,111 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the pages of environment data are merged properly."""
+
+from copy import deepcopy
+
+import pytest
+
+from datagovsg.environment.pagination import merge_page
+
+from .mocks.api_response_environment import (
+    APIResponseAirTemperaturePage1,
+    APIResponseAirTemperaturePage2,
+    APIResponseAirTemperaturePage3,
+    APIResponsePM25Page1,
+    APIResponsePM25Page2,
+    APIResponsePM25Page3,
+    APIResponseTwoHourWeatherForecastPage1,
+    APIResponseTwoHourWeatherForecastPage2,
+)
+
+TEST_PAGES = [
+    (
+        APIResponseAirTemperaturePage1,
+        APIResponseAirTemperaturePage2,
+        APIResponseAirTemperaturePage3,
+    ),
+    (
+        APIResponsePM25Page1,
+        APIResponsePM25Page2,
+        APIResponsePM25Page3,
+    ),
+    (
+        APIResponseTwoHourWeatherForecastPage1,
+        APIResponseTwoHourWeatherForecastPage2,
+    ),
+]
+
+def merge_page_by_scan(data, page_data):
+    """Merge pages by comparing every item of metadata, as before indexing."""
+    for key in ('items', 'readings', 'records'):
+        if key in data and key in page_data:
+            data[key].extend(page_data[key])
+            break
+
+    for key in ('area_metadata', 'regionMetadata', 'stations'):
+        if key in data and key in page_data:
+            for data_centre in page_data[key]:
+                if data_centre not in data[key]:
+                    data[key].append(data_centre)
+            break
+
+def merge_all(pages, merge):
+    data = deepcopy(pages[0])
+    for page_data in pages[1:]:
+        merge(data, deepcopy(page_data))
+    return data
+
+@pytest.mark.parametrize('mocked_responses', TEST_PAGES)
+def test_merge_page_matches_scan(mocked_responses):
+    pages = [response.json()['data'] for response in mocked_responses]
+
+    index = {}
+    data = merge_all(pages, lambda d, p: merge_page(d, p, index))
+
+    assert data == merge_all(pages, merge_page_by_scan)
+
+def test_merge_page_without_index():
+    pages = [
+        response.json()['data'] for response in TEST_PAGES[0]
+    ]
+
+    data = merge_all(pages, merge_page)
+
+    assert data == merge_all(pages, merge_page_by_scan)
+
+def test_merge_page_keeps_unequal_items_with_the_same_id():
+    station = {'id': 'S109', 'name': 'Ang Mo Kio Avenue 5'}
+    renamed_station = {'id': 'S109', 'name': 'Ang Mo Kio Ave 5'}
+    pages = [
+        {'stations': [station], 'readings': [1]},
+        {'stations': [renamed_station, station], 'readings': [2]},
+        {'stations': ['S110', {'id': ['S111']}, 'S110'], 'readings': [3]},
+        {'stations': [{'id': ['S111']}, renamed_station], 'readings': [4]},
+    ]
+
+    index = {}
+    data = merge_all(pages, lambda d, p: merge_page(d, p, index))
+
+    assert data == merge_all(pages, merge_page_by_scan)
+    assert data['stations'] == [
+        station,
+        renamed_station,
+        'S110',
+        {'id': ['S111']},
+    ]
+    assert data['readings'] == [1, 2, 3, 4]
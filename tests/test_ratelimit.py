@@ -0,0 +1,218 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the rate limiter is working properly."""
+
+from datetime import datetime, timedelta, timezone
+from json import dumps
+from time import perf_counter
+
+import pytest
+from requests import Request, Response
+from requests_cache import CachedSession
+from urllib3 import HTTPResponse
+
+from datagovsg import Environment
+from datagovsg.constants import (
+    INVALID_RATE_LIMIT_ERROR_MESSAGE,
+    RATE_LIMIT_CAPACITY,
+    RATE_LIMIT_RATE,
+)
+from datagovsg.ratelimit import (
+    TokenBucket,
+    get_rate_limiter,
+    reset_rate_limits,
+    set_rate_limit,
+)
+
+from .mocks.api_response_datagovsg import APIResponseTrafficImages
+from .mocks.api_response_environment import (
+    APIResponseAirTemperaturePage1,
+    APIResponseAirTemperaturePage2,
+    APIResponseAirTemperaturePage3,
+)
+
+URL = 'https://api-open.data.gov.sg/v2/real-time/api/air-temperature'
+
+class CachedAPIResponseTrafficImages(APIResponseTrafficImages):
+    from_cache = True
+
+def test_token_bucket():
+    bucket = TokenBucket(10, 3)
+
+    delays = [bucket.reserve() for _ in range(5)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+def test_token_bucket_refund():
+    bucket = TokenBucket(1, 1)
+
+    assert bucket.reserve() == 0
+    bucket.refund()
+    assert bucket.reserve() == 0
+    assert bucket.reserve() > 0
+
+def test_token_bucket_acquire():
+    bucket = TokenBucket(20, 1)
+
+    start = perf_counter()
+    for _ in range(3):
+        bucket.acquire()
+
+    assert perf_counter() - start >= 0.09
+
+@pytest.mark.parametrize(
+    ('rate', 'capacity'),
+    [
+        (0, 1),
+        (1, 0),
+    ],
+)
+def test_token_bucket_with_invalid_rate_limit(rate, capacity):
+    with pytest.raises(ValueError) as excinfo:
+        _ = TokenBucket(rate, capacity)
+
+    assert str(excinfo.value) == INVALID_RATE_LIMIT_ERROR_MESSAGE
+
+def test_set_rate_limit_with_invalid_rate_limit():
+    with pytest.raises(ValueError) as excinfo:
+        set_rate_limit(0)
+
+    assert str(excinfo.value) == INVALID_RATE_LIMIT_ERROR_MESSAGE
+
+def test_get_rate_limiter():
+    set_rate_limit(5)
+
+    bucket = get_rate_limiter(URL)
+
+    assert bucket is get_rate_limiter(f'{URL}/foo')
+    assert bucket is not get_rate_limiter('https://api.data.gov.sg/v1/foo')
+    assert bucket is not get_rate_limiter(URL, api_key='foo')
+    assert get_rate_limiter(URL, api_key='foo') \
+        is get_rate_limiter('https://api.data.gov.sg/v1/foo', api_key='foo')
+
+def test_set_rate_limit_of_host():
+    set_rate_limit(5)
+    set_rate_limit(None, host='api-open.data.gov.sg')
+
+    assert get_rate_limiter(URL) is None
+    assert get_rate_limiter('https://api.data.gov.sg/v1/foo') is not None
+
+def test_set_rate_limit_changes_bucket():
+    set_rate_limit(5)
+    bucket = get_rate_limiter(URL, api_key='bar')
+
+    set_rate_limit(7, capacity=3, api_key='bar')
+
+    assert get_rate_limiter(URL, api_key='bar') is bucket
+    assert bucket.rate == 7
+    assert bucket.capacity == 3
+
+def test_send_request_is_rate_limited(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseTrafficImages()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    set_rate_limit(20, capacity=1)
+    client = Environment(cache_backend='memory')
+
+    start = perf_counter()
+    for _ in range(3):
+        _ = client.send_request(URL)
+
+    assert perf_counter() - start >= 0.09
+
+def test_send_request_from_cache_is_not_rate_limited(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return CachedAPIResponseTrafficImages()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    set_rate_limit(1, capacity=1)
+    client = Environment(cache_backend='memory')
+
+    start = perf_counter()
+    for _ in range(3):
+        _ = client.send_request(URL)
+
+    assert perf_counter() - start < 0.5
+
+def test_send_request_cache_hits_do_not_take_tokens(monkeypatch):
+    client = Environment(cache_backend='memory', share_session=False)
+    for page in range(20):
+        response = Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = dumps(  # pylint: disable=protected-access
+            APIResponseTrafficImages.json(),
+        ).encode()
+        response.request = client.session.prepare_request(
+            Request('GET', URL, params={'page': page}),
+        )
+        response.url = response.request.url
+        response.raw = HTTPResponse(status=200, request_url=response.url)
+        client.session.cache.save_response(
+            response,
+            expires=datetime.now(timezone.utc) + timedelta(seconds=60),
+        )
+
+    def mock_requests_get(*args, **kwargs):
+        raise AssertionError('cached responses should not be requested')
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    set_rate_limit(1, capacity=1)
+
+    start = perf_counter()
+    for page in range(20):
+        _ = client.send_request(
+            URL,
+            params={'page': page},
+            cache_duration=60,
+        )
+
+    assert perf_counter() - start < 0.5
+    assert get_rate_limiter(URL).reserve() == 0
+
+def test_pagination_does_not_sleep(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        params = kwargs.get('params', {})
+        pagination_token = params.get('paginationToken', None)
+        if pagination_token is None:
+            return APIResponseAirTemperaturePage1()
+        if pagination_token == 'b2Zmc2V0PTI1':
+            return APIResponseAirTemperaturePage2()
+        return APIResponseAirTemperaturePage3()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    set_rate_limit(5)
+    client = Environment(cache_backend='memory')
+
+    start = perf_counter()
+    data = client.air_temperature()
+
+    assert perf_counter() - start < 0.5
+    assert len(data['readings']) == 9
+
+def test_reset_rate_limits():
+    set_rate_limit(None, host='api-open.data.gov.sg')
+
+    reset_rate_limits()
+
+    bucket = get_rate_limiter(URL)
+    assert bucket is not None
+    assert bucket.rate == RATE_LIMIT_RATE
+    assert bucket.capacity == RATE_LIMIT_CAPACITY
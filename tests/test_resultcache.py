@@ -0,0 +1,240 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the cache of sanitised results is working properly."""
+
+from copy import copy, deepcopy
+from datetime import datetime, timedelta, timezone
+from pickle import dumps, loads
+
+import pytest
+from requests_cache import CachedSession
+
+from datagovsg import Housing
+from datagovsg import resultcache
+from datagovsg.constants import (
+    INVALID_RESULT_CACHE_SIZE_ERROR_MESSAGE,
+    READ_ONLY_RESULT_ERROR_MESSAGE,
+)
+from datagovsg.resultcache import (
+    copy_result,
+    freeze_result,
+    FrozenDict,
+    FrozenList,
+    ResultCache,
+    result_key,
+    seconds_until_expiry,
+)
+
+from .mocks.api_response_housing import APIResponseCarparkAvailability
+
+URL = 'https://api.data.gov.sg/v1/transport/carpark-availability'
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(resultcache, 'monotonic', lambda: now[0])
+    return now
+
+@pytest.fixture
+def requests_get(monkeypatch):
+    calls = []
+
+    def mock_requests_get(*args, **kwargs):
+        calls.append(kwargs.get('params'))
+        return APIResponseCarparkAvailability()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    return calls
+
+def test_result_cache_hit(requests_get):
+    cache = ResultCache()
+    client = Housing(cache_backend='memory', result_cache=cache)
+
+    first = client.carpark_availability()
+    second = client.carpark_availability()
+
+    assert second is first
+    assert len(requests_get) == 1
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['entries'] == 1
+    assert stats['bytes'] > 0
+
+def test_result_cache_matches_no_result_cache(requests_get):
+    client = Housing(cache_backend='memory', result_cache=ResultCache())
+
+    assert client.carpark_availability() == \
+        Housing(cache_backend='memory').carpark_availability()
+
+def test_result_cache_is_shared_between_clients(requests_get):
+    cache = ResultCache()
+
+    first = Housing(cache_backend='memory', result_cache=cache) \
+        .carpark_availability()
+    second = Housing(cache_backend='memory', result_cache=cache) \
+        .carpark_availability()
+
+    assert second is first
+    assert len(requests_get) == 1
+
+@pytest.mark.parametrize(
+    'change',
+    [
+        lambda data: data.clear(),
+        lambda data: data.append({}),
+        lambda data: data[0].update(timestamp=None),
+        lambda data: data[0].__setitem__('timestamp', None),
+        lambda data: data[0]['carpark_data'].pop(),
+        lambda data: data[0]['carpark_data'][0].__delitem__('carpark_number'),
+    ],
+)
+def test_result_cache_hit_is_read_only(requests_get, change):
+    client = Housing(cache_backend='memory', result_cache=ResultCache())
+    expected = Housing(cache_backend='memory').carpark_availability()
+
+    for _ in range(2):
+        with pytest.raises(TypeError) as excinfo:
+            change(client.carpark_availability())
+        assert str(excinfo.value) == READ_ONLY_RESULT_ERROR_MESSAGE
+
+    assert client.carpark_availability() == expected
+    assert len(requests_get) == 2
+
+def test_freeze_result():
+    value = {'items': [{'a': [1, 2]}], 'b': (3, 4), 'c': 'd'}
+
+    frozen = freeze_result(value)
+
+    assert frozen == value
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen['items'], FrozenList)
+    assert isinstance(frozen['items'][0], FrozenDict)
+    assert isinstance(frozen['items'][0]['a'], FrozenList)
+    assert frozen['b'] is value['b']
+    assert freeze_result(frozen) is frozen
+    assert freeze_result(value['c']) is value['c']
+
+def test_frozen_result_copies_are_plain():
+    frozen = freeze_result({'items': [{'a': [1, 2]}]})
+
+    for copied in (copy(frozen), deepcopy(frozen), loads(dumps(frozen))):
+        assert copied == frozen
+        assert not isinstance(copied, FrozenDict)
+        copied['b'] = 1
+
+    copied = deepcopy(frozen)
+    assert not isinstance(copied['items'], FrozenList)
+    assert not isinstance(copied['items'][0], FrozenDict)
+    copied['items'][0]['a'].append(3)
+    assert frozen['items'][0]['a'] == [1, 2]
+
+def test_copy_result():
+    value = {'items': [{'a': [1, 2]}], 'b': (3, 4), 'c': 'd'}
+
+    copy = copy_result(value)
+
+    assert copy == value
+    assert copy is not value
+    assert copy['items'] is not value['items']
+    assert copy['items'][0] is not value['items'][0]
+    assert copy['items'][0]['a'] is not value['items'][0]['a']
+    assert copy['b'] is value['b']
+    assert copy_result(value['c']) is value['c']
+
+def test_result_cache_skips_uncached_requests(requests_get):
+    cache = ResultCache()
+    client = Housing(cache_backend='memory', result_cache=cache)
+
+    for _ in range(2):
+        client.send_request(URL, cache_duration=0)
+        client.send_request(URL, cache_duration=60, sanitise=False)
+
+    assert len(requests_get) == 4
+    assert cache.stats()['entries'] == 0
+
+def test_result_cache_expiry(clock):
+    cache = ResultCache()
+    cache.set('key', 'value', 60)
+
+    clock[0] += 59
+    assert cache['key'] == 'value'
+
+    clock[0] += 1
+    with pytest.raises(KeyError):
+        _ = cache['key']
+    assert cache.stats()['entries'] == 0
+
+def test_result_cache_evicts_least_recently_used(clock):
+    cache = ResultCache(max_entries=2)
+    cache.set('a', 'A', 60)
+    cache.set('b', 'B', 60)
+    _ = cache['a']
+    cache.set('c', 'C', 60)
+
+    assert cache['a'] == 'A'
+    assert cache['c'] == 'C'
+    with pytest.raises(KeyError):
+        _ = cache['b']
+    assert cache.stats()['evictions'] == 1
+
+def test_result_cache_max_bytes(clock):
+    value = list(range(100))
+    sizing_cache = ResultCache()
+    sizing_cache.set('a', value, 60)
+    cache = ResultCache(max_bytes=sizing_cache.stats()['bytes'] + 1)
+
+    cache.set('a', value, 60)
+    cache.set('b', list(range(100)), 60)
+
+    with pytest.raises(KeyError):
+        _ = cache['a']
+    assert cache['b'] == value
+
+    cache.set('c', list(range(1000)), 60)
+    with pytest.raises(KeyError):
+        _ = cache['c']
+    assert cache.stats()['entries'] == 1
+
+@pytest.mark.parametrize(
+    ('max_entries', 'max_bytes'),
+    [
+        (0, 1),
+        (1, 0),
+    ],
+)
+def test_result_cache_with_invalid_size(max_entries, max_bytes):
+    with pytest.raises(ValueError) as excinfo:
+        _ = ResultCache(max_entries=max_entries, max_bytes=max_bytes)
+    assert str(excinfo.value) == INVALID_RESULT_CACHE_SIZE_ERROR_MESSAGE
+
+def test_result_key_normalises_params():
+    assert result_key(URL, {'a': 1, 'b': '2'}, [], None) == \
+        result_key(URL, {'b': 2, 'a': '1'}, [], None)
+    assert result_key(URL, {'a': 1}, [], None) != \
+        result_key(URL, {'a': 1}, ['a'], None)
+    assert result_key(URL, {'a': 1}, [], None) != \
+        result_key(URL, {'a': 1}, [], dict)
+
+def test_seconds_until_expiry():
+    expires = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert seconds_until_expiry(None, 60) == 60
+    assert seconds_until_expiry(expires, 60) == pytest.approx(30, abs=1)
+    assert seconds_until_expiry(expires.replace(tzinfo=None), 60) == \
+        pytest.approx(30, abs=1)
+    assert seconds_until_expiry(expires, 10) == 10
@@ -0,0 +1,162 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that stale responses are served while they are refreshed."""
+
+from datetime import datetime, timedelta, timezone
+from json import dumps
+from threading import Event, Thread
+
+import pytest
+from requests import Request
+
+from datagovsg import Housing
+from datagovsg.constants import INVALID_STALE_WHILE_REVALIDATE_ERROR_MESSAGE
+from datagovsg.revalidate import (
+    refresh_in_background,
+    seconds_since,
+    wait_for_refreshes,
+)
+
+CALLS = []
+RELEASE = Event()
+
+@pytest.fixture(scope='module')
+def stub_do_get():
+    def do_get(handler):
+        CALLS.append(handler.path)
+        RELEASE.wait(5)
+        handler.respond(200, dumps({'items': [{'call': len(CALLS)}]}).encode())
+
+    return do_get
+
+@pytest.fixture
+def stub(stub_url):
+    CALLS.clear()
+    RELEASE.set()
+    yield stub_url
+    RELEASE.set()
+    wait_for_refreshes(5)
+
+def expire(client, url, seconds_ago):
+    cache = client.session.cache
+    key = cache.create_key(client.session.prepare_request(Request('GET', url)))
+    response = cache.get_response(key)
+    cache.save_response(
+        response,
+        cache_key=key,
+        expires=datetime.now(timezone.utc) - timedelta(seconds=seconds_ago),
+    )
+
+def test_send_request_serves_stale_response(stub):
+    stale = []
+    client = Housing(
+        cache_backend='memory',
+        share_session=False,
+        stale_while_revalidate=60,
+        on_stale=lambda url, params, age: stale.append((url, params, age)),
+    )
+    assert client.send_request(stub, cache_duration=60) == {'items': [{'call': 1}]}
+    expire(client, stub, 10)
+    RELEASE.clear()
+
+    assert client.send_request(stub, cache_duration=60) == {'items': [{'call': 1}]}
+    assert client.send_request(stub, cache_duration=60) == {'items': [{'call': 1}]}
+    assert len(stale) == 2
+    assert stale[0][:2] == (stub, {})
+    assert stale[0][2] >= 0
+
+    RELEASE.set()
+    wait_for_refreshes(5)
+
+    assert len(CALLS) == 2
+    assert client.send_request(stub, cache_duration=60) == {'items': [{'call': 2}]}
+    assert len(stale) == 2
+
+def test_send_request_refreshes_once_for_concurrent_callers(stub):
+    client = Housing(
+        cache_backend='memory',
+        share_session=False,
+        stale_while_revalidate=60,
+    )
+    client.send_request(stub, cache_duration=60)
+    expire(client, stub, 10)
+    RELEASE.clear()
+
+    threads = [
+        Thread(target=client.send_request, args=(stub,), \
+            kwargs={'cache_duration': 60})
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    RELEASE.set()
+    wait_for_refreshes(5)
+
+    assert len(CALLS) == 2
+
+def test_send_request_waits_for_response_that_is_too_stale(stub):
+    stale = []
+    client = Housing(
+        cache_backend='memory',
+        share_session=False,
+        stale_while_revalidate=60,
+        on_stale=lambda url, params, age: stale.append(age),
+    )
+    client.send_request(stub, cache_duration=60)
+    expire(client, stub, 120)
+
+    assert client.send_request(stub, cache_duration=60) == {'items': [{'call': 2}]}
+    assert not stale
+
+def test_send_request_without_stale_while_revalidate(stub):
+    client = Housing(cache_backend='memory', share_session=False)
+    client.send_request(stub, cache_duration=60)
+    expire(client, stub, 10)
+
+    assert client.send_request(stub, cache_duration=60) == {'items': [{'call': 2}]}
+
+def test_stale_while_revalidate_is_negative():
+    with pytest.raises(ValueError) as excinfo:
+        _ = Housing(stale_while_revalidate=-1)
+    assert str(excinfo.value) == INVALID_STALE_WHILE_REVALIDATE_ERROR_MESSAGE
+
+def test_refresh_in_background_once_per_key():
+    release = Event()
+    refreshed = []
+
+    def refresh():
+        release.wait(5)
+        refreshed.append(True)
+
+    assert refresh_in_background('key', refresh)
+    assert not refresh_in_background('key', refresh)
+
+    release.set()
+    wait_for_refreshes(5)
+
+    assert refreshed == [True]
+    assert refresh_in_background('key', refreshed.clear)
+    wait_for_refreshes(5)
+
+def test_seconds_since():
+    dt = datetime.now(timezone.utc) - timedelta(seconds=30)
+
+    assert seconds_since(dt) == pytest.approx(30, abs=1)
+    assert seconds_since(dt.replace(tzinfo=None)) == pytest.approx(30, abs=1)
@@ -0,0 +1,303 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the sanitiser functions are working properly."""
+
+from datetime import date, datetime
+from sys import getrecursionlimit
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from datagovsg.constants import (
+    INVALID_SANITISE_CACHE_SIZE_ERROR_MESSAGE,
+    SANITISE_CACHE_MAX_ENTRIES,
+)
+from datagovsg.datagovsg import DataGovSg
+from datagovsg.environment.constants import WIND_SPEED_SANITISE_IGNORE_KEYS
+from datagovsg.environment.types import (
+    EnvironmentReadingDict,
+    PSIDict,
+    UVIndexDict,
+    WeatherDict,
+    WeatherForecastFourDayDict,
+)
+from datagovsg.housing.constants import (
+    CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+)
+from datagovsg.housing.types import CarparkAvailabilityItemDict
+from datagovsg.sanitiser import (
+    clear_sanitise_cache,
+    compile_sanitiser,
+    sanitise_cache_stats,
+    sanitise_string,
+    sanitise_tree,
+    set_sanitise_cache_size,
+)
+from datagovsg.transport.constants import TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS
+from datagovsg.transport.types import (
+    TaxiAvailabilityDict,
+    TrafficImagesItemDict,
+)
+
+from .mocks.api_response_environment import (
+    APIResponseAirTemperature,
+    APIResponseFloodAlerts,
+    APIResponseFourDayWeatherForecast,
+    APIResponsePSI,
+    APIResponseUVIndex,
+    APIResponseWindSpeed,
+)
+from .mocks.api_response_housing import APIResponseCarparkAvailability
+from .mocks.api_response_transport import (
+    APIResponseTaxiAvailability,
+    APIResponseTrafficImages,
+)
+from .mocks.types_args import MockSanitiseDict
+
+SGT_TIMEZONE = ZoneInfo('Asia/Singapore')
+
+MOCK_SANITISE_DICT = {
+    'timestamp': '2026-01-12T00:14:56+08:00',
+    'day': '2026-01-12',
+    'label': '2026-01-12',
+    'items': [
+        {'id': '1001', 'count': '42', 'ratio': '0.5', 'low_high': '7'},
+        {'id': '1002', 'count': 'n/a', 'ratio': 3, 'low_high': '7.5'},
+    ],
+    'optional_count': None,
+    'extra': '37',
+}
+
+@pytest.fixture(scope='module')
+def client():
+    return DataGovSg()
+
+@pytest.fixture
+def sanitise_cache():
+    clear_sanitise_cache()
+    yield
+    set_sanitise_cache_size(SANITISE_CACHE_MAX_ENTRIES)
+
+def test_compile_sanitiser():
+    sanitise = compile_sanitiser(MockSanitiseDict)
+    result = sanitise(MOCK_SANITISE_DICT)
+
+    assert result == {
+        'timestamp': datetime(2026, 1, 12, 0, 14, 56, tzinfo=SGT_TIMEZONE),
+        'day': date(2026, 1, 12),
+        'label': '2026-01-12',
+        'items': [
+            {'id': '1001', 'count': 42, 'ratio': 0.5, 'low_high': 7},
+            {'id': '1002', 'count': 'n/a', 'ratio': 3, 'low_high': 7.5},
+        ],
+        'optional_count': None,
+        'extra': '37',
+    }
+    # the original value is not changed
+    assert MOCK_SANITISE_DICT['items'][0]['count'] == '42'
+
+def test_compile_sanitiser_is_cached():
+    assert compile_sanitiser(MockSanitiseDict) \
+        is compile_sanitiser(MockSanitiseDict)
+
+def test_compile_sanitiser_without_convertible_fields():
+    value = {'foo': '42'}
+    assert compile_sanitiser(dict[str, str])(value) is value
+
+@pytest.mark.parametrize(
+    ('schema', 'value', 'ignore_keys'),
+    [
+        (
+            list[CarparkAvailabilityItemDict],
+            APIResponseCarparkAvailability.json()['items'],
+            CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        ),
+        (
+            TaxiAvailabilityDict,
+            APIResponseTaxiAvailability.json(),
+            None,
+        ),
+        (
+            list[TrafficImagesItemDict],
+            APIResponseTrafficImages.json()['items'],
+            TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS,
+        ),
+        (
+            EnvironmentReadingDict,
+            APIResponseAirTemperature.json()['data'],
+            None,
+        ),
+        (
+            EnvironmentReadingDict,
+            APIResponseWindSpeed.json()['data'],
+            WIND_SPEED_SANITISE_IGNORE_KEYS,
+        ),
+        (
+            PSIDict,
+            APIResponsePSI.json()['data'],
+            None,
+        ),
+        (
+            UVIndexDict,
+            APIResponseUVIndex.json()['data'],
+            None,
+        ),
+        (
+            WeatherDict,
+            APIResponseFloodAlerts.json()['data'],
+            None,
+        ),
+        (
+            WeatherForecastFourDayDict,
+            APIResponseFourDayWeatherForecast.json()['data'],
+            None,
+        ),
+    ],
+)
+def test_sanitise_data_with_schema(client, schema, value, ignore_keys):
+    result = client.sanitise_data_with_schema(value, schema=schema)
+    expected_result = client.sanitise_data(value, ignore_keys=ignore_keys)
+    assert result == expected_result
+
+@pytest.mark.parametrize(
+    ('value', 'expected_value'),
+    [
+        ('42', 42),
+        ('0.5', 0.5),
+        ('1.5, 103.8', (1.5, 103.8)),
+        ('1, 2.5', '1, 2.5'),
+        ('2026-01-12', date(2026, 1, 12)),
+        ('HE12', 'HE12'),
+    ],
+)
+def test_sanitise_string(sanitise_cache, value, expected_value):
+    assert sanitise_string(value) == expected_value
+
+def test_sanitise_cache_returns_same_value(sanitise_cache):
+    timestamp = sanitise_string('2026-01-12T00:14:56+08:00')
+
+    assert sanitise_string('2026-01-12T00:14:56+08:00') is timestamp
+    stats = sanitise_cache_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['entries'] == 1
+    assert stats['max_entries'] == SANITISE_CACHE_MAX_ENTRIES
+
+def test_sanitise_cache_with_repeated_strings(client, sanitise_cache):
+    items = APIResponseCarparkAvailability.json()['items'] * 10
+
+    client.sanitise_data_with_schema(
+        items,
+        schema=list[CarparkAvailabilityItemDict],
+    )
+    schema_stats = sanitise_cache_stats()
+    client.sanitise_data(
+        items,
+        ignore_keys=CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+    )
+    stats = sanitise_cache_stats()
+
+    assert schema_stats['hits'] >= 9 * schema_stats['misses']
+    assert stats['hits'] - schema_stats['hits'] \
+        >= 9 * (stats['misses'] - schema_stats['misses'])
+
+def test_set_sanitise_cache_size(client, sanitise_cache):
+    set_sanitise_cache_size(0)
+
+    assert sanitise_string('42') == 42
+    assert client.sanitise_data_with_schema('42', schema=int) == 42
+    stats = sanitise_cache_stats()
+    assert stats['entries'] == 0
+    assert stats['misses'] == 2
+
+def test_set_sanitise_cache_size_with_invalid_size(sanitise_cache):
+    with pytest.raises(ValueError) as excinfo:
+        set_sanitise_cache_size(-1)
+    assert str(excinfo.value) == INVALID_SANITISE_CACHE_SIZE_ERROR_MESSAGE
+
+def sanitise_data_by_key_path(value, ignore_keys, key_path=''):
+    # The recursive implementation that sanitise_tree() replaces
+    if isinstance(value, list):
+        return [
+            sanitise_data_by_key_path(v, ignore_keys, f'{key_path}[]')
+            for v in value
+        ]
+    if isinstance(value, dict):
+        sanitised_dict = {}
+        for k, v in value.items():
+            current_key_path = f'{key_path}.{k}' if key_path else k
+            sanitised_dict[k] = v if current_key_path in ignore_keys \
+                else sanitise_data_by_key_path(v, ignore_keys, current_key_path)
+        return sanitised_dict
+    if isinstance(value, str):
+        return sanitise_string(value)
+    return value
+
+@pytest.mark.parametrize(
+    ('value', 'ignore_keys'),
+    [
+        (
+            APIResponseCarparkAvailability.json()['items'],
+            CARPARK_AVAILABILITY_SANITISE_IGNORE_KEYS,
+        ),
+        (
+            APIResponseTrafficImages.json()['items'],
+            TRAFFIC_IMAGES_SANITISE_IGNORE_KEYS,
+        ),
+        (
+            APIResponseWindSpeed.json()['data'],
+            WIND_SPEED_SANITISE_IGNORE_KEYS,
+        ),
+        (
+            MOCK_SANITISE_DICT,
+            ['items[].id', 'timestamp', 'unknown'],
+        ),
+    ],
+)
+def test_sanitise_tree_matches_key_paths(value, ignore_keys):
+    assert sanitise_tree(value, ignore_keys) == \
+        sanitise_data_by_key_path(value, ignore_keys)
+
+def test_sanitise_tree_with_any_key():
+    result = sanitise_tree(MOCK_SANITISE_DICT, ['items[].*'])
+
+    assert result['items'] == MOCK_SANITISE_DICT['items']
+    assert result['extra'] == 37
+
+def test_sanitise_tree_with_key_path():
+    result = sanitise_tree(
+        MOCK_SANITISE_DICT['items'],
+        ['items[].id'],
+        key_path='items',
+    )
+
+    assert result == sanitise_data_by_key_path(
+        MOCK_SANITISE_DICT['items'],
+        ['items[].id'],
+        key_path='items',
+    )
+
+def test_sanitise_tree_without_recursion_limit():
+    value = ['42']
+    for _ in range(10 * getrecursionlimit()):
+        value = {'a': [value]}
+
+    result = sanitise_tree(value)
+    for _ in range(10 * getrecursionlimit()):
+        result = result['a'][0]
+
+    assert result == [42]
@@ -0,0 +1,103 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the sessions are shared properly."""
+
+import pytest
+
+from datagovsg import Environment, Transport
+from datagovsg.constants import INVALID_POOL_SIZE_ERROR_MESSAGE
+from datagovsg.sessions import close_sessions, get_session
+
+@pytest.fixture(scope='module')
+def stub_do_get():
+    def do_get(handler):
+        handler.respond(200, b'{"code": 0}')
+
+    return do_get
+
+def test_clients_share_session():
+    environment = Environment(cache_backend='memory')
+    transport = Transport(cache_backend='memory')
+
+    assert environment.session is transport.session
+    assert environment.session is get_session(cache_backend='memory')
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'api_key': 'foo'},
+        {'cache_backend': 'filesystem'},
+        {'pool_maxsize': 20},
+        {'share_session': False},
+    ],
+)
+def test_clients_do_not_share_session(kwargs):
+    environment = Environment(cache_backend='memory')
+    transport = Transport(**({'cache_backend': 'memory'} | kwargs))
+
+    assert environment.session is not transport.session
+
+def test_close_sessions():
+    session = Environment(cache_backend='memory').session
+
+    close_sessions()
+
+    assert Environment(cache_backend='memory').session is not session
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'pool_connections': 0},
+        {'pool_maxsize': 0},
+    ],
+)
+def test_invalid_pool_size(kwargs):
+    with pytest.raises(ValueError) as excinfo:
+        _ = Environment(cache_backend='memory', share_session=False, **kwargs)
+
+    assert str(excinfo.value) == INVALID_POOL_SIZE_ERROR_MESSAGE
+
+def test_pool_stats(stub_url):
+    environment = Environment(cache_backend='memory', share_session=False)
+    transport = Transport(cache_backend='memory', share_session=False)
+
+    assert environment.pool_stats() == {
+        'connections_opened': 0,
+        'connections_reused': 0,
+    }
+
+    for _ in range(3):
+        _ = environment.send_request(stub_url)
+
+    assert environment.pool_stats() == {
+        'connections_opened': 1,
+        'connections_reused': 2,
+    }
+    assert transport.pool_stats()['connections_opened'] == 0
+
+def test_pool_stats_with_shared_session(stub_url):
+    close_sessions()
+    environment = Environment(cache_backend='memory')
+    transport = Transport(cache_backend='memory')
+
+    _ = environment.send_request(stub_url)
+    _ = transport.send_request(stub_url)
+
+    assert transport.pool_stats() == {
+        'connections_opened': 1,
+        'connections_reused': 1,
+    }
@@ -0,0 +1,191 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the spatial index of taxi positions is working properly."""
+
+from math import cos, hypot, radians
+from random import Random
+
+import pytest
+from requests_cache import CachedSession
+
+from datagovsg import Transport
+from datagovsg.constants import (
+    EARTH_RADIUS_M,
+    INVALID_NEAREST_COUNT_ERROR_MESSAGE,
+    SINGAPORE_LATITUDE,
+)
+from datagovsg.transport.constants import (
+    INVALID_CELL_SIZE_ERROR_MESSAGE,
+    INVALID_RADIUS_ERROR_MESSAGE,
+)
+from datagovsg.transport.spatial import NearbyTaxi, TaxiGrid, TaxiPosition
+
+from .mocks.api_response_transport import APIResponseTaxiAvailability
+
+def random_positions(count, seed=0):
+    random = Random(seed)
+    return [
+        [round(random.uniform(103.6, 104.0), 5), round(random.uniform(1.25, 1.45), 5)]
+        for _ in range(count)
+    ]
+
+def taxi_availability(*coordinates):
+    return {
+        'type': 'FeatureCollection',
+        'features': [
+            {'geometry': {'type': 'MultiPoint', 'coordinates': c}}
+            for c in coordinates
+        ],
+    }
+
+def distance(latitude, longitude, position):
+    y_scale = radians(EARTH_RADIUS_M)
+    x_scale = y_scale * cos(radians(SINGAPORE_LATITUDE))
+    return hypot(
+        (position[0] - longitude) * x_scale,
+        (position[1] - latitude) * y_scale,
+    )
+
+POSITIONS = random_positions(2000)
+
+QUERIES = [
+    (1.2839, 103.8515, 500.0),
+    (1.3521, 103.8198, 2000.0),
+    (1.25, 103.6, 1000.0),
+    (1.3, 103.7, 0.0),
+    (1.5, 104.1, 50000.0),
+    (51.5074, -0.1278, 1000.0),
+]
+
+@pytest.fixture(scope='module')
+def grid():
+    return TaxiGrid(taxi_availability(POSITIONS))
+
+@pytest.mark.parametrize(('latitude', 'longitude', 'radius_m'), QUERIES)
+def test_count_within(grid, latitude, longitude, radius_m):
+    assert grid.count_within(latitude, longitude, radius_m) == sum(
+        distance(latitude, longitude, p) <= radius_m for p in POSITIONS
+    )
+
+@pytest.mark.parametrize(
+    ('min_latitude', 'min_longitude', 'max_latitude', 'max_longitude'),
+    [
+        (1.28, 103.84, 1.3, 103.86),
+        (1.2, 103.5, 1.5, 104.1),
+        (1.3, 103.8, 1.3, 103.8),
+        (1.4, 103.9, 1.3, 103.8),
+    ],
+)
+def test_within_bbox(
+    grid,
+    min_latitude,
+    min_longitude,
+    max_latitude,
+    max_longitude,
+):
+    positions = grid.within_bbox(
+        min_latitude,
+        min_longitude,
+        max_latitude,
+        max_longitude,
+    )
+
+    assert sorted(positions) == sorted(
+        TaxiPosition(latitude, longitude)
+        for longitude, latitude in POSITIONS
+        if min_latitude <= latitude <= max_latitude
+        and min_longitude <= longitude <= max_longitude
+    )
+
+@pytest.mark.parametrize(('latitude', 'longitude', '_'), QUERIES)
+@pytest.mark.parametrize('k', [1, 5, 50])
+def test_nearest(grid, latitude, longitude, _, k):
+    nearest = grid.nearest(latitude, longitude, k)
+    expected = sorted(distance(latitude, longitude, p) for p in POSITIONS)[:k]
+
+    assert len(nearest) == k
+    assert [n.distance_m for n in nearest] == pytest.approx(expected)
+    assert all(isinstance(n, NearbyTaxi) for n in nearest)
+
+def test_nearest_with_fewer_taxis_than_k():
+    grid = TaxiGrid(taxi_availability([[103.8, 1.3]], [[103.9, 1.35]]))
+
+    nearest = grid.nearest(1.3, 103.8, 5)
+
+    assert [(n.latitude, n.longitude) for n in nearest] == \
+        [(1.3, 103.8), (1.35, 103.9)]
+    assert nearest[0].distance_m == 0
+
+def test_empty_grid():
+    grid = TaxiGrid()
+
+    assert len(grid) == 0
+    assert grid.count_within(1.3, 103.8, 1000) == 0
+    assert not grid.within_bbox(1.2, 103.6, 1.5, 104.0)
+    assert not grid.nearest(1.3, 103.8)
+
+def test_update_replaces_taxis():
+    grid = TaxiGrid(taxi_availability(POSITIONS), cell_size_m=100)
+    positions = random_positions(500, seed=1)
+
+    grid.update(taxi_availability(positions[:200], positions[200:]))
+
+    assert len(grid) == 500
+    assert grid.count_within(1.35, 103.8, 5000) == sum(
+        distance(1.35, 103.8, p) <= 5000 for p in positions
+    )
+    grid.update(taxi_availability())
+    assert len(grid) == 0
+
+def test_taxi_grid_from_taxi_availability(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseTaxiAvailability()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    grid = TaxiGrid(Transport(cache_backend='memory').taxi_availability())
+
+    assert grid.nearest(1.27377, 103.63601) == \
+        [NearbyTaxi(1.27377, 103.63601, 0.0)]
+
+def test_taxi_grid_from_taxi_availability_array():
+    numpy = pytest.importorskip('numpy')
+
+    grid = TaxiGrid(taxi_availability(numpy.asarray(POSITIONS)))
+
+    assert grid.count_within(1.3521, 103.8198, 2000) == \
+        TaxiGrid(taxi_availability(POSITIONS)).count_within(
+            1.3521,
+            103.8198,
+            2000,
+        )
+
+@pytest.mark.parametrize('cell_size_m', [0, -1.0])
+def test_taxi_grid_with_invalid_cell_size(cell_size_m):
+    with pytest.raises(ValueError) as excinfo:
+        _ = TaxiGrid(cell_size_m=cell_size_m)
+    assert str(excinfo.value) == INVALID_CELL_SIZE_ERROR_MESSAGE
+
+def test_count_within_with_invalid_radius(grid):
+    with pytest.raises(ValueError) as excinfo:
+        _ = grid.count_within(1.3, 103.8, -1)
+    assert str(excinfo.value) == INVALID_RADIUS_ERROR_MESSAGE
+
+def test_nearest_with_invalid_k(grid):
+    with pytest.raises(ValueError) as excinfo:
+        _ = grid.nearest(1.3, 103.8, 0)
+    assert str(excinfo.value) == INVALID_NEAREST_COUNT_ERROR_MESSAGE
@@ -0,0 +1,175 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the nearest-station index is working properly."""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from requests_cache import CachedSession
+
+from datagovsg import Environment
+from datagovsg.constants import INVALID_NEAREST_COUNT_ERROR_MESSAGE
+from datagovsg.environment.stations import (
+    NearbyStation,
+    StationIndex,
+    StationReading,
+)
+
+from .mocks.api_response_environment import (
+    APIResponseAirTemperaturePage1,
+    APIResponseAirTemperaturePage2,
+    APIResponseAirTemperaturePage3,
+    APIResponseTwoHourWeatherForecast,
+    APIResponseWBGT,
+)
+
+READINGS = {
+    'stations': [
+        {
+            'id': 'S109',
+            'name': 'Ang Mo Kio Avenue 5',
+            'location': {'latitude': 1.3764, 'longitude': 103.8492},
+        },
+        {
+            'id': 'S106',
+            'name': 'Pulau Ubin',
+            'location': {'latitude': 1.4168, 'longitude': 103.9673},
+        },
+        {
+            'id': 'S117',
+            'name': 'Banyan Road',
+            'labelLocation': {'latitude': 1.256, 'longitude': 103.679},
+        },
+    ],
+    'readings': [
+        {
+            'timestamp': datetime(2026, 1, 12, 10, 1),
+            'data': [
+                {'stationId': 'S109', 'value': 26.4},
+                {'stationId': 'S117', 'value': 27.5},
+            ],
+        },
+        {
+            'timestamp': datetime(2026, 1, 12, 10, 0),
+            'data': [{'stationId': 'S109', 'value': 26.0}],
+        },
+    ],
+}
+
+@pytest.fixture
+def environment(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        pagination_token = kwargs.get('params', {}).get('paginationToken')
+        if pagination_token is None:
+            return APIResponseAirTemperaturePage1()
+        if pagination_token == 'b2Zmc2V0PTI1':
+            return APIResponseAirTemperaturePage2()
+        return APIResponseAirTemperaturePage3()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    return Environment(cache_backend='memory')
+
+def test_nearest_station():
+    index = StationIndex(READINGS)
+
+    nearest = index.nearest_station(1.38, 103.85, k=2)
+
+    assert len(index) == 3
+    assert [station.id for station in nearest] == ['S109', 'S106']
+    assert nearest[0].name == 'Ang Mo Kio Avenue 5'
+    assert nearest[0].distance_m == pytest.approx(410, abs=1)
+    assert all(isinstance(station, NearbyStation) for station in nearest)
+
+def test_nearest_station_with_more_than_stations():
+    assert len(StationIndex(READINGS).nearest_station(1.38, 103.85, k=10)) == 3
+
+def test_nearest_station_with_invalid_k():
+    with pytest.raises(ValueError) as excinfo:
+        _ = StationIndex(READINGS).nearest_station(1.38, 103.85, k=0)
+    assert str(excinfo.value) == INVALID_NEAREST_COUNT_ERROR_MESSAGE
+
+def test_reading_at():
+    reading = StationIndex(READINGS).reading_at(1.38, 103.85)
+
+    assert isinstance(reading, StationReading)
+    assert reading.station.id == 'S109'
+    assert reading.value == 26.4
+    assert reading.timestamp == datetime(2026, 1, 12, 10, 1)
+
+def test_reading_at_skips_stations_without_readings():
+    assert StationIndex(READINGS).reading_at(1.42, 103.97).station.id == 'S109'
+
+def test_reading_at_without_readings():
+    index = StationIndex({'stations': READINGS['stations'], 'readings': []})
+
+    assert index.reading_at(1.38, 103.85) is None
+    assert not StationIndex({}).nearest_station(1.38, 103.85)
+
+def test_station_index_from_paginated_response(environment):
+    data = environment.air_temperature()
+    index = StationIndex(data)
+
+    assert len(index) == len(data['stations'])
+    nearest = index.nearest_station(1.3764, 103.8492)[0]
+    assert nearest.distance_m == 0
+    latest = max(
+        (reading['timestamp'], datum['value'])
+        for reading in data['readings']
+        for datum in reading['data']
+        if datum['stationId'] == nearest.id
+    )
+    reading = index.reading_at(1.3764, 103.8492)
+    assert (reading.timestamp, reading.value) == latest
+
+def test_station_index_from_area_metadata(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseTwoHourWeatherForecast()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    data = Environment(cache_backend='memory').two_hour_weather_forecast()
+    reading = StationIndex(data).reading_at(1.38, 103.84)
+
+    assert reading.station.id == 'Ang Mo Kio'
+    assert reading.value == 'Partly Cloudy (Day)'
+    assert reading.timestamp == \
+        datetime(2026, 1, 12, 10, 0, tzinfo=ZoneInfo('Asia/Singapore'))
+
+def test_station_index_from_wbgt(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseWBGT()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    data = Environment(cache_backend='memory').wbgt()
+    reading = StationIndex(data).reading_at(1.36, 103.98)
+
+    assert reading.station.id == 'S124'
+    assert reading.value == 26.3
+
+def test_reading_at_matches_nearest_station_with_reading():
+    index = StationIndex(READINGS)
+
+    for latitude in (1.25, 1.3, 1.35, 1.4, 1.45):
+        for longitude in (103.65, 103.75, 103.85, 103.95, 104.05):
+            nearest = [
+                station
+                for station in index.nearest_station(latitude, longitude, k=3)
+                if station.id != 'S106'
+            ][0]
+            assert index.reading_at(latitude, longitude).station == nearest
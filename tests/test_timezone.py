@@ -69,6 +69,20 @@ def test_datetime_as_sgt(date_time, expected_hour):
                 tzinfo=SGT_TIMEZONE,
             ),
         ),
+        (
+            '2019-07-13T08:32:17Z',
+            datetime(
+                2019, 7, 13, 8, 32, 17,
+                tzinfo=SGT_TIMEZONE,
+            ),
+        ),
+        (
+            '2019-07-13t08:32:17',
+            datetime(
+                2019, 7, 13, 8, 32, 17,
+                tzinfo=SGT_TIMEZONE,
+            ),
+        ),
         # date and time with "T" separator without date-hypens
         (
             '20190713T08:32:17.456+08:00',
@@ -132,6 +146,14 @@ def test_datetime_as_sgt(date_time, expected_hour):
             '2019-07-13',
             date(2019, 7, 13),
         ),
+        (
+            '20190713',
+            date(2019, 7, 13),
+        ),
+        (
+            '201971',
+            date(2019, 7, 1),
+        ),
         (
             '13/07/2019',
             date(2019, 7, 13),
@@ -219,6 +241,41 @@ def test_datetime_to_string(date_time, expected_date_time_str):
     date_time_str = timezone.datetime_to_string(date_time)
     assert date_time_str == expected_date_time_str
 
+@pytest.mark.parametrize(
+    ('date_time', 'resolution', 'expected_date_time'),
+    [
+        (
+            datetime(2019, 7, 13, 8, 32, 17, 456000, tzinfo=SGT_TIMEZONE),
+            30,
+            datetime(2019, 7, 13, 8, 32, 0, tzinfo=SGT_TIMEZONE),
+        ),
+        (
+            datetime(2019, 7, 13, 8, 32, 47),
+            30,
+            datetime(2019, 7, 13, 8, 32, 30),
+        ),
+        (
+            datetime(2019, 7, 13, 8, 34, 59, tzinfo=SGT_TIMEZONE),
+            300,
+            datetime(2019, 7, 13, 8, 30, 0, tzinfo=SGT_TIMEZONE),
+        ),
+        (
+            datetime(2019, 7, 13, 8, 59, 59, tzinfo=SGT_TIMEZONE),
+            3600,
+            datetime(2019, 7, 13, 8, 0, 0, tzinfo=SGT_TIMEZONE),
+        ),
+        (
+            datetime(2019, 7, 13, 8, 0, 0, tzinfo=SGT_TIMEZONE),
+            3600,
+            datetime(2019, 7, 13, 8, 0, 0, tzinfo=SGT_TIMEZONE),
+        ),
+    ],
+)
+def test_floor_datetime(date_time, resolution, expected_date_time):
+    floored = timezone.floor_datetime(date_time, resolution)
+    assert floored == expected_date_time
+    assert floored.tzinfo == date_time.tzinfo
+
 @pytest.mark.parametrize(
     'date_time_str',
     [
@@ -226,6 +283,10 @@ def test_datetime_to_string(date_time, expected_date_time_str):
         '2019-07-13 08:32',
         '2019-07',
         '6:25', '625',
+        '2019-02-29',
+        '2019-07-13T08:32:17+24:00',
+        '08:32:17+08:0000',
+        '2019-07-13T08:32:17z',
     ],
 )
 def test_datetime_from_bad_string(date_time_str):
@@ -12,11 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,too-few-public-methods,unused-argument
 
 """Test that the Transport class is working properly."""
 
+import sys
 from datetime import datetime
+from json import dumps, loads
 from os import getenv
 from unittest.mock import Mock
 from zoneinfo import ZoneInfo
@@ -27,7 +29,14 @@ from requests_cache import CachedSession
 from typeguard import check_type
 
 from datagovsg import Transport
+from datagovsg.arrays import position_array_from_json
+from datagovsg.constants import (
+    INVALID_POSITIONS_ERROR_MESSAGE,
+    NUMPY_IMPORT_ERROR_MESSAGE,
+)
+from datagovsg.transport.coordinates import taxi_availability_array
 from datagovsg.transport.types import (
+    TaxiAvailabilityArrayDict,
     TaxiAvailabilityDict,
     TrafficImagesItemDict,
 )
@@ -108,3 +117,106 @@ def test_transport_methods_with_datetime(
     client.send_request.assert_called_once()
     _, kwargs = client.send_request.call_args
     assert kwargs['params']['date_time'] == TEST_DATETIME_STRING
+
+def test_taxi_availability_array(monkeypatch):
+    numpy = pytest.importorskip('numpy')
+
+    class MockedResponse(APIResponseTaxiAvailability):
+        content = dumps(APIResponseTaxiAvailability.json()).encode()
+
+    def mock_requests_get(*args, **kwargs):
+        return MockedResponse()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client = Transport(cache_backend='memory')
+    data = client.taxi_availability_array()
+    taxi_availability = client.taxi_availability()
+
+    assert check_type(data, TaxiAvailabilityArrayDict) == data
+    coordinates = data['features'][0]['geometry'].pop('coordinates')
+    assert coordinates.dtype == numpy.float64
+    assert coordinates.tolist() == \
+        taxi_availability['features'][0]['geometry'].pop('coordinates')
+    assert data == taxi_availability
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        b'{"features":[{"geometry":{"coordinates":[[1.5,2],[3,-4e-1]]}}]}',
+        b'{ "features" : [ { "geometry" : { "coordinates" : [\n'
+        b'  [ 1.5 , 2 ] ,\n  [ 3 , -4e-1 ]\n] } } ] }',
+        b'{"features":[{"geometry":{"coordinates":[[1.5,2],[3,"-0.4"]]}}]}',
+    ],
+)
+def test_taxi_availability_array_from_content(content):
+    pytest.importorskip('numpy')
+
+    data = taxi_availability_array(content, loads)
+
+    assert data['features'][0]['geometry']['coordinates'].tolist() == \
+        [[1.5, 2.0], [3.0, -0.4]]
+
+def test_taxi_availability_array_with_empty_coordinates():
+    pytest.importorskip('numpy')
+
+    data = taxi_availability_array(
+        b'{"features":[{"geometry":{"coordinates":[]}},{"geometry":{}}]}',
+        loads,
+    )
+
+    assert data['features'][0]['geometry']['coordinates'].shape == (0, 2)
+    assert data['features'][1]['geometry'] == {}
+
+def test_taxi_availability_array_with_bad_coordinates():
+    pytest.importorskip('numpy')
+
+    with pytest.raises(ValueError):
+        _ = taxi_availability_array(
+            b'{"features":[{"geometry":{"coordinates":[[1,2,3]]}}]}',
+            loads,
+        )
+
+@pytest.mark.parametrize(
+    ('content', 'expected_positions'),
+    [
+        (b'[]', []),
+        (b'[[103.62403,1.28675]]', [[103.62403, 1.28675]]),
+        (b'[ [ 1 , 2 ] ,\n[3,\t-4e-1] ]', [[1, 2], [3, -0.4]]),
+    ],
+)
+def test_position_array_from_json(content, expected_positions):
+    pytest.importorskip('numpy')
+
+    positions = position_array_from_json(content)
+
+    assert positions.shape == (len(expected_positions), 2)
+    assert positions.tolist() == expected_positions
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        b'[[1,2,3]]',
+        b'[[1],[2]]',
+        b'[[1,2,3],[4]]',
+        b'[[1,2]]]',
+        b'[[[1,2]]]',
+        b'[[1 2,3]]',
+        b'[[1-2,3]]',
+        b'[[1.2.3,4]]',
+        b'[[,]]',
+    ],
+)
+def test_position_array_from_json_with_bad_content(content):
+    pytest.importorskip('numpy')
+
+    with pytest.raises(ValueError) as excinfo:
+        _ = position_array_from_json(content)
+    assert str(excinfo.value) == INVALID_POSITIONS_ERROR_MESSAGE
+
+def test_taxi_availability_array_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    with pytest.raises(ImportError) as excinfo:
+        _ = taxi_availability_array(b'{"features":[]}', loads)
+    assert str(excinfo.value) == NUMPY_IMPORT_ERROR_MESSAGE
@@ -0,0 +1,292 @@
+# Copyright 2026 Yuhui
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-class-docstring,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the validation levels are working properly."""
+
+from os import environ
+from subprocess import run
+from sys import executable
+
+import pytest
+from typeguard import TypeCheckError
+
+from datagovsg import Transport
+from datagovsg.constants import (
+    INVALID_VALIDATION_LEVEL_ERROR_MESSAGE,
+    VALIDATION_LEVEL_ENVIRONMENT_VARIABLE,
+)
+from datagovsg.datagovsg import DataGovSg
+from datagovsg.ratelimit import TokenBucket
+from datagovsg.timezone import datetime_from_string
+from datagovsg.validation import (
+    DEFAULT_VALIDATION_LEVEL,
+    check_validation_level,
+    internal_typechecked,
+)
+
+requires_full_default = pytest.mark.skipif(
+    DEFAULT_VALIDATION_LEVEL != 'full',
+    reason='Functions are only instrumented if the default level is full.',
+)
+
+class CallingClient(DataGovSg):
+    @internal_typechecked
+    def call(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+@pytest.mark.parametrize(
+    'validation_level',
+    ['full', 'boundary', 'off'],
+)
+def test_check_validation_level(validation_level):
+    assert check_validation_level(validation_level) == validation_level
+
+def test_check_validation_level_with_error():
+    with pytest.raises(ValueError) as excinfo:
+        _ = check_validation_level('foo')
+
+    assert str(excinfo.value) == INVALID_VALIDATION_LEVEL_ERROR_MESSAGE
+
+def test_client_default_validation_level():
+    client = DataGovSg()
+    assert client.validation_level == DEFAULT_VALIDATION_LEVEL
+
+def test_client_with_invalid_validation_level():
+    with pytest.raises(ValueError):
+        _ = DataGovSg(validation_level='foo')
+
+@pytest.mark.parametrize(
+    ('validation_level', 'expect_internal_check', 'expect_boundary_check'),
+    [
+        ('full', True, True),
+        ('boundary', False, True),
+        ('off', False, False),
+    ],
+)
+def test_client_validation_level(
+    validation_level,
+    expect_internal_check,
+    expect_boundary_check,
+):
+    client = Transport(validation_level=validation_level)
+
+    def call_internal_method():
+        _ = client.sanitise_data({'foo': '42'}, iterate='yes')
+
+    def call_boundary_method():
+        _ = client.send_request(42)
+
+    for call_method, expect_check in (
+        (call_internal_method, expect_internal_check),
+        (call_boundary_method, expect_boundary_check),
+    ):
+        if expect_check:
+            with pytest.raises(TypeCheckError):
+                call_method()
+        else:
+            with pytest.raises(Exception) as excinfo:
+                call_method()
+                raise RuntimeError('not type-checked')
+            assert not isinstance(excinfo.value, TypeCheckError)
+
+@requires_full_default
+@pytest.mark.parametrize(
+    ('validation_level', 'expect_check'),
+    [
+        ('full', True),
+        ('boundary', False),
+        ('off', False),
+    ],
+)
+def test_validation_level_of_request_helpers(validation_level, expect_check):
+    client = CallingClient(validation_level=validation_level)
+
+    def call_build_params():
+        _ = client.call(
+            DataGovSg.build_params,
+            dict,
+            {},
+            time_resolution='60',
+        )
+
+    def call_validate_date():
+        _ = client.call(
+            DataGovSg.validate_date,
+            {},
+            'date',
+            42,
+            datetime_from_string('0832'),
+        )
+
+    for call_method in (call_build_params, call_validate_date):
+        if expect_check:
+            with pytest.raises(TypeCheckError):
+                call_method()
+        else:
+            call_method()
+
+@requires_full_default
+def test_request_helpers_outside_clients():
+    with pytest.raises(TypeCheckError):
+        _ = DataGovSg.build_params(dict, {}, time_resolution='60')
+    assert DataGovSg.build_params(dict, {'foo': 'bar'}) == {'foo': 'bar'}
+
+def test_validation_level_does_not_change_sanitised_data():
+    value = {
+        'timestamp': '2026-01-12T00:14:56+08:00',
+        'count': '42',
+        'values': '1.5,2.5',
+    }
+    results = [
+        DataGovSg(validation_level=validation_level).sanitise_data(value) \
+            for validation_level in ['full', 'boundary', 'off']
+    ]
+    assert results[0] == results[1] == results[2]
+
+@requires_full_default
+@pytest.mark.parametrize('validation_level', ['boundary', 'off'])
+def test_functions_follow_validation_level_of_client(validation_level):
+    client = CallingClient(validation_level=validation_level)
+
+    with pytest.raises(TypeError) as excinfo:
+        _ = client.call(datetime_from_string, 42)
+    assert not isinstance(excinfo.value, TypeCheckError)
+
+    # Outside the client's methods, the default validation level is followed
+    with pytest.raises(TypeCheckError):
+        _ = datetime_from_string(42)
+
+@requires_full_default
+def test_functions_follow_validation_level_of_client_at_full():
+    client = CallingClient(validation_level='full')
+
+    with pytest.raises(TypeCheckError):
+        _ = client.call(datetime_from_string, 42)
+
+@pytest.mark.parametrize('validation_level', ['boundary', 'off'])
+def test_methods_without_validation_level_follow_client(validation_level):
+    client = CallingClient(validation_level=validation_level)
+
+    with pytest.raises(TypeError) as excinfo:
+        _ = client.call(TokenBucket, 'fast', 1)
+    assert not isinstance(excinfo.value, TypeCheckError)
+
+@requires_full_default
+def test_methods_without_validation_level_follow_default():
+    with pytest.raises(TypeCheckError):
+        _ = TokenBucket('fast', 1)
+
+@pytest.mark.parametrize(
+    ('validation_level', 'expected_output'),
+    [
+        ('full', 'TypeCheckError TypeCheckError'),
+        ('boundary', 'TypeError TypeCheckError'),
+        ('off', 'TypeError TypeCheckError'),
+    ],
+)
+def test_client_validation_level_environment_variable(
+    validation_level,
+    expected_output,
+):
+    code = '\n'.join([
+        'from datagovsg.timezone import datetime_from_string',
+        'from tests.test_validation import CallingClient',
+        'client = CallingClient(validation_level="full")',
+        'for call in (',
+        '    lambda: client.call(datetime_from_string, 42),',
+        '    lambda: client.sanitise_data(42, iterate=42),',
+        '):',
+        '    try:',
+        '        call()',
+        '    except Exception as e:',
+        '        print(type(e).__name__)',
+    ])
+    env = environ | {VALIDATION_LEVEL_ENVIRONMENT_VARIABLE: validation_level}
+
+    result = run(
+        [executable, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    assert ' '.join(result.stdout.split()) == expected_output
+
+@pytest.mark.parametrize(
+    ('validation_level', 'expected_output'),
+    [
+        ('full', 'TypeCheckError'),
+        ('off', 'TypeError'),
+    ],
+)
+def test_validation_level_environment_variable(
+    validation_level,
+    expected_output,
+):
+    code = '\n'.join([
+        'from datagovsg.timezone import datetime_from_string',
+        'try:',
+        '    datetime_from_string(42)',
+        'except Exception as e:',
+        '    print(type(e).__name__)',
+    ])
+    env = environ | {VALIDATION_LEVEL_ENVIRONMENT_VARIABLE: validation_level}
+
+    result = run(
+        [executable, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    assert result.stdout.strip() == expected_output
+
+@pytest.mark.parametrize('validation_level', ['full', 'boundary', 'off'])
+def test_methods_with_default_parameters_at_validation_level_environment_variable(
+    validation_level,
+):
+    code = '\n'.join([
+        'from requests_cache import CachedSession',
+        'from datagovsg import Environment',
+        'from tests.mocks.api_response_environment import (',
+        '    APIResponseLightning,',
+        '    APIResponseWBGT,',
+        ')',
+        'client = Environment(cache_backend="memory")',
+        'for method, mocked_response in (',
+        '    ("wbgt", APIResponseWBGT),',
+        '    ("lightning", APIResponseLightning),',
+        '):',
+        '    CachedSession.get = lambda *args, r=mocked_response, **kwargs: r()',
+        '    try:',
+        '        _ = getattr(client, method)()',
+        '        print("ok")',
+        '    except Exception as e:',
+        '        print(type(e).__name__)',
+    ])
+    env = environ | {VALIDATION_LEVEL_ENVIRONMENT_VARIABLE: validation_level}
+
+    result = run(
+        [executable, '-c', code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    assert result.stdout.split() == ['ok', 'ok']